@@ -13,6 +13,7 @@ from apps.snaps.views import (
     KickoffSnapViewSet,
     FieldGoalSnapViewSet,
     ExtraPointSnapViewSet,
+    SnapExportView,
 )
 
 router = DefaultRouter()
@@ -36,6 +37,11 @@ router.register(r"snaps/field-goal", FieldGoalSnapViewSet, basename="field-goal"
 router.register(r"snaps/extra-point", ExtraPointSnapViewSet, basename="extra-point")
 
 urlpatterns = [
+    path(
+        "snaps/export/<str:export_format>/",
+        SnapExportView.as_view(),
+        name="snap-export",
+    ),
     path("", include(router.urls)),
     path("reports/", include("apps.reports.urls")),
     path("auth/", include("apps.accounts.urls")),
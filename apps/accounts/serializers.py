@@ -4,12 +4,13 @@ Serializers for authentication and user management.
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from apps.core.mixins import TeamScopedFieldsMixin
 from apps.teams.serializers import TeamMinimalSerializer
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """Full user serializer."""
 
     team = TeamMinimalSerializer(read_only=True)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
+
+    def ready(self):
+        from .metrics import install_serializer_timing, metrics_enabled
+
+        if metrics_enabled():
+            install_serializer_timing()
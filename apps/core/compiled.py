@@ -0,0 +1,209 @@
+"""
+Compiled read path for list endpoints.
+
+``CompiledSerializer`` turns a read serializer (as configured for the
+request, sparse options included) into a plan: the columns to fetch with
+``values_list()`` and, per output field, where its value comes from and
+the one conversion it needs. Rendering a page is then a loop over plain
+tuples, skipping model instantiation and DRF's per-field dispatch, and
+gives the same dicts - and so the same JSON bytes - as the serializer.
+
+Handled field kinds:
+
+- model columns, converted by the DRF field's own ``to_representation``
+  when it is not a pass-through for the database value (dates, times,
+  durations, decimals);
+- ``get_<field>_display`` sources;
+- compact relations (``IncludedRelatedField``), read from the FK column;
+- read-only properties, evaluated on a bare instance holding the row's
+  columns, so they must only read the row's own fields;
+- ``many`` nested serializers over a reverse FK, compiled in turn and
+  loaded with one query per page.
+
+Anything else (an expanded nested relation, a method field) raises
+``NotCompilable`` and the view falls back to the serializer.
+"""
+import re
+from collections import defaultdict
+
+from django.db import models
+from django.utils.encoding import force_str
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+
+from .sparse import IncludedRelatedField
+
+# Fields whose to_representation returns a database value unchanged
+PASS_THROUGH = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.ChoiceField,
+    drf_fields.FloatField,
+    drf_fields.IntegerField,
+    drf_fields.ReadOnlyField,
+)
+
+DISPLAY_SOURCE = re.compile(r"^get_(\w+)_display$")
+
+# Plans kept before the cache starts over (one per distinct ?fields=/?expand=)
+PLAN_CACHE_SIZE = 256
+
+
+class NotCompilable(Exception):
+    """The serializer has a field the compiled path does not handle."""
+
+
+def _convert_choice(field, choices):
+    to_representation = field.to_representation
+
+    def convert(value):
+        return to_representation(force_str(choices.get(value, value), strings_only=True))
+
+    return convert
+
+
+class CompiledSerializer:
+    """
+    Render a ``ModelSerializer``'s output from ``values_list()`` rows.
+
+    Build one with ``CompiledSerializer.for_serializer(serializer)``;
+    plans are cached per serializer class and sparse options.
+    """
+
+    def __init__(self, serializer):
+        self.model = serializer.Meta.model
+        self.columns = ["pk"]
+        self.outputs = []
+        self.children = []
+        self.needs_instance = False
+        concrete = {field.name: field for field in self.model._meta.concrete_fields}
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            source = field.source
+            if isinstance(field, IncludedRelatedField):
+                column = self._column(concrete[source].attname)
+                self.outputs.append((name, column, None, field.serializer_class, None))
+            elif isinstance(field, serializers.ListSerializer):
+                self.children.append((name, self._reverse_child(source, field.child)))
+                self.outputs.append((name, None, None, None, len(self.children) - 1))
+            elif isinstance(field, serializers.BaseSerializer) or "." in source or source == "*":
+                raise NotCompilable(f"{type(serializer).__name__}.{name}")
+            elif source in concrete:
+                model_field = concrete[source]
+                if isinstance(model_field, models.ForeignKey):
+                    raise NotCompilable(f"{type(serializer).__name__}.{name}")
+                convert = None if isinstance(field, PASS_THROUGH) else field.to_representation
+                self.outputs.append((name, self._column(source), convert, None, None))
+            elif (match := DISPLAY_SOURCE.match(source)) and match.group(1) in concrete:
+                model_field = concrete[match.group(1)]
+                choices = dict(model_field.flatchoices)
+                convert = _convert_choice(field, choices)
+                self.outputs.append((name, self._column(model_field.name), convert, None, None))
+            elif isinstance(getattr(self.model, source, None), property):
+                self.needs_instance = True
+                convert = None if isinstance(field, PASS_THROUGH) else field.to_representation
+                self.outputs.append((name, source, convert, None, None))
+            else:
+                raise NotCompilable(f"{type(serializer).__name__}.{name}")
+
+        if self.needs_instance:
+            for field in concrete.values():
+                self._column(field.attname)
+        self.attnames = [
+            self.model._meta.pk.attname if column == "pk" else column for column in self.columns
+        ]
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        """The (cached) plan for ``serializer`` under its context's sparse options."""
+        context = serializer.context
+        fields = context.get("fields")
+        expand = context.get("expand")
+        return _plan(
+            type(serializer),
+            frozenset(fields) if fields else None,
+            None if expand is None else frozenset(expand),
+            lambda: cls(serializer),
+        )
+
+    def values(self, queryset):
+        """``queryset`` narrowed to the plan's columns, as tuples."""
+        if hasattr(queryset, "non_polymorphic"):
+            queryset = queryset.non_polymorphic()
+        return queryset.prefetch_related(None).values_list(*self.columns)
+
+    def render(self, rows, included=None):
+        """Output dicts for ``rows`` fetched by ``values()``."""
+        rows = list(rows)
+        children = [
+            child.render_grouped([row[0] for row in rows], included)
+            for _, child in self.children
+        ]
+        model = self.model
+        attnames = self.attnames
+        outputs = self.outputs
+        data = []
+        for row in rows:
+            instance = None
+            if self.needs_instance:
+                instance = model.__new__(model)
+                instance.__dict__.update(zip(attnames, row))
+            item = {}
+            for name, column, convert, related, child in outputs:
+                if child is not None:
+                    item[name] = children[child].get(row[0], [])
+                    continue
+                value = getattr(instance, column) if isinstance(column, str) else row[column]
+                if value is not None:
+                    if related is not None:
+                        if included is not None:
+                            included.add(related, value)
+                    elif convert is not None:
+                        value = convert(value)
+                item[name] = value
+            data.append(item)
+        return data
+
+    def render_grouped(self, parent_ids, included=None):
+        """For a reverse-FK child plan: ``{parent id: [dicts]}`` in default order."""
+        queryset = self.model._default_manager.filter(**{f"{self.parent_column}__in": parent_ids})
+        rows = list(queryset.values_list(*self.columns, self.parent_column))
+        grouped = defaultdict(list)
+        for row, item in zip(rows, self.render(rows, included)):
+            grouped[row[-1]].append(item)
+        return grouped
+
+    def _column(self, name):
+        if name not in self.columns:
+            self.columns.append(name)
+        return self.columns.index(name)
+
+    def _reverse_child(self, source, child):
+        relation = self.model._meta.get_field(source)
+        if not isinstance(relation, models.ManyToOneRel):
+            raise NotCompilable(f"{self.model.__name__}.{source}")
+        plan = CompiledSerializer(child)
+        plan.parent_column = relation.field.attname
+        return plan
+
+
+_plans = {}
+
+
+def _plan(serializer_class, fields, expand, build):
+    key = (serializer_class, fields, expand)
+    try:
+        plan = _plans[key]
+    except KeyError:
+        if len(_plans) >= PLAN_CACHE_SIZE:
+            _plans.clear()
+        try:
+            plan = build()
+        except NotCompilable:
+            plan = None
+        _plans[key] = plan
+    if plan is None:
+        raise NotCompilable(serializer_class.__name__)
+    return plan
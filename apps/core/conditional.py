@@ -0,0 +1,128 @@
+"""
+Conditional GET (ETag / Last-Modified) for API views.
+
+A view states its validators with ``get_validators()``, which must be
+cheap - one aggregate or indexed query - because it runs after
+authentication and permission checks but before the handler. When the
+request's ``If-None-Match``/``If-Modified-Since`` still match, the view
+answers 304 without running the handler, its queries or its serializer;
+otherwise the validators are sent with the full response.
+"""
+import hashlib
+from typing import ClassVar
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def make_etag(*parts):
+    """A strong ETag over reprable ``parts``."""
+    return f'"{hashlib.sha1(repr(parts).encode()).hexdigest()}"'
+
+
+class NotModified(Exception):
+    """Raised from ``initial()`` to short-circuit the handler with a 304."""
+
+    def __init__(self, response):
+        self.response = response
+        super().__init__("not modified")
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET/HEAD with 304 when the client's copy is current.
+
+    Subclasses override ``get_validators(request)`` to return
+    ``(etag, last_modified)``, either of which may be None (both None
+    disables the check for that request). ``last_modified`` is a datetime.
+    """
+
+    def get_validators(self, request):
+        return None, None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._validators = None, None
+        if request.method not in SAFE_METHODS:
+            return
+        etag, last_modified = self._validators = self.get_validators(request)
+        if etag is None and last_modified is None:
+            return
+        response = get_conditional_response(
+            request._request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is not None:
+            raise NotModified(self._set_validators(response))
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == 200 and request.method in SAFE_METHODS:
+            self._set_validators(response)
+        return response
+
+    def _set_validators(self, response):
+        etag, last_modified = getattr(self, "_validators", (None, None))
+        if etag is not None:
+            response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class ConditionalModelMixin(ConditionalGetMixin):
+    """
+    Validators for a model viewset's ``list`` and ``retrieve``.
+
+    Both come from one aggregate over the (filtered) queryset: the newest
+    ``updated_at``, the row count (so deletes change the tag) and any
+    ``version_aggregates`` for related rows the response embeds. Other
+    actions are not conditional unless the view overrides
+    ``get_validators``.
+    """
+
+    # Max() of other timestamps the representation depends on (name -> expression)
+    version_aggregates: ClassVar[dict] = {}
+
+    def get_validators(self, request):
+        if self.action == "list":
+            queryset = self.filter_queryset(self.get_queryset())
+        elif self.action == "retrieve":
+            lookup = self.lookup_url_kwarg or self.lookup_field
+            try:
+                queryset = self.get_queryset().filter(**{self.lookup_field: self.kwargs[lookup]})
+            except (TypeError, ValueError, ValidationError):
+                return None, None
+        else:
+            return None, None
+
+        versions = queryset.order_by().aggregate(
+            modified=Max("updated_at"),
+            count=Count("pk", distinct=True),
+            **self.version_aggregates,
+        )
+        if not versions["count"]:
+            # Nothing to validate; let the handler answer (e.g. 404)
+            return None, None
+        modified = max(
+            value for name, value in versions.items() if name != "count" and value is not None
+        )
+        etag = make_etag(
+            type(self).__name__,
+            self.action,
+            request.get_full_path(),
+            request.accepted_media_type,
+            getattr(request.user, "team_id", None),
+            sorted(versions.items()),
+        )
+        return etag, modified
@@ -0,0 +1,308 @@
+"""
+Per-request SQL and timing instrumentation.
+
+``RequestMetricsMiddleware`` records, for every request, the resolved
+view, wall time, query count, total database time, the slowest statement
+(SQL text only, never parameters), time spent producing serializer
+``.data`` and the response size. Samples go into a bounded in-process
+ring buffer (``request_metrics``) that the staff-only
+``/api/health/metrics/`` endpoint summarizes per view as percentiles,
+as JSON or Prometheus text.
+
+The per-request cost is a timer around each query and each top-level
+serializer, so it can stay on in production. Configure with
+``REQUEST_METRICS_ENABLED`` and ``REQUEST_METRICS_BUFFER_SIZE``; every
+process (gunicorn worker) keeps its own buffer.
+"""
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework import serializers
+from rest_framework.permissions import IsAdminUser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+DEFAULT_BUFFER_SIZE = 5000
+
+# Longest SQL text kept for the slowest statement
+MAX_SQL_LENGTH = 500
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+_current = contextvars.ContextVar("request_metrics", default=None)
+
+
+@dataclass
+class RequestSample:
+    """Measurements for one request."""
+
+    view: str
+    method: str
+    status: int = 0
+    duration_ms: float = 0.0
+    queries: int = 0
+    db_ms: float = 0.0
+    slowest_sql: str = ""
+    slowest_ms: float = 0.0
+    serializer_ms: float = 0.0
+    # None for streaming responses, whose size is unknown when they start
+    response_bytes: int | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    def record_query(self, sql, elapsed_ms):
+        self.queries += 1
+        self.db_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_sql = sql[:MAX_SQL_LENGTH]
+
+
+# Summarized sample fields, in output order
+METRICS = ("duration_ms", "queries", "db_ms", "serializer_ms", "response_bytes")
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class RequestMetrics:
+    """
+    Ring buffer of recent samples plus cumulative per-view totals.
+
+    Percentiles describe the buffered window; totals count every request
+    since the process started (what Prometheus ``_sum``/``_count`` expect).
+    """
+
+    def __init__(self, size=None):
+        self._size = size
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def size(self):
+        return self._size or getattr(
+            settings, "REQUEST_METRICS_BUFFER_SIZE", DEFAULT_BUFFER_SIZE
+        )
+
+    def reset(self):
+        with self._lock:
+            self._samples = deque(maxlen=self.size)
+            self._totals = {}
+            self.started = time.time()
+
+    def add(self, sample):
+        with self._lock:
+            self._samples.append(sample)
+            totals = self._totals.setdefault(
+                sample.view, dict.fromkeys(("count", "errors", *METRICS), 0)
+            )
+            totals["count"] += 1
+            totals["errors"] += sample.status >= 500
+            for name in METRICS:
+                totals[name] += getattr(sample, name) or 0
+
+    def samples(self):
+        with self._lock:
+            return list(self._samples)
+
+    def totals(self):
+        with self._lock:
+            return {view: dict(values) for view, values in self._totals.items()}
+
+    def summary(self):
+        """Per-view percentiles over the buffered window, slowest p90 first."""
+        by_view = {}
+        for sample in self.samples():
+            by_view.setdefault(sample.view, []).append(sample)
+
+        views = []
+        for view, samples in by_view.items():
+            slowest = max(samples, key=lambda sample: sample.slowest_ms)
+            entry = {
+                "view": view,
+                "count": len(samples),
+                "errors": sum(sample.status >= 500 for sample in samples),
+            }
+            for name in METRICS:
+                values = sorted(
+                    getattr(sample, name) for sample in samples
+                    if getattr(sample, name) is not None
+                )
+                entry[name] = {
+                    **{f"p{round(q * 100)}": percentile(values, q) for q in QUANTILES},
+                    "max": values[-1] if values else None,
+                }
+            entry["slowest_query"] = {"sql": slowest.slowest_sql, "ms": slowest.slowest_ms}
+            views.append(entry)
+
+        views.sort(key=lambda entry: entry["duration_ms"]["p90"] or 0, reverse=True)
+        return {
+            "window": {
+                "size": self.size,
+                "samples": sum(entry["count"] for entry in views),
+                "since": datetime.fromtimestamp(self.started, UTC).isoformat(),
+            },
+            "views": views,
+        }
+
+
+request_metrics = RequestMetrics()
+
+
+def metrics_enabled():
+    return getattr(settings, "REQUEST_METRICS_ENABLED", False)
+
+
+class RequestMetricsMiddleware:
+    """Record a RequestSample for every request into ``request_metrics``."""
+
+    def __init__(self, get_response):
+        if not metrics_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        sample = RequestSample(view="", method=request.method)
+        token = _current.set(sample)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self._timed_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        sample.duration_ms = (time.perf_counter() - started) * 1000
+        match = getattr(request, "resolver_match", None)
+        sample.view = match.view_name if match else "<unresolved>"
+        sample.status = response.status_code
+        if not response.streaming:
+            sample.response_bytes = len(response.content)
+        request_metrics.add(sample)
+        return response
+
+    @staticmethod
+    def _timed_query(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            sample = _current.get()
+            if sample is not None:
+                sample.record_query(sql, (time.perf_counter() - started) * 1000)
+
+
+def _timed_data(prop):
+    def data(self):
+        sample = _current.get()
+        if sample is None:
+            return prop.fget(self)
+        started = time.perf_counter()
+        try:
+            return prop.fget(self)
+        finally:
+            sample.serializer_ms += (time.perf_counter() - started) * 1000
+
+    return property(data)
+
+
+def install_serializer_timing():
+    """
+    Time top-level serializer ``.data`` calls.
+
+    Nested serializers go through ``to_representation`` rather than
+    ``.data``, so each response's serialization is counted once.
+    """
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        if not getattr(cls.data, "_request_metrics", False):
+            cls.data = _timed_data(cls.data)
+            cls.data.fget._request_metrics = True
+
+
+# Summary metrics exported to Prometheus: (sample field, metric name, help)
+PROMETHEUS_METRICS = (
+    ("duration_ms", "request_duration_milliseconds", "Request wall time"),
+    ("queries", "request_queries", "SQL queries per request"),
+    ("db_ms", "request_db_milliseconds", "Database time per request"),
+    ("serializer_ms", "request_serializer_milliseconds", "Serializer time per request"),
+    ("response_bytes", "request_response_bytes", "Response body size"),
+)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusRenderer(BaseRenderer):
+    """
+    Render the metrics summary in the Prometheus text exposition format.
+
+    Each metric is a summary per view: quantiles over the buffered window,
+    ``_sum``/``_count`` since the process started.
+    """
+
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if "views" not in data:
+            # Errors (e.g. permission denied) keep their detail message
+            return "".join(f"# {key}: {value}\n" for key, value in data.items())
+
+        totals = data.get("totals", {})
+        lines = []
+        for name, metric, help_text in PROMETHEUS_METRICS:
+            metric = f"sportsman_{metric}"
+            lines.append(f"# HELP {metric} {help_text}.")
+            lines.append(f"# TYPE {metric} summary")
+            for entry in data["views"]:
+                view = _label(entry["view"])
+                for quantile in QUANTILES:
+                    value = entry[name][f"p{round(quantile * 100)}"]
+                    if value is not None:
+                        lines.append(
+                            f'{metric}{{view="{view}",quantile="{quantile}"}} {value:g}'
+                        )
+                view_totals = totals.get(entry["view"], {})
+                lines.append(f'{metric}_sum{{view="{view}"}} {view_totals.get(name, 0):g}')
+                lines.append(f'{metric}_count{{view="{view}"}} {view_totals.get("count", 0)}')
+        lines.append("# HELP sportsman_request_errors_total Responses with a 5xx status.")
+        lines.append("# TYPE sportsman_request_errors_total counter")
+        for view, view_totals in sorted(totals.items()):
+            lines.append(
+                f'sportsman_request_errors_total{{view="{_label(view)}"}} {view_totals["errors"]}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+class RequestMetricsView(APIView):
+    """
+    Per-view request metrics for this process.
+
+    ``?format=prometheus`` returns Prometheus text instead of JSON.
+    Staff only.
+    """
+
+    permission_classes = [IsAdminUser]
+    renderer_classes = [JSONRenderer, PrometheusRenderer]
+
+    def get(self, request):
+        summary = request_metrics.summary()
+        if request.accepted_renderer.format == "prometheus":
+            summary["totals"] = request_metrics.totals()
+        return Response({"enabled": metrics_enabled(), **summary})
@@ -0,0 +1,180 @@
+"""
+ViewSet and serializer mixins shared across apps.
+"""
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+from .compiled import CompiledSerializer, NotCompilable
+from .permissions import IsTeamMember
+from .sparse import Included
+
+# Path from each team-owned model to its team's id
+TEAM_LOOKUPS = {
+    "teams.Team": "pk",
+    "teams.Season": "team_id",
+    "teams.Player": "team_id",
+    "games.Game": "season__team_id",
+}
+
+
+def scope_to_team(queryset, user, lookup):
+    """
+    ``queryset`` limited to ``user``'s team through ``lookup``.
+
+    Staff without a team see every team; anyone else without one sees
+    nothing.
+    """
+    team_id = getattr(user, "team_id", None)
+    if team_id:
+        return queryset.filter(**{lookup: team_id})
+    if user.is_staff:
+        return queryset
+    return queryset.none()
+
+
+class TeamScopedMixin:
+    """
+    Limit a viewset's queryset to the requesting user's team.
+
+    ``team_lookup`` is the path from the model to its team's id (e.g.
+    ``"season__team_id"``); the filter runs in SQL over the foreign key
+    joins, so list, detail, update and delete only ever see the user's
+    own rows and other teams' objects 404. ``IsTeamMember`` turns away
+    users without a team, other than staff.
+    """
+
+    permission_classes = [IsAuthenticated, IsTeamMember]
+    team_lookup = "team_id"
+
+    def get_queryset(self):
+        return scope_to_team(super().get_queryset(), self.request.user, self.team_lookup)
+
+
+class TeamScopedFieldsMixin:
+    """
+    Limit a write serializer's related-id fields to the requesting user's team.
+
+    Every writable ``PrimaryKeyRelatedField`` over a model in
+    ``TEAM_LOOKUPS`` only accepts the user's own rows, so a payload cannot
+    attach a play to another team's game or player. Serializers used
+    without a request in their context are left unscoped.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None:
+            return fields
+        for field in fields.values():
+            if isinstance(field, ManyRelatedField):
+                field = field.child_relation
+            if not isinstance(field, PrimaryKeyRelatedField) or field.read_only:
+                continue
+            lookup = TEAM_LOOKUPS.get(field.queryset.model._meta.label)
+            if lookup is not None:
+                field.queryset = scope_to_team(field.queryset, request.user, lookup)
+        return fields
+
+
+class SparseFieldsetMixin:
+    """
+    ``?fields=`` and ``?expand=`` for a viewset's read serializers.
+
+    Rows are compact by default: nested relations become ids and the
+    distinct related objects are side-loaded once each under
+    ``included`` (one query per kind). ``?expand=game,ball_carrier``
+    nests those relations in the rows instead; ``?fields=id,yards_gained``
+    keeps only the named fields. Read requests drop the queryset's
+    ``select_related`` joins for relations that are not expanded, and
+    its prefetches for fields that are not selected.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.included = Included()
+
+    def get_sparse_options(self):
+        params = self.request.query_params
+        fields = {name for name in params.get("fields", "").split(",") if name}
+        expand = {name for name in params.get("expand", "").split(",") if name}
+        return fields or None, expand
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request is not None and self.request.method in ("GET", "HEAD"):
+            context["fields"], context["expand"] = self.get_sparse_options()
+            context["included"] = getattr(self, "included", None)
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request is None or self.request.method not in ("GET", "HEAD"):
+            return queryset
+        fields, expand = self.get_sparse_options()
+
+        related = queryset.query.select_related
+        if isinstance(related, dict):
+            keep = [path for path in _paths(related) if path.split("__")[0] in expand]
+            queryset = queryset.select_related(None)
+            if keep:
+                queryset = queryset.select_related(*keep)
+
+        lookups = queryset._prefetch_related_lookups
+        if fields and lookups:
+            keep = [lookup for lookup in lookups if _lookup_root(lookup) in fields]
+            queryset = queryset.prefetch_related(None).prefetch_related(*keep)
+        return queryset
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        self._side_load(response.data)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        self._side_load(response.data)
+        return response
+
+    def _side_load(self, data):
+        if getattr(self, "included", None) is not None and isinstance(data, dict):
+            data["included"] = self.included.as_dict(self.get_serializer_context())
+
+
+def _paths(related, prefix=""):
+    """Leaf paths of a ``Query.select_related`` tree."""
+    paths = []
+    for name, children in related.items():
+        path = prefix + name
+        paths.extend(_paths(children, path + "__") if children else [path])
+    return paths
+
+
+def _lookup_root(lookup):
+    path = getattr(lookup, "prefetch_to", lookup)
+    return path.split("__")[0]
+
+
+class CompiledListMixin:
+    """
+    Serve ``list`` through the compiled read path when the serializer allows.
+
+    Rows are fetched as tuples and rendered by ``CompiledSerializer``, with
+    the same filters, ordering, pagination and side-loading as the regular
+    ``list``; requests the plan cannot render (e.g. ``?expand=``) fall
+    back to it.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer()
+        try:
+            compiled = CompiledSerializer.for_serializer(serializer)
+        except NotCompilable:
+            return super().list(request, *args, **kwargs)
+
+        rows = compiled.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        included = serializer.context.get("included")
+        if page is not None:
+            return self.get_paginated_response(compiled.render(page, included))
+        return Response(compiled.render(rows, included))
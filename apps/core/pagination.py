@@ -38,3 +38,14 @@ class SnapCursorPagination(CursorPagination):
     page_size = 20
     ordering = "-sequence_number"
     cursor_query_param = "cursor"
+
+
+class TimelineCursorPagination(SnapCursorPagination):
+    """
+    Snap cursor pagination in play order, for reading a game's
+    play-by-play from the opening kickoff.
+    """
+
+    ordering = "sequence_number"
+    page_size_query_param = "page_size"
+    max_page_size = 200
@@ -0,0 +1,40 @@
+"""
+Request parsers matching the renderers in ``apps.core.renderers``.
+
+``ORJSONParser`` decodes UTF-8 ``application/json`` bodies with orjson
+when it is installed (``JSONParser`` otherwise); like DRF's strict parser
+it rejects ``NaN``/``Infinity``. ``MessagePackParser`` accepts
+``application/msgpack`` bodies and is only registered when msgpack is
+installed.
+"""
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from .renderers import MessagePackRenderer, msgpack, orjson
+
+
+class ORJSONParser(JSONParser):
+    """``JSONParser``, decoding with orjson when available."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(BaseParser):
+    """Parse a MessagePack request body."""
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except ValueError as exc:  # msgpack's unpack errors all derive from it
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -8,16 +8,31 @@ class IsTeamMember(permissions.BasePermission):
     """
     Permission check for team membership.
     Users can only access data belonging to their team.
+
+    Users without a team are turned away unless they are staff, who see
+    every team. Views using ``TeamScopedMixin`` (those with a
+    ``team_lookup``) already filter their queryset by team, so their
+    objects pass without another lookup. Elsewhere team ids are compared,
+    not team rows, which saves loading the team itself.
     """
 
+    message = "Your account is not assigned to a team."
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(getattr(user, "team_id", None) or (user and user.is_staff))
+
     def has_object_permission(self, request, view, obj):
+        if getattr(view, "team_lookup", None) is not None:
+            return True
+        team_id = getattr(request.user, "team_id", None)
         # Check if the object has a team relationship
-        if hasattr(obj, "team"):
-            return obj.team == getattr(request.user, "team", None)
+        if hasattr(obj, "team_id"):
+            return obj.team_id == team_id
         if hasattr(obj, "season"):
-            return obj.season.team == getattr(request.user, "team", None)
+            return obj.season.team_id == team_id
         if hasattr(obj, "game"):
-            return obj.game.season.team == getattr(request.user, "team", None)
+            return obj.game.season.team_id == team_id
         return True
 
 
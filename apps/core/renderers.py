@@ -0,0 +1,73 @@
+"""
+Response renderers for the API.
+
+``ORJSONRenderer`` is the default: the same ``application/json`` bytes as
+DRF's ``JSONRenderer`` (compact, UTF-8, ``\\u2028``/``\\u2029`` escaped),
+encoded by orjson when it is installed. Values orjson has no native form
+for - durations such as ``game_clock``, decimals, lazy strings - go
+through DRF's encoder, so they come out exactly as the stdlib renderer
+writes them. Indented output (``Accept: application/json; indent=4``, the
+browsable API) and anything orjson refuses are left to ``JSONRenderer``.
+
+The one difference is non-finite floats: orjson writes ``NaN`` and
+``Infinity`` as ``null``, where the strict stdlib renderer raises
+``ValueError`` (a 500). Report figures computed over no rows are the
+usual source; clients get ``null`` rather than an error.
+
+``MessagePackRenderer`` (``application/msgpack``, ``?format=msgpack``)
+encodes the same data as MessagePack, with the same string forms for
+dates, times and durations; non-finite floats stay IEEE floats. It is
+only registered when msgpack is installed (see ``REST_FRAMEWORK`` in
+settings); msgpack is in the base requirements.
+"""
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib encoder renders JSON instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - MessagePackRenderer is not registered then
+    msgpack = None
+
+# Same representations as DRF's JSONRenderer for non-native values
+encode_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` output, encoded with orjson when available."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=encode_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder copes
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Render the response data as MessagePack."""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
@@ -0,0 +1,117 @@
+"""
+Sparse fieldsets and compact relations for read serializers.
+
+A serializer with ``SparseFieldsMixin`` reads two options from its
+context, both set by ``SparseFieldsetMixin`` on the view:
+
+- ``fields``: the names to keep (None keeps all).
+- ``expand``: the nested relations to render in full. Every other
+  single nested relation is rendered as its primary key, and the object
+  behind it is added once to the context's ``included`` collector, for
+  the view to side-load next to the rows.
+
+Without the ``expand`` option (a serializer used outside such a view)
+the serializer renders exactly as declared.
+"""
+from collections import defaultdict
+
+from rest_framework import serializers
+
+
+def nested_relations(serializer):
+    """Names of the single (not ``many``) nested serializer fields."""
+    return [
+        name
+        for name, field in serializer.fields.items()
+        if isinstance(field, serializers.BaseSerializer)
+        and not isinstance(field, serializers.ListSerializer)
+    ]
+
+
+def select_related_paths(serializer, prefix=""):
+    """The ``select_related`` paths that rendering ``serializer`` follows."""
+    paths = []
+    for name in nested_relations(serializer):
+        field = serializer.fields[name]
+        if "." in field.source or field.source == "*":
+            continue
+        path = prefix + field.source
+        paths.append(path)
+        paths.extend(select_related_paths(field, path + "__"))
+    return paths
+
+
+class Included:
+    """
+    Distinct related objects referenced by compact rows.
+
+    Collected while the rows are serialized; ``as_dict()`` then loads each
+    kind of object in one query and renders it with the serializer its
+    relation declared, keyed ``{"players": {"12": {...}}, ...}``.
+    """
+
+    def __init__(self):
+        self._ids = defaultdict(set)
+        self._serializers = {}
+
+    def add(self, serializer_class, pk):
+        key = f"{serializer_class.Meta.model._meta.model_name}s"
+        self._serializers.setdefault(key, serializer_class)
+        self._ids[key].add(pk)
+
+    def as_dict(self, context=None):
+        included = {}
+        for key, ids in sorted(self._ids.items()):
+            serializer_class = self._serializers[key]
+            model = serializer_class.Meta.model
+            objects = (
+                model._default_manager.filter(pk__in=ids)
+                .select_related(*select_related_paths(serializer_class()))
+                .order_by("pk")
+            )
+            included[key] = {
+                str(obj.pk): serializer_class(obj, context=context).data for obj in objects
+            }
+        return included
+
+
+class IncludedRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    A nested relation collapsed to its primary key.
+
+    Reads the FK column, so the related row is never loaded, and records
+    the id in the context's ``included`` collector (if any).
+    """
+
+    def __init__(self, serializer_class, **kwargs):
+        self.serializer_class = serializer_class
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        included = self.context.get("included")
+        if included is not None:
+            included.add(self.serializer_class, value.pk)
+        return value.pk
+
+
+class SparseFieldsMixin:
+    """Apply the context's ``fields`` and ``expand`` options to a read serializer."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        expand = self.context.get("expand")
+        if expand is None:
+            return fields
+
+        selected = self.context.get("fields")
+        if selected:
+            fields = {name: field for name, field in fields.items() if name in selected}
+        for name, field in fields.items():
+            if (
+                name not in expand
+                and isinstance(field, serializers.BaseSerializer)
+                and not isinstance(field, serializers.ListSerializer)
+            ):
+                fields[name] = IncludedRelatedField(type(field), source=field.source)
+        return fields
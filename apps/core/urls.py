@@ -3,7 +3,9 @@ Core app URL configuration.
 """
 from django.urls import path
 from .health import health_check
+from .metrics import RequestMetricsView
 
 urlpatterns = [
     path("health/", health_check, name="health_check"),
+    path("health/metrics/", RequestMetricsView.as_view(), name="request_metrics"),
 ]
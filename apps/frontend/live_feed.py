@@ -0,0 +1,215 @@
+"""
+Live play feed fan-out for the game tracker.
+
+Tracker writes publish a small event per play; spectator and press-box
+screens hold one server-sent-events stream per game instead of polling
+tracker_recent_plays. Events fan out in-process to every open stream, so
+each play costs one publish no matter how many screens are watching.
+Events carry ids, sequence numbers and scores only; viewers fetch the
+rows themselves from tracker_recent_plays.
+
+Streams served under ASGI read an AsyncSubscription, which waits on the
+event loop rather than holding a worker thread for the stream's life.
+
+The backend is chosen by the TRACKER_FEED_BACKEND setting:
+
+- InProcessPlayFeed: single-process fan-out (development, one worker).
+- PostgresPlayFeed: publishes with NOTIFY; one LISTEN connection per
+  worker process feeds that process's in-process fan-out.
+"""
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from functools import cache
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'apps.frontend.live_feed.InProcessPlayFeed'
+
+
+class Subscription:
+    """A single stream's view of one game's events."""
+
+    def __init__(self, feed, game_id, maxsize=100):
+        self.feed = feed
+        self.game_id = game_id
+        self._queue = queue.Queue(maxsize=maxsize)
+
+    def deliver(self, event):
+        """Queue an event, dropping the oldest one if the reader fell behind."""
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout=None):
+        """Next event, or None if nothing arrived within ``timeout`` seconds."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.feed.unsubscribe(self)
+
+
+class AsyncSubscription(Subscription):
+    """
+    A subscription read from an event loop.
+
+    Publishers may deliver from any thread; each delivery wakes the
+    stream's loop, so a waiting stream costs no thread.
+    """
+
+    def __init__(self, feed, game_id, maxsize=100):
+        super().__init__(feed, game_id, maxsize)
+        self._loop = asyncio.get_running_loop()
+        self._arrived = asyncio.Event()
+
+    def deliver(self, event):
+        super().deliver(event)
+        try:
+            self._loop.call_soon_threadsafe(self._arrived.set)
+        except RuntimeError:
+            # The stream's loop has already closed
+            pass
+
+    async def aget(self, timeout=None):
+        """Next event, or None if nothing arrived within ``timeout`` seconds."""
+        deadline = None if timeout is None else self._loop.time() + timeout
+        while True:
+            self._arrived.clear()
+            event = self.get(timeout=0)
+            if event is not None:
+                return event
+            remaining = None if deadline is None else deadline - self._loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._arrived.wait(), remaining)
+            except TimeoutError:
+                return None
+
+
+class InProcessPlayFeed:
+    """Fan events out to subscribers within this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def subscribe(self, game_id, subscription_class=Subscription):
+        subscription = subscription_class(self, game_id)
+        with self._lock:
+            self._subscribers.setdefault(game_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.game_id)
+            if subscribers:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.game_id]
+
+    def subscriber_count(self, game_id):
+        with self._lock:
+            return len(self._subscribers.get(game_id, ()))
+
+    def publish(self, game_id, event_type, data):
+        self.dispatch(game_id, {'type': event_type, 'data': data})
+
+    def dispatch(self, game_id, event):
+        with self._lock:
+            subscribers = list(self._subscribers.get(game_id, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+
+class PostgresPlayFeed(InProcessPlayFeed):
+    """
+    Cross-process feed over PostgreSQL LISTEN/NOTIFY.
+
+    Publishing is a single NOTIFY. Each worker process opens one dedicated
+    LISTEN connection (lazily, on its first subscriber) and hands incoming
+    notifications to its in-process subscribers. PostgreSQL rejects NOTIFY
+    payloads of 8000 bytes or more, so oversized events are refused here.
+    """
+
+    channel = 'sportsman_plays'
+    max_payload = 7999
+    reconnect_delay = 2.0
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        super().__init__()
+        self.using = using
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def subscribe(self, game_id, subscription_class=Subscription):
+        self._ensure_listener()
+        return super().subscribe(game_id, subscription_class)
+
+    def publish(self, game_id, event_type, data):
+        payload = json.dumps({'game_id': game_id, 'type': event_type, 'data': data})
+        size = len(payload.encode())
+        if size > self.max_payload:
+            raise ValueError(
+                f"{event_type!r} event is {size} bytes, over the NOTIFY limit; publish ids, not rows"
+            )
+        with connections[self.using].cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [self.channel, payload])
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name='play-feed-listener', daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self):
+        while True:
+            wrapper = connections.create_connection(self.using)
+            try:
+                wrapper.ensure_connection()
+                wrapper.set_autocommit(True)
+                raw = wrapper.connection
+                raw.execute(f'LISTEN {self.channel}')
+                for notify in raw.notifies():
+                    message = json.loads(notify.payload)
+                    self.dispatch(
+                        message['game_id'],
+                        {'type': message['type'], 'data': message['data']},
+                    )
+            except Exception:
+                logger.exception('Play feed listener lost its connection; reconnecting')
+                time.sleep(self.reconnect_delay)
+            finally:
+                wrapper.close()
+
+
+@cache
+def get_play_feed():
+    """The process-wide feed configured by TRACKER_FEED_BACKEND."""
+    backend = getattr(settings, 'TRACKER_FEED_BACKEND', DEFAULT_BACKEND)
+    return import_string(backend)()
+
+
+def publish_play_event(game_id, event_type, data):
+    """Publish once the surrounding transaction (if any) commits."""
+    transaction.on_commit(
+        lambda: get_play_feed().publish(game_id, event_type, data), robust=True
+    )
@@ -5,16 +5,22 @@ Provides a mobile-first single-page interface for coaches to record
 plays during live football games, plus AJAX endpoints for each play type.
 """
 import json
+import time
 
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
-from django.shortcuts import get_object_or_404, render
+from django.contrib.auth.views import redirect_to_login
+from django.core.handlers.asgi import ASGIRequest
+from django.db import DataError, IntegrityError, transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404, render
 from django.views.decorators.http import require_POST, require_GET
 
 from apps.games.models import Game
 from apps.teams.models import Player
 from apps.snaps.models import (
     BaseSnap,
+    ScoreEntry,
+    UndonePlay,
     RunPlay,
     PassPlay,
     DefenseSnap,
@@ -24,17 +30,23 @@ from apps.snaps.models import (
     ExtraPointSnap,
 )
 from apps.snaps.models.offense import OffenseSnap
+from apps.snaps.bulk import assign_sequence_numbers, bulk_create_snaps
+from apps.snaps.game_state import game_state_cache, outcome_of
+from apps.snaps.querysets import downcast_snaps
+from .live_feed import AsyncSubscription, get_play_feed, publish_play_event
+
+# Live feed stream tuning (seconds)
+FEED_KEEPALIVE = 15
+FEED_MAX_DURATION = 300
+
+# Undone plays kept per game for redo
+REDO_DEPTH = 20
 
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
-def _get_next_sequence(game):
-    last = game.snaps.order_by('-sequence_number').values_list('sequence_number', flat=True).first()
-    return (last or 0) + 1
-
-
 def _format_down(down):
     suffixes = {1: 'st', 2: 'nd', 3: 'rd', 4: 'th'}
     return f"{down}{suffixes.get(down, 'th')}"
@@ -51,107 +63,76 @@ def _ball_pos_display(pos):
     return f"OPP {50 - pos}"
 
 
-def compute_next_state(current_state, play_type, play_data, result_data=None):
+def _advance_state(game, plays, entries):
+    """Extend the game's cached state with saved plays; returns the next state."""
+    outcomes = [
+        outcome_of(
+            play,
+            accepted=entry.get('accepted', True),
+            auto_first_down=entry.get('auto_first_down', False),
+        )
+        for play, entry in zip(plays, entries)
+    ]
+    return game_state_cache.append(game.pk, plays, outcomes).as_dict()
+
+
+def _client_key(data):
+    """The tracker's id for a play in the request ``data``, if it sent a usable one."""
+    key = (data or {}).get('key')
+    return key if isinstance(key, str) and 0 < len(key) <= 64 else None
+
+
+def _save_play(game, play, data=None):
     """
-    Calculate next down/distance/ball_position after a play.
+    Save a new play; its score ledger row is written in the same transaction.
 
-    current_state: dict with quarter, down, distance, ball_position
-    play_type: 'run', 'pass', 'penalty', 'kickoff', 'punt', 'field_goal', 'extra_point'
-    play_data: dict of submitted play fields
-    result_data: dict with extra result info (e.g. is_touchdown, yards_gained)
+    A ``key`` in the request ``data`` is kept as the play's client key, so
+    if the response is lost and the tracker later sends the play from its
+    offline queue, tracker_sync skips it instead of recording it twice.
     """
-    result_data = result_data or {}
-    down = current_state.get('down') or 1
-    distance = current_state.get('distance') or 10
-    ball_pos = current_state.get('ball_position') or 0
-    yards = result_data.get('yards_gained', 0)
-
-    # Touchdowns → kickoff state
-    if result_data.get('is_touchdown'):
-        return {
-            'down': None,
-            'distance': None,
-            'ball_position': 35,
-            'situation': 'extra_point',
-        }
+    key = _client_key(data)
+    if key is not None:
+        play.client_key = key
+    play.game = game
+    play.save()
 
-    # Turnovers (interception, fumble lost)
-    if result_data.get('is_interception') or result_data.get('fumble_lost'):
-        new_pos = ball_pos + yards
-        return {
-            'down': 1,
-            'distance': 10,
-            'ball_position': -new_pos,
-            'situation': 'turnover',
-        }
 
-    # Special teams - kickoff
-    if play_type == 'kickoff':
-        if play_data.get('is_touchback'):
-            return {'down': 1, 'distance': 10, 'ball_position': -25, 'situation': 'normal'}
-        return {'down': 1, 'distance': 10, 'ball_position': -25, 'situation': 'normal'}
-
-    # Special teams - punt
-    if play_type == 'punt':
-        punt_yards = play_data.get('punt_yards', 0)
-        if play_data.get('is_touchback'):
-            return {'down': 1, 'distance': 10, 'ball_position': -20, 'situation': 'opponent_ball'}
-        new_pos = ball_pos + punt_yards
-        return {'down': 1, 'distance': 10, 'ball_position': -new_pos, 'situation': 'opponent_ball'}
-
-    # Field goal
-    if play_type == 'field_goal':
-        fg_result = play_data.get('result', 'MISS')
-        if fg_result == 'GOOD':
-            return {'down': None, 'distance': None, 'ball_position': 35, 'situation': 'kickoff'}
-        # Miss/block → opponent ball at spot
-        return {'down': 1, 'distance': 10, 'ball_position': -ball_pos, 'situation': 'opponent_ball'}
-
-    # Extra point / 2pt
-    if play_type == 'extra_point':
-        return {'down': None, 'distance': None, 'ball_position': 35, 'situation': 'kickoff'}
-
-    # Penalty
-    if play_type == 'penalty':
-        pen_yards = play_data.get('penalty_yards', 0)
-        on_us = play_data.get('on_offense', True)
-        accepted = play_data.get('accepted', True)
-        if not accepted:
-            # Declined penalty — same as no play, advance down
-            return {'down': down + 1, 'distance': distance, 'ball_position': ball_pos, 'situation': 'normal'}
-        if on_us:
-            new_pos = ball_pos - pen_yards
-            new_distance = distance + pen_yards
-        else:
-            new_pos = ball_pos + pen_yards
-            new_distance = distance - pen_yards
-        # Automatic first down penalties
-        auto_first = play_data.get('auto_first_down', False)
-        repeat = play_data.get('repeat_down', False)
-        if auto_first or new_distance <= 0:
-            return {'down': 1, 'distance': 10, 'ball_position': new_pos, 'situation': 'normal'}
-        if repeat:
-            return {'down': down, 'distance': new_distance, 'ball_position': new_pos, 'situation': 'normal'}
-        return {'down': down, 'distance': new_distance, 'ball_position': new_pos, 'situation': 'normal'}
-
-    # Normal run/pass plays
-    new_pos = ball_pos + yards
-    new_distance = distance - yards
-    is_first_down = result_data.get('is_first_down', False)
-
-    if is_first_down or new_distance <= 0:
-        return {'down': 1, 'distance': 10, 'ball_position': new_pos, 'situation': 'normal'}
-
-    new_down = down + 1
-    if new_down > 4:
-        return {'down': 1, 'distance': 10, 'ball_position': -new_pos, 'situation': 'turnover_on_downs'}
+def _add_play(request, pk, build):
+    """
+    Record one play built by ``build`` from the request body.
 
-    return {
-        'down': new_down,
-        'distance': max(new_distance, 1),
-        'ball_position': max(min(new_pos, 50), -50),
-        'situation': 'normal',
-    }
+    The game row is locked while the play is saved, so a request retried
+    with the same ``key`` finds the play the first attempt recorded and
+    gets it back, without recording it again or announcing it twice.
+    """
+    data = json.loads(request.body)
+    key = _client_key(data)
+    with transaction.atomic():
+        game = get_object_or_404(Game.objects.select_for_update(), pk=pk)
+        recorded = game.snaps.filter(client_key=key).first() if key is not None else None
+        if recorded is None:
+            play = build(game, data)
+            _save_play(game, play, data)
+
+    if recorded is not None:
+        last_snap = game.snaps.order_by('-sequence_number').first()
+        next_state = game_state_cache.current(game.pk, last_snap).as_dict()
+        return _recorded_play(game, recorded, next_state, data, replayed=True)
+
+    next_state = _advance_state(game, [play], [data])
+    return _recorded_play(game, play, next_state, data)
+
+
+def _play_response(game, payload):
+    """Return a recorded play to the tracker and tell live viewers which play it was."""
+    publish_play_event(game.pk, 'play', {
+        'play_id': payload['play_id'],
+        'sequence': payload['play_detail']['sequence'],
+        'next_state': payload['next_state'],
+        'team_score': payload['team_score'],
+        'opponent_score': payload['opponent_score'],
+    })
+    return JsonResponse({'success': True, **payload})
 
 
 def _snap_to_dict(snap):
@@ -170,66 +151,21 @@ def _snap_to_dict(snap):
 
 
 # =============================================================================
-# Main page view
+# Play builders
 # =============================================================================
+# Each builder maps submitted tracker fields onto an unsaved snap instance,
+# shared by the single-play endpoints and the batch sync endpoint. Bulk
+# inserts skip save(), so play_result is set here rather than left to it.
 
-@login_required
-def game_tracker(request, pk):
-    """Serve the live game tracker page."""
-    game = get_object_or_404(
-        Game.objects.select_related('season', 'season__team'), pk=pk
-    )
-    team = game.season.team
-    players = Player.objects.filter(team=team, is_active=True).order_by('number')
-
-    # Derive current game state from last snap
-    last_snap = game.snaps.order_by('-sequence_number').first()
-    game_state = {
-        'quarter': last_snap.quarter if last_snap else 1,
-        'down': 1,
-        'distance': 10,
-        'ball_position': 25,
-        'next_sequence': (last_snap.sequence_number + 1) if last_snap else 1,
-        'team_score': game.team_score,
-        'opponent_score': game.opponent_score,
-    }
-
-    # Recent plays
-    recent_plays = game.snaps.order_by('-sequence_number')[:10]
-
-    # Player data as JSON for JS
-    players_list = list(players.values('id', 'number', 'first_name', 'last_name', 'position'))
-
-    context = {
-        'game': game,
-        'team': team,
-        'players': players,
-        'game_state_data': game_state,
-        'players_data': players_list,
-        'recent_plays': recent_plays,
-    }
-    return render(request, 'games/tracker.html', context)
-
-
-# =============================================================================
-# AJAX endpoints
-# =============================================================================
-
-@login_required
-@require_POST
-def tracker_add_run(request, pk):
-    """Add a run play."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
-
-    play = RunPlay.objects.create(
+def _build_run(game, data):
+    return RunPlay(
         game=game,
-        sequence_number=_get_next_sequence(game),
         quarter=data.get('quarter', 1),
         down=data.get('down'),
         distance=data.get('distance'),
         ball_position=data.get('ball_position'),
         formation=data.get('formation', ''),
+        play_result=OffenseSnap.PlayResult.RUN,
         ball_carrier_id=data.get('ball_carrier') or None,
         yards_gained=data.get('yards_gained', 0),
         is_touchdown=data.get('is_touchdown', False),
@@ -239,59 +175,17 @@ def tracker_add_run(request, pk):
         notes=data.get('notes', ''),
     )
 
-    # Auto-update score on TD
-    if play.is_touchdown:
-        game.team_score += 6
-        game.save(update_fields=['team_score'])
-
-    carrier_name = ''
-    if play.ball_carrier:
-        carrier_name = f"#{play.ball_carrier.number} {play.ball_carrier.last_name}"
-
-    result_data = {
-        'yards_gained': play.yards_gained,
-        'is_touchdown': play.is_touchdown,
-        'is_first_down': play.is_first_down,
-        'fumble_lost': play.fumble_lost,
-    }
-    next_state = compute_next_state(
-        {'down': data.get('down'), 'distance': data.get('distance'), 'ball_position': data.get('ball_position')},
-        'run', data, result_data
-    )
-
-    return JsonResponse({
-        'success': True,
-        'play_id': play.id,
-        'play_summary': f"{carrier_name} run for {play.yards_gained} yds",
-        'play_detail': {
-            'type': 'Run',
-            'sequence': play.sequence_number,
-            'quarter': play.quarter,
-            'yards': play.yards_gained,
-            'is_touchdown': play.is_touchdown,
-            'is_first_down': play.is_first_down,
-        },
-        'next_state': next_state,
-        'team_score': game.team_score,
-        'opponent_score': game.opponent_score,
-    })
-
 
-@login_required
-@require_POST
-def tracker_add_pass(request, pk):
-    """Add a pass play."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
-
-    play = PassPlay.objects.create(
+def _build_pass(game, data):
+    was_sacked = data.get('was_sacked', False)
+    return PassPlay(
         game=game,
-        sequence_number=_get_next_sequence(game),
         quarter=data.get('quarter', 1),
         down=data.get('down'),
         distance=data.get('distance'),
         ball_position=data.get('ball_position'),
         formation=data.get('formation', ''),
+        play_result=OffenseSnap.PlayResult.SACK if was_sacked else OffenseSnap.PlayResult.PASS,
         quarterback_id=data.get('quarterback') or None,
         receiver_id=data.get('receiver') or None,
         target_id=data.get('receiver') or None,
@@ -300,146 +194,38 @@ def tracker_add_pass(request, pk):
         is_touchdown=data.get('is_touchdown', False),
         is_first_down=data.get('is_first_down', False),
         is_interception=data.get('is_interception', False),
-        was_sacked=data.get('was_sacked', False),
+        was_sacked=was_sacked,
         sack_yards=data.get('sack_yards', 0),
         fumbled=data.get('fumbled', False),
         fumble_lost=data.get('fumble_lost', False),
         notes=data.get('notes', ''),
     )
 
-    if play.is_touchdown:
-        game.team_score += 6
-        game.save(update_fields=['team_score'])
-
-    qb_name = ''
-    if play.quarterback:
-        qb_name = f"#{play.quarterback.number} {play.quarterback.last_name}"
-    rec_name = ''
-    if play.receiver and play.is_complete:
-        rec_name = f" to #{play.receiver.number} {play.receiver.last_name}"
-
-    yards = play.yards_gained
-    if play.was_sacked:
-        summary = f"{qb_name} sacked for {play.sack_yards} yds"
-        yards = play.sack_yards
-    elif play.is_complete:
-        summary = f"{qb_name}{rec_name} for {play.yards_gained} yds"
-    elif play.is_interception:
-        summary = f"{qb_name} INTERCEPTED"
-    else:
-        summary = f"{qb_name} pass incomplete"
-
-    result_data = {
-        'yards_gained': yards,
-        'is_touchdown': play.is_touchdown,
-        'is_first_down': play.is_first_down,
-        'is_interception': play.is_interception,
-        'fumble_lost': play.fumble_lost,
-    }
-    next_state = compute_next_state(
-        {'down': data.get('down'), 'distance': data.get('distance'), 'ball_position': data.get('ball_position')},
-        'pass', data, result_data
-    )
-
-    return JsonResponse({
-        'success': True,
-        'play_id': play.id,
-        'play_summary': summary,
-        'play_detail': {
-            'type': 'Pass',
-            'sequence': play.sequence_number,
-            'quarter': play.quarter,
-            'yards': yards,
-            'is_complete': play.is_complete,
-            'is_touchdown': play.is_touchdown,
-            'is_interception': play.is_interception,
-        },
-        'next_state': next_state,
-        'team_score': game.team_score,
-        'opponent_score': game.opponent_score,
-    })
-
 
-@login_required
-@require_POST
-def tracker_add_penalty(request, pk):
-    """Add a penalty play."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
-
-    on_offense = data.get('on_offense', True)
+def _build_penalty(game, data):
     accepted = data.get('accepted', True)
     pen_yards = data.get('penalty_yards', 0)
-    description = data.get('penalty_description', '')
-
-    if on_offense:
+    common = {
+        'game': game,
+        'quarter': data.get('quarter', 1),
+        'down': data.get('down'),
+        'distance': data.get('distance'),
+        'ball_position': data.get('ball_position'),
+        'formation': data.get('formation', ''),
+        'penalty_yards': pen_yards if accepted else 0,
+        'penalty_description': data.get('penalty_description', ''),
+        'notes': data.get('notes', ''),
+    }
+    if data.get('on_offense', True):
         # Penalty on our offense — record as OffenseSnap
-        play = OffenseSnap.objects.create(
-            game=game,
-            sequence_number=_get_next_sequence(game),
-            quarter=data.get('quarter', 1),
-            down=data.get('down'),
-            distance=data.get('distance'),
-            ball_position=data.get('ball_position'),
-            formation=data.get('formation', ''),
-            play_result=OffenseSnap.PlayResult.PENALTY,
-            had_penalty=True,
-            penalty_yards=pen_yards if accepted else 0,
-            penalty_description=description,
-            notes=data.get('notes', ''),
-        )
-    else:
-        # Penalty on defense
-        play = DefenseSnap.objects.create(
-            game=game,
-            sequence_number=_get_next_sequence(game),
-            quarter=data.get('quarter', 1),
-            down=data.get('down'),
-            distance=data.get('distance'),
-            ball_position=data.get('ball_position'),
-            formation=data.get('formation', ''),
-            play_result=DefenseSnap.PlayResult.PENALTY,
-            penalty_yards=pen_yards if accepted else 0,
-            penalty_description=description,
-            notes=data.get('notes', ''),
-        )
-
-    status = "accepted" if accepted else "declined"
-    summary = f"PENALTY: {description} ({pen_yards} yds, {status})"
-
-    next_state = compute_next_state(
-        {'down': data.get('down'), 'distance': data.get('distance'), 'ball_position': data.get('ball_position')},
-        'penalty', data
-    )
-
-    return JsonResponse({
-        'success': True,
-        'play_id': play.id,
-        'play_summary': summary,
-        'play_detail': {
-            'type': 'Penalty',
-            'sequence': play.sequence_number,
-            'quarter': play.quarter,
-            'penalty': description,
-            'yards': pen_yards,
-            'accepted': accepted,
-        },
-        'next_state': next_state,
-        'team_score': game.team_score,
-        'opponent_score': game.opponent_score,
-    })
+        return OffenseSnap(play_result=OffenseSnap.PlayResult.PENALTY, had_penalty=True, **common)
+    # Penalty on defense
+    return DefenseSnap(play_result=DefenseSnap.PlayResult.PENALTY, **common)
 
 
-@login_required
-@require_POST
-def tracker_add_kickoff(request, pk):
-    """Add a kickoff play."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
-
-    play = KickoffSnap.objects.create(
+def _build_kickoff(game, data):
+    return KickoffSnap(
         game=game,
-        sequence_number=_get_next_sequence(game),
         quarter=data.get('quarter', 1),
         down=None,
         distance=None,
@@ -454,36 +240,10 @@ def tracker_add_kickoff(request, pk):
         notes=data.get('notes', ''),
     )
 
-    summary = f"Kickoff for {play.kick_yards} yds"
-    if play.is_touchback:
-        summary += " (touchback)"
-
-    next_state = compute_next_state(
-        {'down': None, 'distance': None, 'ball_position': 35},
-        'kickoff', data
-    )
-
-    return JsonResponse({
-        'success': True,
-        'play_id': play.id,
-        'play_summary': summary,
-        'play_detail': {'type': 'Kickoff', 'sequence': play.sequence_number, 'quarter': play.quarter},
-        'next_state': next_state,
-        'team_score': game.team_score,
-        'opponent_score': game.opponent_score,
-    })
-
 
-@login_required
-@require_POST
-def tracker_add_punt(request, pk):
-    """Add a punt play."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
-
-    play = PuntSnap.objects.create(
+def _build_punt(game, data):
+    return PuntSnap(
         game=game,
-        sequence_number=_get_next_sequence(game),
         quarter=data.get('quarter', 1),
         down=data.get('down'),
         distance=data.get('distance'),
@@ -497,38 +257,10 @@ def tracker_add_punt(request, pk):
         notes=data.get('notes', ''),
     )
 
-    summary = f"Punt for {play.punt_yards} yds"
-    if play.is_touchback:
-        summary += " (touchback)"
-    if play.is_blocked:
-        summary = "BLOCKED punt"
-
-    next_state = compute_next_state(
-        {'down': data.get('down'), 'distance': data.get('distance'), 'ball_position': data.get('ball_position')},
-        'punt', data
-    )
-
-    return JsonResponse({
-        'success': True,
-        'play_id': play.id,
-        'play_summary': summary,
-        'play_detail': {'type': 'Punt', 'sequence': play.sequence_number, 'quarter': play.quarter},
-        'next_state': next_state,
-        'team_score': game.team_score,
-        'opponent_score': game.opponent_score,
-    })
-
-
-@login_required
-@require_POST
-def tracker_add_field_goal(request, pk):
-    """Add a field goal attempt."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
 
-    play = FieldGoalSnap.objects.create(
+def _build_field_goal(game, data):
+    return FieldGoalSnap(
         game=game,
-        sequence_number=_get_next_sequence(game),
         quarter=data.get('quarter', 1),
         down=data.get('down'),
         distance=data.get('distance'),
@@ -540,81 +272,330 @@ def tracker_add_field_goal(request, pk):
         notes=data.get('notes', ''),
     )
 
+
+def _build_extra_point(game, data):
+    return ExtraPointSnap(
+        game=game,
+        quarter=data.get('quarter', 1),
+        down=None,
+        distance=None,
+        ball_position=data.get('ball_position', 3),
+        formation=data.get('formation', ''),
+        attempt_type=data.get('attempt_type', 'KICK'),
+        result=data.get('result', 'MISS'),
+        kicker_id=data.get('kicker') or None,
+        ball_carrier_id=data.get('ball_carrier') or None,
+        passer_id=data.get('passer') or None,
+        receiver_id=data.get('receiver') or None,
+        notes=data.get('notes', ''),
+    )
+
+
+PLAY_BUILDERS = {
+    'run': _build_run,
+    'pass': _build_pass,
+    'penalty': _build_penalty,
+    'kickoff': _build_kickoff,
+    'punt': _build_punt,
+    'field_goal': _build_field_goal,
+    'extra_point': _build_extra_point,
+}
+
+
+# =============================================================================
+# Play summaries
+# =============================================================================
+# Each describer turns a saved play into the feed's summary line and the
+# type-specific play_detail, for the endpoint that recorded it and for
+# redo. ``data`` is the submitted entry; redo has none.
+
+def _player_label(player):
+    return f"#{player.number} {player.last_name}" if player else ''
+
+
+def _describe_run(play, data):
+    summary = f"{_player_label(play.ball_carrier)} run for {play.yards_gained} yds"
+    return 'Run', summary, {
+        'yards': play.yards_gained,
+        'is_touchdown': play.is_touchdown,
+        'is_first_down': play.is_first_down,
+    }
+
+
+def _describe_pass(play, data):
+    qb_name = _player_label(play.quarterback)
+    yards = play.yards_gained
+    if play.was_sacked:
+        summary = f"{qb_name} sacked for {play.sack_yards} yds"
+        yards = play.sack_yards
+    elif play.is_complete:
+        rec_name = f" to {_player_label(play.receiver)}" if play.receiver else ''
+        summary = f"{qb_name}{rec_name} for {play.yards_gained} yds"
+    elif play.is_interception:
+        summary = f"{qb_name} INTERCEPTED"
+    else:
+        summary = f"{qb_name} pass incomplete"
+    return 'Pass', summary, {
+        'yards': yards,
+        'is_complete': play.is_complete,
+        'is_touchdown': play.is_touchdown,
+        'is_interception': play.is_interception,
+    }
+
+
+def _describe_penalty(play, data):
+    if data:
+        accepted, pen_yards = data.get('accepted', True), data.get('penalty_yards', 0)
+    else:
+        # A redone play: declined penalties were saved without yards
+        accepted, pen_yards = bool(play.penalty_yards), play.penalty_yards
+    status = "accepted" if accepted else "declined"
+    summary = f"PENALTY: {play.penalty_description} ({pen_yards} yds, {status})"
+    return 'Penalty', summary, {
+        'penalty': play.penalty_description,
+        'yards': pen_yards,
+        'accepted': accepted,
+    }
+
+
+def _describe_kickoff(play, data):
+    summary = f"Kickoff for {play.kick_yards} yds"
+    if play.is_touchback:
+        summary += " (touchback)"
+    return 'Kickoff', summary, {}
+
+
+def _describe_punt(play, data):
+    summary = f"Punt for {play.punt_yards} yds"
+    if play.is_touchback:
+        summary += " (touchback)"
+    if play.is_blocked:
+        summary = "BLOCKED punt"
+    return 'Punt', summary, {}
+
+
+def _describe_field_goal(play, data):
     if play.result == 'GOOD':
-        game.team_score += 3
-        game.save(update_fields=['team_score'])
         summary = f"FG GOOD ({play.kick_distance} yds)"
     elif play.result == 'BLOCK':
         summary = f"FG BLOCKED ({play.kick_distance} yds)"
     else:
         summary = f"FG MISSED ({play.kick_distance} yds)"
+    return 'Field Goal', summary, {'result': play.result}
 
-    next_state = compute_next_state(
-        {'down': data.get('down'), 'distance': data.get('distance'), 'ball_position': data.get('ball_position')},
-        'field_goal', {'result': play.result}
-    )
 
-    return JsonResponse({
-        'success': True,
+def _describe_extra_point(play, data):
+    if play.attempt_type == 'KICK':
+        summary = f"PAT {'GOOD' if play.result == 'GOOD' else play.result}"
+    else:
+        summary = f"2-PT {'GOOD' if play.result == 'GOOD' else 'FAILED'}"
+    return 'Extra Point', summary, {}
+
+
+PLAY_DESCRIBERS = {
+    RunPlay: _describe_run,
+    PassPlay: _describe_pass,
+    OffenseSnap: _describe_penalty,
+    DefenseSnap: _describe_penalty,
+    KickoffSnap: _describe_kickoff,
+    PuntSnap: _describe_punt,
+    FieldGoalSnap: _describe_field_goal,
+    ExtraPointSnap: _describe_extra_point,
+}
+
+
+def _recorded_play(game, play, next_state, data=None, replayed=False):
+    """
+    The tracker response for a saved play, described like the feed shows it.
+
+    A ``replayed`` play was recorded by an earlier request, so live viewers
+    already know about it.
+    """
+    describe = PLAY_DESCRIBERS.get(type(play))
+    if describe is None:
+        # Snap types the tracker does not record, put back by redo
+        kind, summary, detail = play._meta.verbose_name.title(), str(play), {}
+    else:
+        kind, summary, detail = describe(play, data or {})
+    payload = {
         'play_id': play.id,
         'play_summary': summary,
-        'play_detail': {'type': 'Field Goal', 'sequence': play.sequence_number, 'quarter': play.quarter, 'result': play.result},
+        'play_detail': {
+            'type': kind,
+            'sequence': play.sequence_number,
+            'quarter': play.quarter,
+            **detail,
+        },
         'next_state': next_state,
         'team_score': game.team_score,
         'opponent_score': game.opponent_score,
-    })
+    }
+    if replayed:
+        return JsonResponse({'success': True, 'replayed': True, **payload})
+    return _play_response(game, payload)
 
 
+# =============================================================================
+# Main page view
+# =============================================================================
+
+@login_required
+def game_tracker(request, pk):
+    """Serve the live game tracker page."""
+    game = get_object_or_404(
+        Game.objects.select_related('season', 'season__team'), pk=pk
+    )
+    team = game.season.team
+    players = Player.objects.filter(team=team, is_active=True).order_by('number')
+
+    # Current game state, replayed from the snaps if not cached
+    last_snap = game.snaps.order_by('-sequence_number').first()
+    game_state = {
+        **game_state_cache.current(game.pk, last_snap).as_dict(),
+        'next_sequence': game.last_sequence_number + 1,
+        'team_score': game.team_score,
+        'opponent_score': game.opponent_score,
+    }
+
+    # Recent plays
+    recent_plays = downcast_snaps(game.snaps.order_by('-sequence_number')[:10])
+
+    # Player data as JSON for JS
+    players_list = list(players.values('id', 'number', 'first_name', 'last_name', 'position'))
+
+    context = {
+        'game': game,
+        'team': team,
+        'players': players,
+        'game_state_data': game_state,
+        'players_data': players_list,
+        'recent_plays': recent_plays,
+    }
+    return render(request, 'games/tracker.html', context)
+
+
+# =============================================================================
+# AJAX endpoints
+# =============================================================================
+
 @login_required
 @require_POST
-def tracker_add_extra_point(request, pk):
-    """Add an extra point / 2-point conversion attempt."""
-    game = get_object_or_404(Game, pk=pk)
-    data = json.loads(request.body)
+def tracker_add_run(request, pk):
+    """Add a run play."""
+    return _add_play(request, pk, _build_run)
 
-    attempt_type = data.get('attempt_type', 'KICK')
-    result = data.get('result', 'MISS')
 
-    play = ExtraPointSnap.objects.create(
-        game=game,
-        sequence_number=_get_next_sequence(game),
-        quarter=data.get('quarter', 1),
-        down=None,
-        distance=None,
-        ball_position=data.get('ball_position', 3),
-        formation=data.get('formation', ''),
-        attempt_type=attempt_type,
-        result=result,
-        kicker_id=data.get('kicker') or None,
-        ball_carrier_id=data.get('ball_carrier') or None,
-        passer_id=data.get('passer') or None,
-        receiver_id=data.get('receiver') or None,
-        notes=data.get('notes', ''),
-    )
+@login_required
+@require_POST
+def tracker_add_pass(request, pk):
+    """Add a pass play."""
+    return _add_play(request, pk, _build_pass)
 
-    # Score updates
-    if result == 'GOOD':
-        if attempt_type == 'KICK':
-            game.team_score += 1
-        else:
-            game.team_score += 2
-        game.save(update_fields=['team_score'])
 
-    if attempt_type == 'KICK':
-        summary = f"PAT {'GOOD' if result == 'GOOD' else result}"
-    else:
-        summary = f"2-PT {'GOOD' if result == 'GOOD' else 'FAILED'}"
+@login_required
+@require_POST
+def tracker_add_penalty(request, pk):
+    """Add a penalty play."""
+    return _add_play(request, pk, _build_penalty)
 
-    next_state = compute_next_state(
-        {'down': None, 'distance': None, 'ball_position': 3},
-        'extra_point', data
-    )
 
+@login_required
+@require_POST
+def tracker_add_kickoff(request, pk):
+    """Add a kickoff play."""
+    return _add_play(request, pk, _build_kickoff)
+
+
+@login_required
+@require_POST
+def tracker_add_punt(request, pk):
+    """Add a punt play."""
+    return _add_play(request, pk, _build_punt)
+
+
+@login_required
+@require_POST
+def tracker_add_field_goal(request, pk):
+    """Add a field goal attempt."""
+    return _add_play(request, pk, _build_field_goal)
+
+
+@login_required
+@require_POST
+def tracker_add_extra_point(request, pk):
+    """Add an extra point / 2-point conversion attempt."""
+    return _add_play(request, pk, _build_extra_point)
+
+
+@login_required
+@require_POST
+def tracker_sync(request, pk):
+    """
+    Apply an ordered batch of plays recorded while offline.
+
+    Body: {"plays": [{"key": "<client id>", "type": "run", ...fields}, ...]}
+    where type is any of PLAY_BUILDERS. Keys already synced for this game
+    are skipped, so replaying a batch never duplicates plays. The batch is
+    inserted in one transaction with its score ledger rows.
+    """
+    try:
+        plays = json.loads(request.body).get('plays')
+    except (ValueError, AttributeError):
+        plays = None
+    if not isinstance(plays, list) or not plays:
+        return JsonResponse({'success': False, 'error': 'Expected a non-empty "plays" list'}, status=400)
+
+    for index, entry in enumerate(plays):
+        if not isinstance(entry, dict) or entry.get('type') not in PLAY_BUILDERS:
+            return JsonResponse({'success': False, 'error': f'Play {index}: unknown play type'}, status=400)
+        key = entry.get('key')
+        if not isinstance(key, str) or not key or len(key) > 64:
+            return JsonResponse({'success': False, 'error': f'Play {index}: missing or invalid key'}, status=400)
+
+    try:
+        with transaction.atomic():
+            # Lock the game row so concurrent syncs of the same batch serialize
+            game = get_object_or_404(Game.objects.select_for_update(), pk=pk)
+            keys = [entry['key'] for entry in plays]
+            synced = set(game.snaps.filter(client_key__in=keys).values_list('client_key', flat=True))
+
+            new_plays, new_entries = [], []
+            for entry in plays:
+                if entry['key'] in synced:
+                    continue
+                synced.add(entry['key'])
+                play = PLAY_BUILDERS[entry['type']](game, entry)
+                play.client_key = entry['key']
+                new_plays.append(play)
+                new_entries.append(entry)
+
+            if new_plays:
+                assign_sequence_numbers(new_plays)
+                bulk_create_snaps(new_plays)
+    except (IntegrityError, DataError, ValueError):
+        return JsonResponse({'success': False, 'error': 'Invalid play data in batch'}, status=400)
+
+    created_keys = {play.client_key for play in new_plays}
+    if new_plays:
+        next_state = _advance_state(game, new_plays, new_entries)
+        # A batch can be any size; viewers fetch its rows by sequence range
+        publish_play_event(game.pk, 'sync', {
+            'first_sequence': new_plays[0].sequence_number,
+            'last_sequence': new_plays[-1].sequence_number,
+            'next_state': next_state,
+            'team_score': game.team_score,
+            'opponent_score': game.opponent_score,
+        })
+    else:
+        last_snap = game.snaps.order_by('-sequence_number').first()
+        next_state = game_state_cache.current(game.pk, last_snap).as_dict()
     return JsonResponse({
         'success': True,
-        'play_id': play.id,
-        'play_summary': summary,
-        'play_detail': {'type': 'Extra Point', 'sequence': play.sequence_number, 'quarter': play.quarter},
+        'created': [
+            {'key': play.client_key, 'play_id': play.id, 'sequence': play.sequence_number}
+            for play in new_plays
+        ],
+        'skipped': [key for key in keys if key not in created_keys],
         'next_state': next_state,
         'team_score': game.team_score,
         'opponent_score': game.opponent_score,
@@ -624,15 +605,20 @@ def tracker_add_extra_point(request, pk):
 @login_required
 @require_POST
 def tracker_update_score(request, pk):
-    """Manually update the game score."""
-    game = get_object_or_404(Game, pk=pk)
+    """Manually correct the game score, recorded as a ledger adjustment."""
     data = json.loads(request.body)
 
-    if 'team_score' in data:
-        game.team_score = int(data['team_score'])
-    if 'opponent_score' in data:
-        game.opponent_score = int(data['opponent_score'])
-    game.save(update_fields=['team_score', 'opponent_score'])
+    with transaction.atomic():
+        game = get_object_or_404(Game.objects.select_for_update(), pk=pk)
+        ScoreEntry.objects.adjust(
+            game,
+            team_score=int(data['team_score']) if 'team_score' in data else None,
+            opponent_score=int(data['opponent_score']) if 'opponent_score' in data else None,
+        )
+    publish_play_event(game.pk, 'score', {
+        'team_score': game.team_score,
+        'opponent_score': game.opponent_score,
+    })
 
     return JsonResponse({
         'success': True,
@@ -644,61 +630,88 @@ def tracker_update_score(request, pk):
 @login_required
 @require_POST
 def tracker_undo_play(request, pk):
-    """Delete the most recent play."""
-    game = get_object_or_404(Game, pk=pk)
-    last_snap = game.snaps.order_by('-sequence_number').first()
-
-    if not last_snap:
-        return JsonResponse({'success': False, 'error': 'No plays to undo'})
-
-    snap_info = {
-        'id': last_snap.id,
-        'sequence_number': last_snap.sequence_number,
-    }
+    """
+    Delete the most recent play and take back its points.
 
-    # Check if we need to reverse score changes
-    actual = last_snap.get_real_instance()
-    if isinstance(actual, RunPlay) and actual.is_touchdown:
-        game.team_score = max(0, game.team_score - 6)
-        game.save(update_fields=['team_score'])
-    elif isinstance(actual, PassPlay) and actual.is_touchdown:
-        game.team_score = max(0, game.team_score - 6)
-        game.save(update_fields=['team_score'])
-    elif isinstance(actual, FieldGoalSnap) and actual.result == 'GOOD':
-        game.team_score = max(0, game.team_score - 3)
-        game.save(update_fields=['team_score'])
-    elif isinstance(actual, ExtraPointSnap) and actual.result == 'GOOD':
-        if actual.attempt_type == 'KICK':
-            game.team_score = max(0, game.team_score - 1)
-        else:
-            game.team_score = max(0, game.team_score - 2)
-        game.save(update_fields=['team_score'])
+    The snap and its score ledger row are deleted in one transaction under
+    the game row lock, so the score can never be left half reversed. The
+    play goes on the game's redo stack; repeated undos walk further back.
+    """
+    with transaction.atomic():
+        game = get_object_or_404(Game.objects.select_for_update(), pk=pk)
+        last_snap = game.snaps.order_by('-sequence_number').first()
 
-    last_snap.delete()
+        if not last_snap:
+            return JsonResponse({'success': False, 'error': 'No plays to undo'})
 
-    # Get new last snap for state
-    new_last = game.snaps.order_by('-sequence_number').first()
+        snap_info = {
+            'id': last_snap.id,
+            'sequence_number': last_snap.sequence_number,
+        }
+        undone = last_snap.get_real_instance()
+        # Deleting the snap takes its points back from this game instance
+        undone.game = game
+        UndonePlay.objects.push(undone, REDO_DEPTH)
+        undone.delete()
+        Game.objects.release_sequence_number(game.pk, snap_info['sequence_number'])
+        new_last = game.snaps.order_by('-sequence_number').first()
+
+    # Step the cached state back to before the deleted play
+    next_state = game_state_cache.undo(game.pk, snap_info['sequence_number'], new_last)
+
+    publish_play_event(game.pk, 'undo', {
+        'deleted': snap_info,
+        'next_state': next_state.as_dict(),
+        'team_score': game.team_score,
+        'opponent_score': game.opponent_score,
+    })
 
     return JsonResponse({
         'success': True,
         'deleted': snap_info,
+        'next_state': next_state.as_dict(),
         'team_score': game.team_score,
         'opponent_score': game.opponent_score,
     })
 
 
+@login_required
+@require_POST
+def tracker_redo_play(request, pk):
+    """Put back the most recently undone play, with its points."""
+    with transaction.atomic():
+        game = get_object_or_404(Game.objects.select_for_update(), pk=pk)
+        play = UndonePlay.objects.pop(game.pk, game.last_sequence_number + 1)
+
+        if play is None:
+            return JsonResponse({'success': False, 'error': 'Nothing to redo'})
+
+        # Insert it again as a new row under its old sequence number
+        _save_play(game, play)
+        UndonePlay.objects.restore_assists(play)
+
+    return _recorded_play(game, play, game_state_cache.append(game.pk, [play]).as_dict())
+
+
 @login_required
 @require_GET
 def tracker_recent_plays(request, pk):
-    """Get recent plays for the feed."""
+    """
+    Get recent plays for the feed, newest first.
+
+    ``after`` limits them to plays with a higher sequence number, which is
+    how live viewers fetch the plays a feed event announced.
+    """
     game = get_object_or_404(Game, pk=pk)
     limit = int(request.GET.get('limit', 10))
-    snaps = game.snaps.order_by('-sequence_number')[:limit]
+    snaps = game.snaps.all()
+    if 'after' in request.GET:
+        snaps = snaps.filter(sequence_number__gt=int(request.GET['after']))
+    snaps = snaps.order_by('-sequence_number')[:limit]
 
     plays = []
-    for snap in snaps:
-        actual = snap.get_real_instance()
-        info = _snap_to_dict(snap)
+    for actual in downcast_snaps(snaps):
+        info = _snap_to_dict(actual)
 
         # Add type-specific summary
         if isinstance(actual, RunPlay):
@@ -730,3 +743,67 @@ def tracker_recent_plays(request, pk):
         plays.append(info)
 
     return JsonResponse({'success': True, 'plays': plays})
+
+
+def _sse_message(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+def _feed_event_stream(subscription):
+    """Yield server-sent events for one subscription until it times out."""
+    try:
+        # Tell EventSource how fast to reconnect once this stream ends
+        yield 'retry: 3000\n\n'
+        deadline = time.monotonic() + FEED_MAX_DURATION
+        while time.monotonic() < deadline:
+            event = subscription.get(timeout=FEED_KEEPALIVE)
+            if event is None:
+                yield ': keepalive\n\n'
+                continue
+            yield _sse_message(event)
+    finally:
+        subscription.close()
+
+
+async def _async_feed_event_stream(subscription):
+    """``_feed_event_stream`` for an ``AsyncSubscription``, waiting on the event loop."""
+    try:
+        yield 'retry: 3000\n\n'
+        deadline = time.monotonic() + FEED_MAX_DURATION
+        while time.monotonic() < deadline:
+            event = await subscription.aget(timeout=FEED_KEEPALIVE)
+            if event is None:
+                yield ': keepalive\n\n'
+                continue
+            yield _sse_message(event)
+    finally:
+        subscription.close()
+
+
+@require_GET
+async def tracker_live_feed(request, pk):
+    """
+    Server-sent events stream of plays as they are recorded.
+
+    Viewers load tracker_recent_plays once, then follow this stream for
+    'play', 'sync', 'undo' and 'score' events instead of polling, fetching
+    the plays an event names from tracker_recent_plays.
+
+    Deployed under ASGI (the ``feed`` service), an open stream is a
+    suspended coroutine rather than a gunicorn thread. Under WSGI
+    (runserver, the test client) it falls back to a blocking stream.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return redirect_to_login(request.get_full_path())
+    game = await aget_object_or_404(Game.objects.only('pk'), pk=pk)
+
+    if isinstance(request, ASGIRequest):
+        stream = _async_feed_event_stream(get_play_feed().subscribe(game.pk, AsyncSubscription))
+    else:
+        stream = _feed_event_stream(get_play_feed().subscribe(game.pk))
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -19,8 +19,13 @@ urlpatterns = [
     path('games/<int:pk>/tracker/field-goal/', tracker.tracker_add_field_goal, name='add_field_goal'),
     path('games/<int:pk>/tracker/extra-point/', tracker.tracker_add_extra_point, name='add_extra_point'),
 
+    # Offline batch sync
+    path('games/<int:pk>/tracker/sync/', tracker.tracker_sync, name='sync'),
+
     # Game state endpoints
     path('games/<int:pk>/tracker/update-score/', tracker.tracker_update_score, name='update_score'),
     path('games/<int:pk>/tracker/undo/', tracker.tracker_undo_play, name='undo_play'),
+    path('games/<int:pk>/tracker/redo/', tracker.tracker_redo_play, name='redo_play'),
     path('games/<int:pk>/tracker/plays/', tracker.tracker_recent_plays, name='recent_plays'),
+    path('games/<int:pk>/tracker/live/', tracker.tracker_live_feed, name='live_feed'),
 ]
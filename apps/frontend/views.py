@@ -12,7 +12,8 @@ from django.db.models import Sum, Count, F, Q
 from apps.teams.models import Team, Player, Season
 from apps.games.models import Game, QuarterScore
 from apps.snaps.models import BaseSnap, RunPlay, PassPlay, DefenseSnap
-from apps.reports.services import OffenseReportService, DefenseReportService, SpecialTeamsReportService
+from apps.snaps.querysets import downcast_snaps
+from apps.reports.services import ReportBundleService
 
 
 # =============================================================================
@@ -396,10 +397,10 @@ def game_detail(request, pk):
         }
 
     # Get game stats using services
-    offense_service = OffenseReportService(game_ids=[game.id])
+    offense = ReportBundleService(game_ids=[game.id]).get_bundle()['offense']
     stats = {
-        'rushing': offense_service.get_rushing_totals(),
-        'passing': offense_service.get_passing_totals(),
+        'rushing': offense['rushing_totals'],
+        'passing': offense['passing_totals'],
     }
     stats['total_yards'] = (stats['rushing'].get('yards', 0) or 0) + (stats['passing'].get('yards', 0) or 0)
     stats['turnovers'] = (
@@ -408,9 +409,9 @@ def game_detail(request, pk):
     )
 
     # Get top performers
-    rushing_leaders = offense_service.get_rushing_by_player()
-    passing_leaders = offense_service.get_passing_by_quarterback()
-    receiving_leaders = offense_service.get_receiving_by_player()
+    rushing_leaders = offense['rushing_by_player']
+    passing_leaders = offense['passing_by_quarterback']
+    receiving_leaders = offense['receiving_by_player']
 
     top_rusher = rushing_leaders[0] if rushing_leaders else None
     top_passer = passing_leaders[0] if passing_leaders else None
@@ -449,7 +450,7 @@ def game_plays(request, pk):
 
     return render(request, 'games/plays.html', {
         'game': game,
-        'plays': plays,
+        'plays': downcast_snaps(plays),
         'current_quarter': quarter,
         'summary': summary,
     })
@@ -531,18 +532,18 @@ def report_offense(request):
 
     kwargs = {}
     if season_id:
-        kwargs['season_ids'] = [int(season_id)]
+        kwargs['season_id'] = int(season_id)
     if game_id:
         kwargs['game_ids'] = [int(game_id)]
 
-    service = OffenseReportService(**kwargs)
+    offense = ReportBundleService(**kwargs).get_bundle()['offense']
 
     return render(request, 'reports/offense.html', {
-        'rushing_totals': service.get_rushing_totals(),
-        'passing_totals': service.get_passing_totals(),
-        'rushing_by_player': service.get_rushing_by_player(),
-        'passing_by_qb': service.get_passing_by_quarterback(),
-        'receiving_by_player': service.get_receiving_by_player(),
+        'rushing_totals': offense['rushing_totals'],
+        'passing_totals': offense['passing_totals'],
+        'rushing_by_player': offense['rushing_by_player'],
+        'passing_by_qb': offense['passing_by_quarterback'],
+        'receiving_by_player': offense['receiving_by_player'],
         'seasons': Season.objects.all(),
         'games': Game.objects.order_by('-date')[:50],
         'season': Season.objects.filter(pk=season_id).first() if season_id else None,
@@ -557,15 +558,15 @@ def report_defense(request):
 
     kwargs = {}
     if season_id:
-        kwargs['season_ids'] = [int(season_id)]
+        kwargs['season_id'] = int(season_id)
     if game_id:
         kwargs['game_ids'] = [int(game_id)]
 
-    service = DefenseReportService(**kwargs)
+    defense = ReportBundleService(**kwargs).get_bundle()['defense']
 
     return render(request, 'reports/defense.html', {
-        'team_totals': service.get_team_totals(),
-        'player_stats': service.get_player_summary(),
+        'team_totals': defense['team_totals'],
+        'player_stats': defense['player_summary'],
         'seasons': Season.objects.all(),
         'games': Game.objects.order_by('-date')[:50],
         'season': Season.objects.filter(pk=season_id).first() if season_id else None,
@@ -580,18 +581,18 @@ def report_special_teams(request):
 
     kwargs = {}
     if season_id:
-        kwargs['season_ids'] = [int(season_id)]
+        kwargs['season_id'] = int(season_id)
     if game_id:
         kwargs['game_ids'] = [int(game_id)]
 
-    service = SpecialTeamsReportService(**kwargs)
+    special_teams = ReportBundleService(**kwargs).get_bundle()['special_teams']
 
     return render(request, 'reports/special_teams.html', {
-        'fg_totals': service.get_field_goal_totals(),
-        'pat_totals': service.get_extra_point_totals(),
-        'punt_totals': service.get_punt_totals(),
-        'kickoff_totals': service.get_kickoff_totals(),
-        'kickers': service.get_field_goal_by_kicker(),
+        'fg_totals': special_teams['field_goal_totals'],
+        'pat_totals': special_teams['extra_point_totals'],
+        'punt_totals': special_teams['punt_totals'],
+        'kickoff_totals': special_teams['kickoff_totals'],
+        'kickers': special_teams['field_goal_by_kicker'],
         'seasons': Season.objects.all(),
         'games': Game.objects.order_by('-date')[:50],
         'season': Season.objects.filter(pk=season_id).first() if season_id else None,
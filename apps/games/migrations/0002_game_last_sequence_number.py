@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='last_sequence_number',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,10 +1,56 @@
 """
 Game and QuarterScore models.
 """
-from django.db import models
+from django.db import connection, models, transaction
+from django.utils import timezone
 from apps.core.models import TimeStampedModel
 
 
+class GameManager(models.Manager):
+    """
+    Manager for Game with the per-game snap sequence allocator.
+
+    Sequence numbers are handed out from a counter column on the game row
+    so concurrent sideline devices never read the same MAX(sequence_number).
+    """
+
+    def allocate_sequence_number(self, game_id: int) -> int:
+        """Atomically bump the game's counter and return the new value."""
+        return self.allocate_sequence_block(game_id, 1).start
+
+    def allocate_sequence_block(self, game_id: int, count: int) -> range:
+        """Reserve ``count`` consecutive sequence numbers in one statement."""
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {qn(self.model._meta.db_table)} "
+                f"SET {qn('last_sequence_number')} = {qn('last_sequence_number')} + %s "
+                f"WHERE {qn('id')} = %s "
+                f"RETURNING {qn('last_sequence_number')}",
+                [count, game_id],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise self.model.DoesNotExist(f"Game {game_id} does not exist")
+        return range(row[0] - count + 1, row[0] + 1)
+
+    def reserve_sequence_number(self, game_id: int, sequence_number: int) -> None:
+        """Advance the counter past an explicitly supplied sequence number."""
+        self.filter(pk=game_id, last_sequence_number__lt=sequence_number).update(
+            last_sequence_number=sequence_number
+        )
+
+    def touch(self, game_id: int) -> None:
+        """Bump ``updated_at`` after a change stored outside the game row."""
+        self.filter(pk=game_id).update(updated_at=timezone.now())
+
+    def release_sequence_number(self, game_id: int, sequence_number: int) -> None:
+        """Hand back the most recent number after its snap is deleted."""
+        self.filter(pk=game_id, last_sequence_number=sequence_number).update(
+            last_sequence_number=sequence_number - 1
+        )
+
+
 class Game(TimeStampedModel):
     """
     Represents a single football game with conditions and final scores.
@@ -43,6 +89,11 @@ class Game(TimeStampedModel):
 
     notes = models.TextField(blank=True)
 
+    # Highest snap sequence number handed out for this game
+    last_sequence_number = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = GameManager()
+
     class Meta:
         db_table = "games"
         ordering = ["-date"]
@@ -53,6 +104,18 @@ class Game(TimeStampedModel):
     def __str__(self):
         return f"{self.season.team.abbreviation} vs {self.opponent} ({self.date})"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        from apps.snaps.models import ScoreEntry
+
+        # A game created with a score opens its ledger with it
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            ScoreEntry.objects.open(self)
+
     @property
     def is_win(self):
         return self.team_score > self.opponent_score
@@ -91,3 +154,13 @@ class QuarterScore(models.Model):
 
     def __str__(self):
         return f"{self.game} Q{self.quarter}: {self.team_score}-{self.opponent_score}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Quarter scores are part of the game's representation
+        Game.objects.touch(self.game_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Game.objects.touch(self.game_id)
+        return result
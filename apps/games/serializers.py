@@ -1,7 +1,11 @@
 """
 Serializers for Game and QuarterScore models.
 """
+from django.db import transaction
 from rest_framework import serializers
+from apps.core.mixins import TeamScopedFieldsMixin
+from apps.core.sparse import SparseFieldsMixin
+from apps.snaps.models import ScoreEntry
 from apps.teams.models import Season
 from apps.teams.serializers import SeasonMinimalSerializer
 from .models import Game, QuarterScore
@@ -15,7 +19,7 @@ class QuarterScoreSerializer(serializers.ModelSerializer):
         fields = ["id", "quarter", "team_score", "opponent_score"]
 
 
-class GameReadSerializer(serializers.ModelSerializer):
+class GameReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Full Game serializer for GET requests."""
 
     season = SeasonMinimalSerializer(read_only=True)
@@ -54,7 +58,7 @@ class GameReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class GameWriteSerializer(serializers.ModelSerializer):
+class GameWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """Game serializer for POST/PUT requests."""
 
     season_id = serializers.PrimaryKeyRelatedField(
@@ -75,6 +79,18 @@ class GameWriteSerializer(serializers.ModelSerializer):
             "notes",
         ]
 
+    def update(self, instance, validated_data):
+        """Score edits go through the ledger as an adjustment."""
+        team_score = validated_data.pop("team_score", None)
+        opponent_score = validated_data.pop("opponent_score", None)
+        with transaction.atomic():
+            # Start from the current score, under the row lock
+            current = Game.objects.select_for_update().only("team_score", "opponent_score")
+            locked = current.get(pk=instance.pk)
+            instance.team_score, instance.opponent_score = locked.team_score, locked.opponent_score
+            ScoreEntry.objects.adjust(instance, team_score=team_score, opponent_score=opponent_score)
+            return super().update(instance, validated_data)
+
 
 class GameMinimalSerializer(serializers.ModelSerializer):
     """Minimal Game serializer for nested responses."""
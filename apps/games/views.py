@@ -1,9 +1,20 @@
 """
 ViewSets for Game and QuarterScore models.
 """
+from django.db.models import OuterRef, Subquery
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from apps.core.conditional import ConditionalModelMixin, make_etag
+from apps.core.mixins import CompiledListMixin, SparseFieldsetMixin, TeamScopedMixin
+from apps.core.pagination import TimelineCursorPagination
+from apps.core.sparse import select_related_paths
+from apps.reports.cache import report_cache
+from apps.reports.models import DataVersion
+from apps.snaps.models import DefenseSnap
+from apps.snaps.querysets import downcast_page
+from apps.snaps.serializers import SnapTimelineSerializer
+from apps.teams.models import Player
 from .models import Game, QuarterScore
 from .serializers import (
     GameReadSerializer,
@@ -13,23 +24,70 @@ from .serializers import (
 from .filters import GameFilter
 
 
-class GameViewSet(viewsets.ModelViewSet):
+def _team_players_modified():
+    """The newest ``updated_at`` of the game's team's players, which timeline rows embed."""
+    return Subquery(
+        Player.objects.filter(team_id=OuterRef("season__team_id"))
+        .order_by("-updated_at")
+        .values("updated_at")[:1]
+    )
+
+
+class GameViewSet(
+    TeamScopedMixin,
+    ConditionalModelMixin,
+    SparseFieldsetMixin,
+    CompiledListMixin,
+    viewsets.ModelViewSet,
+):
     """
     ViewSet for Game CRUD operations.
+
+    Score and quarter score changes touch the game's ``updated_at``, so it
+    alone validates list and detail responses.
     """
 
     queryset = Game.objects.select_related("season", "season__team").prefetch_related(
         "quarter_scores"
     )
+    team_lookup = "season__team_id"
     filterset_class = GameFilter
     search_fields = ["opponent", "notes"]
     ordering_fields = ["date", "team_score", "opponent_score", "created_at"]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "timeline":
+            queryset = queryset.annotate(players_modified=_team_players_modified())
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ["list", "retrieve"]:
             return GameReadSerializer
         return GameWriteSerializer
 
+    def get_validators(self, request):
+        if self.action != "timeline":
+            return super().get_validators(request)
+        try:
+            game = self.get_queryset().filter(pk=self.kwargs["pk"])
+        except (TypeError, ValueError):
+            return None, None
+        row = game.values_list(
+            "updated_at",
+            DataVersion.objects.token_of("game", OuterRef("pk")),
+            "players_modified",
+        ).first()
+        if row is None:
+            return None, None
+        etag = make_etag(
+            "timeline",
+            request.get_full_path(),
+            request.accepted_media_type,
+            *row,
+        )
+        return etag, None
+
     @action(detail=True, methods=["get", "post"])
     def quarter_scores(self, request, pk=None):
         """Get or add quarter scores for a game."""
@@ -47,6 +105,61 @@ class GameViewSet(viewsets.ModelViewSet):
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=TimelineCursorPagination,
+        filter_backends=[],
+    )
+    def timeline(self, request, pk=None):
+        """
+        Every snap in the game, of every type, in sequence order.
+
+        A page costs one query per snap type on it. Pages are cached
+        against the game's snap data version (and its score, which each
+        row's game carries, and its team's players, which rows embed), so
+        they are rebuilt only after a change.
+        """
+        game = self.get_object()
+        return Response(
+            report_cache.get_or_compute_scoped(
+                "GameViewSet.timeline",
+                (
+                    request.build_absolute_uri(),
+                    game.updated_at,
+                    game.team_score,
+                    game.opponent_score,
+                    game.players_modified,
+                ),
+                lambda: self._timeline_page(game),
+                game_ids=[game.pk],
+            )
+        )
+
+    def _timeline_page(self, game):
+        snaps = game.snaps.non_polymorphic().only(
+            "pk", "polymorphic_ctype_id", "game_id", "sequence_number"
+        )
+        _, expand = self.get_sparse_options()
+        page = downcast_page(
+            self.paginate_queryset(snaps),
+            snaps,
+            # Join only the expanded players; the game is already known
+            select_related={
+                model: [
+                    path
+                    for path in select_related_paths(serializer_class())
+                    if path.split("__")[0] in expand and path != "game"
+                ]
+                for model, serializer_class in SnapTimelineSerializer.SERIALIZERS.items()
+            },
+            prefetch_related={DefenseSnap: ["assists__player"]},
+        )
+        serializer = SnapTimelineSerializer(
+            page, many=True, context=self.get_serializer_context()
+        )
+        return self.get_paginated_response(serializer.data).data
+
     @action(detail=True, methods=["get"])
     def summary(self, request, pk=None):
         """Get game summary with basic stats."""
@@ -59,11 +172,12 @@ class GameViewSet(viewsets.ModelViewSet):
         )
 
 
-class QuarterScoreViewSet(viewsets.ModelViewSet):
+class QuarterScoreViewSet(TeamScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for QuarterScore CRUD operations.
     """
 
     queryset = QuarterScore.objects.select_related("game")
+    team_lookup = "game__season__team_id"
     serializer_class = QuarterScoreSerializer
     filterset_fields = ["game", "quarter"]
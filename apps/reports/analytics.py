@@ -0,0 +1,197 @@
+"""
+Columnar situational analytics over snap facts.
+
+``PlayColumns`` loads a filtered set of runs and passes into NumPy arrays
+with one query; each split is then a vectorized group-by over those
+arrays (``np.unique`` / ``np.bincount``) instead of a query per split
+cell. Yards are net of sacks, so a sack counts as a pass play for
+negative yardage.
+"""
+import numpy as np
+
+from apps.snaps.models import SnapFact
+
+RUN = SnapFact.PlayType.RUN
+PASS = SnapFact.PlayType.PASS
+
+# Share of the distance a play must gain to be a success, by down
+SUCCESS_SHARE = {1: 0.4, 2: 0.6, 3: 1.0, 4: 1.0}
+
+# Distance buckets: short is 1-3 yards, medium 4-6, long 7+
+DISTANCE_BUCKETS = ["short", "medium", "long"]
+DISTANCE_EDGES = [4, 7]
+
+# Inside the opponent's 20 (ball_position runs -50 to 50)
+RED_ZONE_START = 30
+
+# Gains that count as explosive, by play type
+EXPLOSIVE_YARDS = {RUN: 10, PASS: 20}
+
+YARDAGE_BINS = ["loss", "0-3", "4-6", "7-9", "10-19", "20+"]
+YARDAGE_EDGES = [0, 4, 7, 10, 20]
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+class PlayColumns:
+    """One array per play attribute for a set of runs and passes."""
+
+    FIELDS = (
+        "play_type", "down", "distance", "ball_position", "formation",
+        "yards_gained", "sack_yards", "was_sacked", "is_touchdown",
+        "is_interception", "fumble_lost",
+    )
+
+    def __init__(self, rows):
+        columns = dict(zip(self.FIELDS, zip(*rows))) if rows else {
+            name: () for name in self.FIELDS
+        }
+        self.size = len(rows)
+        play_type = np.array(columns["play_type"], dtype=object)
+        self.is_run = play_type == RUN
+        self.is_pass = play_type == PASS
+        # Nullable situation columns are floats with NaN for "not recorded"
+        self.down = np.array(columns["down"], dtype=float)
+        self.distance = np.array(columns["distance"], dtype=float)
+        self.ball_position = np.array(columns["ball_position"], dtype=float)
+        self.formation = np.array(columns["formation"], dtype=object)
+
+        was_sacked = np.array(columns["was_sacked"], dtype=bool)
+        gained = np.nan_to_num(np.array(columns["yards_gained"], dtype=float))
+        sack_yards = np.array(columns["sack_yards"], dtype=float)
+        self.yards = gained + np.where(was_sacked, sack_yards, 0)
+        self.touchdown = np.array(columns["is_touchdown"], dtype=bool)
+        turnover = (
+            np.array(columns["is_interception"], dtype=bool)
+            | np.array(columns["fumble_lost"], dtype=bool)
+        )
+
+        share = np.select(
+            [self.down == down for down in SUCCESS_SHARE],
+            list(SUCCESS_SHARE.values()),
+            np.nan,
+        )
+        # Comparisons with NaN are False: no down/distance, no success
+        self.success = ~turnover & (self.touchdown | (self.yards >= share * self.distance))
+        self.explosive = (
+            (self.is_run & (self.yards >= EXPLOSIVE_YARDS[RUN]))
+            | (self.is_pass & (self.yards >= EXPLOSIVE_YARDS[PASS]))
+        )
+
+    @classmethod
+    def load(cls, queryset):
+        """Columns for the runs and passes in a SnapFact queryset."""
+        return cls(list(
+            queryset.filter(play_type__in=[RUN, PASS])
+            .values_list(*cls.FIELDS)
+            .order_by()
+        ))
+
+
+def _group(keys, **values):
+    """
+    Group ``values`` arrays by ``keys``.
+
+    Returns the distinct keys (sorted), the row count of each and, per
+    value array, its sum within each group.
+    """
+    groups, inverse = np.unique(keys, return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(groups))
+    sums = {
+        name: np.bincount(inverse, weights=value, minlength=len(groups))
+        for name, value in values.items()
+    }
+    return groups, counts, sums
+
+
+def _rate(part, whole):
+    return round(float(part) / whole, 3) if whole else 0.0
+
+
+def success_by_down_distance(plays: PlayColumns) -> list[dict]:
+    """Success rate and yards per play for each down and distance bucket."""
+    known = ~np.isnan(plays.down) & ~np.isnan(plays.distance) & (plays.distance > 0)
+    down = plays.down[known].astype(int)
+    bucket = np.digitize(plays.distance[known], DISTANCE_EDGES)
+    groups, counts, sums = _group(
+        down * len(DISTANCE_BUCKETS) + bucket,
+        success=plays.success[known],
+        yards=plays.yards[known],
+    )
+    return [
+        {
+            "down": int(key) // len(DISTANCE_BUCKETS),
+            "distance_bucket": DISTANCE_BUCKETS[int(key) % len(DISTANCE_BUCKETS)],
+            "plays": int(count),
+            "successes": int(successes),
+            "success_rate": _rate(successes, count),
+            "yards_per_play": _rate(yards, count),
+        }
+        for key, count, successes, yards in zip(
+            groups, counts, sums["success"], sums["yards"]
+        )
+    ]
+
+
+def red_zone(plays: PlayColumns) -> dict:
+    """Efficiency of plays snapped inside the opponent's 20."""
+    inside = plays.ball_position >= RED_ZONE_START
+    count = int(inside.sum())
+    touchdowns = int(plays.touchdown[inside].sum())
+    successes = int(plays.success[inside].sum())
+    return {
+        "plays": count,
+        "run_plays": int((inside & plays.is_run).sum()),
+        "pass_plays": int((inside & plays.is_pass).sum()),
+        "touchdowns": touchdowns,
+        "touchdown_rate": _rate(touchdowns, count),
+        "successes": successes,
+        "success_rate": _rate(successes, count),
+        "yards_per_play": _rate(plays.yards[inside].sum(), count),
+    }
+
+
+def explosive_by_formation(plays: PlayColumns) -> list[dict]:
+    """Explosive-play rate per formation, most-used formation first."""
+    if not plays.size:
+        return []
+    groups, counts, sums = _group(
+        plays.formation.astype(str), explosive=plays.explosive, yards=plays.yards
+    )
+    order = np.lexsort((groups, -counts))
+    return [
+        {
+            "formation": str(groups[index]),
+            "plays": int(counts[index]),
+            "explosive": int(sums["explosive"][index]),
+            "explosive_rate": _rate(sums["explosive"][index], counts[index]),
+            "yards_per_play": _rate(sums["yards"][index], counts[index]),
+        }
+        for index in order
+    ]
+
+
+def yards_distribution(plays: PlayColumns) -> dict:
+    """Yards-per-play histogram and percentiles for runs, passes and both."""
+    return {
+        "runs": _distribution(plays.yards[plays.is_run]),
+        "passes": _distribution(plays.yards[plays.is_pass]),
+        "all": _distribution(plays.yards),
+    }
+
+
+def _distribution(yards):
+    counts = np.bincount(np.digitize(yards, YARDAGE_EDGES), minlength=len(YARDAGE_BINS))
+    percentiles = (
+        np.percentile(yards, PERCENTILES) if yards.size else np.zeros(len(PERCENTILES))
+    )
+    return {
+        "plays": int(yards.size),
+        "mean": round(float(yards.mean()), 3) if yards.size else 0.0,
+        "percentiles": {
+            f"p{rank}": float(value) for rank, value in zip(PERCENTILES, percentiles)
+        },
+        "histogram": [
+            {"bin": label, "plays": int(count)}
+            for label, count in zip(YARDAGE_BINS, counts)
+        ],
+    }
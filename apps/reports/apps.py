@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ReportsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.reports"
+
+    def ready(self):
+        from apps.snaps.signals import snap_data_changed
+        from .cache import invalidate_reports
+
+        snap_data_changed.connect(invalidate_reports, dispatch_uid="reports.invalidate")
@@ -0,0 +1,208 @@
+"""
+Versioned result cache for report service methods.
+
+Entries are keyed by ``(service, method, game_ids, season_id, team_id)``
+plus the data version of the scope they cover. Every snap write bumps the
+version of its game, season and team, so cached reports go stale exactly
+when their inputs change and are never explicitly deleted; superseded
+entries age out through the backend's eviction. Unscoped reports follow
+the versions of every team together, so no version row is shared by the
+writes of all games.
+
+Versions live in the database (``DataVersion``), bumped inside the
+writing transaction, so every worker process agrees on them whatever the
+cache backend. Results live in the ``REPORT_CACHE_ALIAS`` entry in
+``CACHES`` (default ``"reports"``): local memory (LRU culling at
+``MAX_ENTRIES``, one copy per process), file-based, or Redis configured
+with an LRU ``maxmemory-policy``.
+"""
+import contextlib
+import functools
+import hashlib
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import DataVersion
+
+DEFAULT_ALIAS = "reports"
+ENTRY_PREFIX = "report"
+
+
+class ReportCache:
+    """Get-or-compute cache for report results with hit/miss counters."""
+
+    def __init__(self, alias=None):
+        self._alias = alias
+        self._lock = threading.Lock()
+        # Versions read by the outermost lookup, reused by the lookups
+        # nested in its computation (one version query per report)
+        self._pinned = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def alias(self):
+        return self._alias or getattr(settings, "REPORT_CACHE_ALIAS", DEFAULT_ALIAS)
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get_or_compute(self, service, method_name, compute):
+        """Return the cached result for ``service.method_name`` or compute it."""
+        with self._pinned_versions():
+            return self._get_or_compute(self._entry_key(service, method_name), compute)
+
+    def get_or_compute_scoped(self, name, params, compute, game_ids=(), season_id=None, team_id=None):
+        """
+        Cache any result derived from snap data, not just a service method.
+
+        ``name`` and ``params`` (a reprable tuple) identify the result; the
+        scope arguments say whose data version it follows, as for a report
+        service with the same filters.
+        """
+        game_ids, season_id, team_id = self._normalize(game_ids, season_id, team_id)
+        with self._pinned_versions():
+            return self._get_or_compute(
+                self._key(name, params, game_ids, season_id, team_id), compute
+            )
+
+    @contextlib.contextmanager
+    def _pinned_versions(self):
+        if getattr(self._pinned, "versions", None) is not None:
+            yield
+            return
+        self._pinned.versions = {}
+        try:
+            yield
+        finally:
+            self._pinned.versions = None
+
+    def _get_or_compute(self, key, compute):
+        missing = object()
+        result = self.backend.get(key, missing)
+        if result is not missing:
+            self._count(hit=True)
+            return result
+
+        self._count(hit=False)
+        result = compute()
+        self.backend.set(key, result)
+        return result
+
+    def version(self, game_ids=(), season_id=None, team_id=None):
+        """
+        The data version of the narrowest scope these filters name.
+
+        One indexed query: cheap enough to decide whether a client's copy
+        of a report is current before computing anything.
+        """
+        return self._versions(*self._normalize(game_ids, season_id, team_id))
+
+    def invalidate(self, scopes):
+        """
+        Bump the data version of every scope a write touched.
+
+        ``scopes`` is an iterable of ``(game_id, season_id, team_id)``.
+        The new versions commit (or roll back) with the write, so a report
+        computed from pre-commit data is keyed by the old version.
+        """
+        keys = set()
+        for game_id, season_id, team_id in scopes:
+            keys.update(
+                (scope, pk)
+                for scope, pk in (("game", game_id), ("season", season_id), ("team", team_id))
+                if pk is not None
+            )
+        if keys:
+            DataVersion.objects.bump(keys)
+
+    def stats(self):
+        """Hit/miss counters for this process."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _entry_key(self, service, method_name):
+        game_ids, season_id, team_id = self._normalize(
+            service.game_ids, service.season_id, service.team_id
+        )
+        return self._key(
+            f"{type(service).__name__}.{method_name}", (), game_ids, season_id, team_id
+        )
+
+    def _key(self, name, params, game_ids, season_id, team_id):
+        raw = repr((
+            name,
+            params,
+            game_ids,
+            season_id,
+            team_id,
+            self._versions(game_ids, season_id, team_id),
+        ))
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        return f"{ENTRY_PREFIX}:{name}:{digest}"
+
+    @staticmethod
+    def _normalize(game_ids, season_id, team_id):
+        return (
+            tuple(sorted({int(pk) for pk in game_ids or ()})),
+            int(season_id) if season_id else None,
+            int(team_id) if team_id else None,
+        )
+
+    def _versions(self, game_ids, season_id, team_id):
+        """Current version tokens for the narrowest scope the filters name."""
+        if game_ids:
+            scope, ids = "game", game_ids
+        elif season_id:
+            scope, ids = "season", (season_id,)
+        elif team_id:
+            scope, ids = "team", (team_id,)
+        else:
+            scope, ids = "team", None
+
+        pinned = getattr(self._pinned, "versions", None)
+        if pinned is None:
+            return DataVersion.objects.tokens(scope, ids)
+        if (scope, ids) not in pinned:
+            pinned[scope, ids] = DataVersion.objects.tokens(scope, ids)
+        return pinned[scope, ids]
+
+
+report_cache = ReportCache()
+
+
+def cached_report(method):
+    """Serve a report service method through ``report_cache``."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if args or kwargs:
+            return method(self, *args, **kwargs)
+        return report_cache.get_or_compute(self, method.__name__, lambda: method(self))
+
+    return wrapper
+
+
+def invalidate_reports(sender, scopes, **kwargs):
+    """``snap_data_changed`` receiver that bumps the touched scopes."""
+    report_cache.invalidate(scopes)
@@ -0,0 +1,143 @@
+"""
+EXPLAIN every report service query and fail on sequential scans of large tables.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.reports.services import BaseReportService
+from apps.snaps.models import SnapFact
+
+
+class Command(BaseCommand):
+    help = (
+        "Run every BaseReportService query for a game, season and team scope, "
+        "EXPLAIN it (EXPLAIN ANALYZE on PostgreSQL) and exit non-zero if any "
+        "plan sequentially scans a table of at least --min-rows rows. Load "
+        "data with generate_games first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="Ignore scans of tables smaller than this; the planner rightly scans them",
+        )
+        parser.add_argument(
+            "--verbose-plans", action="store_true", help="Print every query's plan"
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("postgresql", "sqlite"):
+            raise CommandError(f"Unsupported database vendor: {connection.vendor}")
+
+        keys = SnapFact.objects.values("game_id", "season_id", "team_id").first()
+        if keys is None:
+            raise CommandError("No snap data; run generate_games first")
+        # Unscoped reports aggregate whole tables by design, so only the
+        # scopes the API actually serves are checked.
+        scopes = {
+            "game": {"game_ids": [keys["game_id"]]},
+            "season": {"season_id": keys["season_id"], "team_id": keys["team_id"]},
+            "team": {"team_id": keys["team_id"]},
+        }
+
+        tables = set(connection.introspection.table_names())
+        row_counts = {}
+        failures = []
+        checked = 0
+        for scope, filters in scopes.items():
+            for service_class in _service_classes():
+                for name in _report_methods(service_class):
+                    label = f"{service_class.__name__}.{name} [{scope}]"
+                    for sql, params in _captured_queries(service_class(**filters), name):
+                        checked += 1
+                        plan, scanned = _explain(sql, params)
+                        if options["verbose_plans"]:
+                            self.stdout.write(f"{label}\n{plan}\n")
+                        for table in tables.intersection(scanned):
+                            if table not in row_counts:
+                                row_counts[table] = _row_count(table)
+                            if row_counts[table] >= options["min_rows"]:
+                                failures.append(f"{label}: sequential scan of {table}")
+
+        if failures:
+            for failure in failures:
+                self.stdout.write(failure)
+            raise CommandError(
+                f"{len(failures)} sequential scan(s) across {checked} report queries"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"No sequential scans in {checked} report queries")
+        )
+
+
+def _service_classes():
+    """Every concrete report service, the bundle included."""
+    pending = list(BaseReportService.__subclasses__())
+    while pending:
+        service_class = pending.pop(0)
+        pending.extend(service_class.__subclasses__())
+        yield service_class
+
+
+def _report_methods(service_class):
+    return sorted(
+        name for name in dir(service_class)
+        if name.startswith("get_") and callable(getattr(service_class, name))
+    )
+
+
+def _captured_queries(service, name):
+    """(sql, params) of each SELECT the method runs, bypassing the report cache."""
+    method = getattr(type(service), name)
+    method = getattr(method, "__wrapped__", method)
+    queries = []
+
+    def capture(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith("SELECT"):
+            queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(capture):
+        method(service)
+    return queries
+
+
+def _explain(sql, params):
+    """Plan text and the tables it scans sequentially."""
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return json.dumps(plan, indent=2), sorted(_pg_seq_scans(plan[0]["Plan"]))
+
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        details = [row[-1] for row in cursor.fetchall()]
+    # SQLite reports index lookups as "SEARCH t USING INDEX ..." and index
+    # scans as "SCAN t USING [COVERING] INDEX ..."; a bare "SCAN t" reads
+    # the whole table (or a subquery / constant row, filtered by the caller).
+    scanned = {
+        detail.split()[1] for detail in details
+        if detail.startswith("SCAN ") and " USING " not in detail
+    }
+    return "\n".join(details), sorted(scanned)
+
+
+def _pg_seq_scans(node):
+    tables = set()
+    if node.get("Node Type") == "Seq Scan":
+        tables.add(node["Relation Name"])
+    for child in node.get("Plans", ()):
+        tables |= _pg_seq_scans(child)
+    return tables
+
+
+def _row_count(table):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+        return cursor.fetchone()[0]
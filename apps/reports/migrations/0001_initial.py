@@ -0,0 +1,30 @@
+# Generated by Django 5.0.14 on 2026-10-16 23:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=10)),
+                ('scope_id', models.BigIntegerField(default=0)),
+                ('token', models.CharField(max_length=32)),
+            ],
+            options={
+                'db_table': 'report_data_versions',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dataversion',
+            constraint=models.UniqueConstraint(fields=('scope', 'scope_id'), name='report_data_versions_unique_scope'),
+        ),
+    ]
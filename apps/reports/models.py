@@ -0,0 +1,68 @@
+"""
+Report data versions - the token each cached report result is keyed by.
+"""
+import uuid
+
+from django.db import models
+from django.db.models.functions import Coalesce
+
+# Scope id stored for scopes without an id
+ALL = 0
+
+
+class DataVersionManager(models.Manager):
+    """Reads and bumps scope version tokens."""
+
+    def tokens(self, scope, ids=None):
+        """
+        The tokens of ``scope`` rows ``ids``, in order; unbumped scopes read "0".
+
+        Without ``ids``, the ``(id, token)`` of every bumped ``scope`` row:
+        a version for data spanning all of them.
+        """
+        if ids is None:
+            return tuple(self.filter(scope=scope).order_by("scope_id").values_list("scope_id", "token"))
+        found = dict(self.filter(scope=scope, scope_id__in=ids).values_list("scope_id", "token"))
+        return tuple(found.get(pk, "0") for pk in ids)
+
+    def token_of(self, scope, pk):
+        """An expression for the token of one ``scope`` row, to read it with other columns."""
+        return Coalesce(
+            models.Subquery(self.filter(scope=scope, scope_id=pk).values("token")[:1]),
+            models.Value("0"),
+        )
+
+    def bump(self, keys):
+        """Give every ``(scope, id)`` in ``keys`` one new token, in one statement."""
+        token = uuid.uuid4().hex
+        self.bulk_create(
+            [DataVersion(scope=scope, scope_id=pk, token=token) for scope, pk in sorted(keys)],
+            update_conflicts=True,
+            unique_fields=["scope", "scope_id"],
+            update_fields=["token"],
+        )
+
+
+class DataVersion(models.Model):
+    """
+    The current data version of one report scope (a game, season or team).
+
+    Written in the same transaction as the snap write that changed the
+    scope, so every worker process sees the new token exactly when it
+    sees the new data.
+    """
+
+    scope = models.CharField(max_length=10)
+    scope_id = models.BigIntegerField(default=ALL)
+    token = models.CharField(max_length=32)
+
+    objects = DataVersionManager()
+
+    class Meta:
+        db_table = "report_data_versions"
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "scope_id"], name="report_data_versions_unique_scope"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.scope_id} {self.token}"
@@ -163,3 +163,224 @@ class PuntTotalsSerializer(serializers.Serializer):
     touchbacks = serializers.IntegerField()
     blocked = serializers.IntegerField()
     out_of_bounds = serializers.IntegerField()
+
+
+class PuntPlayerSerializer(serializers.Serializer):
+    """Serializer for per-punter stats."""
+
+    punter__id = serializers.IntegerField()
+    punter__first_name = serializers.CharField()
+    punter__last_name = serializers.CharField()
+    punter__number = serializers.IntegerField()
+    punts = serializers.IntegerField()
+    total_yards = serializers.IntegerField()
+    avg_yards = serializers.FloatField()
+    longest = serializers.IntegerField()
+    touchbacks = serializers.IntegerField()
+    blocked = serializers.IntegerField()
+
+
+class KickoffTotalsSerializer(serializers.Serializer):
+    """Serializer for team kickoff totals."""
+
+    kickoffs = serializers.IntegerField()
+    total_yards = serializers.IntegerField()
+    avg_yards = serializers.FloatField()
+    touchbacks = serializers.IntegerField()
+    onside_attempts = serializers.IntegerField()
+    onside_recovered = serializers.IntegerField()
+    out_of_bounds = serializers.IntegerField()
+
+
+class ExtraPointTotalsSerializer(serializers.Serializer):
+    """Serializer for team extra point totals."""
+
+    pat_attempts = serializers.IntegerField()
+    pat_made = serializers.IntegerField()
+    two_pt_attempts = serializers.IntegerField()
+    two_pt_made = serializers.IntegerField()
+
+
+class OffenseBundleSerializer(serializers.Serializer):
+    """Serializer for the offense section of a report bundle."""
+
+    rushing_totals = RushingTotalsSerializer()
+    passing_totals = PassingTotalsSerializer()
+    rushing_by_player = RushingPlayerSerializer(many=True)
+    passing_by_quarterback = PassingPlayerSerializer(many=True)
+    receiving_by_player = ReceivingPlayerSerializer(many=True)
+
+
+class DefenseBundleSerializer(serializers.Serializer):
+    """Serializer for the defense section of a report bundle."""
+
+    team_totals = DefenseTotalsSerializer()
+    player_summary = DefensePlayerSerializer(many=True)
+
+
+class SpecialTeamsBundleSerializer(serializers.Serializer):
+    """Serializer for the special teams section of a report bundle."""
+
+    punt_totals = PuntTotalsSerializer()
+    kickoff_totals = KickoffTotalsSerializer()
+    field_goal_totals = FieldGoalTotalsSerializer()
+    extra_point_totals = ExtraPointTotalsSerializer()
+    punt_by_punter = PuntPlayerSerializer(many=True)
+    field_goal_by_kicker = FieldGoalKickerSerializer(many=True)
+
+
+class ReportBundleSerializer(serializers.Serializer):
+    """Serializer for every report section in one response."""
+
+    offense = OffenseBundleSerializer()
+    defense = DefenseBundleSerializer()
+    special_teams = SpecialTeamsBundleSerializer()
+
+
+class DownDistanceSplitSerializer(serializers.Serializer):
+    """Serializer for success rate in one down and distance bucket."""
+
+    down = serializers.IntegerField()
+    distance_bucket = serializers.CharField()
+    plays = serializers.IntegerField()
+    successes = serializers.IntegerField()
+    success_rate = serializers.FloatField()
+    yards_per_play = serializers.FloatField()
+
+
+class RedZoneSerializer(serializers.Serializer):
+    """Serializer for red-zone efficiency."""
+
+    plays = serializers.IntegerField()
+    run_plays = serializers.IntegerField()
+    pass_plays = serializers.IntegerField()
+    touchdowns = serializers.IntegerField()
+    touchdown_rate = serializers.FloatField()
+    successes = serializers.IntegerField()
+    success_rate = serializers.FloatField()
+    yards_per_play = serializers.FloatField()
+
+
+class FormationSplitSerializer(serializers.Serializer):
+    """Serializer for explosive-play rate in one formation."""
+
+    formation = serializers.CharField(allow_blank=True)
+    plays = serializers.IntegerField()
+    explosive = serializers.IntegerField()
+    explosive_rate = serializers.FloatField()
+    yards_per_play = serializers.FloatField()
+
+
+class YardageBinSerializer(serializers.Serializer):
+    """Serializer for one yards-per-play histogram bin."""
+
+    bin = serializers.CharField()
+    plays = serializers.IntegerField()
+
+
+class YardageDistributionSerializer(serializers.Serializer):
+    """Serializer for a yards-per-play distribution."""
+
+    plays = serializers.IntegerField()
+    mean = serializers.FloatField()
+    percentiles = serializers.DictField(child=serializers.FloatField())
+    histogram = YardageBinSerializer(many=True)
+
+
+class YardageDistributionsSerializer(serializers.Serializer):
+    """Serializer for run, pass and combined yardage distributions."""
+
+    runs = YardageDistributionSerializer()
+    passes = YardageDistributionSerializer()
+    all = YardageDistributionSerializer()
+
+
+class SituationalSplitsSerializer(serializers.Serializer):
+    """Serializer for every situational split in one response."""
+
+    success_by_down_distance = DownDistanceSplitSerializer(many=True)
+    red_zone = RedZoneSerializer()
+    explosive_by_formation = FormationSplitSerializer(many=True)
+    yards_distribution = YardageDistributionsSerializer()
+
+
+class DriveSummarySerializer(serializers.Serializer):
+    """Serializer for drive efficiency totals."""
+
+    drives = serializers.IntegerField()
+    points = serializers.IntegerField()
+    touchdowns = serializers.IntegerField()
+    field_goals = serializers.IntegerField()
+    punts = serializers.IntegerField()
+    turnovers = serializers.IntegerField()
+    three_and_outs = serializers.IntegerField()
+    points_per_drive = serializers.FloatField()
+    touchdown_rate = serializers.FloatField()
+    scoring_rate = serializers.FloatField()
+    three_and_out_rate = serializers.FloatField()
+    avg_start_position = serializers.FloatField(allow_null=True)
+    avg_plays = serializers.FloatField()
+    avg_yards = serializers.FloatField()
+    avg_duration_seconds = serializers.FloatField(allow_null=True)
+
+
+class EpaTotalsSerializer(serializers.Serializer):
+    """Serializer for team EPA totals."""
+
+    plays = serializers.IntegerField()
+    total_epa = serializers.FloatField()
+    epa_per_play = serializers.FloatField()
+    successes = serializers.IntegerField()
+    success_rate = serializers.FloatField()
+    run_plays = serializers.IntegerField()
+    run_epa_per_play = serializers.FloatField()
+    pass_plays = serializers.IntegerField()
+    pass_epa_per_play = serializers.FloatField()
+
+
+class RushingEpaLeaderSerializer(serializers.Serializer):
+    """Serializer for one ball carrier on an EPA leaderboard."""
+
+    ball_carrier__id = serializers.IntegerField()
+    ball_carrier__first_name = serializers.CharField()
+    ball_carrier__last_name = serializers.CharField()
+    ball_carrier__number = serializers.IntegerField()
+    plays = serializers.IntegerField()
+    total_epa = serializers.FloatField()
+    epa_per_play = serializers.FloatField()
+    successes = serializers.IntegerField()
+
+
+class PassingEpaLeaderSerializer(serializers.Serializer):
+    """Serializer for one quarterback on an EPA leaderboard."""
+
+    quarterback__id = serializers.IntegerField()
+    quarterback__first_name = serializers.CharField()
+    quarterback__last_name = serializers.CharField()
+    quarterback__number = serializers.IntegerField()
+    plays = serializers.IntegerField()
+    total_epa = serializers.FloatField()
+    epa_per_play = serializers.FloatField()
+    successes = serializers.IntegerField()
+
+
+class ReceivingEpaLeaderSerializer(serializers.Serializer):
+    """Serializer for one receiver on an EPA leaderboard."""
+
+    receiver__id = serializers.IntegerField()
+    receiver__first_name = serializers.CharField()
+    receiver__last_name = serializers.CharField()
+    receiver__number = serializers.IntegerField()
+    plays = serializers.IntegerField()
+    total_epa = serializers.FloatField()
+    epa_per_play = serializers.FloatField()
+    successes = serializers.IntegerField()
+
+
+class EpaLeaderboardsSerializer(serializers.Serializer):
+    """Serializer for team EPA and the per-player leaderboards."""
+
+    totals = EpaTotalsSerializer()
+    rushing = RushingEpaLeaderSerializer(many=True)
+    passing = PassingEpaLeaderSerializer(many=True)
+    receiving = ReceivingEpaLeaderSerializer(many=True)
@@ -5,10 +5,18 @@ from .base import BaseReportService
 from .offense import OffenseReportService
 from .defense import DefenseReportService
 from .special_teams import SpecialTeamsReportService
+from .bundle import ReportBundleService
+from .situational import SituationalReportService
+from .drives import DriveReportService
+from .expected_points import ExpectedPointsReportService
 
 __all__ = [
     "BaseReportService",
     "OffenseReportService",
     "DefenseReportService",
     "SpecialTeamsReportService",
+    "ReportBundleService",
+    "SituationalReportService",
+    "DriveReportService",
+    "ExpectedPointsReportService",
 ]
@@ -1,7 +1,10 @@
 """
 Base report service with common filtering logic.
 """
-from django.db.models import Q
+from django.db.models import Aggregate, FloatField, Q, Sum
+from django.db.models.functions import Cast
+from apps.snaps.models import PlayerGameStats, SnapFact
+from apps.teams.models import Player
 
 
 class BaseReportService:
@@ -12,6 +15,14 @@ class BaseReportService:
     - Reusable across views, management commands, Celery tasks
     - Testable in isolation (no HTTP layer)
     - Single place for complex queries
+
+    Team totals aggregate from the flat SnapFact table and per-player
+    stats sum the per-game PlayerGameStats rollups. Both carry the same
+    game/season/team columns, so ``self.filters`` applies to either
+    without joins.
+
+    Public ``get_*`` methods are wrapped with ``cached_report`` so repeat
+    requests for unchanged data are served from the report cache.
     """
 
     def __init__(
@@ -20,11 +31,77 @@ class BaseReportService:
         season_id: int | None = None,
         team_id: int | None = None,
     ):
+        self.game_ids = game_ids
+        self.season_id = season_id
+        self.team_id = team_id
         self.filters = Q()
 
         if game_ids:
             self.filters &= Q(game_id__in=game_ids)
         if season_id:
-            self.filters &= Q(game__season_id=season_id)
+            self.filters &= Q(season_id=season_id)
         if team_id:
-            self.filters &= Q(game__season__team_id=team_id)
+            self.filters &= Q(team_id=team_id)
+
+    def _facts(self, play_type, *args, **kwargs):
+        """Filtered SnapFact rows of one play type."""
+        return SnapFact.objects.filter(
+            self.filters, *args, play_type=play_type, **kwargs
+        )
+
+    def _by_player(self, active, prefix, fields, order_by, **annotations):
+        """
+        Sum per-game rollups per player, keyed like ``prefix__<field>``.
+
+        Only games where the player has a non-zero ``active`` column count.
+        Grouping runs on the rollup table alone; names are then loaded for
+        just the players in the result, in one query.
+        """
+        rows = list(
+            PlayerGameStats.objects.filter(self.filters, **{f"{active}__gt": 0})
+            .values("player_id")
+            .annotate(**annotations)
+            .order_by(order_by)
+        )
+        players = Player.objects.only(*fields).in_bulk(
+            {row["player_id"] for row in rows}
+        )
+        return self._with_player_details(rows, prefix, fields, players)
+
+    @staticmethod
+    def _with_player_details(rows, prefix, fields, players):
+        """Replace each row's ``player_id`` with ``prefix__<field>`` details."""
+        results = []
+        for row in rows:
+            player = players[row.pop("player_id")]
+            details = {f"{prefix}__{field}": getattr(player, field) for field in fields}
+            results.append({**details, **row})
+        return results
+
+    @classmethod
+    def _filtered(cls, expression, condition):
+        """
+        Copy of ``expression`` with ``condition`` ANDed into every aggregate.
+
+        Lets one query compute aggregates written for differently filtered
+        querysets side by side (conditional aggregation).
+        """
+        if not hasattr(expression, "get_source_expressions"):
+            return expression
+        expression = expression.copy()
+        if isinstance(expression, Aggregate):
+            if expression.filter is None:
+                expression.filter = condition
+            else:
+                expression.filter = condition & expression.filter
+            return expression
+        expression.set_source_expressions([
+            cls._filtered(source, condition)
+            for source in expression.get_source_expressions()
+        ])
+        return expression
+
+    @staticmethod
+    def _average(total, count):
+        """Per-attempt average of two summed rollup columns, as a float."""
+        return Cast(Sum(total), FloatField()) / Sum(count)
@@ -0,0 +1,163 @@
+"""
+Combined report service - every report section in a fixed number of queries.
+"""
+from typing import ClassVar
+
+from django.db.models import Count, Q
+
+from apps.snaps.models import PlayerGameStats, SnapFact
+from apps.teams.models import Player
+
+from ..cache import cached_report
+from .defense import DefenseReportService
+from .offense import OffenseReportService
+from .special_teams import SpecialTeamsReportService
+
+PlayType = SnapFact.PlayType
+
+
+class ReportBundleService(
+    OffenseReportService, DefenseReportService, SpecialTeamsReportService
+):
+    """
+    Offense, defense and special teams reports computed together.
+
+    Instead of one aggregate query per section, every team total is a
+    conditional aggregate (``FILTER (WHERE play_type = ...)``) in a single
+    scan of the filtered SnapFact rows, and every per-player split is a
+    conditional sum in a single grouped scan of the PlayerGameStats
+    rollups. Player details are then loaded once for all splits, so a
+    bundle costs three queries however many sections it holds.
+
+    Section definitions are shared with the single-section services, so
+    each bundle entry matches the corresponding ``get_*`` method.
+    """
+
+    # section -> {key: (play type, aggregates method, finisher method)}
+    TOTALS: ClassVar[dict] = {
+        "offense": {
+            "rushing_totals": (PlayType.RUN, "_rushing_totals", None),
+            "passing_totals": (PlayType.PASS, "_passing_totals", None),
+        },
+        "defense": {
+            "team_totals": (PlayType.DEFENSE, "_defense_totals", None),
+        },
+        "special_teams": {
+            "punt_totals": (PlayType.PUNT, "_punt_totals", None),
+            "kickoff_totals": (PlayType.KICKOFF, "_kickoff_totals", None),
+            "field_goal_totals": (
+                PlayType.FIELD_GOAL, "_field_goal_totals", "_with_percentage"
+            ),
+            "extra_point_totals": (PlayType.EXTRA_POINT, "_extra_point_totals", None),
+        },
+    }
+
+    # section -> {key: (split method, finisher method)}
+    SPLITS: ClassVar[dict] = {
+        "offense": {
+            "rushing_by_player": ("_rushing_split", None),
+            "passing_by_quarterback": ("_passing_split", "_with_passer_ratings"),
+            "receiving_by_player": ("_receiving_split", None),
+        },
+        "defense": {
+            "player_summary": ("_defense_split", None),
+        },
+        "special_teams": {
+            "punt_by_punter": ("_punt_split", None),
+            "field_goal_by_kicker": ("_kicker_split", "_with_kicker_percentages"),
+        },
+    }
+
+    @cached_report
+    def get_bundle(self) -> dict:
+        """Totals and per-player splits for every section."""
+        bundle = {section: {} for section in self.TOTALS}
+        for section, results in self._bundle_totals().items():
+            bundle[section].update(results)
+        for section, results in self._bundle_splits().items():
+            bundle[section].update(results)
+        return bundle
+
+    def _bundle_totals(self) -> dict:
+        """Every TOTALS entry from one aggregate over the filtered facts."""
+        play_types = set()
+        aggregates = {}
+        for items in self.TOTALS.values():
+            for key, (play_type, method, _) in items.items():
+                play_types.add(play_type)
+                for name, expression in getattr(self, method)().items():
+                    aggregates[f"{key}__{name}"] = self._filtered(
+                        expression, Q(play_type=play_type)
+                    )
+
+        row = SnapFact.objects.filter(
+            self.filters, play_type__in=play_types
+        ).aggregate(**aggregates)
+
+        results = {}
+        for section, items in self.TOTALS.items():
+            results[section] = {}
+            for key, (_, _, finish) in items.items():
+                totals = self._unprefix(row, key)
+                results[section][key] = getattr(self, finish)(totals) if finish else totals
+        return results
+
+    def _bundle_splits(self) -> dict:
+        """Every SPLITS entry from one grouped scan of the rollups."""
+        specs = {}
+        annotations = {}
+        fields = set()
+        for items in self.SPLITS.values():
+            for key, (method, _) in items.items():
+                spec = getattr(self, method)()
+                active = Q(**{f"{spec.pop('active')}__gt": 0})
+                specs[key] = {
+                    name: spec.pop(name) for name in ("prefix", "fields", "order_by")
+                }
+                fields.update(specs[key]["fields"])
+                # Games where the player was active for this split; the
+                # single-section query filters on the same condition.
+                annotations[f"{key}__games"] = Count("pk", filter=active)
+                for name, expression in spec.items():
+                    annotations[f"{key}__{name}"] = self._filtered(expression, active)
+
+        rows = list(
+            PlayerGameStats.objects.filter(self.filters)
+            .values("player_id")
+            .annotate(**annotations)
+            .order_by()
+        )
+        players = Player.objects.only(*fields).in_bulk(
+            {row["player_id"] for row in rows}
+        )
+
+        results = {}
+        for section, items in self.SPLITS.items():
+            results[section] = {}
+            for key, (_, finish) in items.items():
+                spec = specs[key]
+                split_rows = []
+                for row in rows:
+                    split_row = self._unprefix(row, key)
+                    if split_row.pop("games"):
+                        split_rows.append({"player_id": row["player_id"], **split_row})
+
+                order_by = spec["order_by"]
+                split_rows.sort(
+                    key=lambda split_row: split_row[order_by.lstrip("-")],
+                    reverse=order_by.startswith("-"),
+                )
+                stats = self._with_player_details(
+                    split_rows, spec["prefix"], spec["fields"], players
+                )
+                results[section][key] = getattr(self, finish)(stats) if finish else stats
+        return results
+
+    @staticmethod
+    def _unprefix(row, key):
+        prefix = f"{key}__"
+        return {
+            name[len(prefix):]: value
+            for name, value in row.items()
+            if name.startswith(prefix)
+        }
@@ -3,78 +3,73 @@ Defensive statistics report service.
 """
 from django.db.models import Count, Sum, Q
 from django.db.models.functions import Coalesce
-from apps.snaps.models import DefenseSnap, DefenseSnapAssist
+from apps.snaps.models import DefenseSnap, DefenseSnapAssist, SnapFact
+from ..cache import cached_report
 from .base import BaseReportService
 
+DEFENSE = SnapFact.PlayType.DEFENSE
+
 
 class DefenseReportService(BaseReportService):
     """Defense statistics and analytics."""
 
+    @cached_report
     def get_team_totals(self) -> dict:
         """Team-wide defensive totals."""
-        return DefenseSnap.objects.filter(self.filters).aggregate(
-            total_tackles=Count(
-                "id", filter=Q(play_result=DefenseSnap.PlayResult.TACKLE)
+        return self._facts(DEFENSE).aggregate(**self._defense_totals())
+
+    def _defense_totals(self) -> dict:
+        return {
+            "total_tackles": Count(
+                "pk", filter=Q(result=DefenseSnap.PlayResult.TACKLE)
             ),
-            total_tfl=Count(
-                "id", filter=Q(play_result=DefenseSnap.PlayResult.TACKLE_FOR_LOSS)
+            "total_tfl": Count(
+                "pk", filter=Q(result=DefenseSnap.PlayResult.TACKLE_FOR_LOSS)
             ),
-            total_sacks=Count("id", filter=Q(play_result=DefenseSnap.PlayResult.SACK)),
-            total_interceptions=Count(
-                "id", filter=Q(play_result=DefenseSnap.PlayResult.INTERCEPTION)
+            "total_sacks": Count("pk", filter=Q(result=DefenseSnap.PlayResult.SACK)),
+            "total_interceptions": Count(
+                "pk", filter=Q(result=DefenseSnap.PlayResult.INTERCEPTION)
             ),
-            total_fumble_recoveries=Count(
-                "id", filter=Q(play_result=DefenseSnap.PlayResult.FUMBLE_RECOVERY)
+            "total_fumble_recoveries": Count(
+                "pk", filter=Q(result=DefenseSnap.PlayResult.FUMBLE_RECOVERY)
             ),
-            total_pass_defended=Count(
-                "id", filter=Q(play_result=DefenseSnap.PlayResult.PASS_DEFENDED)
+            "total_pass_defended": Count(
+                "pk", filter=Q(result=DefenseSnap.PlayResult.PASS_DEFENDED)
             ),
-            total_pressures=Count("id", filter=Q(applied_pressure=True)),
-            total_forced_incompletions=Count("id", filter=Q(forced_incompletion=True)),
-            defensive_touchdowns=Count("id", filter=Q(is_defensive_touchdown=True)),
-            int_return_yards=Coalesce(Sum("interception_return_yards"), 0),
-            fumble_return_yards=Coalesce(Sum("fumble_return_yards"), 0),
-        )
+            "total_pressures": Count("pk", filter=Q(applied_pressure=True)),
+            "total_forced_incompletions": Count("pk", filter=Q(forced_incompletion=True)),
+            "defensive_touchdowns": Count("pk", filter=Q(is_touchdown=True)),
+            "int_return_yards": Coalesce(Sum("interception_return_yards"), 0),
+            "fumble_return_yards": Coalesce(Sum("fumble_return_yards"), 0),
+        }
 
+    @cached_report
     def get_player_summary(self) -> list[dict]:
         """Per-player defensive statistics."""
-        return list(
-            DefenseSnap.objects.filter(self.filters, primary_player__isnull=False)
-            .values(
-                "primary_player__id",
-                "primary_player__first_name",
-                "primary_player__last_name",
-                "primary_player__number",
-                "primary_player__position",
-            )
-            .annotate(
-                tackles=Count(
-                    "id", filter=Q(play_result=DefenseSnap.PlayResult.TACKLE)
-                ),
-                tfl=Count(
-                    "id", filter=Q(play_result=DefenseSnap.PlayResult.TACKLE_FOR_LOSS)
-                ),
-                sacks=Count("id", filter=Q(play_result=DefenseSnap.PlayResult.SACK)),
-                interceptions=Count(
-                    "id", filter=Q(play_result=DefenseSnap.PlayResult.INTERCEPTION)
-                ),
-                fumble_recoveries=Count(
-                    "id", filter=Q(play_result=DefenseSnap.PlayResult.FUMBLE_RECOVERY)
-                ),
-                pass_defended=Count(
-                    "id", filter=Q(play_result=DefenseSnap.PlayResult.PASS_DEFENDED)
-                ),
-                pressures=Count("id", filter=Q(applied_pressure=True)),
-                def_tds=Count("id", filter=Q(is_defensive_touchdown=True)),
-            )
-            .order_by("-tackles")
-        )
+        return self._by_player(**self._defense_split())
+
+    def _defense_split(self) -> dict:
+        return {
+            "active": "def_plays",
+            "prefix": "primary_player",
+            "fields": ["id", "first_name", "last_name", "number", "position"],
+            "order_by": "-tackles",
+            "tackles": Sum("def_tackles"),
+            "tfl": Sum("def_tfl"),
+            "sacks": Sum("def_sacks"),
+            "interceptions": Sum("def_interceptions"),
+            "fumble_recoveries": Sum("def_fumble_recoveries"),
+            "pass_defended": Sum("def_pass_defended"),
+            "pressures": Sum("def_pressures"),
+            "def_tds": Sum("def_touchdowns"),
+        }
 
+    @cached_report
     def get_player_assists(self) -> list[dict]:
         """Get assist counts by player."""
         return list(
             DefenseSnapAssist.objects.filter(
-                snap__in=DefenseSnap.objects.filter(self.filters)
+                snap_id__in=self._facts(DEFENSE).values("snap_id")
             )
             .values(
                 "player__id",
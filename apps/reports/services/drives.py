@@ -0,0 +1,58 @@
+"""
+Drive efficiency report service.
+"""
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from apps.snaps.models import Drive
+
+from ..cache import cached_report
+from .base import BaseReportService
+
+Result = Drive.Result
+
+# A punt after this many plays or fewer is a three-and-out
+THREE_AND_OUT_PLAYS = 3
+
+
+class DriveReportService(BaseReportService):
+    """Per-drive efficiency, aggregated from the Drive table alone."""
+
+    @cached_report
+    def get_drive_summary(self) -> dict:
+        """Points per drive, three-and-outs, starting field position and drive length."""
+        totals = Drive.objects.filter(self.filters).aggregate(
+            drives=Count("pk"),
+            points=Coalesce(Sum("points"), 0),
+            touchdowns=Count("pk", filter=Q(result=Result.TOUCHDOWN)),
+            field_goals=Count("pk", filter=Q(result=Result.FIELD_GOAL)),
+            punts=Count("pk", filter=Q(result=Result.PUNT)),
+            turnovers=Count("pk", filter=Q(result__in=[Result.TURNOVER, Result.DOWNS])),
+            three_and_outs=Count(
+                "pk", filter=Q(result=Result.PUNT, plays__lte=THREE_AND_OUT_PLAYS)
+            ),
+            avg_start_position=Avg("start_position"),
+            avg_plays=Coalesce(Avg("plays"), 0.0),
+            avg_yards=Coalesce(Avg("yards"), 0.0),
+            avg_duration=Avg("duration"),
+        )
+        drives = totals["drives"]
+        scores = totals["touchdowns"] + totals["field_goals"]
+        duration = totals.pop("avg_duration")
+        return {
+            **totals,
+            "avg_start_position": _round(totals["avg_start_position"]),
+            "avg_plays": _round(totals["avg_plays"]),
+            "avg_yards": _round(totals["avg_yards"]),
+            "avg_duration_seconds": _round(duration.total_seconds()) if duration else None,
+            "points_per_drive": _round(totals["points"] / drives) if drives else 0.0,
+            "touchdown_rate": _round(totals["touchdowns"] / drives) if drives else 0.0,
+            "scoring_rate": _round(scores / drives) if drives else 0.0,
+            "three_and_out_rate": (
+                _round(totals["three_and_outs"] / drives) if drives else 0.0
+            ),
+        }
+
+
+def _round(value):
+    return round(float(value), 3) if value is not None else None
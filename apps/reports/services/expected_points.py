@@ -0,0 +1,99 @@
+"""
+Expected points added (EPA) report service.
+"""
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from apps.snaps.models import SnapFact
+from apps.teams.models import Player
+
+from ..cache import cached_report
+from .base import BaseReportService
+
+RUN = SnapFact.PlayType.RUN
+PASS = SnapFact.PlayType.PASS
+
+LEADERBOARD_SIZE = 10
+PLAYER_FIELDS = ["id", "first_name", "last_name", "number"]
+
+
+class ExpectedPointsReportService(BaseReportService):
+    """
+    Team EPA and per-player EPA leaderboards.
+
+    EPA is stored on each SnapFact when the snap is written (see
+    ``apps.snaps.expected_points``), so every figure here is a single
+    grouped aggregate over the fact table. Plays without EPA (no fitted
+    model yet, or no down/distance/position recorded) are left out.
+    """
+
+    def _scored(self, play_types, **conditions):
+        return SnapFact.objects.filter(
+            self.filters, play_type__in=play_types, epa__isnull=False, **conditions
+        )
+
+    @cached_report
+    def get_epa_totals(self) -> dict:
+        """Team EPA per play and success rate, overall and by play type."""
+        totals = self._scored([RUN, PASS]).aggregate(
+            plays=Count("pk"),
+            total_epa=Coalesce(Sum("epa"), 0.0),
+            epa_per_play=Coalesce(Avg("epa"), 0.0),
+            successes=Count("pk", filter=Q(epa__gt=0)),
+            run_plays=Count("pk", filter=Q(play_type=RUN)),
+            run_epa_per_play=Coalesce(Avg("epa", filter=Q(play_type=RUN)), 0.0),
+            pass_plays=Count("pk", filter=Q(play_type=PASS)),
+            pass_epa_per_play=Coalesce(Avg("epa", filter=Q(play_type=PASS)), 0.0),
+        )
+        totals["success_rate"] = (
+            round(totals["successes"] / totals["plays"], 3) if totals["plays"] else 0.0
+        )
+        return totals
+
+    @cached_report
+    def get_rushing_leaders(self) -> list[dict]:
+        """Ball carriers by total EPA."""
+        return self._leaders(self._scored([RUN]), "player_id", "ball_carrier")
+
+    @cached_report
+    def get_passing_leaders(self) -> list[dict]:
+        """Quarterbacks by total EPA on dropbacks."""
+        return self._leaders(self._scored([PASS]), "player_id", "quarterback")
+
+    @cached_report
+    def get_receiving_leaders(self) -> list[dict]:
+        """Receivers by total EPA on their receptions."""
+        return self._leaders(
+            self._scored([PASS], is_complete=True), "receiver_id", "receiver"
+        )
+
+    @cached_report
+    def get_leaderboards(self) -> dict:
+        """Team EPA and every leaderboard in one response."""
+        return {
+            "totals": self.get_epa_totals(),
+            "rushing": self.get_rushing_leaders(),
+            "passing": self.get_passing_leaders(),
+            "receiving": self.get_receiving_leaders(),
+        }
+
+    def _leaders(self, facts, role, prefix):
+        rows = list(
+            facts.filter(**{f"{role}__isnull": False})
+            .values(role)
+            .annotate(
+                plays=Count("pk"),
+                total_epa=Sum("epa"),
+                epa_per_play=Avg("epa"),
+                successes=Count("pk", filter=Q(epa__gt=0)),
+            )
+            .order_by("-total_epa", role)[:LEADERBOARD_SIZE]
+        )
+        for row in rows:
+            row["player_id"] = row.pop(role)
+            row["total_epa"] = round(row["total_epa"], 3)
+            row["epa_per_play"] = round(row["epa_per_play"], 3)
+        players = Player.objects.only(*PLAYER_FIELDS).in_bulk(
+            {row["player_id"] for row in rows}
+        )
+        return self._with_player_details(rows, prefix, PLAYER_FIELDS, players)
@@ -3,9 +3,13 @@ Offensive statistics report service.
 """
 from django.db.models import Count, Sum, Avg, Max, Q
 from django.db.models.functions import Coalesce
-from apps.snaps.models import RunPlay, PassPlay
+from apps.snaps.models import SnapFact
+from ..cache import cached_report
 from .base import BaseReportService
 
+RUN = SnapFact.PlayType.RUN
+PASS = SnapFact.PlayType.PASS
+
 
 class OffenseReportService(BaseReportService):
     """
@@ -17,86 +21,91 @@ class OffenseReportService(BaseReportService):
     - Single query instead of N+1
     """
 
+    @cached_report
     def get_rushing_totals(self) -> dict:
         """Team rushing totals."""
-        return RunPlay.objects.filter(self.filters).aggregate(
-            attempts=Count("id"),
-            yards=Coalesce(Sum("yards_gained"), 0),
-            touchdowns=Count("id", filter=Q(is_touchdown=True)),
-            first_downs=Count("id", filter=Q(is_first_down=True)),
-            fumbles=Count("id", filter=Q(fumbled=True)),
-            fumbles_lost=Count("id", filter=Q(fumble_lost=True)),
-            longest=Coalesce(Max("yards_gained"), 0),
-            avg_yards=Coalesce(Avg("yards_gained"), 0.0),
-        )
+        return self._facts(RUN).aggregate(**self._rushing_totals())
+
+    def _rushing_totals(self) -> dict:
+        return {
+            "attempts": Count("pk"),
+            "yards": Coalesce(Sum("yards_gained"), 0),
+            "touchdowns": Count("pk", filter=Q(is_touchdown=True)),
+            "first_downs": Count("pk", filter=Q(is_first_down=True)),
+            "fumbles": Count("pk", filter=Q(fumbled=True)),
+            "fumbles_lost": Count("pk", filter=Q(fumble_lost=True)),
+            "longest": Coalesce(Max("yards_gained"), 0),
+            "avg_yards": Coalesce(Avg("yards_gained"), 0.0),
+        }
 
+    @cached_report
     def get_rushing_by_player(self) -> list[dict]:
         """Per-player rushing statistics."""
-        return list(
-            RunPlay.objects.filter(self.filters, ball_carrier__isnull=False)
-            .values(
-                "ball_carrier__id",
-                "ball_carrier__first_name",
-                "ball_carrier__last_name",
-                "ball_carrier__number",
-            )
-            .annotate(
-                attempts=Count("id"),
-                yards=Coalesce(Sum("yards_gained"), 0),
-                touchdowns=Count("id", filter=Q(is_touchdown=True)),
-                first_downs=Count("id", filter=Q(is_first_down=True)),
-                fumbles=Count("id", filter=Q(fumbled=True)),
-                fumbles_lost=Count("id", filter=Q(fumble_lost=True)),
-                longest=Coalesce(Max("yards_gained"), 0),
-                avg_yards=Coalesce(Avg("yards_gained"), 0.0),
-                short_runs=Count("id", filter=Q(yards_gained__lte=5)),
-                long_runs=Count("id", filter=Q(yards_gained__gt=5)),
-                explosive_runs=Count("id", filter=Q(yards_gained__gte=10)),
-            )
-            .order_by("-yards")
-        )
+        return self._by_player(**self._rushing_split())
+
+    def _rushing_split(self) -> dict:
+        return {
+            "active": "rush_attempts",
+            "prefix": "ball_carrier",
+            "fields": ["id", "first_name", "last_name", "number"],
+            "order_by": "-yards",
+            "attempts": Sum("rush_attempts"),
+            "yards": Sum("rush_yards"),
+            "touchdowns": Sum("rush_touchdowns"),
+            "first_downs": Sum("rush_first_downs"),
+            "fumbles": Sum("rush_fumbles"),
+            "fumbles_lost": Sum("rush_fumbles_lost"),
+            "longest": Coalesce(Max("rush_longest"), 0),
+            "avg_yards": self._average("rush_yards", "rush_attempts"),
+            "short_runs": Sum("rush_short"),
+            "long_runs": Sum("rush_long"),
+            "explosive_runs": Sum("rush_explosive"),
+        }
 
+    @cached_report
     def get_passing_totals(self) -> dict:
         """Team passing totals."""
-        return PassPlay.objects.filter(self.filters).aggregate(
-            attempts=Count("id"),
-            completions=Count("id", filter=Q(is_complete=True)),
-            yards=Coalesce(Sum("yards_gained", filter=Q(is_complete=True)), 0),
-            touchdowns=Count("id", filter=Q(is_touchdown=True)),
-            interceptions=Count("id", filter=Q(is_interception=True)),
-            sacks=Count("id", filter=Q(was_sacked=True)),
-            sack_yards=Coalesce(Sum("sack_yards", filter=Q(was_sacked=True)), 0),
-            air_yards=Coalesce(Sum("air_yards"), 0),
-            yac=Coalesce(Sum("yards_after_catch", filter=Q(is_complete=True)), 0),
-            longest=Coalesce(Max("yards_gained", filter=Q(is_complete=True)), 0),
-        )
+        return self._facts(PASS).aggregate(**self._passing_totals())
+
+    def _passing_totals(self) -> dict:
+        return {
+            "attempts": Count("pk"),
+            "completions": Count("pk", filter=Q(is_complete=True)),
+            "yards": Coalesce(Sum("yards_gained", filter=Q(is_complete=True)), 0),
+            "touchdowns": Count("pk", filter=Q(is_touchdown=True)),
+            "interceptions": Count("pk", filter=Q(is_interception=True)),
+            "sacks": Count("pk", filter=Q(was_sacked=True)),
+            "sack_yards": Coalesce(Sum("sack_yards", filter=Q(was_sacked=True)), 0),
+            "air_yards": Coalesce(Sum("air_yards"), 0),
+            "yac": Coalesce(Sum("yards_after_catch", filter=Q(is_complete=True)), 0),
+            "longest": Coalesce(Max("yards_gained", filter=Q(is_complete=True)), 0),
+        }
 
+    @cached_report
     def get_passing_by_quarterback(self) -> list[dict]:
         """Per-QB passing statistics with passer rating."""
-        qb_stats = list(
-            PassPlay.objects.filter(self.filters, quarterback__isnull=False)
-            .values(
-                "quarterback__id",
-                "quarterback__first_name",
-                "quarterback__last_name",
-                "quarterback__number",
-            )
-            .annotate(
-                attempts=Count("id"),
-                completions=Count("id", filter=Q(is_complete=True)),
-                yards=Coalesce(Sum("yards_gained", filter=Q(is_complete=True)), 0),
-                touchdowns=Count("id", filter=Q(is_touchdown=True)),
-                interceptions=Count("id", filter=Q(is_interception=True)),
-                sacks=Count("id", filter=Q(was_sacked=True)),
-                air_yards=Coalesce(Sum("air_yards"), 0),
-                yac=Coalesce(Sum("yards_after_catch", filter=Q(is_complete=True)), 0),
-                longest=Coalesce(Max("yards_gained", filter=Q(is_complete=True)), 0),
-                thrown_away=Count("id", filter=Q(is_thrown_away=True)),
-                under_pressure=Count("id", filter=Q(was_under_pressure=True)),
-            )
-            .order_by("-yards")
-        )
+        return self._with_passer_ratings(self._by_player(**self._passing_split()))
 
+    def _passing_split(self) -> dict:
+        return {
+            "active": "pass_attempts",
+            "prefix": "quarterback",
+            "fields": ["id", "first_name", "last_name", "number"],
+            "order_by": "-yards",
+            "attempts": Sum("pass_attempts"),
+            "completions": Sum("pass_completions"),
+            "yards": Sum("pass_yards"),
+            "touchdowns": Sum("pass_touchdowns"),
+            "interceptions": Sum("pass_interceptions"),
+            "sacks": Sum("pass_sacks"),
+            "air_yards": Sum("pass_air_yards"),
+            "yac": Sum("pass_yac"),
+            "longest": Coalesce(Max("pass_longest"), 0),
+            "thrown_away": Sum("pass_thrown_away"),
+            "under_pressure": Sum("pass_under_pressure"),
+        }
+
+    def _with_passer_ratings(self, qb_stats: list[dict]) -> list[dict]:
         # Calculate passer rating
         for stat in qb_stats:
             stat["completion_pct"] = (
@@ -128,28 +137,23 @@ class OffenseReportService(BaseReportService):
 
         return round(((a + b + c + d) / 6) * 100, 1)
 
+    @cached_report
     def get_receiving_by_player(self) -> list[dict]:
         """Per-receiver statistics."""
-        return list(
-            PassPlay.objects.filter(
-                self.filters, receiver__isnull=False, is_complete=True
-            )
-            .values(
-                "receiver__id",
-                "receiver__first_name",
-                "receiver__last_name",
-                "receiver__number",
-                "receiver__position",
-            )
-            .annotate(
-                receptions=Count("id"),
-                yards=Coalesce(Sum("yards_gained"), 0),
-                touchdowns=Count("id", filter=Q(is_touchdown=True)),
-                first_downs=Count("id", filter=Q(is_first_down=True)),
-                longest=Coalesce(Max("yards_gained"), 0),
-                yac=Coalesce(Sum("yards_after_catch"), 0),
-                fumbles=Count("id", filter=Q(fumbled=True)),
-                avg_yards=Coalesce(Avg("yards_gained"), 0.0),
-            )
-            .order_by("-yards")
-        )
+        return self._by_player(**self._receiving_split())
+
+    def _receiving_split(self) -> dict:
+        return {
+            "active": "rec_receptions",
+            "prefix": "receiver",
+            "fields": ["id", "first_name", "last_name", "number", "position"],
+            "order_by": "-yards",
+            "receptions": Sum("rec_receptions"),
+            "yards": Sum("rec_yards"),
+            "touchdowns": Sum("rec_touchdowns"),
+            "first_downs": Sum("rec_first_downs"),
+            "longest": Coalesce(Max("rec_longest"), 0),
+            "yac": Sum("rec_yac"),
+            "fumbles": Sum("rec_fumbles"),
+            "avg_yards": self._average("rec_yards", "rec_receptions"),
+        }
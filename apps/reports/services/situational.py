@@ -0,0 +1,54 @@
+"""
+Situational splits report service.
+"""
+from functools import cached_property
+
+from apps.snaps.models import SnapFact
+
+from .. import analytics
+from ..cache import cached_report
+from .base import BaseReportService
+
+
+class SituationalReportService(BaseReportService):
+    """
+    Down-and-distance, red-zone, formation and yardage splits.
+
+    The filtered runs and passes are loaded into NumPy columns once per
+    service instance and every split is computed from those arrays, so
+    any number of splits costs one query.
+    """
+
+    @cached_property
+    def plays(self) -> analytics.PlayColumns:
+        return analytics.PlayColumns.load(SnapFact.objects.filter(self.filters))
+
+    @cached_report
+    def get_success_by_down_distance(self) -> list[dict]:
+        """Success rate by down and distance bucket."""
+        return analytics.success_by_down_distance(self.plays)
+
+    @cached_report
+    def get_red_zone(self) -> dict:
+        """Red-zone efficiency."""
+        return analytics.red_zone(self.plays)
+
+    @cached_report
+    def get_explosive_by_formation(self) -> list[dict]:
+        """Explosive-play rate by formation."""
+        return analytics.explosive_by_formation(self.plays)
+
+    @cached_report
+    def get_yards_distribution(self) -> dict:
+        """Yards-per-play distribution for runs, passes and both."""
+        return analytics.yards_distribution(self.plays)
+
+    @cached_report
+    def get_splits(self) -> dict:
+        """Every situational split from one load of the plays."""
+        return {
+            "success_by_down_distance": analytics.success_by_down_distance(self.plays),
+            "red_zone": analytics.red_zone(self.plays),
+            "explosive_by_formation": analytics.explosive_by_formation(self.plays),
+            "yards_distribution": analytics.yards_distribution(self.plays),
+        }
@@ -3,132 +3,147 @@ Special teams statistics report service.
 """
 from django.db.models import Count, Sum, Avg, Max, Q
 from django.db.models.functions import Coalesce
-from apps.snaps.models import PuntSnap, KickoffSnap, FieldGoalSnap, ExtraPointSnap
+from apps.snaps.models import FieldGoalSnap, ExtraPointSnap, SnapFact
+from ..cache import cached_report
 from .base import BaseReportService
 
+PUNT = SnapFact.PlayType.PUNT
+KICKOFF = SnapFact.PlayType.KICKOFF
+FIELD_GOAL = SnapFact.PlayType.FIELD_GOAL
+EXTRA_POINT = SnapFact.PlayType.EXTRA_POINT
+
 
 class SpecialTeamsReportService(BaseReportService):
     """Special teams statistics."""
 
+    @cached_report
     def get_punt_totals(self) -> dict:
         """Team punting totals."""
-        return PuntSnap.objects.filter(self.filters).aggregate(
-            punts=Count("id"),
-            total_yards=Coalesce(Sum("punt_yards"), 0),
-            avg_yards=Coalesce(Avg("punt_yards"), 0.0),
-            longest=Coalesce(Max("punt_yards"), 0),
-            touchbacks=Count("id", filter=Q(is_touchback=True)),
-            blocked=Count("id", filter=Q(is_blocked=True)),
-            out_of_bounds=Count("id", filter=Q(out_of_bounds=True)),
-        )
+        return self._facts(PUNT).aggregate(**self._punt_totals())
 
+    def _punt_totals(self) -> dict:
+        return {
+            "punts": Count("pk"),
+            "total_yards": Coalesce(Sum("yards_gained"), 0),
+            "avg_yards": Coalesce(Avg("yards_gained"), 0.0),
+            "longest": Coalesce(Max("yards_gained"), 0),
+            "touchbacks": Count("pk", filter=Q(is_touchback=True)),
+            "blocked": Count("pk", filter=Q(is_blocked=True)),
+            "out_of_bounds": Count("pk", filter=Q(out_of_bounds=True)),
+        }
+
+    @cached_report
     def get_punt_by_punter(self) -> list[dict]:
         """Per-punter statistics."""
-        return list(
-            PuntSnap.objects.filter(self.filters, punter__isnull=False)
-            .values(
-                "punter__id",
-                "punter__first_name",
-                "punter__last_name",
-                "punter__number",
-            )
-            .annotate(
-                punts=Count("id"),
-                total_yards=Coalesce(Sum("punt_yards"), 0),
-                avg_yards=Coalesce(Avg("punt_yards"), 0.0),
-                longest=Coalesce(Max("punt_yards"), 0),
-                touchbacks=Count("id", filter=Q(is_touchback=True)),
-                blocked=Count("id", filter=Q(is_blocked=True)),
-            )
-            .order_by("-total_yards")
-        )
+        return self._by_player(**self._punt_split())
 
+    def _punt_split(self) -> dict:
+        return {
+            "active": "punts",
+            "prefix": "punter",
+            "fields": ["id", "first_name", "last_name", "number"],
+            "order_by": "-total_yards",
+            # Annotated before ``punts`` so it averages the rollup column,
+            # not the same-named annotation
+            "avg_yards": self._average("punt_yards", "punts"),
+            "punts": Sum("punts"),
+            "total_yards": Sum("punt_yards"),
+            "longest": Coalesce(Max("punt_longest"), 0),
+            "touchbacks": Sum("punt_touchbacks"),
+            "blocked": Sum("punt_blocked"),
+        }
+
+    @cached_report
     def get_kickoff_totals(self) -> dict:
         """Team kickoff totals."""
-        return KickoffSnap.objects.filter(self.filters).aggregate(
-            kickoffs=Count("id"),
-            total_yards=Coalesce(Sum("kick_yards"), 0),
-            avg_yards=Coalesce(Avg("kick_yards"), 0.0),
-            touchbacks=Count("id", filter=Q(is_touchback=True)),
-            onside_attempts=Count("id", filter=Q(is_onside_kick=True)),
-            onside_recovered=Count("id", filter=Q(onside_recovered=True)),
-            out_of_bounds=Count("id", filter=Q(out_of_bounds=True)),
-        )
+        return self._facts(KICKOFF).aggregate(**self._kickoff_totals())
+
+    def _kickoff_totals(self) -> dict:
+        return {
+            "kickoffs": Count("pk"),
+            "total_yards": Coalesce(Sum("yards_gained"), 0),
+            "avg_yards": Coalesce(Avg("yards_gained"), 0.0),
+            "touchbacks": Count("pk", filter=Q(is_touchback=True)),
+            "onside_attempts": Count("pk", filter=Q(is_onside_kick=True)),
+            "onside_recovered": Count("pk", filter=Q(onside_recovered=True)),
+            "out_of_bounds": Count("pk", filter=Q(out_of_bounds=True)),
+        }
 
+    @cached_report
     def get_field_goal_totals(self) -> dict:
         """Team field goal totals."""
-        totals = FieldGoalSnap.objects.filter(self.filters).aggregate(
-            attempts=Count("id"),
-            made=Count("id", filter=Q(result=FieldGoalSnap.Result.GOOD)),
-            missed=Count("id", filter=Q(result=FieldGoalSnap.Result.MISSED)),
-            blocked=Count("id", filter=Q(result=FieldGoalSnap.Result.BLOCKED)),
-            longest=Max("kick_distance", filter=Q(result=FieldGoalSnap.Result.GOOD)),
+        return self._with_percentage(
+            self._facts(FIELD_GOAL).aggregate(**self._field_goal_totals())
         )
 
+    def _field_goal_totals(self) -> dict:
+        return {
+            "attempts": Count("pk"),
+            "made": Count("pk", filter=Q(result=FieldGoalSnap.Result.GOOD)),
+            "missed": Count("pk", filter=Q(result=FieldGoalSnap.Result.MISSED)),
+            "blocked": Count("pk", filter=Q(result=FieldGoalSnap.Result.BLOCKED)),
+            "longest": Max("yards_gained", filter=Q(result=FieldGoalSnap.Result.GOOD)),
+        }
+
+    @staticmethod
+    def _with_percentage(totals: dict) -> dict:
         # Calculate percentage
         totals["percentage"] = (
             round(totals["made"] / totals["attempts"] * 100, 1)
             if totals["attempts"] > 0
             else 0.0
         )
-
         return totals
 
+    @cached_report
     def get_field_goal_by_kicker(self) -> list[dict]:
         """Per-kicker field goal statistics."""
-        stats = list(
-            FieldGoalSnap.objects.filter(self.filters, kicker__isnull=False)
-            .values(
-                "kicker__id",
-                "kicker__first_name",
-                "kicker__last_name",
-                "kicker__number",
-            )
-            .annotate(
-                attempts=Count("id"),
-                made=Count("id", filter=Q(result=FieldGoalSnap.Result.GOOD)),
-                missed=Count("id", filter=Q(result=FieldGoalSnap.Result.MISSED)),
-                blocked=Count("id", filter=Q(result=FieldGoalSnap.Result.BLOCKED)),
-                longest=Max("kick_distance", filter=Q(result=FieldGoalSnap.Result.GOOD)),
-            )
-            .order_by("-made")
-        )
+        return self._with_kicker_percentages(self._by_player(**self._kicker_split()))
 
-        for stat in stats:
-            stat["percentage"] = (
-                round(stat["made"] / stat["attempts"] * 100, 1)
-                if stat["attempts"] > 0
-                else 0.0
-            )
+    def _kicker_split(self) -> dict:
+        return {
+            "active": "fg_attempts",
+            "prefix": "kicker",
+            "fields": ["id", "first_name", "last_name", "number"],
+            "order_by": "-made",
+            "attempts": Sum("fg_attempts"),
+            "made": Sum("fg_made"),
+            "missed": Sum("fg_missed"),
+            "blocked": Sum("fg_blocked"),
+            "longest": Max("fg_longest"),
+        }
 
-        return stats
+    def _with_kicker_percentages(self, stats: list[dict]) -> list[dict]:
+        return [self._with_percentage(stat) for stat in stats]
 
+    @cached_report
     def get_extra_point_totals(self) -> dict:
         """Team extra point totals."""
-        totals = ExtraPointSnap.objects.filter(self.filters).aggregate(
+        return self._facts(EXTRA_POINT).aggregate(**self._extra_point_totals())
+
+    def _extra_point_totals(self) -> dict:
+        return {
             # PAT kicks
-            pat_attempts=Count(
-                "id", filter=Q(attempt_type=ExtraPointSnap.AttemptType.KICK)
+            "pat_attempts": Count(
+                "pk", filter=Q(attempt_type=ExtraPointSnap.AttemptType.KICK)
             ),
-            pat_made=Count(
-                "id",
+            "pat_made": Count(
+                "pk",
                 filter=Q(
                     attempt_type=ExtraPointSnap.AttemptType.KICK,
                     result=ExtraPointSnap.Result.GOOD,
                 ),
             ),
             # 2-point conversions
-            two_pt_attempts=Count(
-                "id",
+            "two_pt_attempts": Count(
+                "pk",
                 filter=Q(attempt_type__in=["2PT_RUN", "2PT_PASS"]),
             ),
-            two_pt_made=Count(
-                "id",
+            "two_pt_made": Count(
+                "pk",
                 filter=Q(
                     attempt_type__in=["2PT_RUN", "2PT_PASS"],
                     result=ExtraPointSnap.Result.GOOD,
                 ),
             ),
-        )
-
-        return totals
+        }
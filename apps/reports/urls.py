@@ -11,6 +11,9 @@ urlpatterns = [
     path("offense/passing/totals/", views.PassingTotalsView.as_view(), name="passing-totals"),
     path("offense/passing/quarterbacks/", views.PassingByQBView.as_view(), name="passing-qbs"),
     path("offense/receiving/players/", views.ReceivingByPlayerView.as_view(), name="receiving-players"),
+    path("offense/situational/", views.SituationalSplitsView.as_view(), name="situational-splits"),
+    path("offense/drives/", views.DriveSummaryView.as_view(), name="drive-summary"),
+    path("offense/epa/", views.EpaLeaderboardsView.as_view(), name="epa-leaderboards"),
     # Defense
     path("defense/totals/", views.DefenseTotalsView.as_view(), name="defense-totals"),
     path("defense/players/", views.DefenseByPlayerView.as_view(), name="defense-players"),
@@ -18,4 +21,6 @@ urlpatterns = [
     path("special-teams/punting/totals/", views.PuntTotalsView.as_view(), name="punt-totals"),
     path("special-teams/kicking/totals/", views.FieldGoalTotalsView.as_view(), name="fg-totals"),
     path("special-teams/kicking/kickers/", views.FieldGoalByKickerView.as_view(), name="fg-kickers"),
+    # Combined
+    path("bundle/", views.ReportBundleView.as_view(), name="report-bundle"),
 ]
@@ -5,7 +5,17 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from .services import OffenseReportService, DefenseReportService, SpecialTeamsReportService
+from apps.core.conditional import ConditionalGetMixin, make_etag
+from .cache import report_cache
+from .services import (
+    OffenseReportService,
+    DefenseReportService,
+    SpecialTeamsReportService,
+    ReportBundleService,
+    SituationalReportService,
+    DriveReportService,
+    ExpectedPointsReportService,
+)
 from .serializers import (
     RushingTotalsSerializer,
     RushingPlayerSerializer,
@@ -17,14 +27,38 @@ from .serializers import (
     FieldGoalTotalsSerializer,
     FieldGoalKickerSerializer,
     PuntTotalsSerializer,
+    ReportBundleSerializer,
+    SituationalSplitsSerializer,
+    DriveSummarySerializer,
+    EpaLeaderboardsSerializer,
 )
 
 
-class BaseReportView(APIView):
-    """Base class for report views with common parameter parsing."""
+class BaseReportView(ConditionalGetMixin, APIView):
+    """
+    Base class for report views with common parameter parsing.
+
+    Reports are tagged with the data version of the scope they cover (the
+    one their cached results are keyed by), so a client holding a current
+    copy gets a 304 after one indexed version lookup.
+    """
 
     permission_classes = [IsAuthenticated]
 
+    def get_validators(self, request):
+        try:
+            filters = self._get_filters(request)
+        except ValueError:
+            return None, None
+        etag = make_etag(
+            type(self).__name__,
+            request.get_full_path(),
+            request.accepted_media_type,
+            filters["team_id"],
+            report_cache.version(**filters),
+        )
+        return etag, None
+
     def _parse_game_ids(self, request):
         """Parse game_ids from query params."""
         game_ids_param = request.query_params.get("game_ids")
@@ -118,6 +152,60 @@ class ReceivingByPlayerView(BaseReportView):
         return Response(serializer.data)
 
 
+class SituationalSplitsView(BaseReportView):
+    """Down-and-distance, red-zone, formation and yardage splits."""
+
+    @extend_schema(
+        summary="Situational offense splits",
+        parameters=[
+            OpenApiParameter(name="game_ids", type=str, description="Comma-separated game IDs"),
+            OpenApiParameter(name="season_id", type=int, description="Filter by season"),
+        ],
+        responses={200: SituationalSplitsSerializer},
+    )
+    def get(self, request):
+        service = SituationalReportService(**self._get_filters(request))
+        data = service.get_splits()
+        serializer = SituationalSplitsSerializer(data)
+        return Response(serializer.data)
+
+
+class DriveSummaryView(BaseReportView):
+    """Drive efficiency: points per drive, three-and-outs, field position."""
+
+    @extend_schema(
+        summary="Drive efficiency summary",
+        parameters=[
+            OpenApiParameter(name="game_ids", type=str, description="Comma-separated game IDs"),
+            OpenApiParameter(name="season_id", type=int, description="Filter by season"),
+        ],
+        responses={200: DriveSummarySerializer},
+    )
+    def get(self, request):
+        service = DriveReportService(**self._get_filters(request))
+        data = service.get_drive_summary()
+        serializer = DriveSummarySerializer(data)
+        return Response(serializer.data)
+
+
+class EpaLeaderboardsView(BaseReportView):
+    """Team EPA per play and per-player EPA leaderboards."""
+
+    @extend_schema(
+        summary="Expected points added leaderboards",
+        parameters=[
+            OpenApiParameter(name="game_ids", type=str, description="Comma-separated game IDs"),
+            OpenApiParameter(name="season_id", type=int, description="Filter by season"),
+        ],
+        responses={200: EpaLeaderboardsSerializer},
+    )
+    def get(self, request):
+        service = ExpectedPointsReportService(**self._get_filters(request))
+        data = service.get_leaderboards()
+        serializer = EpaLeaderboardsSerializer(data)
+        return Response(serializer.data)
+
+
 # Defense Reports
 
 
@@ -192,3 +280,24 @@ class FieldGoalByKickerView(BaseReportView):
         data = service.get_field_goal_by_kicker()
         serializer = FieldGoalKickerSerializer(data, many=True)
         return Response(serializer.data)
+
+
+# Combined Reports
+
+
+class ReportBundleView(BaseReportView):
+    """Every report section in one response."""
+
+    @extend_schema(
+        summary="Offense, defense and special teams reports",
+        parameters=[
+            OpenApiParameter(name="game_ids", type=str, description="Comma-separated game IDs"),
+            OpenApiParameter(name="season_id", type=int, description="Filter by season"),
+        ],
+        responses={200: ReportBundleSerializer},
+    )
+    def get(self, request):
+        service = ReportBundleService(**self._get_filters(request))
+        data = service.get_bundle()
+        serializer = ReportBundleSerializer(data)
+        return Response(serializer.data)
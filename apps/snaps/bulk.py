@@ -0,0 +1,190 @@
+"""
+Bulk insert support for the polymorphic snap hierarchy.
+
+Django's ``bulk_create`` refuses multi-table inherited models, so a RunPlay
+normally costs one INSERT per table (snaps, snaps_offense, snaps_offense_run).
+``bulk_create_snaps`` instead inserts the whole batch, in any mix of snap
+types, with one multi-row INSERT into the root table (which returns the new
+ids) and one ``executemany`` per child table.
+"""
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, router, transaction
+
+from apps.games.models import Game
+
+from .models import BaseSnap, ScoreEntry, SnapFact
+from .models.ledger import points_scored
+
+
+def _table_chain(model):
+    """Concrete models backing ``model``, root table first."""
+    return [*reversed(model._meta.get_parent_list()), model]
+
+
+# Python types each column type's values can go to the driver as, unconverted
+_INTEGER = frozenset({int, type(None)})
+PLAIN_VALUE_TYPES = {
+    "AutoField": _INTEGER,
+    "BigAutoField": _INTEGER,
+    "IntegerField": _INTEGER,
+    "BigIntegerField": _INTEGER,
+    "SmallIntegerField": _INTEGER,
+    "PositiveIntegerField": _INTEGER,
+    "PositiveBigIntegerField": _INTEGER,
+    "PositiveSmallIntegerField": _INTEGER,
+    "BooleanField": frozenset({bool, type(None)}),
+    "CharField": frozenset({str, type(None)}),
+    "TextField": frozenset({str, type(None)}),
+}
+
+
+def _plain_value_types(field):
+    """Value types ``field`` can skip ``get_db_prep_save`` for (maybe none)."""
+    if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+        return frozenset()
+    target = field.target_field if field.is_relation else field
+    return PLAIN_VALUE_TYPES.get(target.get_internal_type(), frozenset())
+
+
+def insert_rows(model, objs, using):
+    """
+    INSERT one row per object with ``executemany``, returning nothing.
+
+    Values are taken straight from the objects instead of compiling a
+    multi-row statement value by value, which is most of the cost of
+    ``bulk_create`` on wide tables; only values that need conversion
+    (durations, dates, non-integer keys) go through the field's
+    ``get_db_prep_save``. For tables whose primary keys are already set
+    (child tables, SnapFact).
+    """
+    connection = connections[using]
+    fields = model._meta.local_concrete_fields
+    quote = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote(model._meta.db_table),
+        ", ".join(quote(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields)),
+    )
+    plain = [_plain_value_types(field) for field in fields]
+    rows = []
+    for obj in objs:
+        row = []
+        for field, plain_types in zip(fields, plain):
+            value = getattr(obj, field.attname)
+            if type(value) not in plain_types:
+                value = field.get_db_prep_save(field.pre_save(obj, True), connection)
+            row.append(value)
+        rows.append(row)
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def _insert_rows(model, objs, using):
+    """Multi-row INSERT of ``model``'s local columns, batched for the backend."""
+    connection = connections[using]
+    meta = model._meta
+    returning = meta.pk.attname if meta.pk.auto_created and not meta.parents else None
+    if not returning:
+        insert_rows(model, objs, using)
+        return
+    fields = [f for f in meta.local_concrete_fields if f.attname != returning]
+
+    batch_size = max(connection.ops.bulk_batch_size(fields, objs), 1)
+    can_return = connection.features.can_return_rows_from_bulk_insert
+    if returning and not can_return:
+        batch_size = 1
+
+    for start in range(0, len(objs), batch_size):
+        batch = objs[start:start + batch_size]
+        rows = model._base_manager.using(using)._insert(
+            batch,
+            fields=fields,
+            returning_fields=meta.db_returning_fields if returning else None,
+            using=using,
+        )
+        if returning:
+            for obj, row in zip(batch, rows):
+                setattr(obj, returning, row[0])
+
+
+def assign_sequence_numbers(snaps):
+    """
+    Number snaps that have no sequence number, per game, in play order.
+
+    Each game's counter is first advanced past any explicitly numbered
+    snaps, then one block is reserved for the rest, so a batch costs at
+    most two statements per game. Call inside the insert's transaction.
+    """
+    by_game = defaultdict(list)
+    for snap in snaps:
+        by_game[snap.game_id].append(snap)
+
+    for game_id, game_snaps in by_game.items():
+        explicit = [s.sequence_number for s in game_snaps if s.sequence_number is not None]
+        if explicit:
+            Game.objects.reserve_sequence_number(game_id, max(explicit))
+        missing = [s for s in game_snaps if s.sequence_number is None]
+        if missing:
+            numbers = Game.objects.allocate_sequence_block(game_id, len(missing))
+            for snap, number in zip(missing, numbers):
+                snap.sequence_number = number
+    return snaps
+
+
+def bulk_create_snaps(snaps, using=None):
+    """
+    Insert unsaved snaps of any concrete type with one INSERT per table.
+
+    Sequence numbers must already be assigned (see
+    ``assign_sequence_numbers``). ``BaseSnap.save()`` is not called, so
+    neither are signals; ``set_derived_fields()`` is. Their SnapFact rows
+    and the score ledger rows of scoring snaps are written in the same
+    transaction, each game's score moving once for the batch (on the
+    snaps' ``game`` instance too, when it is loaded).
+    Returns the snaps with primary keys populated.
+    """
+    snaps = list(snaps)
+    if not snaps:
+        return snaps
+    using = using or router.db_for_write(BaseSnap)
+
+    by_model = defaultdict(list)
+    for snap in snaps:
+        snap.set_derived_fields()
+        snap.polymorphic_ctype_id = ContentType.objects.db_manager(using).get_for_model(
+            snap, for_concrete_model=False
+        ).pk
+        by_model[type(snap)].append(snap)
+
+    with transaction.atomic(using=using, savepoint=False):
+        # Root rows for every type at once; their ids key all child tables.
+        _insert_rows(BaseSnap, snaps, using)
+
+        # Each intermediate/leaf table once, covering every type built on it.
+        by_table = defaultdict(list)
+        for model, objs in by_model.items():
+            for table_model in _table_chain(model)[1:]:
+                by_table[table_model].extend(objs)
+
+        for table_model in sorted(by_table, key=lambda m: len(m._meta.get_parent_list())):
+            objs = by_table[table_model]
+            for parent, link in table_model._meta.parents.items():
+                for obj in objs:
+                    setattr(obj, link.attname, getattr(obj, parent._meta.pk.attname))
+            _insert_rows(table_model, objs, using)
+
+        SnapFact.objects.db_manager(using).bulk_sync(snaps)
+
+        scoring = defaultdict(list)
+        for snap in snaps:
+            if points_scored(snap):
+                scoring[snap.game_id].append(snap)
+        for game_snaps in scoring.values():
+            ScoreEntry.objects.db_manager(using).record(game_snaps[0].game, game_snaps)
+
+    for snap in snaps:
+        snap._state.adding = False
+        snap._state.db = using
+    return snaps
@@ -0,0 +1,473 @@
+"""
+Expected points (EP) and win probability (WP) from our own snaps.
+
+The model is two small lookup tables fitted offline with NumPy
+(``manage.py fit_expected_points``) and stored as one ``.npz`` file at
+``settings.EXPECTED_POINTS_TABLES``:
+
+- ``ep[down, distance bin, yards-to-goal bin]``: the points our offense
+  goes on to score on the current drive from that situation. Each cell
+  is the observed mean shrunk toward a smooth field-position curve plus
+  a per-down offset, so sparse cells stay sensible. Opponent
+  possessions are not tracked snap by snap, so EP counts our drive's
+  points only (a turnover is worth 0, not the opponent's EP).
+- ``wp[elapsed bin, lead]``: a logistic regression of the game result
+  on our lead (score entering the quarter, from QuarterScore, plus the
+  snap's EP) and game time, evaluated on a grid.
+
+EPA for a scrimmage play is EP after the play minus EP before it, with
+the after-state derived from the play itself (yards, first down,
+touchdown, turnover), so a play is scored as soon as it is recorded
+without waiting for the next snap. Punts and field goal attempts end
+the drive: their EP after is 0 or the 3 points made.
+
+``score_facts`` fills ``ep``, ``epa`` and ``wp`` on SnapFact instances
+before they are written (``SnapFactManager`` calls it for every tracker
+play and bulk insert); ``rescore`` recomputes stored facts in bulk after
+a refit. Without a fitted model the columns stay empty.
+"""
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+from apps.games.models import Game, QuarterScore
+from apps.snaps.signals import snap_data_changed
+
+from .models import Drive, FieldGoalSnap, OffenseSnap, SnapFact
+
+PlayType = SnapFact.PlayType
+
+SCRIMMAGE = [PlayType.RUN, PlayType.PASS, PlayType.OFFENSE]
+DRIVE_ENDING_KICKS = [PlayType.PUNT, PlayType.FIELD_GOAL]
+
+# Distance bins: 1, 2, 3, 4-5, 6-7, 8-10, 11-15, 16+
+DISTANCE_EDGES = np.array([2, 3, 4, 6, 8, 11, 16])
+# Yards to the opponent's goal (1-99) in 5-yard bins
+YARD_BIN = 5
+YARD_BINS = 20
+
+# Regulation in 16 bins of 3:45; overtime shares the last bin
+QUARTER_SECONDS = 15 * 60
+GAME_SECONDS = 4 * QUARTER_SECONDS
+TIME_BINS = 16
+MAX_LEAD = 28
+
+# Weight, in plays, of the smooth prior against each cell's own mean
+SHRINKAGE = 25
+RIDGE = 1.0
+MIN_PLAYS = 100
+
+# SnapFact columns needed to score a fact
+SCORE_FIELDS = [
+    "game", "quarter", "game_clock", "down", "distance", "ball_position",
+    "play_type", "result", "yards_gained", "sack_yards", "was_sacked",
+    "is_touchdown", "is_first_down", "is_interception", "fumble_lost",
+]
+
+
+@dataclass
+class ExpectedPointsModel:
+    """Fitted EP and WP tables."""
+
+    ep: np.ndarray
+    wp: np.ndarray
+    touchdown_value: float
+    plays: int = 0
+    games: int = 0
+
+    def expected_points(self, down, distance, yards_to_goal):
+        """EP per situation; NaN where down, distance or position is missing."""
+        down = np.asarray(down, dtype=float)
+        distance = np.asarray(distance, dtype=float)
+        yards_to_goal = np.asarray(yards_to_goal, dtype=float)
+        known = (
+            (down >= 1) & (down <= 4) & (distance >= 1)
+            & (yards_to_goal >= 1) & (yards_to_goal <= 99)
+        )
+        result = np.full(down.shape, np.nan)
+        result[known] = self.ep[
+            down[known].astype(int) - 1,
+            _distance_bin(distance[known]),
+            _yard_bin(yards_to_goal[known]),
+        ]
+        return result
+
+    def situation_ep(self, columns):
+        """EP before each of our offense's snaps in fact columns; NaN otherwise."""
+        ep = self.expected_points(
+            columns["down"], columns["distance"], 50 - columns["ball_position"]
+        )
+        return np.where(_ours(columns), ep, np.nan)
+
+    def win_probability(self, elapsed, lead):
+        """WP for seconds of game time elapsed and our (expected) lead."""
+        return self.wp[_time_bin(np.asarray(elapsed, dtype=float)), _lead_bin(lead)]
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                ep=self.ep.astype(np.float32),
+                wp=self.wp.astype(np.float32),
+                touchdown_value=self.touchdown_value,
+                plays=self.plays,
+                games=self.games,
+            )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as tables:
+            return cls(
+                ep=tables["ep"].astype(float),
+                wp=tables["wp"].astype(float),
+                touchdown_value=float(tables["touchdown_value"]),
+                plays=int(tables["plays"]),
+                games=int(tables["games"]),
+            )
+
+    @classmethod
+    def fit(cls, game_ids=None):
+        """Fit both tables from the stored facts, drives and game results."""
+        facts = SnapFact.objects.all()
+        drives = Drive.objects.exclude(result="")
+        games = Game.objects.all()
+        if game_ids is not None:
+            facts = facts.filter(game_id__in=game_ids)
+            drives = drives.filter(game_id__in=game_ids)
+            games = games.filter(pk__in=game_ids)
+
+        columns = _columns(facts.values_list("sequence_number", *_attnames(SCORE_FIELDS)))
+        drive_rows = np.array(
+            list(drives.values_list("game_id", "start_sequence", "end_sequence", "points")),
+            dtype=float,
+        ).reshape(-1, 4)
+
+        points = _drive_points(columns, drive_rows)
+        situation = _ours(columns) & ~np.isnan(points)
+        yards_to_goal = 50 - columns["ball_position"]
+        known = situation & (
+            (columns["down"] >= 1) & (columns["down"] <= 4) & (columns["distance"] >= 1)
+            & (yards_to_goal >= 1) & (yards_to_goal <= 99)
+        )
+        if known.sum() < MIN_PLAYS:
+            raise ValueError(
+                f"{int(known.sum())} plays with a known situation; at least "
+                f"{MIN_PLAYS} are needed to fit expected points"
+            )
+
+        ep = _fit_ep(
+            columns["down"][known].astype(int) - 1,
+            columns["distance"][known],
+            yards_to_goal[known],
+            points[known],
+        )
+        touchdown_drives = drive_rows[:, 3][drive_rows[:, 3] >= 6]
+        model = cls(
+            ep=ep,
+            wp=np.zeros((TIME_BINS, 2 * MAX_LEAD + 1)),
+            touchdown_value=float(touchdown_drives.mean()) if touchdown_drives.size else 7.0,
+            plays=int(known.sum()),
+        )
+
+        results = {
+            game_id: 1.0 if ours > theirs else 0.0 if ours < theirs else 0.5
+            for game_id, ours, theirs in games.values_list(
+                "pk", "team_score", "opponent_score"
+            )
+        }
+        model.games = len(results)
+        won = np.array([results.get(game_id, np.nan) for game_id in columns["game_id"]])
+        timed = ~np.isnan(won)
+        lead = _leads(columns, quarter_leads(game_ids)) + np.nan_to_num(
+            model.situation_ep(columns)
+        )
+        _, game_index, game_snaps = np.unique(
+            columns["game_id"][timed], return_inverse=True, return_counts=True
+        )
+        model.wp = _fit_wp(
+            _elapsed(columns)[timed], lead[timed], won[timed], 1 / game_snaps[game_index]
+        )
+        return model
+
+
+def _ours(columns):
+    """Snaps with our offense on the field: scrimmage plays, punts and field goals."""
+    return np.isin(columns["play_type"], SCRIMMAGE + DRIVE_ENDING_KICKS)
+
+
+def _distance_bin(distance):
+    return np.digitize(distance, DISTANCE_EDGES)
+
+
+def _yard_bin(yards_to_goal):
+    return np.clip((yards_to_goal.astype(int) - 1) // YARD_BIN, 0, YARD_BINS - 1)
+
+
+def _time_bin(elapsed):
+    return np.clip((elapsed * TIME_BINS // GAME_SECONDS).astype(int), 0, TIME_BINS - 1)
+
+
+def _lead_bin(lead):
+    return np.clip(np.rint(lead).astype(int), -MAX_LEAD, MAX_LEAD) + MAX_LEAD
+
+
+def _fit_ep(down, distance, yards_to_goal, points):
+    """Shrunk cell means over a quadratic field-position curve plus down offsets."""
+    curve = np.polynomial.Polynomial.fit(yards_to_goal, points, deg=2)
+    residual = points - curve(yards_to_goal)
+    down_offset = (
+        np.bincount(down, weights=residual, minlength=4)
+        / (np.bincount(down, minlength=4) + SHRINKAGE)
+    )
+    centers = np.arange(YARD_BINS) * YARD_BIN + (YARD_BIN + 1) / 2
+    prior = down_offset[:, None, None] + curve(centers)[None, None, :]
+
+    shape = (4, len(DISTANCE_EDGES) + 1, YARD_BINS)
+    cell = np.ravel_multi_index(
+        (down, _distance_bin(distance), _yard_bin(yards_to_goal)), shape
+    )
+    size = int(np.prod(shape))
+    sums = np.bincount(cell, weights=points, minlength=size).reshape(shape)
+    counts = np.bincount(cell, minlength=size).reshape(shape)
+    return (sums + SHRINKAGE * prior) / (counts + SHRINKAGE)
+
+
+def _fit_wp(elapsed, lead, won, weight):
+    """
+    Ridge-regularized logistic regression by IRLS, evaluated on the table grid.
+
+    ``weight`` gives each game a total weight of one, so long games do not
+    count more and a handful of games cannot push the fit to certainty.
+    """
+    def features(elapsed, lead):
+        share = np.clip(elapsed / GAME_SECONDS, 0, 1)
+        return np.column_stack([np.ones_like(lead), lead, lead * share, share])
+
+    x = features(elapsed, lead)
+    beta = np.zeros(x.shape[1])
+    penalty = RIDGE * np.eye(x.shape[1])
+    for _ in range(50):
+        p = 1 / (1 + np.exp(-x @ beta))
+        hessian = x.T @ (x * (weight * p * (1 - p))[:, None]) + penalty
+        step = np.linalg.solve(hessian, x.T @ (weight * (won - p)) - penalty @ beta)
+        beta += step
+        if np.abs(step).max() < 1e-8:
+            break
+
+    grid_elapsed, grid_lead = np.meshgrid(
+        (np.arange(TIME_BINS) + 0.5) * GAME_SECONDS / TIME_BINS,
+        np.arange(-MAX_LEAD, MAX_LEAD + 1),
+        indexing="ij",
+    )
+    logits = features(grid_elapsed.ravel(), grid_lead.ravel().astype(float)) @ beta
+    return (1 / (1 + np.exp(-logits))).reshape(grid_elapsed.shape)
+
+
+def _attnames(fields):
+    return [f"{name}_id" if name == "game" else name for name in fields]
+
+
+def _columns(rows):
+    """Fact rows (``sequence_number`` then SCORE_FIELDS) as NumPy columns."""
+    names = ["sequence_number", *_attnames(SCORE_FIELDS)]
+    rows = list(rows)
+    raw = dict(zip(names, zip(*rows))) if rows else {name: () for name in names}
+    columns = {
+        name: np.array(raw[name], dtype=object if name in ("play_type", "result") else float)
+        for name in names
+        if name != "game_clock"
+    }
+    for flag in ("was_sacked", "is_touchdown", "is_first_down", "is_interception", "fumble_lost"):
+        columns[flag] = columns[flag].astype(bool)
+    columns["game_clock"] = np.array(
+        [np.nan if clock is None else clock.total_seconds() for clock in raw["game_clock"]],
+        dtype=float,
+    )
+    return columns
+
+
+def _drive_points(columns, drives):
+    """Points of the closed drive each fact belongs to; NaN outside one."""
+    points = np.full(len(columns["game_id"]), np.nan)
+    if not len(drives):
+        return points
+    # Order drives by (game, start) and find the last one starting at or
+    # before each fact
+    span = max(columns["sequence_number"].max(initial=0), drives[:, 2].max()) + 1
+    starts = drives[:, 0] * span + drives[:, 1]
+    order = np.argsort(starts)
+    keys = columns["game_id"] * span + columns["sequence_number"]
+    index = np.searchsorted(starts[order], keys, side="right") - 1
+    found = index >= 0
+    drive = order[np.clip(index, 0, None)]
+    inside = found & (drives[drive, 0] == columns["game_id"]) & (
+        columns["sequence_number"] <= drives[drive, 2]
+    )
+    points[inside] = drives[drive[inside], 3]
+    return points
+
+
+def quarter_leads(game_ids=None):
+    """
+    Our lead entering each recorded quarter, as ``{(game_id, quarter): lead}``.
+
+    ``(game_id, None)`` holds the lead after the last recorded quarter.
+    """
+    scores = QuarterScore.objects.order_by("game_id", "quarter")
+    if game_ids is not None:
+        scores = scores.filter(game_id__in=list(game_ids))
+    leads = {}
+    running = {}
+    for game_id, quarter, ours, theirs in scores.values_list(
+        "game_id", "quarter", "team_score", "opponent_score"
+    ):
+        lead = running.get(game_id, 0)
+        leads[game_id, quarter] = lead
+        running[game_id] = lead + ours - theirs
+    for game_id, lead in running.items():
+        leads[game_id, None] = lead
+    return leads
+
+
+def _leads(columns, leads):
+    """Lead entering each fact's quarter (after the last recorded one if later)."""
+    return np.array([
+        leads.get((game_id, quarter), leads.get((game_id, None), 0))
+        for game_id, quarter in zip(columns["game_id"], columns["quarter"])
+    ], dtype=float)
+
+
+def _elapsed(columns):
+    """Seconds of game time before each snap; mid-quarter when the clock is missing."""
+    remaining = np.where(
+        np.isnan(columns["game_clock"]), QUARTER_SECONDS / 2, columns["game_clock"]
+    )
+    return (np.minimum(columns["quarter"], 4) - 1) * QUARTER_SECONDS + (
+        QUARTER_SECONDS - remaining
+    )
+
+
+def _score(model, columns, leads):
+    """(ep, epa, wp) arrays for fact columns."""
+    play_type = columns["play_type"]
+    down, distance = columns["down"], columns["distance"]
+    yards_to_goal = 50 - columns["ball_position"]
+    ep = model.situation_ep(columns)
+
+    gained = np.nan_to_num(columns["yards_gained"])
+    net = np.where(
+        play_type == PlayType.OFFENSE,
+        -gained,
+        gained + np.where(columns["was_sacked"], columns["sack_yards"], 0),
+    )
+    converted = columns["is_first_down"] | (net >= distance)
+    after_yards = np.clip(yards_to_goal - net, 1, 99)
+    # A penalty replays the down; anything else uses one up
+    replayed = (play_type == PlayType.OFFENSE) & (
+        columns["result"] == OffenseSnap.PlayResult.PENALTY
+    )
+    after = np.where(
+        converted,
+        model.expected_points(np.ones_like(down), np.minimum(10, after_yards), after_yards),
+        model.expected_points(
+            np.where(replayed, down, down + 1), np.maximum(distance - net, 1), after_yards
+        ),
+    )
+    # A failed fourth down (down + 1 == 5) has no EP: the drive is over
+    after = np.nan_to_num(after)
+    after = np.where(columns["is_touchdown"], model.touchdown_value, after)
+    after = np.where(columns["is_interception"] | columns["fumble_lost"], 0.0, after)
+    after = np.where(
+        play_type == PlayType.FIELD_GOAL,
+        np.where(columns["result"] == FieldGoalSnap.Result.GOOD, 3.0, 0.0),
+        np.where(play_type == PlayType.PUNT, 0.0, after),
+    )
+    epa = after - ep
+
+    lead = _leads(columns, leads) + np.nan_to_num(ep)
+    wp = np.where(columns["quarter"] >= 1, model.win_probability(_elapsed(columns), lead), np.nan)
+    return ep, epa, wp
+
+
+def _value(number, digits):
+    return None if np.isnan(number) else round(float(number), digits)
+
+
+def score_facts(facts, model=None):
+    """
+    Fill ``ep``, ``epa`` and ``wp`` on SnapFact instances in place.
+
+    Costs one query (the games' quarter scores) and nothing when no model
+    has been fitted yet.
+    """
+    facts = list(facts)
+    model = model or load_model()
+    if model is None or not facts:
+        return facts
+    columns = _columns([
+        (fact.sequence_number, *(getattr(fact, name) for name in _attnames(SCORE_FIELDS)))
+        for fact in facts
+    ])
+    ep, epa, wp = _score(model, columns, quarter_leads({fact.game_id for fact in facts}))
+    for fact, fact_ep, fact_epa, fact_wp in zip(facts, ep, epa, wp):
+        fact.ep = _value(fact_ep, 3)
+        fact.epa = _value(fact_epa, 3)
+        fact.wp = _value(fact_wp, 4)
+    return facts
+
+
+def rescore(game_ids=None, model=None, batch_size=50):
+    """
+    Recompute ``ep``/``epa``/``wp`` for stored facts, ``batch_size`` games
+    at a time. Returns the row count.
+    """
+    model = model or load_model()
+    if model is None:
+        return 0
+    if game_ids is None:
+        game_ids = Game.objects.order_by("pk").values_list("pk", flat=True)
+    game_ids = list(game_ids)
+
+    total = 0
+    scopes = set()
+    for start in range(0, len(game_ids), batch_size):
+        facts = score_facts(
+            SnapFact.objects.filter(game_id__in=game_ids[start:start + batch_size])
+            .only("sequence_number", "season", "team", *SCORE_FIELDS),
+            model,
+        )
+        SnapFact.objects.bulk_update(facts, ["ep", "epa", "wp"], batch_size=500)
+        scopes.update(SnapFact.objects.scope_of(fact) for fact in facts)
+        total += len(facts)
+
+    snap_data_changed.send(sender=SnapFact, scopes=scopes)
+    return total
+
+
+_loaded = {}
+
+
+def load_model(path=None):
+    """
+    The model stored at ``path`` (default ``settings.EXPECTED_POINTS_TABLES``).
+
+    Returns None when nothing has been fitted. The tables are cached per
+    process and re-read when the file changes, so a refit reaches running
+    workers without a restart.
+    """
+    path = path or getattr(settings, "EXPECTED_POINTS_TABLES", None)
+    if not path:
+        return None
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _loaded.get(str(path))
+    if cached is None or cached[0] != modified:
+        cached = _loaded[str(path)] = (modified, ExpectedPointsModel.load(path))
+    return cached[1]
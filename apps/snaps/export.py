@@ -0,0 +1,239 @@
+"""
+Streaming play-by-play export.
+
+Every concrete snap type is read with its own server-side cursor
+(``iterator(chunk_size=...)``) ordered by game and sequence number, and
+the per-type streams are merged lazily, so an export holds at most one
+chunk per snap type in memory however large the season is. Rows are
+flat dicts over the union of all snap columns; columns a snap type does
+not have are empty.
+
+Formats: ``csv``, ``ndjson``, ``parquet`` and ``arrow`` (Arrow IPC
+stream). The columnar formats need ``pyarrow`` and write one row group /
+record batch per chunk.
+"""
+import csv
+import heapq
+import io
+import json
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from .models import BaseSnap
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Text output is flushed to the client in pieces of roughly this size
+FLUSH_BYTES = 64 * 1024
+
+SCOPE_FILTERS = {
+    "game_id": "game_id",
+    "season_id": "game__season_id",
+    "team_id": "game__season__team_id",
+}
+
+
+def snap_models():
+    """BaseSnap and every concrete subclass, parents before children."""
+    found = [BaseSnap]
+    for model in found:
+        found.extend(
+            subclass
+            for subclass in model.__subclasses__()
+            if not subclass._meta.abstract and not subclass._meta.proxy
+        )
+    return found
+
+
+def _exported_fields(model):
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if not (isinstance(field, models.OneToOneField) and field.remote_field.parent_link)
+        and field.attname != "polymorphic_ctype_id"
+    ]
+
+
+def export_fields():
+    """Exported model fields by column name, in output order."""
+    fields = {}
+    for model in snap_models():
+        for field in _exported_fields(model):
+            fields.setdefault(field.attname, field)
+    return fields
+
+
+def export_columns():
+    return ["snap_type", *export_fields()]
+
+
+def export_rows(game_id=None, season_id=None, team_id=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield one dict per snap in scope, ordered by game and sequence number.
+
+    Durations (game clock, hang time) are exported as seconds.
+    """
+    scope = {"game_id": game_id, "season_id": season_id, "team_id": team_id}
+    filters = {SCOPE_FILTERS[key]: value for key, value in scope.items() if value}
+    empty_row = dict.fromkeys(export_columns())
+
+    streams = []
+    for model in snap_models():
+        columns = [field.attname for field in _exported_fields(model)]
+        durations = [
+            field.attname
+            for field in _exported_fields(model)
+            if isinstance(field, models.DurationField)
+        ]
+        rows = (
+            model._base_manager.non_polymorphic()
+            .filter(
+                polymorphic_ctype=ContentType.objects.get_for_model(
+                    model, for_concrete_model=False
+                ),
+                **filters,
+            )
+            .order_by("game_id", "sequence_number")
+            .values_list(*columns)
+            .iterator(chunk_size=chunk_size)
+        )
+        streams.append(_as_dicts(rows, model.__name__, columns, durations, empty_row))
+
+    return heapq.merge(
+        *streams, key=lambda row: (row["game_id"], row["sequence_number"])
+    )
+
+
+def _as_dicts(rows, snap_type, columns, durations, empty_row):
+    for values in rows:
+        row = {**empty_row, "snap_type": snap_type, **dict(zip(columns, values))}
+        for column in durations:
+            if row[column] is not None:
+                row[column] = row[column].total_seconds()
+        yield row
+
+
+def stream_csv(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encode rows as CSV with a header line, yielding bytes."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=export_columns())
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= FLUSH_BYTES:
+            yield _drain_text(buffer)
+    yield _drain_text(buffer)
+
+
+def stream_ndjson(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encode rows as newline-delimited JSON, yielding bytes."""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(json.dumps(row, cls=DjangoJSONEncoder))
+        buffer.write("\n")
+        if buffer.tell() >= FLUSH_BYTES:
+            yield _drain_text(buffer)
+    yield _drain_text(buffer)
+
+
+def stream_parquet(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encode rows as a Parquet file, one row group per chunk."""
+    import pyarrow.parquet as pq
+
+    yield from _stream_arrow(
+        rows, chunk_size, lambda sink, schema: pq.ParquetWriter(sink, schema)
+    )
+
+
+def stream_arrow(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Encode rows as an Arrow IPC stream, one record batch per chunk."""
+    import pyarrow as pa
+
+    yield from _stream_arrow(
+        rows, chunk_size, lambda sink, schema: pa.ipc.new_stream(sink, schema)
+    )
+
+
+def _stream_arrow(rows, chunk_size, open_writer):
+    import pyarrow as pa
+
+    schema = arrow_schema()
+    sink = _ByteSink()
+    writer = open_writer(sink, schema)
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            batch = []
+            yield sink.drain()
+    if batch:
+        writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+    writer.close()
+    yield sink.drain()
+
+
+def arrow_schema():
+    """Arrow schema matching ``export_columns()``."""
+    import pyarrow as pa
+
+    def arrow_type(field):
+        if isinstance(field, models.ForeignKey):
+            return arrow_type(field.target_field)
+        if isinstance(field, models.BooleanField):
+            return pa.bool_()
+        if isinstance(field, models.IntegerField):
+            return pa.int64()
+        if isinstance(field, (models.DurationField, models.FloatField)):
+            return pa.float64()
+        if isinstance(field, models.DateTimeField):
+            return pa.timestamp("us", tz="UTC")
+        return pa.string()
+
+    return pa.schema(
+        [("snap_type", pa.string())]
+        + [(name, arrow_type(field)) for name, field in export_fields().items()]
+    )
+
+
+class _ByteSink(io.RawIOBase):
+    """Write-only file that hands written bytes back to a generator."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _drain_text(buffer):
+    data = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+# format -> (encoder, content type, file extension)
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv", "csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson", "ndjson"),
+    "parquet": (stream_parquet, "application/vnd.apache.parquet", "parquet"),
+    "arrow": (stream_arrow, "application/vnd.apache.arrow.stream", "arrows"),
+}
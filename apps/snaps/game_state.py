@@ -0,0 +1,360 @@
+"""
+Game state machine for the live tracker.
+
+A game's situation - quarter, down, distance, ball position and what the
+next snap has to be - is an immutable ``GameState``. ``advance`` applies
+one play's ``Outcome`` to a state. States are interned and transitions
+memoized, so a situation the game has been in before is a dictionary
+lookup that returns the same instance rather than a freshly built dict.
+
+``replay`` folds a game's snaps into its current state. Each snap's
+recorded down, distance and ball position (what the coach saw before the
+snap) take precedence over the running state, so a corrected spot on one
+play carries forward. ``GameStateCache`` keeps the state after every snap
+of a game, so tracker writes extend it by one transition and an undo
+steps back one, instead of replaying the game.
+
+Ball position is from the point of view of the team with the ball,
+-50 (own goal line) to 50.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .models import (
+    BaseSnap,
+    DefenseSnap,
+    ExtraPointSnap,
+    FieldGoalSnap,
+    KickoffSnap,
+    OffenseSnap,
+    PassPlay,
+    PuntSnap,
+    RunPlay,
+)
+from .querysets import downcast_snaps
+
+# What the next snap has to be
+NORMAL = "normal"
+EXTRA_POINT = "extra_point"
+KICKOFF = "kickoff"
+TURNOVER = "turnover"
+OPPONENT_BALL = "opponent_ball"
+TURNOVER_ON_DOWNS = "turnover_on_downs"
+
+# Outcome kinds
+SCRIMMAGE = "scrimmage"
+PENALTY = "penalty"
+PUNT = "punt"
+FIELD_GOAL = "field_goal"
+
+# Bounds for the interned states and memoized transitions
+STATE_CACHE_SIZE = 1 << 16
+TRANSITION_CACHE_SIZE = 1 << 16
+
+DEFAULT_CACHE_ALIAS = "default"
+CACHE_PREFIX = "game-state"
+
+
+@dataclass(frozen=True, slots=True)
+class GameState:
+    """The situation before a game's next snap."""
+
+    quarter: int
+    down: int | None
+    distance: int | None
+    ball_position: int | None
+    situation: str
+
+    @staticmethod
+    def of(quarter, down, distance, ball_position, situation=NORMAL):
+        """The interned state with these values."""
+        return _intern(quarter, down, distance, ball_position, situation)
+
+    def replace(self, **changes):
+        """This state with ``changes`` applied (interned)."""
+        return _intern(
+            changes.get("quarter", self.quarter),
+            changes.get("down", self.down),
+            changes.get("distance", self.distance),
+            changes.get("ball_position", self.ball_position),
+            changes.get("situation", self.situation),
+        )
+
+    def as_dict(self):
+        return {
+            "quarter": self.quarter,
+            "down": self.down,
+            "distance": self.distance,
+            "ball_position": self.ball_position,
+            "situation": self.situation,
+        }
+
+
+@lru_cache(maxsize=STATE_CACHE_SIZE)
+def _intern(quarter, down, distance, ball_position, situation):
+    return GameState(quarter, down, distance, ball_position, situation)
+
+
+# A game that has not started is waiting for the opening kickoff
+INITIAL_STATE = GameState.of(1, None, None, 35, KICKOFF)
+
+
+class Outcome(NamedTuple):
+    """What one play did, as far as the down/distance rules care."""
+
+    kind: str
+    yards: int = 0
+    touchdown: bool = False
+    first_down: bool = False
+    turnover: bool = False
+    touchback: bool = False
+    good: bool = False
+    # Penalties only
+    on_offense: bool = True
+    accepted: bool = True
+    auto_first_down: bool = False
+
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def advance(state, outcome):
+    """The state after a play with ``outcome`` run from ``state``."""
+    quarter = state.quarter
+    down = state.down or 1
+    distance = state.distance or 10
+    ball = state.ball_position or 0
+    kind = outcome.kind
+    yards = outcome.yards
+
+    if outcome.touchdown:
+        return _intern(quarter, None, None, 35, EXTRA_POINT)
+    if outcome.turnover:
+        return _intern(quarter, 1, 10, -(ball + yards), TURNOVER)
+
+    if kind == KICKOFF:
+        return _intern(quarter, 1, 10, -25, NORMAL)
+    if kind == PUNT:
+        if outcome.touchback:
+            return _intern(quarter, 1, 10, -20, OPPONENT_BALL)
+        return _intern(quarter, 1, 10, -(ball + yards), OPPONENT_BALL)
+    if kind == FIELD_GOAL:
+        if outcome.good:
+            return _intern(quarter, None, None, 35, KICKOFF)
+        # Miss/block: opponent ball at the spot
+        return _intern(quarter, 1, 10, -ball, OPPONENT_BALL)
+    if kind == EXTRA_POINT:
+        return _intern(quarter, None, None, 35, KICKOFF)
+
+    if kind == PENALTY:
+        if not outcome.accepted:
+            # Declined: as if no play, the down advances
+            return _intern(quarter, down + 1, distance, ball, NORMAL)
+        if outcome.on_offense:
+            position, distance = ball - yards, distance + yards
+        else:
+            position, distance = ball + yards, distance - yards
+        if outcome.auto_first_down or distance <= 0:
+            return _intern(quarter, 1, 10, position, NORMAL)
+        return _intern(quarter, down, distance, position, NORMAL)
+
+    # Scrimmage plays
+    position = ball + yards
+    distance -= yards
+    if outcome.first_down or distance <= 0:
+        return _intern(quarter, 1, 10, position, NORMAL)
+    if down >= 4:
+        return _intern(quarter, 1, 10, -position, TURNOVER_ON_DOWNS)
+    return _intern(quarter, down + 1, max(distance, 1), max(min(position, 50), -50), NORMAL)
+
+
+def outcome_of(snap, accepted=True, auto_first_down=False):
+    """
+    The ``Outcome`` of a concrete snap, or None if it does not move the state.
+
+    Whether a penalty was declined or gave an automatic first down is not
+    stored (declined penalties are saved with no yardage), so the tracker
+    passes what the coach entered; replays take the defaults.
+    """
+    if isinstance(snap, RunPlay):
+        return Outcome(
+            SCRIMMAGE,
+            yards=snap.yards_gained,
+            touchdown=snap.is_touchdown,
+            first_down=snap.is_first_down,
+            turnover=snap.fumble_lost,
+        )
+    if isinstance(snap, PassPlay):
+        return Outcome(
+            SCRIMMAGE,
+            yards=snap.sack_yards if snap.was_sacked else snap.yards_gained,
+            touchdown=snap.is_touchdown,
+            first_down=snap.is_first_down,
+            turnover=snap.is_interception or snap.fumble_lost,
+        )
+    if isinstance(snap, (OffenseSnap, DefenseSnap)) and snap.play_result == snap.PlayResult.PENALTY:
+        return Outcome(
+            PENALTY,
+            yards=snap.penalty_yards or 0,
+            on_offense=isinstance(snap, OffenseSnap),
+            accepted=accepted,
+            auto_first_down=auto_first_down,
+        )
+    if isinstance(snap, DefenseSnap):
+        # The opponent's scrimmage play, from their side of the ball
+        return Outcome(
+            SCRIMMAGE,
+            yards=snap.tackle_yards or 0,
+            touchdown=snap.is_defensive_touchdown,
+            turnover=snap.play_result in (
+                DefenseSnap.PlayResult.INTERCEPTION, DefenseSnap.PlayResult.FUMBLE_RECOVERY
+            ),
+        )
+    if isinstance(snap, KickoffSnap):
+        return Outcome(KICKOFF, touchback=snap.is_touchback)
+    if isinstance(snap, PuntSnap):
+        return Outcome(PUNT, yards=snap.punt_yards, touchback=snap.is_touchback)
+    if isinstance(snap, FieldGoalSnap):
+        return Outcome(FIELD_GOAL, good=snap.result == FieldGoalSnap.Result.GOOD)
+    if isinstance(snap, ExtraPointSnap):
+        return Outcome(EXTRA_POINT)
+    # Returns and other snaps the tracker does not record
+    return None
+
+
+def step(state, snap, outcome=None):
+    """
+    The state after ``snap``, played from ``state``.
+
+    Down, distance and ball position recorded on the snap replace the
+    running values; ``outcome`` defaults to ``outcome_of(snap)``.
+    """
+    state = _intern(
+        snap.quarter,
+        state.down if snap.down is None else snap.down,
+        state.distance if snap.distance is None else snap.distance,
+        state.ball_position if snap.ball_position is None else snap.ball_position,
+        state.situation,
+    )
+    if outcome is None:
+        outcome = outcome_of(snap)
+    return state if outcome is None else advance(state, outcome)
+
+
+def replay(snaps, state=INITIAL_STATE):
+    """Fold concrete snaps, in sequence order, into the game's current state."""
+    for snap in snaps:
+        state = step(state, snap)
+    return state
+
+
+def _stamp(snap):
+    """Identifies one version of a stored snap."""
+    return (snap.pk, snap.sequence_number, snap.updated_at)
+
+
+class GameStateCache:
+    """
+    Per-game state history, kept in step with tracker writes.
+
+    An entry is a tuple of ``(stamp, state)``, one per snap in sequence
+    order, where the state is the one after that snap. Reads check the
+    entry against the game's latest snap and replay the game when it no
+    longer matches (a snap edited or deleted elsewhere, an evicted entry),
+    so the cache never has to be invalidated explicitly.
+    """
+
+    def __init__(self, alias=None):
+        self._alias = alias
+
+    @property
+    def alias(self):
+        return self._alias or getattr(settings, "GAME_STATE_CACHE_ALIAS", DEFAULT_CACHE_ALIAS)
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def current(self, game_id, last_snap):
+        """The state before the next snap; ``last_snap`` is the game's latest."""
+        history = self.backend.get(self._key(game_id))
+        if history is None or not self._matches(history, last_snap):
+            history = self.rebuild(game_id)
+        return history[-1][1] if history else INITIAL_STATE
+
+    def append(self, game_id, snaps, outcomes=None):
+        """
+        Extend the game's history with newly saved concrete snaps.
+
+        ``outcomes`` (parallel to ``snaps``) overrides ``outcome_of`` for
+        details the snaps do not store. Returns the new current state.
+
+        The snaps must directly follow the cached history; if any were
+        saved or removed in between (through the API, an import or another
+        worker whose append was lost), the game is replayed instead.
+        """
+        history = self.backend.get(self._key(game_id))
+        if history is None or not self._continues(history, snaps):
+            # Cold, or the snaps do not follow on: replay from the database
+            history = self.rebuild(game_id)
+            return history[-1][1] if history else INITIAL_STATE
+
+        state = history[-1][1] if history else INITIAL_STATE
+        added = []
+        for snap, outcome in zip(snaps, outcomes or [None] * len(snaps)):
+            state = step(state, snap, outcome)
+            added.append((_stamp(snap), state))
+        self.backend.set(self._key(game_id), history + tuple(added), timeout=None)
+        return state
+
+    def undo(self, game_id, sequence_number, last_snap):
+        """
+        Step back past the deleted snap ``sequence_number``.
+
+        ``last_snap`` is the game's latest snap after the delete (or None).
+        Returns the new current state.
+        """
+        history = self.backend.get(self._key(game_id))
+        if history is not None:
+            while history and history[-1][0][1] >= sequence_number:
+                history = history[:-1]
+            if self._matches(history, last_snap):
+                self.backend.set(self._key(game_id), history, timeout=None)
+                return history[-1][1] if history else INITIAL_STATE
+        history = self.rebuild(game_id)
+        return history[-1][1] if history else INITIAL_STATE
+
+    def rebuild(self, game_id):
+        """Replay the game from its stored snaps; returns the new history."""
+        snaps = downcast_snaps(BaseSnap.objects.filter(game_id=game_id).order_by("sequence_number"))
+        history = []
+        state = INITIAL_STATE
+        for snap in snaps:
+            state = step(state, snap)
+            history.append((_stamp(snap), state))
+        history = tuple(history)
+        self.backend.set(self._key(game_id), history, timeout=None)
+        return history
+
+    def clear(self, game_id):
+        self.backend.delete(self._key(game_id))
+
+    @staticmethod
+    def _continues(history, snaps):
+        first = history[-1][0][1] + 1 if history else 1
+        return [snap.sequence_number for snap in snaps] == list(range(first, first + len(snaps)))
+
+    @staticmethod
+    def _matches(history, last_snap):
+        if last_snap is None:
+            return not history
+        return bool(history) and history[-1][0] == _stamp(last_snap)
+
+    @staticmethod
+    def _key(game_id):
+        return f"{CACHE_PREFIX}:{game_id}"
+
+
+game_state_cache = GameStateCache()
@@ -0,0 +1,508 @@
+"""
+Synthetic play-by-play for load and scale testing.
+
+Games are simulated drive by drive on a game clock. Each play's outcome
+is drawn from simple distributions and the next down, distance and field
+position come from the tracker's game state machine (``game_state``), so
+generated games follow the same rules as games recorded on the sideline.
+Every snap the tracker would record from our sideline is emitted: our
+offense and kicking units, our defense, and our punt/kickoff returns.
+
+Simulation is pure Python and deterministic: a game's plays depend only
+on the seed, the team and the game's place in its season, so seasons can
+be generated in any order (or in worker processes) and produce the same
+rows. ``write_season`` stores a simulated season with bulk inserts.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from django.db import transaction
+
+from apps.games.models import Game, QuarterScore
+from apps.teams.models import Player, Season, Team
+
+from .bulk import bulk_create_snaps
+from .game_state import (
+    EXTRA_POINT,
+    FIELD_GOAL,
+    INITIAL_STATE,
+    KICKOFF,
+    OPPONENT_BALL,
+    PENALTY,
+    PUNT,
+    SCRIMMAGE,
+    TURNOVER,
+    TURNOVER_ON_DOWNS,
+    Outcome,
+    advance,
+)
+from .models import (
+    DefenseSnap,
+    ExtraPointSnap,
+    FieldGoalSnap,
+    KickoffReturnSnap,
+    KickoffSnap,
+    OffenseSnap,
+    PassPlay,
+    PuntReturnSnap,
+    PuntSnap,
+    RunPlay,
+    ScoreEntry,
+)
+
+# Players generated per position for a new team
+ROSTER = {
+    "QB": 3, "RB": 4, "WR": 6, "TE": 3, "OL": 9,
+    "DL": 7, "LB": 6, "CB": 5, "S": 4, "K": 1, "P": 1,
+}
+
+QUARTER_SECONDS = 15 * 60
+
+# Offensive formations, picked from the situation by GameSimulator._formation
+SHORT_YARDAGE_FORMATION = "I-Formation"
+PASSING_DOWN_FORMATION = "Empty"
+BASE_FORMATIONS = {"run": "Singleback", "pass": "Shotgun"}
+
+OPPONENTS = [
+    "Lions", "Tigers", "Wolves", "Hawks", "Panthers", "Rams", "Falcons",
+    "Bulldogs", "Wildcats", "Knights", "Spartans", "Titans", "Mustangs",
+]
+
+
+@dataclass
+class SimulatedGame:
+    """One game's final score, per-quarter scoring and snaps (unsaved)."""
+
+    team_score: int = 0
+    opponent_score: int = 0
+    # [team points, opponent points] per quarter
+    quarter_scores: list = field(default_factory=lambda: [[0, 0] for _ in range(4)])
+    # (snap model, field values) in play order
+    snaps: list = field(default_factory=list)
+
+
+class GameSimulator:
+    """
+    Play one game from the opening kickoff to the end of the fourth quarter.
+
+    ``state`` is the tracker's ``GameState``, always from the point of
+    view of the team with the ball (``ours`` says which one that is).
+    """
+
+    def __init__(self, rng, players):
+        self.rng = rng
+        self.players = players
+        self.game = SimulatedGame()
+        self.quarter = 1
+        self.clock = QUARTER_SECONDS
+        self.ours = False
+        self.state = INITIAL_STATE
+
+    def play(self):
+        we_receive = self.rng.random() < 0.5
+        self._kickoff(by_us=not we_receive)
+        while self.quarter <= 4:
+            situation = self.state.situation
+            if situation == EXTRA_POINT:
+                self._extra_point()
+            elif situation == KICKOFF:
+                self._kickoff(by_us=self.ours)
+            elif self.state.down == 4 and not self._go_for_it():
+                if self._field_goal_distance() <= 52:
+                    self._field_goal()
+                else:
+                    self._punt()
+            elif self.rng.random() < 0.05:
+                self._penalty()
+            elif self.rng.random() < self._pass_rate():
+                self._pass()
+            else:
+                self._run()
+
+            if self._tick() == 3:
+                # Second half: the team that received first kicks off
+                if self.state.situation == EXTRA_POINT:
+                    self._extra_point()
+                self._kickoff(by_us=we_receive)
+        return self.game
+
+    # ----------------------------------------------------------------- clock
+
+    def _tick(self):
+        """Run the clock after a play; return the new quarter if one began."""
+        self.clock -= self.rng.randint(5, 42)
+        if self.clock > 0:
+            return None
+        self.quarter += 1
+        self.clock = QUARTER_SECONDS
+        return self.quarter
+
+    # ------------------------------------------------------------- decisions
+
+    def _pick(self, *positions):
+        return self.rng.choice(self.players[self.rng.choice(positions)])
+
+    def _pass_rate(self):
+        if self.state.down == 3 and self.state.distance >= 5:
+            return 0.75
+        return 0.45
+
+    def _go_for_it(self):
+        return self.state.distance <= 2 and self.state.ball_position >= 10
+
+    def _field_goal_distance(self):
+        return 50 - self.state.ball_position + 17
+
+    # ---------------------------------------------------------------- output
+
+    def _situation(self):
+        return {
+            "quarter": self.quarter,
+            "game_clock": timedelta(seconds=self.clock),
+            "down": self.state.down,
+            "distance": self.state.distance,
+            "ball_position": self.state.ball_position,
+        }
+
+    def _emit(self, model, **values):
+        self.game.snaps.append((model, {**self._situation(), **values}))
+
+    def _score(self, points, ours):
+        self.game.quarter_scores[self.quarter - 1][0 if ours else 1] += points
+        if ours:
+            self.game.team_score += points
+        else:
+            self.game.opponent_score += points
+
+    def _advance(self, outcome):
+        """Move to the next state; hand the ball over if the play did."""
+        self.state = advance(self.state, outcome)
+        if self.state.situation in (TURNOVER, TURNOVER_ON_DOWNS, OPPONENT_BALL):
+            self.ours = not self.ours
+        self.state = self.state.replace(ball_position=max(min(self.state.ball_position, 49), -49))
+
+    # ----------------------------------------------------------- scrimmage
+
+    def _gain(self, yards):
+        """Clamp a gain to the field; return (yards, reached the end zone)."""
+        ball = self.state.ball_position
+        yards = max(yards, -49 - ball)
+        return min(yards, 50 - ball), ball + yards >= 50
+
+    def _run(self):
+        yards, touchdown = self._gain(round(self.rng.gauss(4.2, 5)))
+        fumble_lost = not touchdown and self.rng.random() < 0.01
+        first_down = not touchdown and yards >= self.state.distance
+        if self.ours:
+            self._emit(
+                RunPlay,
+                formation=self._formation("run"),
+                ball_carrier_id=self._pick("RB", "RB", "RB", "QB", "WR"),
+                yards_gained=yards,
+                is_touchdown=touchdown,
+                is_first_down=first_down,
+                fumbled=fumble_lost or self.rng.random() < 0.01,
+                fumble_lost=fumble_lost,
+            )
+        else:
+            self._emit(DefenseSnap, **self._defense_result(yards, fumble_lost=fumble_lost))
+        self._finish_scrimmage(yards, touchdown, first_down, turnover=fumble_lost)
+
+    def _pass(self):
+        rng = self.rng
+        sacked = rng.random() < 0.06
+        complete = not sacked and rng.random() < 0.63
+        intercepted = not sacked and not complete and rng.random() < 0.06
+        air_yards = rng.randint(-3, 25) if not sacked else 0
+        after_catch = max(round(rng.gauss(4, 4)), 0) if complete else 0
+        if sacked:
+            yards, touchdown = self._gain(-rng.randint(2, 10))
+        elif complete:
+            yards, touchdown = self._gain(air_yards + after_catch)
+            # A catch at the goal line shortens the play
+            air_yards = min(air_yards, yards)
+            after_catch = yards - air_yards
+        else:
+            yards, touchdown = 0, False
+        first_down = not touchdown and yards >= self.state.distance
+        if self.ours:
+            target = self._pick("WR", "WR", "WR", "TE", "RB")
+            self._emit(
+                PassPlay,
+                formation=self._formation("pass"),
+                quarterback_id=self.players["QB"][0],
+                target_id=None if sacked else target,
+                receiver_id=target if complete else None,
+                is_complete=complete,
+                yards_gained=0 if sacked else yards,
+                air_yards=air_yards,
+                yards_after_catch=after_catch,
+                is_touchdown=touchdown,
+                is_first_down=first_down,
+                is_interception=intercepted,
+                was_under_pressure=sacked or rng.random() < 0.2,
+                was_sacked=sacked,
+                sack_yards=yards if sacked else 0,
+            )
+        else:
+            self._emit(
+                DefenseSnap,
+                **self._defense_result(
+                    yards, sacked=sacked, incomplete=not complete, intercepted=intercepted
+                ),
+            )
+        self._finish_scrimmage(yards, touchdown, first_down, turnover=intercepted)
+
+    def _formation(self, play_type):
+        """Formation implied by the situation; draws nothing from the rng."""
+        down, distance = self.state.down, self.state.distance
+        if distance <= 2:
+            return SHORT_YARDAGE_FORMATION
+        if play_type == "pass" and down >= 3 and distance >= 7:
+            return PASSING_DOWN_FORMATION
+        return BASE_FORMATIONS[play_type]
+
+    def _defense_result(self, yards, sacked=False, incomplete=False, intercepted=False,
+                        fumble_lost=False):
+        """DefenseSnap fields for an opponent scrimmage play."""
+        if intercepted:
+            result = DefenseSnap.PlayResult.INTERCEPTION
+        elif fumble_lost:
+            result = DefenseSnap.PlayResult.FUMBLE_RECOVERY
+        elif sacked:
+            result = DefenseSnap.PlayResult.SACK
+        elif incomplete:
+            result = DefenseSnap.PlayResult.PASS_DEFENDED
+        elif yards < 0:
+            result = DefenseSnap.PlayResult.TACKLE_FOR_LOSS
+        else:
+            result = DefenseSnap.PlayResult.TACKLE
+        return {
+            "play_result": result,
+            "primary_player_id": self._pick(
+                *{
+                    DefenseSnap.PlayResult.INTERCEPTION: ("CB", "S"),
+                    DefenseSnap.PlayResult.SACK: ("DL", "DL", "LB"),
+                    DefenseSnap.PlayResult.PASS_DEFENDED: ("CB", "CB", "S", "LB"),
+                }.get(result, ("DL", "LB", "LB", "CB", "S"))
+            ),
+            "tackle_yards": None if incomplete and not sacked else yards,
+            "tackle_for_loss": result == DefenseSnap.PlayResult.TACKLE_FOR_LOSS,
+            "applied_pressure": sacked or self.rng.random() < 0.2,
+            "forced_incompletion": incomplete and not sacked and not intercepted,
+            "interception_return_yards": self.rng.randint(0, 30) if intercepted else None,
+            "fumble_return_yards": self.rng.randint(0, 10) if fumble_lost else None,
+        }
+
+    def _finish_scrimmage(self, yards, touchdown, first_down, turnover=False):
+        if touchdown:
+            self._score(6, self.ours)
+        self._advance(Outcome(
+            SCRIMMAGE, yards=yards, touchdown=touchdown, first_down=first_down, turnover=turnover
+        ))
+
+    def _penalty(self):
+        """A penalty on our unit, whichever side of the ball it is on."""
+        yards = self.rng.choice([5, 5, 5, 10, 10, 15])
+        description = {5: "False start", 10: "Holding", 15: "Personal foul"}[yards]
+        if self.ours:
+            self._emit(
+                OffenseSnap,
+                play_result=OffenseSnap.PlayResult.PENALTY,
+                had_penalty=True,
+                penalty_player_id=self._pick("OL", "OL", "WR", "TE"),
+                penalty_yards=yards,
+                penalty_description=description,
+            )
+        else:
+            self._emit(
+                DefenseSnap,
+                play_result=DefenseSnap.PlayResult.PENALTY,
+                penalty_player_id=self._pick("DL", "LB", "CB", "S"),
+                penalty_yards=yards,
+                penalty_description=description,
+            )
+        self._advance(Outcome(PENALTY, yards=yards, on_offense=self.ours))
+
+    # -------------------------------------------------------- special teams
+
+    def _kickoff(self, by_us):
+        """Kick to the other team, who then has the ball."""
+        self.state = self.state.replace(down=None, distance=None, ball_position=35)
+        touchback = self.rng.random() < 0.55
+        return_yards = 0 if touchback else self.rng.randint(12, 40)
+        if by_us:
+            self._emit(
+                KickoffSnap,
+                kicker_id=self.players["K"][0],
+                kick_yards=65 if touchback else self.rng.randint(55, 68),
+                is_touchback=touchback,
+            )
+        else:
+            self._emit(
+                KickoffReturnSnap,
+                returner_id=self._pick("WR", "RB", "CB"),
+                return_yards=return_yards,
+            )
+        self.ours = not by_us
+        self._advance(Outcome(KICKOFF, touchback=touchback))
+        if not touchback:
+            self.state = self.state.replace(ball_position=-50 + 5 + return_yards)
+
+    def _punt(self):
+        ball = self.state.ball_position
+        punt_yards = max(min(round(self.rng.gauss(42, 6)), 50 - ball), 20)
+        touchback = ball + punt_yards >= 50
+        fair_catch = not touchback and self.rng.random() < 0.3
+        return_yards = 0 if touchback or fair_catch else self.rng.randint(0, 15)
+        if self.ours:
+            self._emit(
+                PuntSnap,
+                punter_id=self.players["P"][0],
+                punt_yards=punt_yards,
+                hang_time=timedelta(milliseconds=self.rng.randint(3600, 4800)),
+                is_touchback=touchback,
+            )
+        else:
+            self._emit(
+                PuntReturnSnap,
+                returner_id=self._pick("WR", "CB"),
+                return_yards=return_yards,
+                is_fair_catch=fair_catch,
+            )
+        self._advance(Outcome(PUNT, yards=punt_yards, touchback=touchback))
+        self.state = self.state.replace(
+            ball_position=max(self.state.ball_position + return_yards, -49)
+        )
+
+    def _field_goal(self):
+        distance = self._field_goal_distance()
+        made = self.rng.random() < max(0.98 - (distance - 20) * 0.018, 0.3)
+        result = FieldGoalSnap.Result.GOOD if made else FieldGoalSnap.Result.MISSED
+        if self.ours:
+            self._emit(
+                FieldGoalSnap,
+                kicker_id=self.players["K"][0],
+                holder_id=self.players["P"][0],
+                kick_distance=distance,
+                result=result,
+            )
+        if made:
+            self._score(3, self.ours)
+        self._advance(Outcome(FIELD_GOAL, good=made))
+
+    def _extra_point(self):
+        self.state = self.state.replace(down=None, distance=None, ball_position=None)
+        two_point = self.rng.random() < 0.06
+        made = self.rng.random() < (0.48 if two_point else 0.94)
+        if self.ours:
+            if two_point:
+                attempt = self.rng.choice(
+                    [ExtraPointSnap.AttemptType.TWO_PT_RUN, ExtraPointSnap.AttemptType.TWO_PT_PASS]
+                )
+                result = ExtraPointSnap.Result.GOOD if made else ExtraPointSnap.Result.FAILED
+                players = (
+                    {"ball_carrier_id": self._pick("RB")}
+                    if attempt == ExtraPointSnap.AttemptType.TWO_PT_RUN
+                    else {"passer_id": self.players["QB"][0], "receiver_id": self._pick("WR", "TE")}
+                )
+            else:
+                attempt = ExtraPointSnap.AttemptType.KICK
+                result = ExtraPointSnap.Result.GOOD if made else ExtraPointSnap.Result.MISSED
+                players = {"kicker_id": self.players["K"][0]}
+            self._emit(ExtraPointSnap, attempt_type=attempt, result=result, **players)
+        if made:
+            self._score(2 if two_point else 1, self.ours)
+        self._advance(Outcome(EXTRA_POINT))
+
+
+def game_rng(seed, team, season, week):
+    """Random stream for one game, independent of every other game's."""
+    return random.Random(f"{seed}:{team}:{season}:{week}")
+
+
+def simulate_season(seed, team, season, games, players):
+    """Simulate ``games`` games of one season."""
+    return [
+        GameSimulator(game_rng(seed, team, season, week), players).play()
+        for week in range(games)
+    ]
+
+
+def generate_season(seed, team, year, season, games, players):
+    """
+    Simulate and store one season; returns the snap count.
+
+    Opens its own connection when run in a worker process, so seasons can
+    be written in parallel.
+    """
+    simulated = simulate_season(seed, team.abbreviation, season, games, players)
+    return write_season(team, year, simulated, seed=seed)
+
+
+def create_team(number):
+    """A generated team with a full roster; returns (team, player ids by position)."""
+    team = Team.objects.create(name=f"Generated Team {number}", abbreviation=f"GEN{number}")
+    Player.objects.bulk_create(
+        Player(
+            team=team,
+            first_name=f"{position}{index + 1}",
+            last_name=f"Team{number}",
+            position=position,
+            number=jersey,
+        )
+        for jersey, (position, index) in enumerate(
+            ((position, index) for position, count in ROSTER.items() for index in range(count)),
+            start=1,
+        )
+    )
+    players = {}
+    for pk, position in Player.objects.filter(team=team).order_by("pk").values_list("pk", "position"):
+        players.setdefault(position, []).append(pk)
+    return team, players
+
+
+@transaction.atomic
+def write_season(team, year, simulated, seed=0):
+    """
+    Store a simulated season with bulk inserts; returns the snap count.
+
+    Games are created with their sequence counters, so snaps are numbered
+    1..n per game without touching the allocator, and with the opponent's
+    final score as their ledger's opening row. Our points are added by
+    the snap insert, which writes a ledger row per scoring snap.
+    """
+    rng = random.Random(f"{seed}:{team.abbreviation}:{year}:details")
+    season = Season.objects.create(team=team, year=year)
+    games = Game.objects.bulk_create(
+        Game(
+            season=season,
+            date=date(year, 9, 1) + timedelta(weeks=week),
+            opponent=rng.choice(OPPONENTS),
+            location=rng.choice(Game.Location.values),
+            weather=rng.choice(Game.Weather.values),
+            field_condition=rng.choice(Game.FieldCondition.values),
+            opponent_score=result.opponent_score,
+            last_sequence_number=len(result.snaps),
+        )
+        for week, result in enumerate(simulated)
+    )
+    QuarterScore.objects.bulk_create(
+        QuarterScore(game=game, quarter=quarter, team_score=ours, opponent_score=theirs)
+        for game, result in zip(games, simulated)
+        for quarter, (ours, theirs) in enumerate(result.quarter_scores, start=1)
+    )
+    # The opponent's points are not tracked play by play
+    ScoreEntry.objects.bulk_create(
+        ScoreEntry(game_id=game.pk, opponent_points=result.opponent_score)
+        for game, result in zip(games, simulated)
+        if result.opponent_score
+    )
+    snaps = [
+        model(game=game, sequence_number=number, **values)
+        for game, result in zip(games, simulated)
+        for number, (model, values) in enumerate(result.snaps, start=1)
+    ]
+    bulk_create_snaps(snaps)
+    return len(snaps)
@@ -0,0 +1,52 @@
+"""
+Diff the PlayerGameStats rollups against a full recompute from SnapFact.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.snaps.models import PlayerGameStats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute per-game player rollups from snap facts and report any "
+        "rows that differ from the stored ones. Exits non-zero on mismatch "
+        "unless --fix is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--game",
+            type=int,
+            action="append",
+            dest="game_ids",
+            help="Only check this game (repeatable)",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the rollups of games with mismatches",
+        )
+
+    def handle(self, *args, **options):
+        mismatches = PlayerGameStats.objects.diff(options["game_ids"])
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("Player game rollups are consistent"))
+            return
+
+        for game_id, player_id, column, stored, expected in mismatches:
+            self.stdout.write(
+                f"game={game_id} player={player_id} {column}: "
+                f"stored={stored} expected={expected}"
+            )
+
+        games = sorted({mismatch[0] for mismatch in mismatches})
+        if options["fix"]:
+            PlayerGameStats.objects.rebuild(games)
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt rollups for {len(games)} game(s)")
+            )
+            return
+
+        raise CommandError(
+            f"{len(mismatches)} rollup value(s) differ across {len(games)} game(s)"
+        )
@@ -0,0 +1,53 @@
+"""
+Export play-by-play for a game, season or team to CSV, NDJSON, Parquet or Arrow.
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.snaps.export import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, export_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream every snap in scope to a file (or stdout) without loading the "
+        "season into memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--game", type=int, dest="game_id", help="Export one game")
+        parser.add_argument("--season", type=int, dest="season_id", help="Export one season")
+        parser.add_argument("--team", type=int, dest="team_id", help="Export one team")
+        parser.add_argument(
+            "--format", choices=list(EXPORT_FORMATS), default="csv", dest="export_format"
+        )
+        parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows per database fetch and per Parquet row group",
+        )
+
+    def handle(self, *args, **options):
+        scope = {
+            key: options[key]
+            for key in ("game_id", "season_id", "team_id")
+            if options[key]
+        }
+        if not scope:
+            raise CommandError("Pass --game, --season or --team")
+
+        encode = EXPORT_FORMATS[options["export_format"]][0]
+        binary = options["export_format"] in ("parquet", "arrow")
+        if binary and not options["output"]:
+            raise CommandError(f"--format {options['export_format']} needs --output")
+
+        rows = export_rows(**scope, chunk_size=options["chunk_size"])
+        chunks = encode(rows, chunk_size=options["chunk_size"])
+
+        if options["output"]:
+            with open(options["output"], "wb") as output:
+                output.writelines(chunks)
+            self.stderr.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk.decode(), ending="")
@@ -0,0 +1,71 @@
+"""
+Fit the expected points / win probability tables and rescore snap facts.
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.games.models import Game
+from apps.snaps.expected_points import ExpectedPointsModel, load_model, rescore
+
+
+class Command(BaseCommand):
+    help = (
+        "Fit expected points and win probability lookup tables from historical "
+        "snaps, save them, and recompute EP/EPA/WP on every snap fact."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            type=int,
+            action="append",
+            dest="season_ids",
+            help="Fit from this season's games only (repeatable; default: all games)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Where to write the tables (default: settings.EXPECTED_POINTS_TABLES)",
+        )
+        parser.add_argument(
+            "--no-fit",
+            action="store_true",
+            help="Only rescore facts with the tables already on disk",
+        )
+        parser.add_argument(
+            "--no-rescore", action="store_true", help="Only fit and save the tables"
+        )
+
+    def handle(self, *args, **options):
+        path = options["output"] or settings.EXPECTED_POINTS_TABLES
+        if not path:
+            raise CommandError("Set EXPECTED_POINTS_TABLES or pass --output")
+
+        started = time.perf_counter()
+        if options["no_fit"]:
+            model = load_model(path)
+            if model is None:
+                raise CommandError(f"No expected points tables at {path}")
+        else:
+            game_ids = None
+            if options["season_ids"]:
+                game_ids = list(
+                    Game.objects.filter(season_id__in=options["season_ids"])
+                    .values_list("pk", flat=True)
+                )
+            try:
+                model = ExpectedPointsModel.fit(game_ids)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            model.save(path)
+            self.stdout.write(
+                f"Fitted on {model.plays} plays from {model.games} games; wrote {path}"
+            )
+
+        if not options["no_rescore"]:
+            count = rescore(model=model)
+            self.stdout.write(f"Rescored {count} snap facts")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Done in {elapsed:.1f}s"))
@@ -0,0 +1,87 @@
+"""
+Generate synthetic teams, seasons and full play-by-play for load testing.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from apps.snaps.generator import create_team, generate_season
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate whole games drive by drive and bulk insert their snaps. The "
+        "data is deterministic for a given --seed, with or without --workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=1, help="Teams to create")
+        parser.add_argument("--seasons", type=int, default=1, help="Seasons per team")
+        parser.add_argument("--games", type=int, default=12, help="Games per season")
+        parser.add_argument(
+            "--start-year", type=int, default=2015, help="Year of each team's first season"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help=(
+                "Generate seasons in this many worker processes, each writing "
+                "on its own connection (0: in this process)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        for name in ("teams", "seasons", "games"):
+            if options[name] < 1:
+                raise CommandError(f"--{name} must be at least 1")
+        if options["workers"] and connection.vendor == "sqlite":
+            raise CommandError(
+                "--workers needs a database server; SQLite allows one writer at a time"
+            )
+
+        first = Team.objects.filter(abbreviation__startswith="GEN").count() + 1
+        numbers = range(first, first + options["teams"])
+        if Team.objects.filter(abbreviation__in=[f"GEN{n}" for n in numbers]).exists():
+            raise CommandError("Generated team abbreviations are already taken")
+
+        started = time.perf_counter()
+        tasks = []
+        for number in numbers:
+            team, players = create_team(number)
+            tasks.extend(
+                (
+                    options["seed"],
+                    team,
+                    options["start_year"] + season,
+                    season,
+                    options["games"],
+                    players,
+                )
+                for season in range(options["seasons"])
+            )
+
+        if options["workers"]:
+            # Children must open their own connections, not share the parent's
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options["workers"], initializer=django.setup
+            ) as executor:
+                snaps = sum(executor.map(_generate_season, tasks))
+        else:
+            snaps = sum(generate_season(*task) for task in tasks)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(tasks) * options['games']} games and {snaps} snaps "
+            f"in {elapsed:.1f}s ({snaps / elapsed:,.0f} snaps/s)"
+        ))
+
+
+def _generate_season(task):
+    return generate_season(*task)
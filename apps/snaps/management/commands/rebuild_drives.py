@@ -0,0 +1,81 @@
+"""
+Segment games into Drive rows, optionally across worker processes.
+"""
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+
+from apps.games.models import Game
+from apps.snaps.models import Drive
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-segment historical games into drives from their snap facts. Games "
+        "are split into chunks that worker processes rebuild independently."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--game",
+            type=int,
+            action="append",
+            dest="game_ids",
+            help="Only rebuild this game's drives (repeatable)",
+        )
+        parser.add_argument(
+            "--season", type=int, dest="season_id", help="Only rebuild this season's drives"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help=(
+                "Rebuild in this many worker processes, each on its own "
+                "connection (0: in this process)"
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=200, help="Games per worker task"
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+        if options["workers"] and connection.vendor == "sqlite":
+            raise CommandError(
+                "--workers needs a database server; SQLite allows one writer at a time"
+            )
+
+        games = Game.objects.order_by("pk")
+        if options["game_ids"]:
+            games = games.filter(pk__in=options["game_ids"])
+        if options["season_id"]:
+            games = games.filter(season_id=options["season_id"])
+        game_ids = list(games.values_list("pk", flat=True))
+        size = options["chunk_size"]
+        chunks = [game_ids[start:start + size] for start in range(0, len(game_ids), size)]
+
+        started = time.perf_counter()
+        if options["workers"]:
+            # Children must open their own connections, not share the parent's
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options["workers"], initializer=django.setup
+            ) as executor:
+                drives = sum(executor.map(_rebuild_chunk, chunks))
+        else:
+            drives = sum(_rebuild_chunk(chunk) for chunk in chunks)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {drives} drives for {len(game_ids)} games in {elapsed:.1f}s"
+        ))
+
+
+def _rebuild_chunk(game_ids):
+    with transaction.atomic():
+        return Drive.objects.rebuild(game_ids, batch_size=len(game_ids))
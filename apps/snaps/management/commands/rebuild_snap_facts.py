@@ -0,0 +1,49 @@
+"""
+Rebuild the denormalized SnapFact table, stat rollups and drives from the snap hierarchy.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.snaps.models import BaseSnap, Drive, PlayerGameStats, SnapFact
+
+
+class Command(BaseCommand):
+    help = (
+        "Recreate SnapFact, PlayerGameStats and Drive rows from the snap tables. Run "
+        "after migrating, or after writes that bypassed save() (QuerySet.update, "
+        "raw SQL)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--game",
+            type=int,
+            action="append",
+            dest="game_ids",
+            help="Only rebuild this game's facts (repeatable)",
+        )
+        parser.add_argument(
+            "--season", type=int, dest="season_id", help="Only rebuild this season's facts"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Rows per read and insert batch"
+        )
+
+    def handle(self, *args, **options):
+        snaps = BaseSnap.objects.all()
+        if options["game_ids"]:
+            snaps = snaps.filter(game_id__in=options["game_ids"])
+        if options["season_id"]:
+            snaps = snaps.filter(game__season_id=options["season_id"])
+
+        scoped = options["game_ids"] or options["season_id"]
+        game_ids = set(snaps.values_list("game_id", flat=True)) if scoped else None
+
+        with transaction.atomic():
+            count = SnapFact.objects.rebuild(snaps, batch_size=options["batch_size"])
+            rollups = PlayerGameStats.objects.rebuild(game_ids)
+            drives = Drive.objects.rebuild(game_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {count} snap facts, {rollups} player game rollups and {drives} drives"
+        ))
@@ -0,0 +1,55 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:30
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def renumber_duplicate_sequences(apps, schema_editor):
+    """Make (game, sequence_number) unique before the constraint is added."""
+    BaseSnap = apps.get_model("snaps", "BaseSnap")
+
+    duplicated_games = (
+        BaseSnap.objects.values("game_id", "sequence_number")
+        .annotate(n=models.Count("id"))
+        .filter(n__gt=1)
+        .values_list("game_id", flat=True)
+        .distinct()
+    )
+    for game_id in set(duplicated_games):
+        snaps = BaseSnap.objects.filter(game_id=game_id).order_by("sequence_number", "id")
+        for number, snap in enumerate(snaps, start=1):
+            if snap.sequence_number != number:
+                BaseSnap.objects.filter(pk=snap.pk).update(sequence_number=number)
+
+
+def backfill_game_counters(apps, schema_editor):
+    """Seed each game's sequence counter from its existing snaps."""
+    BaseSnap = apps.get_model("snaps", "BaseSnap")
+    Game = apps.get_model("games", "Game")
+
+    highest = BaseSnap.objects.values("game_id").annotate(last=Max("sequence_number"))
+    for row in highest:
+        Game.objects.filter(pk=row["game_id"]).update(last_sequence_number=row["last"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0002_game_last_sequence_number"),
+        ("snaps", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(renumber_duplicate_sequences, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="basesnap",
+            name="snaps_game_id_247729_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="basesnap",
+            constraint=models.UniqueConstraint(
+                fields=("game", "sequence_number"), name="snaps_unique_game_sequence"
+            ),
+        ),
+        migrations.RunPython(backfill_game_counters, migrations.RunPython.noop),
+    ]
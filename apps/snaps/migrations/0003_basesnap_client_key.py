@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0002_unique_game_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='basesnap',
+            name='client_key',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='basesnap',
+            constraint=models.UniqueConstraint(fields=('game', 'client_key'), name='snaps_unique_game_client_key'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0003_basesnap_client_key'),
+        ('teams', '0002_seed_default_season'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SnapFact',
+            fields=[
+                ('snap', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='fact', serialize=False, to='snaps.basesnap')),
+                ('sequence_number', models.PositiveIntegerField()),
+                ('quarter', models.PositiveSmallIntegerField()),
+                ('down', models.PositiveSmallIntegerField(null=True)),
+                ('distance', models.PositiveSmallIntegerField(null=True)),
+                ('ball_position', models.SmallIntegerField(null=True)),
+                ('play_type', models.CharField(choices=[('RUN', 'Run'), ('PASS', 'Pass'), ('OFF', 'Other Offense'), ('DEF', 'Defense'), ('ST', 'Other Special Teams'), ('PUNT', 'Punt'), ('PR', 'Punt Return'), ('KO', 'Kickoff'), ('KR', 'Kickoff Return'), ('FG', 'Field Goal'), ('XP', 'Extra Point')], max_length=4)),
+                ('result', models.CharField(blank=True, max_length=10)),
+                ('attempt_type', models.CharField(blank=True, max_length=10)),
+                ('yards_gained', models.SmallIntegerField(null=True)),
+                ('air_yards', models.SmallIntegerField(default=0)),
+                ('yards_after_catch', models.SmallIntegerField(default=0)),
+                ('sack_yards', models.SmallIntegerField(default=0)),
+                ('interception_return_yards', models.SmallIntegerField(null=True)),
+                ('fumble_return_yards', models.SmallIntegerField(null=True)),
+                ('is_touchdown', models.BooleanField(default=False)),
+                ('is_first_down', models.BooleanField(default=False)),
+                ('is_complete', models.BooleanField(default=False)),
+                ('is_interception', models.BooleanField(default=False)),
+                ('is_thrown_away', models.BooleanField(default=False)),
+                ('was_under_pressure', models.BooleanField(default=False)),
+                ('was_sacked', models.BooleanField(default=False)),
+                ('fumbled', models.BooleanField(default=False)),
+                ('fumble_lost', models.BooleanField(default=False)),
+                ('applied_pressure', models.BooleanField(default=False)),
+                ('forced_incompletion', models.BooleanField(default=False)),
+                ('is_touchback', models.BooleanField(default=False)),
+                ('is_blocked', models.BooleanField(default=False)),
+                ('out_of_bounds', models.BooleanField(default=False)),
+                ('is_onside_kick', models.BooleanField(default=False)),
+                ('onside_recovered', models.BooleanField(default=False)),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='games.game')),
+                ('player', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='teams.player')),
+                ('receiver', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='teams.player')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.season')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.team')),
+            ],
+            options={
+                'db_table': 'snap_facts',
+                'indexes': [models.Index(fields=['play_type', 'game'], name='snap_facts_play_ty_deeb35_idx'), models.Index(fields=['play_type', 'season'], name='snap_facts_play_ty_1bc534_idx'), models.Index(fields=['play_type', 'team'], name='snap_facts_play_ty_677050_idx'), models.Index(fields=['play_type', 'player'], name='snap_facts_play_ty_a80009_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.0.14 on 2026-10-16 20:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0004_snapfact'),
+        ('teams', '0002_seed_default_season'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerGameStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rush_attempts', models.PositiveSmallIntegerField(default=0)),
+                ('rush_yards', models.SmallIntegerField(default=0)),
+                ('rush_touchdowns', models.PositiveSmallIntegerField(default=0)),
+                ('rush_first_downs', models.PositiveSmallIntegerField(default=0)),
+                ('rush_fumbles', models.PositiveSmallIntegerField(default=0)),
+                ('rush_fumbles_lost', models.PositiveSmallIntegerField(default=0)),
+                ('rush_longest', models.SmallIntegerField(null=True)),
+                ('rush_short', models.PositiveSmallIntegerField(default=0, help_text='Runs of 5 yards or less')),
+                ('rush_long', models.PositiveSmallIntegerField(default=0, help_text='Runs over 5 yards')),
+                ('rush_explosive', models.PositiveSmallIntegerField(default=0, help_text='Runs of 10+ yards')),
+                ('pass_attempts', models.PositiveSmallIntegerField(default=0)),
+                ('pass_completions', models.PositiveSmallIntegerField(default=0)),
+                ('pass_yards', models.SmallIntegerField(default=0)),
+                ('pass_touchdowns', models.PositiveSmallIntegerField(default=0)),
+                ('pass_interceptions', models.PositiveSmallIntegerField(default=0)),
+                ('pass_sacks', models.PositiveSmallIntegerField(default=0)),
+                ('pass_air_yards', models.SmallIntegerField(default=0)),
+                ('pass_yac', models.SmallIntegerField(default=0)),
+                ('pass_longest', models.SmallIntegerField(null=True)),
+                ('pass_thrown_away', models.PositiveSmallIntegerField(default=0)),
+                ('pass_under_pressure', models.PositiveSmallIntegerField(default=0)),
+                ('rec_receptions', models.PositiveSmallIntegerField(default=0)),
+                ('rec_yards', models.SmallIntegerField(default=0)),
+                ('rec_touchdowns', models.PositiveSmallIntegerField(default=0)),
+                ('rec_first_downs', models.PositiveSmallIntegerField(default=0)),
+                ('rec_longest', models.SmallIntegerField(null=True)),
+                ('rec_yac', models.SmallIntegerField(default=0)),
+                ('rec_fumbles', models.PositiveSmallIntegerField(default=0)),
+                ('def_plays', models.PositiveSmallIntegerField(default=0)),
+                ('def_tackles', models.PositiveSmallIntegerField(default=0)),
+                ('def_tfl', models.PositiveSmallIntegerField(default=0)),
+                ('def_sacks', models.PositiveSmallIntegerField(default=0)),
+                ('def_interceptions', models.PositiveSmallIntegerField(default=0)),
+                ('def_fumble_recoveries', models.PositiveSmallIntegerField(default=0)),
+                ('def_pass_defended', models.PositiveSmallIntegerField(default=0)),
+                ('def_pressures', models.PositiveSmallIntegerField(default=0)),
+                ('def_touchdowns', models.PositiveSmallIntegerField(default=0)),
+                ('fg_attempts', models.PositiveSmallIntegerField(default=0)),
+                ('fg_made', models.PositiveSmallIntegerField(default=0)),
+                ('fg_missed', models.PositiveSmallIntegerField(default=0)),
+                ('fg_blocked', models.PositiveSmallIntegerField(default=0)),
+                ('fg_longest', models.PositiveSmallIntegerField(null=True)),
+                ('punts', models.PositiveSmallIntegerField(default=0)),
+                ('punt_yards', models.PositiveSmallIntegerField(default=0)),
+                ('punt_longest', models.PositiveSmallIntegerField(null=True)),
+                ('punt_touchbacks', models.PositiveSmallIntegerField(default=0)),
+                ('punt_blocked', models.PositiveSmallIntegerField(default=0)),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='games.game')),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='game_stats', to='teams.player')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.season')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.team')),
+            ],
+            options={
+                'db_table': 'player_game_stats',
+                'indexes': [models.Index(fields=['season', 'player'], name='player_game_season__8061a7_idx'), models.Index(fields=['team', 'player'], name='player_game_team_id_a0402c_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='playergamestats',
+            constraint=models.UniqueConstraint(fields=('game', 'player'), name='player_game_stats_unique_game_player'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-16 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0005_playergamestats'),
+        ('teams', '0002_seed_default_season'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='passplay',
+            index=models.Index(condition=models.Q(('is_complete', True)), fields=['receiver'], name='snaps_pass_reception_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='snapfact',
+            index=models.Index(condition=models.Q(('player__isnull', False)), fields=['game', 'player'], name='snap_facts_game_player_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='snapfact',
+            index=models.Index(condition=models.Q(('receiver__isnull', False)), fields=['game', 'receiver'], name='snap_facts_game_receiver_idx'),
+        ),
+    ]
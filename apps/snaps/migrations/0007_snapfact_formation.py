@@ -0,0 +1,30 @@
+# Generated by Django 5.0.14 on 2026-10-16 22:05
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_formations(apps, schema_editor):
+    BaseSnap = apps.get_model("snaps", "BaseSnap")
+    SnapFact = apps.get_model("snaps", "SnapFact")
+    SnapFact.objects.update(
+        formation=Subquery(
+            BaseSnap.objects.filter(pk=OuterRef("snap_id")).values("formation")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('snaps', '0006_report_access_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapfact',
+            name='formation',
+            field=models.CharField(blank=True, max_length=50),
+        ),
+        migrations.RunPython(copy_formations, migrations.RunPython.noop),
+    ]
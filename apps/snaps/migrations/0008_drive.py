@@ -0,0 +1,63 @@
+# Generated by Django 5.0.14 on 2026-10-16 22:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_game_clocks(apps, schema_editor):
+    BaseSnap = apps.get_model("snaps", "BaseSnap")
+    SnapFact = apps.get_model("snaps", "SnapFact")
+    SnapFact.objects.update(
+        game_clock=Subquery(
+            BaseSnap.objects.filter(pk=OuterRef("snap_id")).values("game_clock")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0007_snapfact_formation'),
+        ('teams', '0002_seed_default_season'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapfact',
+            name='game_clock',
+            field=models.DurationField(null=True),
+        ),
+        migrations.RunPython(copy_game_clocks, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='Drive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveSmallIntegerField(help_text='Order of this drive within the game')),
+                ('start_sequence', models.PositiveIntegerField()),
+                ('end_sequence', models.PositiveIntegerField()),
+                ('start_quarter', models.PositiveSmallIntegerField()),
+                ('end_quarter', models.PositiveSmallIntegerField()),
+                ('start_clock', models.DurationField(null=True)),
+                ('end_clock', models.DurationField(null=True)),
+                ('duration', models.DurationField(help_text='Game clock from the first to the last snap', null=True)),
+                ('start_position', models.SmallIntegerField(null=True)),
+                ('end_position', models.SmallIntegerField(null=True)),
+                ('plays', models.PositiveSmallIntegerField(default=0)),
+                ('yards', models.SmallIntegerField(default=0)),
+                ('first_downs', models.PositiveSmallIntegerField(default=0)),
+                ('result', models.CharField(blank=True, choices=[('TD', 'Touchdown'), ('FG', 'Field Goal'), ('MISSED_FG', 'Missed Field Goal'), ('PUNT', 'Punt'), ('TURNOVER', 'Turnover'), ('DOWNS', 'Turnover on Downs'), ('HALF', 'End of Half'), ('LOST', 'Possession Lost (not recorded)')], max_length=10)),
+                ('points', models.PositiveSmallIntegerField(default=0)),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='drives', to='games.game')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.season')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.team')),
+            ],
+            options={
+                'db_table': 'drives',
+                'ordering': ['game', 'number'],
+                'indexes': [models.Index(fields=['season', 'result'], name='drives_season_result_idx'), models.Index(fields=['team', 'result'], name='drives_team_result_idx')],
+                'constraints': [models.UniqueConstraint(fields=('game', 'number'), name='drives_unique_game_number')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.14 on 2026-10-16 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('snaps', '0008_drive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapfact',
+            name='ep',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='snapfact',
+            name='epa',
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddField(
+            model_name='snapfact',
+            name='wp',
+            field=models.FloatField(null=True),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.14 on 2026-10-16 22:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# (snap model, filter, points) for every kind of scoring snap
+SCORING_SNAPS = [
+    ("RunPlay", {"is_touchdown": True}, 6),
+    ("PassPlay", {"is_touchdown": True}, 6),
+    ("DefenseSnap", {"is_defensive_touchdown": True}, 6),
+    ("PuntReturnSnap", {"is_touchdown": True}, 6),
+    ("KickoffReturnSnap", {"is_touchdown": True}, 6),
+    ("FieldGoalSnap", {"result": "GOOD"}, 3),
+    ("ExtraPointSnap", {"result": "GOOD", "attempt_type": "KICK"}, 1),
+    ("ExtraPointSnap", {"result": "GOOD", "attempt_type__in": ["2PT_RUN", "2PT_PASS"]}, 2),
+]
+
+
+def backfill_ledger(apps, schema_editor):
+    """A row per scoring snap, plus an opening balance for the rest of each score."""
+    Game = apps.get_model("games", "Game")
+    ScoreEntry = apps.get_model("snaps", "ScoreEntry")
+
+    entries = []
+    snap_points = {}
+    for model_name, filters, points in SCORING_SNAPS:
+        model = apps.get_model("snaps", model_name)
+        for snap_id, game_id in model.objects.filter(**filters).values_list("pk", "game_id"):
+            entries.append(ScoreEntry(game_id=game_id, snap_id=snap_id, team_points=points))
+            snap_points[game_id] = snap_points.get(game_id, 0) + points
+
+    for game_id, team_score, opponent_score in Game.objects.values_list(
+        "pk", "team_score", "opponent_score"
+    ):
+        team_points = team_score - snap_points.get(game_id, 0)
+        if team_points or opponent_score:
+            entries.append(ScoreEntry(
+                game_id=game_id, team_points=team_points, opponent_points=opponent_score
+            ))
+    ScoreEntry.objects.bulk_create(entries, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0009_snapfact_expected_points'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('team_points', models.SmallIntegerField(default=0)),
+                ('opponent_points', models.SmallIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_entries', to='games.game')),
+                ('snap', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='score_entry', to='snaps.basesnap')),
+            ],
+            options={
+                'verbose_name_plural': 'score entries',
+                'db_table': 'score_ledger',
+                'ordering': ['game', 'pk'],
+            },
+        ),
+        migrations.RunPython(backfill_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.14 on 2026-10-16 23:36
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('games', '0002_game_last_sequence_number'),
+        ('snaps', '0010_scoreentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UndonePlay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence_number', models.PositiveIntegerField()),
+                ('values', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('game', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='undone_plays', to='games.game')),
+                ('snap_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'db_table': 'tracker_redo_stack',
+                'ordering': ['game', 'pk'],
+            },
+        ),
+    ]
@@ -13,6 +13,11 @@ from .special_teams import (
     FieldGoalSnap,
     ExtraPointSnap,
 )
+from .facts import SnapFact
+from .rollups import PlayerGameStats
+from .drives import Drive
+from .ledger import ScoreEntry
+from .redo import UndonePlay
 
 __all__ = [
     "Play",
@@ -29,4 +34,9 @@ __all__ = [
     "KickoffReturnSnap",
     "FieldGoalSnap",
     "ExtraPointSnap",
+    "SnapFact",
+    "PlayerGameStats",
+    "Drive",
+    "ScoreEntry",
+    "UndonePlay",
 ]
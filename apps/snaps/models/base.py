@@ -1,9 +1,11 @@
 """
 Base snap models - polymorphic base class and Play reference table.
 """
-from django.db import models
+from django.db import models, transaction
 from polymorphic.models import PolymorphicModel
 from apps.core.models import TimeStampedModel
+from apps.games.models import Game
+from apps.snaps.signals import snap_data_changed
 
 
 class Play(TimeStampedModel):
@@ -66,13 +68,96 @@ class BaseSnap(PolymorphicModel, TimeStampedModel):
     )
     notes = models.TextField(blank=True)
 
+    # Client-generated idempotency key from offline tracker sync
+    client_key = models.CharField(max_length=64, null=True, blank=True, editable=False)
+
     class Meta:
         db_table = "snaps"
         ordering = ["game", "sequence_number"]
         indexes = [
             models.Index(fields=["game", "quarter"]),
-            models.Index(fields=["game", "sequence_number"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "sequence_number"],
+                name="snaps_unique_game_sequence",
+            ),
+            models.UniqueConstraint(
+                fields=["game", "client_key"],
+                name="snaps_unique_game_client_key",
+            ),
         ]
 
     def __str__(self):
         return f"{self.game} - Play #{self.sequence_number}"
+
+    def set_derived_fields(self):
+        """
+        Fill fields computed from other fields before a write.
+
+        Called by ``save()`` and ``bulk_create_snaps``; subclasses override.
+        """
+
+    def save(self, *args, **kwargs):
+        self.set_derived_fields()
+        if not self._state.adding:
+            with transaction.atomic(savepoint=False):
+                super().save(*args, **kwargs)
+                self._sync_fact(created=False)
+                self._sync_score(created=False)
+            return
+
+        # Allocate (or reserve) the sequence number in the same transaction
+        # as the multi-table insert so the game row lock covers both.
+        with transaction.atomic(savepoint=False):
+            if self.sequence_number is None:
+                self.sequence_number = Game.objects.allocate_sequence_number(
+                    self.game_id
+                )
+            else:
+                Game.objects.reserve_sequence_number(
+                    self.game_id, self.sequence_number
+                )
+            super().save(*args, **kwargs)
+            self._sync_fact(created=True)
+            self._sync_score(created=True)
+
+    def delete(self, *args, **kwargs):
+        from .drives import Drive
+        from .facts import SnapFact
+        from .ledger import ScoreEntry
+        from .rollups import PlayerGameStats
+
+        with transaction.atomic(savepoint=False):
+            previous = SnapFact.objects.current(self.pk)
+            ScoreEntry.objects.remove(self)
+            result = super().delete(*args, **kwargs)
+            if previous:
+                PlayerGameStats.objects.refresh(
+                    previous["game_id"],
+                    [previous["player_id"], previous["receiver_id"]],
+                )
+                Drive.objects.rebuild([previous["game_id"]])
+                snap_data_changed.send(
+                    sender=SnapFact, scopes={SnapFact.objects.scope_of(previous)}
+                )
+        return result
+
+    def _sync_fact(self, created):
+        """Refresh this snap's denormalized SnapFact row."""
+        from .facts import SnapFact
+
+        if type(self) in SnapFact.SNAP_TYPES:
+            SnapFact.objects.sync(self, created=created)
+
+    def _sync_score(self, created):
+        """Write this snap's points to the game's score ledger."""
+        from .ledger import ScoreEntry, points_scored
+
+        if self.polymorphic_ctype_id and type(self) is not self.get_real_instance_class():
+            # A base-class instance cannot tell what it scored
+            return
+        if not created:
+            ScoreEntry.objects.rescore(self)
+        elif points_scored(self):
+            ScoreEntry.objects.record(self.game, [self])
@@ -0,0 +1,274 @@
+"""
+Drives - our offense's possessions, segmented from the snap sequence.
+"""
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+
+from django.db import models
+
+from apps.games.models import Game
+
+from .defense import DefenseSnap
+from .facts import SnapFact
+from .special_teams import ExtraPointSnap, FieldGoalSnap
+
+PlayType = SnapFact.PlayType
+
+# Our offense on the field: scrimmage plays and offensive penalties
+OFFENSE_PLAYS = frozenset({PlayType.RUN, PlayType.PASS, PlayType.OFFENSE})
+
+QUARTER_LENGTH = timedelta(minutes=15)
+
+# SnapFact columns the segmenter reads
+FACT_FIELDS = [
+    "game", "season", "team", "sequence_number", "quarter",
+    "game_clock", "down", "distance", "ball_position", "play_type", "result",
+    "attempt_type", "yards_gained", "sack_yards", "was_sacked", "is_touchdown",
+    "is_first_down", "is_interception", "fumble_lost",
+]
+
+
+def _half(quarter):
+    """Halves 1 and 2 for regulation; each overtime period stands alone."""
+    return (quarter + 1) // 2 if quarter <= 4 else quarter
+
+
+def _net_yards(fact):
+    if fact.play_type == PlayType.OFFENSE:
+        # Offensive facts without a run/pass carry our penalty yardage
+        return -(fact.yards_gained or 0)
+    yards = fact.yards_gained or 0
+    return yards + fact.sack_yards if fact.was_sacked else yards
+
+
+class DriveSegmenter:
+    """
+    Fold a game's facts, in sequence order, into Drive rows.
+
+    A drive opens at our first offensive snap after a change of possession
+    and closes on a touchdown, turnover, failed fourth down, punt, field
+    goal attempt or the end of a half. Any other snap (defense, returns,
+    kickoffs) while a drive is open means possession changed without a
+    recorded ending. Penalties on our defense are ignored, and a good
+    try after a touchdown adds its points to that drive.
+
+    Start from the game's last stored drive to extend a game whose new
+    facts all come after the stored ones; ``touched`` lists the drives
+    to write (unsaved ones are new).
+    """
+
+    def __init__(self, last=None):
+        self.last = last
+        self.open = last if last is not None and not last.result else None
+        self.touched = []
+
+    def feed(self, fact):
+        if self.open and _half(fact.quarter) != _half(self.open.end_quarter):
+            self._close(Drive.Result.END_OF_HALF)
+
+        play_type = fact.play_type
+        if play_type in OFFENSE_PLAYS:
+            drive = self._extend(fact)
+            if play_type != PlayType.OFFENSE:
+                drive.plays += 1
+            drive.yards += _net_yards(fact)
+            drive.first_downs += fact.is_first_down
+            if fact.is_touchdown:
+                self._close(Drive.Result.TOUCHDOWN, points=6)
+            elif fact.is_interception or fact.fumble_lost:
+                self._close(Drive.Result.TURNOVER)
+            elif (
+                play_type != PlayType.OFFENSE
+                and fact.down == 4
+                and not fact.is_first_down
+                and fact.distance is not None
+                and _net_yards(fact) < fact.distance
+            ):
+                self._close(Drive.Result.DOWNS)
+        elif play_type == PlayType.PUNT:
+            self._extend(fact)
+            self._close(Drive.Result.PUNT)
+        elif play_type == PlayType.FIELD_GOAL:
+            self._extend(fact)
+            if fact.result == FieldGoalSnap.Result.GOOD:
+                self._close(Drive.Result.FIELD_GOAL, points=3)
+            else:
+                self._close(Drive.Result.MISSED_FIELD_GOAL)
+        elif play_type == PlayType.EXTRA_POINT:
+            last = self.last
+            if (
+                last is not None
+                and last.result == Drive.Result.TOUCHDOWN
+                and last.points == 6
+                and fact.result == ExtraPointSnap.Result.GOOD
+            ):
+                last.points += 1 if fact.attempt_type == ExtraPointSnap.AttemptType.KICK else 2
+                self._touch(last)
+        elif play_type == PlayType.DEFENSE and fact.result == DefenseSnap.PlayResult.PENALTY:
+            pass
+        elif self.open:
+            self._close(Drive.Result.POSSESSION_LOST)
+
+    def _extend(self, fact):
+        """The open drive (opened at ``fact`` if none), ending at ``fact``."""
+        drive = self.open
+        if drive is None:
+            drive = Drive(
+                game_id=fact.game_id,
+                season_id=fact.season_id,
+                team_id=fact.team_id,
+                number=self.last.number + 1 if self.last is not None else 1,
+                start_sequence=fact.sequence_number,
+                start_quarter=fact.quarter,
+                start_clock=fact.game_clock,
+                start_position=fact.ball_position,
+            )
+            self.open = self.last = drive
+        drive.end_sequence = fact.sequence_number
+        drive.end_quarter = fact.quarter
+        drive.end_clock = fact.game_clock
+        drive.end_position = fact.ball_position
+        drive.duration = drive.elapsed()
+        self._touch(drive)
+        return drive
+
+    def _close(self, result, points=0):
+        self.open.result = result
+        self.open.points = points
+        self._touch(self.open)
+        self.open = None
+
+    def _touch(self, drive):
+        if drive not in self.touched:
+            self.touched.append(drive)
+
+
+class DriveManager(models.Manager):
+    """
+    Keeps Drive rows in step with SnapFact.
+
+    ``SnapFactManager`` appends newly inserted facts to their game's
+    drives and re-segments a game whose facts were edited, deleted or
+    inserted out of sequence. ``manage.py rebuild_drives`` re-segments
+    historical games.
+    """
+
+    def append(self, facts):
+        """Extend each game's drives with newly inserted fact instances."""
+        by_game = {}
+        for fact in sorted(facts, key=lambda fact: fact.sequence_number):
+            by_game.setdefault(fact.game_id, []).append(fact)
+
+        for game_id, game_facts in by_game.items():
+            later = SnapFact.objects.filter(
+                game_id=game_id, sequence_number__gt=game_facts[0].sequence_number
+            ).exclude(pk__in=[fact.pk for fact in game_facts])
+            if later.exists():
+                self.rebuild([game_id])
+                continue
+
+            segmenter = DriveSegmenter(self.filter(game_id=game_id).order_by("-number").first())
+            for fact in game_facts:
+                segmenter.feed(fact)
+            self._write(segmenter.touched)
+
+    def rebuild(self, game_ids=None, batch_size=200):
+        """Re-segment ``game_ids`` (default: every game); returns the drive count."""
+        if game_ids is None:
+            game_ids = Game.objects.order_by("pk").values_list("pk", flat=True)
+        game_ids = list(game_ids)
+
+        total = 0
+        for start in range(0, len(game_ids), batch_size):
+            batch = game_ids[start:start + batch_size]
+            self.filter(game_id__in=batch).delete()
+            facts = (
+                SnapFact.objects.filter(game_id__in=batch)
+                .only(*FACT_FIELDS)
+                .order_by("game_id", "sequence_number")
+                .iterator(chunk_size=2000)
+            )
+            drives = []
+            for _, game_facts in groupby(facts, key=attrgetter("game_id")):
+                segmenter = DriveSegmenter()
+                for fact in game_facts:
+                    segmenter.feed(fact)
+                drives.extend(segmenter.touched)
+            total += len(self.bulk_create(drives))
+        return total
+
+    def _write(self, drives):
+        for drive in drives:
+            if drive.pk is not None:
+                drive.save()
+        self.bulk_create([drive for drive in drives if drive.pk is None])
+
+
+class Drive(models.Model):
+    """
+    One possession by our offense.
+
+    Drives carry the game/season/team keys like SnapFact, so drive reports
+    (points per drive, three-and-outs, starting field position) aggregate
+    this table alone. The game's latest drive has a blank result while it
+    is still in progress.
+    """
+
+    class Result(models.TextChoices):
+        TOUCHDOWN = "TD", "Touchdown"
+        FIELD_GOAL = "FG", "Field Goal"
+        MISSED_FIELD_GOAL = "MISSED_FG", "Missed Field Goal"
+        PUNT = "PUNT", "Punt"
+        TURNOVER = "TURNOVER", "Turnover"
+        DOWNS = "DOWNS", "Turnover on Downs"
+        END_OF_HALF = "HALF", "End of Half"
+        POSSESSION_LOST = "LOST", "Possession Lost (not recorded)"
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="drives")
+    season = models.ForeignKey(
+        "teams.Season", on_delete=models.CASCADE, related_name="+"
+    )
+    team = models.ForeignKey("teams.Team", on_delete=models.CASCADE, related_name="+")
+    number = models.PositiveSmallIntegerField(help_text="Order of this drive within the game")
+
+    start_sequence = models.PositiveIntegerField()
+    end_sequence = models.PositiveIntegerField()
+    start_quarter = models.PositiveSmallIntegerField()
+    end_quarter = models.PositiveSmallIntegerField()
+    start_clock = models.DurationField(null=True)
+    end_clock = models.DurationField(null=True)
+    duration = models.DurationField(
+        null=True, help_text="Game clock from the first to the last snap"
+    )
+    start_position = models.SmallIntegerField(null=True)
+    end_position = models.SmallIntegerField(null=True)
+
+    plays = models.PositiveSmallIntegerField(default=0)
+    yards = models.SmallIntegerField(default=0)
+    first_downs = models.PositiveSmallIntegerField(default=0)
+    result = models.CharField(max_length=10, choices=Result.choices, blank=True)
+    points = models.PositiveSmallIntegerField(default=0)
+
+    objects = DriveManager()
+
+    class Meta:
+        db_table = "drives"
+        ordering = ["game", "number"]
+        constraints = [
+            models.UniqueConstraint(fields=["game", "number"], name="drives_unique_game_number"),
+        ]
+        indexes = [
+            models.Index(fields=["season", "result"], name="drives_season_result_idx"),
+            models.Index(fields=["team", "result"], name="drives_team_result_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.game_id} - Drive #{self.number} ({self.result or 'in progress'})"
+
+    def elapsed(self):
+        """Game clock between the first and last snap, or None without clocks."""
+        if self.start_clock is None or self.end_clock is None:
+            return None
+        quarters = self.end_quarter - self.start_quarter
+        return quarters * QUARTER_LENGTH + self.start_clock - self.end_clock
@@ -0,0 +1,356 @@
+"""
+Denormalized snap facts - one flat row per snap for reporting.
+"""
+from typing import ClassVar
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from apps.games.models import Game
+from apps.snaps.signals import snap_data_changed
+
+from .base import BaseSnap
+from .defense import DefenseSnap
+from .offense import OffenseSnap, PassPlay, RunPlay
+from .special_teams import (
+    ExtraPointSnap,
+    FieldGoalSnap,
+    KickoffReturnSnap,
+    KickoffSnap,
+    PuntReturnSnap,
+    PuntSnap,
+    SpecialTeamsSnap,
+)
+
+
+class SnapFactManager(models.Manager):
+    """
+    Keeps SnapFact rows in step with the snap hierarchy.
+
+    ``BaseSnap.save()`` and ``bulk_create_snaps`` call into this manager,
+    which also keeps the PlayerGameStats rollups and Drive rows current;
+    deletes cascade through the one-to-one link and ``BaseSnap.delete()``
+    refreshes the rollups and drives. Writes that bypass these paths
+    (``QuerySet.update()``, queryset deletes, raw SQL) need
+    ``manage.py rebuild_snap_facts``.
+    """
+
+    def sync(self, snap, created=False):
+        """Write the fact row for a saved snap and update its rollups and drives."""
+        from apps.snaps.expected_points import score_facts
+
+        from .drives import Drive
+        from .rollups import PlayerGameStats
+
+        previous = None if created else self.current(snap.pk)
+        game_keys = self._game_keys(snap)
+        fact = self.model.from_snap(snap, *game_keys)
+        score_facts([fact])
+        fact.save(using=self.db, force_insert=created)
+
+        scopes = {(fact.game_id, fact.season_id, fact.team_id)}
+        if created:
+            PlayerGameStats.objects.add_facts(self.filter(pk=fact.pk))
+            Drive.objects.append([fact])
+        else:
+            touched = {fact.game_id: {fact.player_id, fact.receiver_id}}
+            if previous:
+                touched.setdefault(previous["game_id"], set()).update(
+                    (previous["player_id"], previous["receiver_id"])
+                )
+                scopes.add(self.scope_of(previous))
+            for game_id, player_ids in touched.items():
+                PlayerGameStats.objects.refresh(game_id, player_ids)
+            Drive.objects.rebuild(touched)
+
+        snap_data_changed.send(sender=self.model, scopes=scopes)
+        return fact
+
+    def bulk_sync(self, snaps):
+        """Insert fact rows for newly created snaps in one ``executemany``."""
+        from apps.snaps.bulk import insert_rows
+        from apps.snaps.expected_points import score_facts
+
+        from .drives import Drive
+        from .rollups import PlayerGameStats
+
+        snaps = list(snaps)
+        game_keys = self._game_keys_for({snap.game_id for snap in snaps})
+        facts = [self.model.from_snap(snap, *game_keys[snap.game_id]) for snap in snaps]
+        score_facts(facts)
+        insert_rows(self.model, facts, self.db)
+        PlayerGameStats.objects.add_facts(self.filter(pk__in=[snap.pk for snap in snaps]))
+        Drive.objects.append(facts)
+        snap_data_changed.send(
+            sender=self.model, scopes={self.scope_of(fact) for fact in facts}
+        )
+        return facts
+
+    def current(self, snap_id):
+        """Scope and player ids of a snap's stored fact, or None."""
+        return self.filter(pk=snap_id).values(
+            "game_id", "season_id", "team_id", "player_id", "receiver_id"
+        ).first()
+
+    @staticmethod
+    def scope_of(fact):
+        """(game_id, season_id, team_id) of a fact instance or ``current()`` dict."""
+        if isinstance(fact, dict):
+            return fact["game_id"], fact["season_id"], fact["team_id"]
+        return fact.game_id, fact.season_id, fact.team_id
+
+    def rebuild(self, snap_queryset=None, batch_size=1000):
+        """
+        Recreate facts for every snap in ``snap_queryset`` (default: all).
+
+        Each concrete snap type is read in its own chunked query, so the
+        rebuild never loads the whole table at once. Returns the row count.
+        """
+        from apps.snaps.expected_points import load_model, score_facts
+
+        points_model = load_model()
+        if snap_queryset is None:
+            snap_queryset = BaseSnap.objects.all()
+        snap_ids = snap_queryset.non_polymorphic().values("pk")
+        self.filter(snap__in=snap_ids).delete()
+
+        total = 0
+        for model in SnapFact.SNAP_TYPES:
+            rows = (
+                model._base_manager.non_polymorphic()
+                .filter(
+                    pk__in=snap_ids,
+                    polymorphic_ctype=ContentType.objects.get_for_model(
+                        model, for_concrete_model=False
+                    ),
+                )
+                .select_related("game__season")
+                .order_by("pk")
+            )
+            batch = []
+            for snap in rows.iterator(chunk_size=batch_size):
+                batch.append(
+                    self.model.from_snap(
+                        snap, snap.game.season_id, snap.game.season.team_id
+                    )
+                )
+                if len(batch) >= batch_size:
+                    total += len(self.bulk_create(score_facts(batch, points_model)))
+                    batch = []
+            if batch:
+                total += len(self.bulk_create(score_facts(batch, points_model)))
+
+        snap_data_changed.send(
+            sender=self.model,
+            scopes=set(
+                self.filter(snap__in=snap_ids)
+                .values_list("game_id", "season_id", "team_id")
+                .distinct()
+            ),
+        )
+        return total
+
+    def _game_keys(self, snap):
+        """(season_id, team_id) for the snap's game, from cache when loaded."""
+        if BaseSnap.game.is_cached(snap) and Game.season.is_cached(snap.game):
+            return snap.game.season_id, snap.game.season.team_id
+        return self._game_keys_for({snap.game_id})[snap.game_id]
+
+    def _game_keys_for(self, game_ids):
+        return {
+            game_id: (season_id, team_id)
+            for game_id, season_id, team_id in Game.objects.filter(
+                pk__in=game_ids
+            ).values_list("pk", "season_id", "season__team_id")
+        }
+
+
+class SnapFact(models.Model):
+    """
+    Flat, join-free copy of a snap's reportable columns.
+
+    The report services aggregate from this single table instead of
+    joining snaps -> snaps_offense -> snaps_offense_run/_pass -> games ->
+    seasons. Type-specific columns are folded onto shared ones
+    (``yards_gained`` holds punt, kick, return or tackle yards, or the
+    field goal distance, depending on ``play_type``).
+    """
+
+    class PlayType(models.TextChoices):
+        RUN = "RUN", "Run"
+        PASS = "PASS", "Pass"
+        OFFENSE = "OFF", "Other Offense"
+        DEFENSE = "DEF", "Defense"
+        SPECIAL_TEAMS = "ST", "Other Special Teams"
+        PUNT = "PUNT", "Punt"
+        PUNT_RETURN = "PR", "Punt Return"
+        KICKOFF = "KO", "Kickoff"
+        KICKOFF_RETURN = "KR", "Kickoff Return"
+        FIELD_GOAL = "FG", "Field Goal"
+        EXTRA_POINT = "XP", "Extra Point"
+
+    # Concrete snap model -> (play type, {fact column: snap attribute}).
+    # Columns not listed are copied from a same-named snap attribute if
+    # the snap has one.
+    SNAP_TYPES: ClassVar[dict] = {
+        RunPlay: (PlayType.RUN, {
+            "player_id": "ball_carrier_id",
+            "result": "play_result",
+        }),
+        PassPlay: (PlayType.PASS, {
+            "player_id": "quarterback_id",
+            "result": "play_result",
+        }),
+        OffenseSnap: (PlayType.OFFENSE, {
+            "player_id": "penalty_player_id",
+            "yards_gained": "penalty_yards",
+            "result": "play_result",
+        }),
+        DefenseSnap: (PlayType.DEFENSE, {
+            "player_id": "primary_player_id",
+            "yards_gained": "tackle_yards",
+            "result": "play_result",
+            "is_touchdown": "is_defensive_touchdown",
+        }),
+        SpecialTeamsSnap: (PlayType.SPECIAL_TEAMS, {
+            "player_id": "penalty_player_id",
+            "yards_gained": "penalty_yards",
+        }),
+        PuntSnap: (PlayType.PUNT, {"player_id": "punter_id", "yards_gained": "punt_yards"}),
+        PuntReturnSnap: (PlayType.PUNT_RETURN, {
+            "player_id": "returner_id",
+            "yards_gained": "return_yards",
+        }),
+        KickoffSnap: (PlayType.KICKOFF, {"player_id": "kicker_id", "yards_gained": "kick_yards"}),
+        KickoffReturnSnap: (PlayType.KICKOFF_RETURN, {
+            "player_id": "returner_id",
+            "yards_gained": "return_yards",
+        }),
+        FieldGoalSnap: (PlayType.FIELD_GOAL, {
+            "player_id": "kicker_id",
+            "yards_gained": "kick_distance",
+        }),
+        ExtraPointSnap: (PlayType.EXTRA_POINT, {"player_id": "kicker_id"}),
+    }
+
+    snap = models.OneToOneField(
+        BaseSnap, on_delete=models.CASCADE, primary_key=True, related_name="fact"
+    )
+
+    # Scope keys copied from the game so reports filter without joins
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="+")
+    season = models.ForeignKey(
+        "teams.Season", on_delete=models.CASCADE, related_name="+"
+    )
+    team = models.ForeignKey("teams.Team", on_delete=models.CASCADE, related_name="+")
+
+    # Situation
+    sequence_number = models.PositiveIntegerField()
+    quarter = models.PositiveSmallIntegerField()
+    game_clock = models.DurationField(null=True)
+    down = models.PositiveSmallIntegerField(null=True)
+    distance = models.PositiveSmallIntegerField(null=True)
+    ball_position = models.SmallIntegerField(null=True)
+    formation = models.CharField(max_length=50, blank=True)
+
+    # Play family and outcome
+    play_type = models.CharField(max_length=4, choices=PlayType.choices)
+    result = models.CharField(max_length=10, blank=True)
+    attempt_type = models.CharField(max_length=10, blank=True)
+
+    # Players: the primary actor (carrier, passer, defender, kicker, punter,
+    # returner) and, for passes, the receiver
+    player = models.ForeignKey(
+        "teams.Player", on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    receiver = models.ForeignKey(
+        "teams.Player", on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+
+    # Yardage
+    yards_gained = models.SmallIntegerField(null=True)
+    air_yards = models.SmallIntegerField(default=0)
+    yards_after_catch = models.SmallIntegerField(default=0)
+    sack_yards = models.SmallIntegerField(default=0)
+    interception_return_yards = models.SmallIntegerField(null=True)
+    fumble_return_yards = models.SmallIntegerField(null=True)
+
+    # Outcome flags
+    is_touchdown = models.BooleanField(default=False)
+    is_first_down = models.BooleanField(default=False)
+    is_complete = models.BooleanField(default=False)
+    is_interception = models.BooleanField(default=False)
+    is_thrown_away = models.BooleanField(default=False)
+    was_under_pressure = models.BooleanField(default=False)
+    was_sacked = models.BooleanField(default=False)
+    fumbled = models.BooleanField(default=False)
+    fumble_lost = models.BooleanField(default=False)
+    applied_pressure = models.BooleanField(default=False)
+    forced_incompletion = models.BooleanField(default=False)
+    is_touchback = models.BooleanField(default=False)
+    is_blocked = models.BooleanField(default=False)
+    out_of_bounds = models.BooleanField(default=False)
+    is_onside_kick = models.BooleanField(default=False)
+    onside_recovered = models.BooleanField(default=False)
+
+    # Expected points before the snap, points added by it and our win
+    # probability before it; empty until a model is fitted
+    # (apps.snaps.expected_points)
+    ep = models.FloatField(null=True)
+    epa = models.FloatField(null=True)
+    wp = models.FloatField(null=True)
+
+    objects = SnapFactManager()
+
+    class Meta:
+        db_table = "snap_facts"
+        indexes = [
+            models.Index(fields=["play_type", "game"]),
+            models.Index(fields=["play_type", "season"]),
+            models.Index(fields=["play_type", "team"]),
+            models.Index(fields=["play_type", "player"]),
+            # Rollup refreshes read one game's facts per player role
+            models.Index(
+                fields=["game", "player"],
+                condition=models.Q(player__isnull=False),
+                name="snap_facts_game_player_idx",
+            ),
+            models.Index(
+                fields=["game", "receiver"],
+                condition=models.Q(receiver__isnull=False),
+                name="snap_facts_game_receiver_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_play_type_display()} fact for snap {self.snap_id}"
+
+    @classmethod
+    def from_snap(cls, snap, season_id, team_id):
+        """Build an unsaved fact row from a concrete snap instance."""
+        play_type, sources = cls.SNAP_TYPES[type(snap)]
+        fact = cls(
+            snap_id=snap.pk,
+            game_id=snap.game_id,
+            season_id=season_id,
+            team_id=team_id,
+            sequence_number=snap.sequence_number,
+            quarter=snap.quarter,
+            down=snap.down,
+            distance=snap.distance,
+            ball_position=snap.ball_position,
+            play_type=play_type,
+        )
+        for field in cls._copied_fields():
+            source = sources.get(field.attname, field.attname)
+            if hasattr(snap, source):
+                setattr(fact, field.attname, getattr(snap, source))
+        return fact
+
+    @classmethod
+    def _copied_fields(cls):
+        fixed = {
+            "snap_id", "game_id", "season_id", "team_id", "sequence_number",
+            "quarter", "down", "distance", "ball_position", "play_type",
+        }
+        return [f for f in cls._meta.concrete_fields if f.attname not in fixed]
@@ -0,0 +1,149 @@
+"""
+Score ledger - the points behind each game's score, one row per change.
+"""
+from django.db import models
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from apps.games.models import Game
+
+from .base import BaseSnap
+from .defense import DefenseSnap
+from .offense import PassPlay, RunPlay
+from .special_teams import (
+    ExtraPointSnap,
+    FieldGoalSnap,
+    KickoffReturnSnap,
+    PuntReturnSnap,
+)
+
+TOUCHDOWN_POINTS = 6
+FIELD_GOAL_POINTS = 3
+
+
+def points_scored(snap):
+    """Points our team scored on a concrete snap."""
+    if isinstance(snap, (RunPlay, PassPlay, PuntReturnSnap, KickoffReturnSnap)):
+        return TOUCHDOWN_POINTS if snap.is_touchdown else 0
+    if isinstance(snap, DefenseSnap):
+        return TOUCHDOWN_POINTS if snap.is_defensive_touchdown else 0
+    if isinstance(snap, FieldGoalSnap):
+        return FIELD_GOAL_POINTS if snap.result == FieldGoalSnap.Result.GOOD else 0
+    if isinstance(snap, ExtraPointSnap) and snap.result == ExtraPointSnap.Result.GOOD:
+        return 1 if snap.attempt_type == ExtraPointSnap.AttemptType.KICK else 2
+    return 0
+
+
+class ScoreEntryManager(models.Manager):
+    """
+    Writes ledger rows and applies them to the game's score.
+
+    Every change to ``Game.team_score``/``opponent_score`` goes through
+    here inside the caller's transaction - snap saves and deletes, bulk
+    inserts, a new game's opening score and manual edits from the tracker
+    or the games API - so the score columns always equal ``totals()``.
+    Scores move by the entry's points with an ``F()`` update: reversing a
+    play costs one row lookup, however long the game.
+    """
+
+    def record(self, game, snaps):
+        """Add a row for each scoring snap in ``snaps`` (saved, concrete)."""
+        entries = [
+            ScoreEntry(game_id=game.pk, snap_id=snap.pk, team_points=points)
+            for snap in snaps
+            if (points := points_scored(snap))
+        ]
+        if entries:
+            self.bulk_create(entries)
+            self._apply(game, sum(entry.team_points for entry in entries), 0)
+        return entries
+
+    def rescore(self, snap):
+        """Bring an edited snap's row in line with the points it now scores."""
+        points = points_scored(snap)
+        entry = self.filter(snap_id=snap.pk).values_list("pk", "team_points").first()
+        current = entry[1] if entry else 0
+        if points == current:
+            return
+        if entry is None:
+            self.create(game_id=snap.game_id, snap_id=snap.pk, team_points=points)
+        elif points:
+            self.filter(pk=entry[0]).update(team_points=points)
+        else:
+            self.filter(pk=entry[0]).delete()
+        self._apply(snap.game, points - current, 0)
+
+    def open(self, game):
+        """The opening balance of a game created with a score already set."""
+        if game.team_score or game.opponent_score:
+            self.create(
+                game_id=game.pk, team_points=game.team_score, opponent_points=game.opponent_score
+            )
+
+    def adjust(self, game, team_score=None, opponent_score=None):
+        """Record a manual correction that sets the game's score."""
+        team_points = 0 if team_score is None else team_score - game.team_score
+        opponent_points = 0 if opponent_score is None else opponent_score - game.opponent_score
+        if team_points or opponent_points:
+            self.create(game_id=game.pk, team_points=team_points, opponent_points=opponent_points)
+            self._apply(game, team_points, opponent_points)
+
+    def remove(self, snap):
+        """Delete ``snap``'s row, if it scored, and take its points back."""
+        entry = self.filter(snap_id=snap.pk).values_list("pk", "team_points", "opponent_points").first()
+        if entry is not None:
+            pk, team_points, opponent_points = entry
+            self.filter(pk=pk).delete()
+            self._apply(snap.game, -team_points, -opponent_points)
+
+    def totals(self, game_id):
+        """(team, opponent) score as the sum of the game's ledger."""
+        totals = self.filter(game_id=game_id).aggregate(
+            team=Sum("team_points", default=0), opponent=Sum("opponent_points", default=0)
+        )
+        return totals["team"], totals["opponent"]
+
+    def _apply(self, game, team_points, opponent_points):
+        now = timezone.now()
+        Game.objects.filter(pk=game.pk).update(
+            team_score=F("team_score") + team_points,
+            opponent_score=F("opponent_score") + opponent_points,
+            updated_at=now,
+        )
+        game.team_score += team_points
+        game.opponent_score += opponent_points
+        game.updated_at = now
+
+
+class ScoreEntry(models.Model):
+    """
+    One change to a game's score.
+
+    Scoring snaps get a row written with the snap and deleted with it;
+    rows without a snap are manual corrections and opening balances (of
+    games created with a score, or scored before the ledger existed). A
+    game's score is the sum of its rows.
+    """
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="score_entries")
+    snap = models.OneToOneField(
+        BaseSnap,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="score_entry",
+    )
+    team_points = models.SmallIntegerField(default=0)
+    opponent_points = models.SmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = ScoreEntryManager()
+
+    class Meta:
+        db_table = "score_ledger"
+        ordering = ["game", "pk"]
+        verbose_name_plural = "score entries"
+
+    def __str__(self):
+        source = f"snap {self.snap_id}" if self.snap_id else "adjustment"
+        return f"{self.game_id}: +{self.team_points}/+{self.opponent_points} ({source})"
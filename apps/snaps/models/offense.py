@@ -67,9 +67,8 @@ class RunPlay(OffenseSnap):
     class Meta:
         db_table = "snaps_offense_run"
 
-    def save(self, *args, **kwargs):
+    def set_derived_fields(self):
         self.play_result = OffenseSnap.PlayResult.RUN
-        super().save(*args, **kwargs)
 
 
 class PassPlay(OffenseSnap):
@@ -129,10 +128,17 @@ class PassPlay(OffenseSnap):
 
     class Meta:
         db_table = "snaps_offense_pass"
-
-    def save(self, *args, **kwargs):
+        indexes = [
+            # Receptions per receiver (``?receiver=<id>&is_complete=true``)
+            models.Index(
+                fields=["receiver"],
+                condition=models.Q(is_complete=True),
+                name="snaps_pass_reception_idx",
+            ),
+        ]
+
+    def set_derived_fields(self):
         if self.was_sacked:
             self.play_result = OffenseSnap.PlayResult.SACK
         else:
             self.play_result = OffenseSnap.PlayResult.PASS
-        super().save(*args, **kwargs)
@@ -0,0 +1,103 @@
+"""
+Tracker redo stack - plays taken back by undo, kept so redo can restore them.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from apps.games.models import Game
+
+from .defense import DefenseSnap, DefenseSnapAssist
+
+
+def _snap_fields(model):
+    """The columns that describe a snap, without its primary and parent keys."""
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if not field.primary_key and not (field.remote_field and field.remote_field.parent_link)
+    ]
+
+
+class UndonePlayManager(models.Manager):
+    """
+    Per-game stack of undone plays, newest last.
+
+    Stored in the database rather than a cache so an undo and the redo
+    that follows can land on different worker processes. Call both under
+    the game row lock.
+    """
+
+    def push(self, snap, depth):
+        """
+        Keep ``snap`` before it is deleted; the stack holds at most ``depth`` plays.
+
+        A defensive snap's assists are kept with it, since deleting the
+        snap deletes them too.
+        """
+        values = {field.attname: field.value_from_object(snap) for field in _snap_fields(type(snap))}
+        if isinstance(snap, DefenseSnap):
+            values["assists"] = list(snap.assists.values_list("player_id", "assist_type"))
+        self.create(
+            game_id=snap.game_id,
+            sequence_number=snap.sequence_number,
+            snap_type=ContentType.objects.get_for_model(snap, for_concrete_model=False),
+            values=values,
+        )
+        stale = self.filter(game_id=snap.game_id).order_by("-pk").values_list("pk", flat=True)[depth:]
+        self.filter(pk__in=list(stale)).delete()
+
+    def pop(self, game_id, next_sequence):
+        """
+        The most recently undone play as an unsaved snap, or None.
+
+        Recording a play after an undo takes the undone play's sequence
+        number, which ends redo for the whole stack.
+        """
+        top = self.filter(game_id=game_id).order_by("-pk").first()
+        if top is None or top.sequence_number != next_sequence:
+            self.filter(game_id=game_id).delete()
+            return None
+        top.delete()
+        return top.rebuild()
+
+    def restore_assists(self, snap):
+        """Insert the assists a popped ``snap`` had, once it is saved again."""
+        DefenseSnapAssist.objects.bulk_create(
+            DefenseSnapAssist(snap=snap, player_id=player_id, assist_type=assist_type)
+            for player_id, assist_type in getattr(snap, "undone_assists", [])
+        )
+
+
+class UndonePlay(models.Model):
+    """A play removed by the tracker's undo, with the field values to insert it again."""
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="undone_plays")
+    sequence_number = models.PositiveIntegerField()
+    snap_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    values = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = UndonePlayManager()
+
+    class Meta:
+        db_table = "tracker_redo_stack"
+        ordering = ["game", "pk"]
+
+    def __str__(self):
+        return f"{self.game_id}: undone play #{self.sequence_number}"
+
+    def rebuild(self):
+        """
+        An unsaved snap of the original type with the stored values.
+
+        Its assists are left on ``undone_assists`` for ``restore_assists``.
+        """
+        model = self.snap_type.model_class()
+        snap = model(**{
+            field.attname: field.to_python(self.values[field.attname])
+            for field in _snap_fields(model)
+            if field.attname in self.values
+        })
+        snap.undone_assists = self.values.get("assists", [])
+        return snap
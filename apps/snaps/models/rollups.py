@@ -0,0 +1,329 @@
+"""
+Per-game, per-player stat rollups maintained from snap facts.
+"""
+from collections import defaultdict
+
+from django.db import models
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.games.models import Game
+
+from .defense import DefenseSnap
+from .facts import SnapFact
+from .special_teams import FieldGoalSnap
+
+PlayType = SnapFact.PlayType
+DefenseResult = DefenseSnap.PlayResult
+FieldGoalResult = FieldGoalSnap.Result
+
+
+def _count(play_type, **conditions):
+    return Count("pk", filter=Q(play_type=play_type, **conditions))
+
+
+def _sum(field, play_type, **conditions):
+    return Coalesce(Sum(field, filter=Q(play_type=play_type, **conditions)), 0)
+
+
+def _max(field, play_type, **conditions):
+    return Max(field, filter=Q(play_type=play_type, **conditions))
+
+
+# Rollup column -> aggregate over the game's SnapFact rows, grouped by the
+# fact's primary player (carrier, passer, defender, kicker, punter)...
+PLAYER_COLUMNS = {
+    "rush_attempts": _count(PlayType.RUN),
+    "rush_yards": _sum("yards_gained", PlayType.RUN),
+    "rush_touchdowns": _count(PlayType.RUN, is_touchdown=True),
+    "rush_first_downs": _count(PlayType.RUN, is_first_down=True),
+    "rush_fumbles": _count(PlayType.RUN, fumbled=True),
+    "rush_fumbles_lost": _count(PlayType.RUN, fumble_lost=True),
+    "rush_longest": _max("yards_gained", PlayType.RUN),
+    "rush_short": _count(PlayType.RUN, yards_gained__lte=5),
+    "rush_long": _count(PlayType.RUN, yards_gained__gt=5),
+    "rush_explosive": _count(PlayType.RUN, yards_gained__gte=10),
+    "pass_attempts": _count(PlayType.PASS),
+    "pass_completions": _count(PlayType.PASS, is_complete=True),
+    "pass_yards": _sum("yards_gained", PlayType.PASS, is_complete=True),
+    "pass_touchdowns": _count(PlayType.PASS, is_touchdown=True),
+    "pass_interceptions": _count(PlayType.PASS, is_interception=True),
+    "pass_sacks": _count(PlayType.PASS, was_sacked=True),
+    "pass_air_yards": _sum("air_yards", PlayType.PASS),
+    "pass_yac": _sum("yards_after_catch", PlayType.PASS, is_complete=True),
+    "pass_longest": _max("yards_gained", PlayType.PASS, is_complete=True),
+    "pass_thrown_away": _count(PlayType.PASS, is_thrown_away=True),
+    "pass_under_pressure": _count(PlayType.PASS, was_under_pressure=True),
+    "def_plays": _count(PlayType.DEFENSE),
+    "def_tackles": _count(PlayType.DEFENSE, result=DefenseResult.TACKLE),
+    "def_tfl": _count(PlayType.DEFENSE, result=DefenseResult.TACKLE_FOR_LOSS),
+    "def_sacks": _count(PlayType.DEFENSE, result=DefenseResult.SACK),
+    "def_interceptions": _count(PlayType.DEFENSE, result=DefenseResult.INTERCEPTION),
+    "def_fumble_recoveries": _count(
+        PlayType.DEFENSE, result=DefenseResult.FUMBLE_RECOVERY
+    ),
+    "def_pass_defended": _count(PlayType.DEFENSE, result=DefenseResult.PASS_DEFENDED),
+    "def_pressures": _count(PlayType.DEFENSE, applied_pressure=True),
+    "def_touchdowns": _count(PlayType.DEFENSE, is_touchdown=True),
+    "fg_attempts": _count(PlayType.FIELD_GOAL),
+    "fg_made": _count(PlayType.FIELD_GOAL, result=FieldGoalResult.GOOD),
+    "fg_missed": _count(PlayType.FIELD_GOAL, result=FieldGoalResult.MISSED),
+    "fg_blocked": _count(PlayType.FIELD_GOAL, result=FieldGoalResult.BLOCKED),
+    "fg_longest": _max("yards_gained", PlayType.FIELD_GOAL, result=FieldGoalResult.GOOD),
+    "punts": _count(PlayType.PUNT),
+    "punt_yards": _sum("yards_gained", PlayType.PUNT),
+    "punt_longest": _max("yards_gained", PlayType.PUNT),
+    "punt_touchbacks": _count(PlayType.PUNT, is_touchback=True),
+    "punt_blocked": _count(PlayType.PUNT, is_blocked=True),
+}
+
+# ...and by the pass receiver.
+RECEIVER_COLUMNS = {
+    "rec_receptions": _count(PlayType.PASS, is_complete=True),
+    "rec_yards": _sum("yards_gained", PlayType.PASS, is_complete=True),
+    "rec_touchdowns": _count(PlayType.PASS, is_complete=True, is_touchdown=True),
+    "rec_first_downs": _count(PlayType.PASS, is_complete=True, is_first_down=True),
+    "rec_longest": _max("yards_gained", PlayType.PASS, is_complete=True),
+    "rec_yac": _sum("yards_after_catch", PlayType.PASS, is_complete=True),
+    "rec_fumbles": _count(PlayType.PASS, is_complete=True, fumbled=True),
+}
+
+ROLES = (("player_id", PLAYER_COLUMNS), ("receiver_id", RECEIVER_COLUMNS))
+MAX_COLUMNS = frozenset(name for name in {**PLAYER_COLUMNS, **RECEIVER_COLUMNS}
+                        if name.endswith("_longest"))
+
+
+class PlayerGameStatsManager(models.Manager):
+    """
+    Maintains PlayerGameStats from SnapFact rows.
+
+    New snaps are folded in as increments (``col = col + delta``), so the
+    tracker's hot path never re-aggregates a game. Edits and undos refresh
+    just the affected players' rows for that game from its facts.
+    """
+
+    def add_facts(self, facts):
+        """
+        Increment the rollups touched by newly inserted facts.
+
+        Rows that do not exist yet (a player's first snap of a game, or a
+        whole freshly inserted game) are created with their values in one
+        statement; only existing rows are incremented one by one. Writers
+        hold the game row's sequence lock, so the existence check cannot
+        race another insert for the same game.
+        """
+        rows = self.aggregate_facts(facts)
+        existing = set()
+        for game_id in {game_id for game_id, _, _, _ in rows}:
+            existing.update(
+                (game_id, player_id)
+                for player_id in self.filter(
+                    game_id=game_id,
+                    player_id__in=[key[3] for key in rows if key[0] == game_id],
+                ).values_list("player_id", flat=True)
+            )
+        self.bulk_create(self._build({
+            key: values for key, values in rows.items()
+            if (key[0], key[3]) not in existing
+        }))
+
+        for key, values in rows.items():
+            game_id, _, _, player_id = key
+            if (game_id, player_id) not in existing:
+                continue
+            updates = {}
+            for column, value in values.items():
+                if column in MAX_COLUMNS:
+                    if value is not None:
+                        updates[column] = Greatest(Coalesce(F(column), value), value)
+                elif value:
+                    updates[column] = F(column) + value
+            self.filter(game_id=game_id, player_id=player_id).update(**updates)
+
+    def refresh(self, game_id, player_ids=None):
+        """Recompute one game's rows (optionally only ``player_ids``) from facts."""
+        if player_ids is not None:
+            player_ids = {pk for pk in player_ids if pk is not None}
+            if not player_ids:
+                return
+        rows = self.aggregate_facts(
+            SnapFact.objects.filter(game_id=game_id), player_ids
+        )
+
+        stale = self.filter(game_id=game_id)
+        if player_ids is not None:
+            stale = stale.filter(player_id__in=player_ids)
+        stale.delete()
+        self.bulk_create(self._build(rows))
+
+    def rebuild(self, game_ids=None):
+        """Recompute every rollup row, or those of ``game_ids``."""
+        facts = SnapFact.objects.all()
+        stale = self.all()
+        if game_ids is not None:
+            facts = facts.filter(game_id__in=game_ids)
+            stale = stale.filter(game_id__in=game_ids)
+        stale.delete()
+        return len(self.bulk_create(self._build(self.aggregate_facts(facts))))
+
+    def diff(self, game_ids=None):
+        """
+        Compare stored rollups with a full recompute from SnapFact.
+
+        Returns ``(game_id, player_id, column, stored, expected)`` tuples;
+        an empty list means the rollups are consistent.
+        """
+        facts = SnapFact.objects.all()
+        stored_rows = self.all()
+        if game_ids is not None:
+            facts = facts.filter(game_id__in=game_ids)
+            stored_rows = stored_rows.filter(game_id__in=game_ids)
+
+        expected = {
+            (game_id, player_id): values
+            for (game_id, _, _, player_id), values in self.aggregate_facts(facts).items()
+        }
+        columns = list(PLAYER_COLUMNS) + list(RECEIVER_COLUMNS)
+        stored = {
+            (row["game_id"], row["player_id"]): row
+            for row in stored_rows.values("game_id", "player_id", *columns)
+        }
+
+        mismatches = []
+        for key in sorted(expected.keys() | stored.keys()):
+            want = expected.get(key) or dict.fromkeys(columns)
+            have = stored.get(key) or dict.fromkeys(columns)
+            for column in columns:
+                if have[column] != want[column]:
+                    mismatches.append((*key, column, have[column], want[column]))
+        return mismatches
+
+    def aggregate_facts(self, facts, player_ids=None):
+        """
+        Rollup values per (game, season, team, player) for a fact queryset.
+
+        Players whose values are all zero/empty (e.g. a penalty-only
+        appearance) get no row.
+        """
+        defaults = {
+            name: None if name in MAX_COLUMNS else 0
+            for name in {**PLAYER_COLUMNS, **RECEIVER_COLUMNS}
+        }
+        results = defaultdict(lambda: dict(defaults))
+        for role, columns in ROLES:
+            rows = facts.filter(**{f"{role}__isnull": False})
+            if player_ids is not None:
+                rows = rows.filter(**{f"{role}__in": player_ids})
+            for row in (
+                rows.values("game_id", "season_id", "team_id", role)
+                .annotate(**columns)
+                .order_by()
+            ):
+                key = (row.pop("game_id"), row.pop("season_id"),
+                       row.pop("team_id"), row.pop(role))
+                results[key].update(row)
+
+        return {
+            key: values for key, values in results.items()
+            if any(values.values())
+        }
+
+    def _build(self, rows):
+        return [
+            self.model(game_id=game_id, season_id=season_id, team_id=team_id,
+                       player_id=player_id, **values)
+            for (game_id, season_id, team_id, player_id), values in rows.items()
+        ]
+
+
+class PlayerGameStats(models.Model):
+    """
+    One player's box score for one game.
+
+    Season and career reports sum these rows instead of re-aggregating
+    every snap. Rows are kept current from SnapFact writes; ``manage.py
+    check_stat_rollups`` diffs them against a full recompute.
+    """
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="+")
+    season = models.ForeignKey(
+        "teams.Season", on_delete=models.CASCADE, related_name="+"
+    )
+    team = models.ForeignKey("teams.Team", on_delete=models.CASCADE, related_name="+")
+    player = models.ForeignKey(
+        "teams.Player", on_delete=models.CASCADE, related_name="game_stats"
+    )
+
+    # Rushing
+    rush_attempts = models.PositiveSmallIntegerField(default=0)
+    rush_yards = models.SmallIntegerField(default=0)
+    rush_touchdowns = models.PositiveSmallIntegerField(default=0)
+    rush_first_downs = models.PositiveSmallIntegerField(default=0)
+    rush_fumbles = models.PositiveSmallIntegerField(default=0)
+    rush_fumbles_lost = models.PositiveSmallIntegerField(default=0)
+    rush_longest = models.SmallIntegerField(null=True)
+    rush_short = models.PositiveSmallIntegerField(default=0, help_text="Runs of 5 yards or less")
+    rush_long = models.PositiveSmallIntegerField(default=0, help_text="Runs over 5 yards")
+    rush_explosive = models.PositiveSmallIntegerField(default=0, help_text="Runs of 10+ yards")
+
+    # Passing
+    pass_attempts = models.PositiveSmallIntegerField(default=0)
+    pass_completions = models.PositiveSmallIntegerField(default=0)
+    pass_yards = models.SmallIntegerField(default=0)
+    pass_touchdowns = models.PositiveSmallIntegerField(default=0)
+    pass_interceptions = models.PositiveSmallIntegerField(default=0)
+    pass_sacks = models.PositiveSmallIntegerField(default=0)
+    pass_air_yards = models.SmallIntegerField(default=0)
+    pass_yac = models.SmallIntegerField(default=0)
+    pass_longest = models.SmallIntegerField(null=True)
+    pass_thrown_away = models.PositiveSmallIntegerField(default=0)
+    pass_under_pressure = models.PositiveSmallIntegerField(default=0)
+
+    # Receiving
+    rec_receptions = models.PositiveSmallIntegerField(default=0)
+    rec_yards = models.SmallIntegerField(default=0)
+    rec_touchdowns = models.PositiveSmallIntegerField(default=0)
+    rec_first_downs = models.PositiveSmallIntegerField(default=0)
+    rec_longest = models.SmallIntegerField(null=True)
+    rec_yac = models.SmallIntegerField(default=0)
+    rec_fumbles = models.PositiveSmallIntegerField(default=0)
+
+    # Defense
+    def_plays = models.PositiveSmallIntegerField(default=0)
+    def_tackles = models.PositiveSmallIntegerField(default=0)
+    def_tfl = models.PositiveSmallIntegerField(default=0)
+    def_sacks = models.PositiveSmallIntegerField(default=0)
+    def_interceptions = models.PositiveSmallIntegerField(default=0)
+    def_fumble_recoveries = models.PositiveSmallIntegerField(default=0)
+    def_pass_defended = models.PositiveSmallIntegerField(default=0)
+    def_pressures = models.PositiveSmallIntegerField(default=0)
+    def_touchdowns = models.PositiveSmallIntegerField(default=0)
+
+    # Kicking
+    fg_attempts = models.PositiveSmallIntegerField(default=0)
+    fg_made = models.PositiveSmallIntegerField(default=0)
+    fg_missed = models.PositiveSmallIntegerField(default=0)
+    fg_blocked = models.PositiveSmallIntegerField(default=0)
+    fg_longest = models.PositiveSmallIntegerField(null=True)
+    punts = models.PositiveSmallIntegerField(default=0)
+    punt_yards = models.PositiveSmallIntegerField(default=0)
+    punt_longest = models.PositiveSmallIntegerField(null=True)
+    punt_touchbacks = models.PositiveSmallIntegerField(default=0)
+    punt_blocked = models.PositiveSmallIntegerField(default=0)
+
+    objects = PlayerGameStatsManager()
+
+    class Meta:
+        db_table = "player_game_stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "player"], name="player_game_stats_unique_game_player"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["season", "player"]),
+            models.Index(fields=["team", "player"]),
+        ]
+
+    def __str__(self):
+        return f"Player {self.player_id} - Game {self.game_id}"
@@ -0,0 +1,76 @@
+"""
+Batch downcasting for polymorphic snap querysets.
+
+Iterating BaseSnap rows and calling ``get_real_instance()`` costs a query
+per row, plus one more for every player FK the caller touches.
+``downcast_snaps`` loads the page's ids once, then fetches each concrete
+snap type in a single query with its player relations joined in, so a
+page costs one query per snap type present no matter how many plays it
+holds.
+"""
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from .models import BaseSnap
+
+
+def _related_players(model):
+    """Forward FKs declared below BaseSnap, i.e. the snap's player links."""
+    return [
+        field.name
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.ForeignKey)
+        and not field.remote_field.parent_link
+        and field.model is not BaseSnap
+    ]
+
+
+def downcast_snaps(queryset, select_related=None, prefetch_related=None):
+    """
+    Return the snaps in ``queryset`` as their concrete types, in its order.
+
+    ``queryset`` may be filtered, ordered and sliced. ``select_related``
+    maps a snap model to the relations to join for it; by default every
+    player FK on that model is joined. ``prefetch_related`` likewise maps
+    a model to lookups to prefetch (one more query each, for that model
+    only). Instances a related manager already knows (e.g. the game behind
+    ``game.snaps``) are attached without a query.
+    """
+    rows = list(
+        queryset.non_polymorphic().values_list("pk", "polymorphic_ctype_id")
+    )
+    return _concrete(rows, queryset, select_related, prefetch_related)
+
+
+def downcast_page(snaps, queryset, select_related=None, prefetch_related=None):
+    """
+    ``downcast_snaps`` for base snaps already fetched from ``queryset``.
+
+    For a page a paginator has sliced off a non-polymorphic queryset: the
+    base rows are not loaded again.
+    """
+    rows = [(snap.pk, snap.polymorphic_ctype_id) for snap in snaps]
+    return _concrete(rows, queryset, select_related, prefetch_related)
+
+
+def _concrete(rows, queryset, select_related, prefetch_related):
+    ids_by_ctype = defaultdict(list)
+    for pk, ctype_id in rows:
+        ids_by_ctype[ctype_id].append(pk)
+
+    snaps_by_id = {}
+    for ctype_id, ids in ids_by_ctype.items():
+        model = ContentType.objects.get_for_id(ctype_id).model_class()
+        if select_related is not None and model in select_related:
+            related = select_related[model]
+        else:
+            related = _related_players(model)
+        subclass_qs = model._base_manager.non_polymorphic().select_related(*related)
+        if prefetch_related and model in prefetch_related:
+            subclass_qs = subclass_qs.prefetch_related(*prefetch_related[model])
+        subclass_qs._known_related_objects = queryset._known_related_objects
+        snaps_by_id.update(subclass_qs.in_bulk(ids))
+
+    return [snaps_by_id[pk] for pk, _ in rows if pk in snaps_by_id]
@@ -2,6 +2,7 @@
 Serializers for snap models.
 """
 from .offense import (
+    OffenseSnapReadSerializer,
     RunPlayReadSerializer,
     RunPlayWriteSerializer,
     PassPlayReadSerializer,
@@ -13,17 +14,22 @@ from .defense import (
     DefenseSnapAssistSerializer,
 )
 from .special_teams import (
+    SpecialTeamsSnapReadSerializer,
     PuntSnapReadSerializer,
     PuntSnapWriteSerializer,
+    PuntReturnSnapReadSerializer,
     KickoffSnapReadSerializer,
     KickoffSnapWriteSerializer,
+    KickoffReturnSnapReadSerializer,
     FieldGoalSnapReadSerializer,
     FieldGoalSnapWriteSerializer,
     ExtraPointSnapReadSerializer,
     ExtraPointSnapWriteSerializer,
 )
+from .timeline import SnapTimelineSerializer
 
 __all__ = [
+    "OffenseSnapReadSerializer",
     "RunPlayReadSerializer",
     "RunPlayWriteSerializer",
     "PassPlayReadSerializer",
@@ -31,12 +37,16 @@ __all__ = [
     "DefenseSnapReadSerializer",
     "DefenseSnapWriteSerializer",
     "DefenseSnapAssistSerializer",
+    "SpecialTeamsSnapReadSerializer",
     "PuntSnapReadSerializer",
     "PuntSnapWriteSerializer",
+    "PuntReturnSnapReadSerializer",
     "KickoffSnapReadSerializer",
     "KickoffSnapWriteSerializer",
+    "KickoffReturnSnapReadSerializer",
     "FieldGoalSnapReadSerializer",
     "FieldGoalSnapWriteSerializer",
     "ExtraPointSnapReadSerializer",
     "ExtraPointSnapWriteSerializer",
+    "SnapTimelineSerializer",
 ]
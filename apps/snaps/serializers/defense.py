@@ -2,6 +2,8 @@
 Serializers for defensive snap models.
 """
 from rest_framework import serializers
+from apps.core.mixins import TeamScopedFieldsMixin
+from apps.core.sparse import SparseFieldsMixin
 from apps.teams.models import Player
 from apps.teams.serializers import PlayerMinimalSerializer
 from apps.games.models import Game
@@ -9,7 +11,7 @@ from apps.games.serializers import GameMinimalSerializer
 from apps.snaps.models import DefenseSnap, DefenseSnapAssist
 
 
-class DefenseSnapAssistSerializer(serializers.ModelSerializer):
+class DefenseSnapAssistSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """Serializer for DefenseSnapAssist model."""
 
     player = PlayerMinimalSerializer(read_only=True)
@@ -22,7 +24,7 @@ class DefenseSnapAssistSerializer(serializers.ModelSerializer):
         fields = ["id", "player", "player_id", "assist_type"]
 
 
-class DefenseSnapReadSerializer(serializers.ModelSerializer):
+class DefenseSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests - includes nested data."""
 
     game = GameMinimalSerializer(read_only=True)
@@ -61,7 +63,7 @@ class DefenseSnapReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class DefenseSnapWriteSerializer(serializers.ModelSerializer):
+class DefenseSnapWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests - accepts IDs."""
 
     game_id = serializers.PrimaryKeyRelatedField(
@@ -2,14 +2,44 @@
 Serializers for offensive snap models.
 """
 from rest_framework import serializers
+from apps.core.mixins import TeamScopedFieldsMixin
+from apps.core.sparse import SparseFieldsMixin
 from apps.teams.models import Player
 from apps.teams.serializers import PlayerMinimalSerializer
 from apps.games.models import Game
 from apps.games.serializers import GameMinimalSerializer
-from apps.snaps.models import RunPlay, PassPlay
+from apps.snaps.models import OffenseSnap, RunPlay, PassPlay
 
 
-class RunPlayReadSerializer(serializers.ModelSerializer):
+class OffenseSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """For GET requests - offensive snaps recorded without a run or pass (penalties)."""
+
+    game = GameMinimalSerializer(read_only=True)
+    penalty_player = PlayerMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = OffenseSnap
+        fields = [
+            "id",
+            "game",
+            "sequence_number",
+            "quarter",
+            "game_clock",
+            "down",
+            "distance",
+            "ball_position",
+            "formation",
+            "play_result",
+            "had_penalty",
+            "penalty_player",
+            "penalty_yards",
+            "penalty_description",
+            "notes",
+            "created_at",
+        ]
+
+
+class RunPlayReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests - includes nested player/game data."""
 
     ball_carrier = PlayerMinimalSerializer(read_only=True)
@@ -46,7 +76,7 @@ class RunPlayReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class RunPlayWriteSerializer(serializers.ModelSerializer):
+class RunPlayWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests - accepts IDs."""
 
     game_id = serializers.PrimaryKeyRelatedField(
@@ -103,7 +133,7 @@ class RunPlayWriteSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class PassPlayReadSerializer(serializers.ModelSerializer):
+class PassPlayReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests - includes nested player/game data."""
 
     quarterback = PlayerMinimalSerializer(read_only=True)
@@ -150,7 +180,7 @@ class PassPlayReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class PassPlayWriteSerializer(serializers.ModelSerializer):
+class PassPlayWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests - accepts IDs."""
 
     game_id = serializers.PrimaryKeyRelatedField(
@@ -2,19 +2,50 @@
 Serializers for special teams snap models.
 """
 from rest_framework import serializers
+from apps.core.mixins import TeamScopedFieldsMixin
+from apps.core.sparse import SparseFieldsMixin
 from apps.teams.models import Player
 from apps.teams.serializers import PlayerMinimalSerializer
 from apps.games.models import Game
 from apps.games.serializers import GameMinimalSerializer
 from apps.snaps.models import (
+    SpecialTeamsSnap,
     PuntSnap,
+    PuntReturnSnap,
     KickoffSnap,
+    KickoffReturnSnap,
     FieldGoalSnap,
     ExtraPointSnap,
 )
 
 
-class PuntSnapReadSerializer(serializers.ModelSerializer):
+class SpecialTeamsSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """For GET requests - special teams snaps of no specific kind (penalties)."""
+
+    game = GameMinimalSerializer(read_only=True)
+    penalty_player = PlayerMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = SpecialTeamsSnap
+        fields = [
+            "id",
+            "game",
+            "sequence_number",
+            "quarter",
+            "game_clock",
+            "down",
+            "distance",
+            "ball_position",
+            "formation",
+            "penalty_player",
+            "penalty_yards",
+            "penalty_description",
+            "notes",
+            "created_at",
+        ]
+
+
+class PuntSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests."""
 
     game = GameMinimalSerializer(read_only=True)
@@ -44,7 +75,7 @@ class PuntSnapReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class PuntSnapWriteSerializer(serializers.ModelSerializer):
+class PuntSnapWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests."""
 
     game_id = serializers.PrimaryKeyRelatedField(
@@ -76,7 +107,38 @@ class PuntSnapWriteSerializer(serializers.ModelSerializer):
         ]
 
 
-class KickoffSnapReadSerializer(serializers.ModelSerializer):
+class PuntReturnSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """For GET requests."""
+
+    game = GameMinimalSerializer(read_only=True)
+    returner = PlayerMinimalSerializer(read_only=True)
+    tackler = PlayerMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = PuntReturnSnap
+        fields = [
+            "id",
+            "game",
+            "sequence_number",
+            "quarter",
+            "game_clock",
+            "down",
+            "distance",
+            "ball_position",
+            "formation",
+            "returner",
+            "return_yards",
+            "is_fair_catch",
+            "is_touchdown",
+            "fumbled",
+            "fumble_lost",
+            "tackler",
+            "notes",
+            "created_at",
+        ]
+
+
+class KickoffSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests."""
 
     game = GameMinimalSerializer(read_only=True)
@@ -102,7 +164,7 @@ class KickoffSnapReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class KickoffSnapWriteSerializer(serializers.ModelSerializer):
+class KickoffSnapWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests."""
 
     game_id = serializers.PrimaryKeyRelatedField(
@@ -130,7 +192,37 @@ class KickoffSnapWriteSerializer(serializers.ModelSerializer):
         ]
 
 
-class FieldGoalSnapReadSerializer(serializers.ModelSerializer):
+class KickoffReturnSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """For GET requests."""
+
+    game = GameMinimalSerializer(read_only=True)
+    returner = PlayerMinimalSerializer(read_only=True)
+    tackler = PlayerMinimalSerializer(read_only=True)
+
+    class Meta:
+        model = KickoffReturnSnap
+        fields = [
+            "id",
+            "game",
+            "sequence_number",
+            "quarter",
+            "game_clock",
+            "down",
+            "distance",
+            "ball_position",
+            "formation",
+            "returner",
+            "return_yards",
+            "is_touchdown",
+            "fumbled",
+            "fumble_lost",
+            "tackler",
+            "notes",
+            "created_at",
+        ]
+
+
+class FieldGoalSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests."""
 
     game = GameMinimalSerializer(read_only=True)
@@ -157,7 +249,7 @@ class FieldGoalSnapReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class FieldGoalSnapWriteSerializer(serializers.ModelSerializer):
+class FieldGoalSnapWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests."""
 
     game_id = serializers.PrimaryKeyRelatedField(
@@ -192,7 +284,7 @@ class FieldGoalSnapWriteSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExtraPointSnapReadSerializer(serializers.ModelSerializer):
+class ExtraPointSnapReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """For GET requests."""
 
     game = GameMinimalSerializer(read_only=True)
@@ -221,7 +313,7 @@ class ExtraPointSnapReadSerializer(serializers.ModelSerializer):
         ]
 
 
-class ExtraPointSnapWriteSerializer(serializers.ModelSerializer):
+class ExtraPointSnapWriteSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """For POST/PUT requests."""
 
     game_id = serializers.PrimaryKeyRelatedField(
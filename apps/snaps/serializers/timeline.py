@@ -0,0 +1,75 @@
+"""
+Serializer for a game's play-by-play across every snap type.
+"""
+from typing import ClassVar
+
+from rest_framework import serializers
+
+from apps.snaps.models import (
+    DefenseSnap,
+    ExtraPointSnap,
+    FieldGoalSnap,
+    KickoffReturnSnap,
+    KickoffSnap,
+    OffenseSnap,
+    PassPlay,
+    PuntReturnSnap,
+    PuntSnap,
+    RunPlay,
+    SnapFact,
+    SpecialTeamsSnap,
+)
+
+from .defense import DefenseSnapReadSerializer
+from .offense import (
+    OffenseSnapReadSerializer,
+    PassPlayReadSerializer,
+    RunPlayReadSerializer,
+)
+from .special_teams import (
+    ExtraPointSnapReadSerializer,
+    FieldGoalSnapReadSerializer,
+    KickoffReturnSnapReadSerializer,
+    KickoffSnapReadSerializer,
+    PuntReturnSnapReadSerializer,
+    PuntSnapReadSerializer,
+    SpecialTeamsSnapReadSerializer,
+)
+
+
+class SnapTimelineSerializer(serializers.BaseSerializer):
+    """
+    Read-only; serializes concrete snaps of any type.
+
+    Each row is the snap type's own read serializer output with a leading
+    ``type`` key (the ``SnapFact`` play type, e.g. ``"RUN"``). One child
+    serializer is built per type and reused for every row of that type.
+    """
+
+    SERIALIZERS: ClassVar[dict] = {
+        OffenseSnap: OffenseSnapReadSerializer,
+        RunPlay: RunPlayReadSerializer,
+        PassPlay: PassPlayReadSerializer,
+        DefenseSnap: DefenseSnapReadSerializer,
+        SpecialTeamsSnap: SpecialTeamsSnapReadSerializer,
+        PuntSnap: PuntSnapReadSerializer,
+        PuntReturnSnap: PuntReturnSnapReadSerializer,
+        KickoffSnap: KickoffSnapReadSerializer,
+        KickoffReturnSnap: KickoffReturnSnapReadSerializer,
+        FieldGoalSnap: FieldGoalSnapReadSerializer,
+        ExtraPointSnap: ExtraPointSnapReadSerializer,
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._children = {}
+
+    def to_representation(self, instance):
+        model = type(instance)
+        child = self._children.get(model)
+        if child is None:
+            child = self._children[model] = self.SERIALIZERS[model](context=self.context)
+        return {
+            "type": SnapFact.SNAP_TYPES[model][0],
+            **child.to_representation(instance),
+        }
@@ -0,0 +1,9 @@
+"""
+Signals sent when snap-derived data changes.
+"""
+from django.dispatch import Signal
+
+# Sent after SnapFact rows are written, refreshed or removed, with
+# ``scopes``: a set of (game_id, season_id, team_id) tuples whose data
+# changed. Derived caches (e.g. report results) listen to invalidate.
+snap_data_changed = Signal()
@@ -1,11 +1,35 @@
 """
 ViewSets for snap models.
 """
-from rest_framework import viewsets, status
+from collections import defaultdict
+from typing import ClassVar
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
+from apps.core.conditional import ConditionalModelMixin
+from apps.core.mixins import (
+    TEAM_LOOKUPS,
+    CompiledListMixin,
+    SparseFieldsetMixin,
+    TeamScopedMixin,
+    scope_to_team,
+)
 from apps.core.pagination import SnapCursorPagination
+from apps.core.permissions import IsTeamMember
+from apps.games.models import Game
+from apps.teams.models import Season, Team
+from .bulk import assign_sequence_numbers, bulk_create_snaps
 from .models import (
+    BaseSnap,
     RunPlay,
     PassPlay,
     DefenseSnap,
@@ -32,6 +56,7 @@ from .serializers import (
     ExtraPointSnapReadSerializer,
     ExtraPointSnapWriteSerializer,
 )
+from .export import EXPORT_FORMATS, export_rows
 from .filters import (
     RunPlayFilter,
     PassPlayFilter,
@@ -42,7 +67,179 @@ from .filters import (
 )
 
 
-class RunPlayViewSet(viewsets.ModelViewSet):
+class _PrefetchedQuerySet:
+    """Stands in for a related field's queryset, answering ``get(pk=)`` from a dict."""
+
+    def __init__(self, model, objects):
+        self.model = model
+        self._objects = objects
+
+    def get(self, pk):
+        try:
+            pk = self.model._meta.pk.to_python(pk)
+        except DjangoValidationError as exc:
+            raise ValueError(pk) from exc
+        try:
+            return self._objects[pk]
+        except KeyError:
+            raise self.model.DoesNotExist from None
+
+
+class BulkCreateMixin:
+    """
+    Adds ``POST <prefix>/bulk/`` for creating a list of snaps at once.
+
+    Related ids are resolved with one query per related model instead of
+    one per row and field, and the rows are written with
+    ``bulk_create_snaps`` (one INSERT per table) in a single transaction.
+    The batch is all-or-nothing: if any row is invalid nothing is saved
+    and the response lists each failing row's index and errors.
+    Rows without a ``sequence_number`` are numbered in list order.
+    """
+
+    bulk_max_rows = 5000
+
+    @extend_schema(summary="Create snaps in bulk")
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Create a list of snaps in one transaction."""
+        serializer = self.get_serializer(
+            data=request.data, many=True, max_length=self.bulk_max_rows
+        )
+        # Omitted sequence numbers are allocated below, after validation
+        serializer.child.fields["sequence_number"].required = False
+        if isinstance(request.data, list):
+            self._prefetch_related(serializer.child, request.data)
+        if not serializer.is_valid():
+            return self._bulk_errors(serializer.errors)
+
+        model = serializer.child.Meta.model
+        snaps = [model(**row) for row in serializer.validated_data]
+        conflicts = self._sequence_conflicts(snaps)
+        if conflicts:
+            return self._bulk_errors(conflicts)
+
+        try:
+            with transaction.atomic():
+                assign_sequence_numbers(snaps)
+                bulk_create_snaps(snaps)
+        except IntegrityError:
+            return Response(
+                {"error": "Sequence numbers were taken by a concurrent write; retry"},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        return Response(
+            {
+                "created": [
+                    {"id": snap.pk, "sequence_number": snap.sequence_number}
+                    for snap in snaps
+                ]
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    @staticmethod
+    def _prefetch_related(child, rows):
+        """Load every related object the rows reference, one query per model."""
+        groups = defaultdict(list)
+        for name, field in child.fields.items():
+            if isinstance(field, serializers.PrimaryKeyRelatedField) and not field.read_only:
+                queryset = field.get_queryset()
+                # Fields sharing a model and queryset (e.g. the player
+                # links) are resolved together.
+                groups[(queryset.model, str(queryset.query))].append((name, field))
+
+        for (model, _), fields in groups.items():
+            pk_field = model._meta.pk
+            ids = set()
+            for row in rows:
+                for name, _field in fields:
+                    value = row.get(name) if isinstance(row, dict) else None
+                    if value in (None, ""):
+                        continue
+                    try:
+                        ids.add(pk_field.to_python(value))
+                    except (DjangoValidationError, TypeError):
+                        pass
+            objects = fields[0][1].get_queryset().in_bulk(ids)
+            for _name, field in fields:
+                field.queryset = _PrefetchedQuerySet(model, objects)
+
+    @staticmethod
+    def _sequence_conflicts(snaps):
+        """Row errors for explicit sequence numbers already used or repeated."""
+        wanted = {
+            (snap.game_id, snap.sequence_number)
+            for snap in snaps
+            if snap.sequence_number is not None
+        }
+        if not wanted:
+            return []
+        taken = set(
+            BaseSnap.objects.non_polymorphic()
+            .filter(
+                game_id__in={game_id for game_id, _ in wanted},
+                sequence_number__in={number for _, number in wanted},
+            )
+            .values_list("game_id", "sequence_number")
+        )
+
+        errors = [{} for _ in snaps]
+        for index, snap in enumerate(snaps):
+            key = (snap.game_id, snap.sequence_number)
+            if snap.sequence_number is None:
+                continue
+            if key in taken:
+                errors[index] = {
+                    "sequence_number": ["This game already has a snap with this sequence number."]
+                }
+            taken.add(key)
+        return errors if any(errors) else []
+
+    @staticmethod
+    def _bulk_errors(errors):
+        if isinstance(errors, dict):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "errors": [
+                    {"index": index, "errors": row_errors}
+                    for index, row_errors in enumerate(errors)
+                    if row_errors
+                ]
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+def _modified_of(*relations):
+    """``version_aggregates`` for embedded relations: the newest ``updated_at`` of each."""
+    return {
+        f"{relation.replace('__', '_')}_modified": Max(f"{relation}__updated_at")
+        for relation in relations
+    }
+
+
+class ConditionalSnapMixin(ConditionalModelMixin):
+    """
+    Conditional list/retrieve for snaps, which embed their game (and its score).
+
+    Viewsets whose reads also embed players add each player relation, so
+    editing a player's name or number changes the validators.
+    """
+
+    version_aggregates: ClassVar[dict] = _modified_of("game")
+
+
+class RunPlayViewSet(
+    TeamScopedMixin,
+    ConditionalSnapMixin,
+    SparseFieldsetMixin,
+    BulkCreateMixin,
+    CompiledListMixin,
+    viewsets.ModelViewSet,
+):
     """ViewSet for RunPlay CRUD operations."""
 
     queryset = RunPlay.objects.select_related(
@@ -53,6 +250,10 @@ class RunPlayViewSet(viewsets.ModelViewSet):
         "fumble_recovered_by",
         "penalty_player",
     )
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of(
+        "game", "ball_carrier", "fumble_recovered_by", "penalty_player"
+    )
     filterset_class = RunPlayFilter
     ordering_fields = ["sequence_number", "yards_gained", "created_at"]
 
@@ -76,12 +277,23 @@ class RunPlayViewSet(viewsets.ModelViewSet):
         return self.get_paginated_response(serializer.data)
 
 
-class PassPlayViewSet(viewsets.ModelViewSet):
+class PassPlayViewSet(
+    TeamScopedMixin,
+    ConditionalSnapMixin,
+    SparseFieldsetMixin,
+    BulkCreateMixin,
+    CompiledListMixin,
+    viewsets.ModelViewSet,
+):
     """ViewSet for PassPlay CRUD operations."""
 
     queryset = PassPlay.objects.select_related(
         "game", "quarterback", "target", "receiver", "penalty_player"
     )
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of(
+        "game", "quarterback", "target", "receiver", "penalty_player"
+    )
     filterset_class = PassPlayFilter
     ordering_fields = ["sequence_number", "yards_gained", "air_yards", "created_at"]
 
@@ -119,12 +331,18 @@ class PassPlayViewSet(viewsets.ModelViewSet):
         return self.get_paginated_response(serializer.data)
 
 
-class DefenseSnapViewSet(viewsets.ModelViewSet):
+class DefenseSnapViewSet(
+    TeamScopedMixin, ConditionalSnapMixin, SparseFieldsetMixin, BulkCreateMixin, viewsets.ModelViewSet
+):
     """ViewSet for DefenseSnap CRUD operations."""
 
     queryset = DefenseSnap.objects.select_related(
         "game", "primary_player", "penalty_player"
     ).prefetch_related("assists", "assists__player")
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of(
+        "game", "primary_player", "penalty_player", "assists__player"
+    )
     filterset_class = DefenseSnapFilter
     ordering_fields = ["sequence_number", "created_at"]
 
@@ -144,10 +362,14 @@ class DefenseSnapViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class PuntSnapViewSet(viewsets.ModelViewSet):
+class PuntSnapViewSet(
+    TeamScopedMixin, ConditionalSnapMixin, SparseFieldsetMixin, BulkCreateMixin, viewsets.ModelViewSet
+):
     """ViewSet for PuntSnap CRUD operations."""
 
     queryset = PuntSnap.objects.select_related("game", "punter")
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of("game", "punter")
     filterset_class = PuntSnapFilter
     ordering_fields = ["sequence_number", "punt_yards", "created_at"]
 
@@ -157,10 +379,14 @@ class PuntSnapViewSet(viewsets.ModelViewSet):
         return PuntSnapWriteSerializer
 
 
-class KickoffSnapViewSet(viewsets.ModelViewSet):
+class KickoffSnapViewSet(
+    TeamScopedMixin, ConditionalSnapMixin, SparseFieldsetMixin, BulkCreateMixin, viewsets.ModelViewSet
+):
     """ViewSet for KickoffSnap CRUD operations."""
 
     queryset = KickoffSnap.objects.select_related("game", "kicker")
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of("game", "kicker")
     filterset_class = KickoffSnapFilter
     ordering_fields = ["sequence_number", "kick_yards", "created_at"]
 
@@ -170,10 +396,14 @@ class KickoffSnapViewSet(viewsets.ModelViewSet):
         return KickoffSnapWriteSerializer
 
 
-class FieldGoalSnapViewSet(viewsets.ModelViewSet):
+class FieldGoalSnapViewSet(
+    TeamScopedMixin, ConditionalSnapMixin, SparseFieldsetMixin, BulkCreateMixin, viewsets.ModelViewSet
+):
     """ViewSet for FieldGoalSnap CRUD operations."""
 
     queryset = FieldGoalSnap.objects.select_related("game", "kicker", "holder")
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of("game", "kicker", "holder")
     filterset_class = FieldGoalSnapFilter
     ordering_fields = ["sequence_number", "distance", "created_at"]
 
@@ -183,12 +413,18 @@ class FieldGoalSnapViewSet(viewsets.ModelViewSet):
         return FieldGoalSnapWriteSerializer
 
 
-class ExtraPointSnapViewSet(viewsets.ModelViewSet):
+class ExtraPointSnapViewSet(
+    TeamScopedMixin, ConditionalSnapMixin, SparseFieldsetMixin, BulkCreateMixin, viewsets.ModelViewSet
+):
     """ViewSet for ExtraPointSnap CRUD operations."""
 
     queryset = ExtraPointSnap.objects.select_related(
         "game", "kicker", "ball_carrier", "passer", "receiver"
     )
+    team_lookup = "game__season__team_id"
+    version_aggregates: ClassVar[dict] = _modified_of(
+        "game", "kicker", "ball_carrier", "passer", "receiver"
+    )
     filterset_fields = ["game", "quarter", "attempt_type", "result"]
     ordering_fields = ["sequence_number", "created_at"]
 
@@ -196,3 +432,77 @@ class ExtraPointSnapViewSet(viewsets.ModelViewSet):
         if self.action in ["list", "retrieve"]:
             return ExtraPointSnapReadSerializer
         return ExtraPointSnapWriteSerializer
+
+
+class SnapExportView(APIView):
+    """
+    Stream every snap of a game, season or team as a file download.
+
+    Rows come from ``apps.snaps.export``, which reads each snap type
+    through a server-side cursor, so memory stays flat however many
+    snaps are exported. Every requested game, season and team must
+    belong to the user's team (staff without a team may export any);
+    other teams' ids 404 like they do on the scoped viewsets, and users
+    with a team who give no scope export their own team.
+    """
+
+    permission_classes = [IsAuthenticated, IsTeamMember]
+    scope_models: ClassVar[dict] = {"game_id": Game, "season_id": Season, "team_id": Team}
+
+    @extend_schema(
+        summary="Export play-by-play",
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                location=OpenApiParameter.PATH,
+                enum=list(EXPORT_FORMATS),
+            ),
+            OpenApiParameter(name="game_id", type=int, description="Export one game"),
+            OpenApiParameter(name="season_id", type=int, description="Export one season"),
+            OpenApiParameter(name="team_id", type=int, description="Export one team"),
+        ],
+        responses={(200, "application/octet-stream"): OpenApiTypes.BINARY},
+    )
+    def get(self, request, export_format):
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"error": f"format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        scope = {}
+        for key in ("game_id", "season_id", "team_id"):
+            value = request.query_params.get(key)
+            if value:
+                if not value.isdigit():
+                    return Response(
+                        {"error": f"{key} must be an integer"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                scope[key] = int(value)
+        for key, value in scope.items():
+            model = self.scope_models[key]
+            visible = scope_to_team(
+                model.objects.filter(pk=value), request.user, TEAM_LOOKUPS[model._meta.label]
+            )
+            if not visible.exists():
+                return Response(
+                    {"error": f"{key} {value} not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+        if not scope and request.user.team_id:
+            scope["team_id"] = request.user.team_id
+        if not scope:
+            return Response(
+                {"error": "game_id, season_id or team_id parameter required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        encode, content_type, extension = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(
+            encode(export_rows(**scope)),
+            content_type=content_type,
+        )
+        name = "-".join(f"{key[:-3]}{value}" for key, value in scope.items())
+        response["Content-Disposition"] = f'attachment; filename="snaps-{name}.{extension}"'
+        return response
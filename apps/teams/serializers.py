@@ -2,6 +2,7 @@
 Serializers for Team, Season, and Player models.
 """
 from rest_framework import serializers
+from apps.core.mixins import TeamScopedFieldsMixin
 from .models import Team, Season, Player
 
 
@@ -22,7 +23,7 @@ class TeamMinimalSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "abbreviation"]
 
 
-class SeasonSerializer(serializers.ModelSerializer):
+class SeasonSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """Full Season serializer."""
 
     team = TeamMinimalSerializer(read_only=True)
@@ -46,7 +47,7 @@ class SeasonMinimalSerializer(serializers.ModelSerializer):
         fields = ["id", "year", "team"]
 
 
-class PlayerSerializer(serializers.ModelSerializer):
+class PlayerSerializer(TeamScopedFieldsMixin, serializers.ModelSerializer):
     """Full Player serializer."""
 
     team = TeamMinimalSerializer(read_only=True)
@@ -4,6 +4,7 @@ ViewSets for Team, Season, and Player models.
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from apps.core.mixins import TeamScopedMixin
 from .models import Team, Season, Player
 from .serializers import (
     TeamSerializer,
@@ -13,12 +14,13 @@ from .serializers import (
 from .filters import TeamFilter, SeasonFilter, PlayerFilter
 
 
-class TeamViewSet(viewsets.ModelViewSet):
+class TeamViewSet(TeamScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Team CRUD operations.
     """
 
     queryset = Team.objects.all()
+    team_lookup = "id"
     serializer_class = TeamSerializer
     filterset_class = TeamFilter
     search_fields = ["name", "abbreviation"]
@@ -41,7 +43,7 @@ class TeamViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class SeasonViewSet(viewsets.ModelViewSet):
+class SeasonViewSet(TeamScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Season CRUD operations.
     """
@@ -52,7 +54,7 @@ class SeasonViewSet(viewsets.ModelViewSet):
     ordering_fields = ["year", "created_at"]
 
 
-class PlayerViewSet(viewsets.ModelViewSet):
+class PlayerViewSet(TeamScopedMixin, viewsets.ModelViewSet):
     """
     ViewSet for Player CRUD operations.
     """
@@ -1,6 +1,12 @@
 #!/bin/sh
 set -e
 
+if [ "$1" = "feed" ]; then
+    # Live tracker streams: one asyncio process holds every open stream
+    echo "Starting live feed server..."
+    exec uvicorn sportsman.asgi:application --host 0.0.0.0 --port 8001 --no-access-log
+fi
+
 echo "Running migrations..."
 python manage.py migrate --noinput
 
@@ -8,4 +14,4 @@ echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
 echo "Starting gunicorn..."
-exec gunicorn --bind 0.0.0.0:8000 --workers 3 --access-logfile - sportsman.wsgi:application
+exec gunicorn --bind 0.0.0.0:8000 --workers 3 --threads 8 --access-logfile - sportsman.wsgi:application
@@ -4,6 +4,8 @@ Base Django settings for Sports-Man project.
 Shared settings across all environments.
 Environment-specific settings in development.py, local_network.py, production.py.
 """
+import os
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import timedelta
 
@@ -38,6 +40,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover every other middleware
+    "apps.core.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -114,7 +118,71 @@ AUTH_USER_MODEL = "accounts.User"
 LOGIN_URL = "/login/"
 LOGIN_REDIRECT_URL = "/"
 
+# Caches. Report results live in their own alias so they can be sized and
+# backed independently; local memory culls least-recently-used entries.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "reports": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sportsman-reports",
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {"MAX_ENTRIES": 5000, "CULL_FREQUENCY": 10},
+    },
+}
+REPORT_CACHE_ALIAS = "reports"
+
+# Report results shared across workers: Redis (run it with
+# maxmemory-policy allkeys-lru) or a shared directory. Optional: versions
+# are kept in the database, so per-worker local memory is never stale,
+# only computed once per worker.
+if os.environ.get("REPORT_CACHE_REDIS_URL"):
+    CACHES["reports"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ["REPORT_CACHE_REDIS_URL"],
+        "KEY_PREFIX": "sportsman",
+        "TIMEOUT": 60 * 60 * 24,
+    }
+elif os.environ.get("REPORT_CACHE_DIR"):
+    CACHES["reports"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ["REPORT_CACHE_DIR"],
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    }
+
+# Live tracker feed: in-process fan-out by default. Deployments where the
+# workers that record plays and the ASGI server that streams them are
+# separate processes set TRACKER_FEED_BACKEND to
+# "apps.frontend.live_feed.PostgresPlayFeed" (LISTEN/NOTIFY), so every
+# process sees every play.
+TRACKER_FEED_BACKEND = os.environ.get(
+    "TRACKER_FEED_BACKEND", "apps.frontend.live_feed.InProcessPlayFeed"
+)
+
+# Per-view request metrics at /api/health/metrics/, kept in a ring buffer
+# of the most recent requests in each process.
+REQUEST_METRICS_ENABLED = True
+REQUEST_METRICS_BUFFER_SIZE = 5000
+
+# Expected points / win probability lookup tables written by
+# ``manage.py fit_expected_points``; snaps get no EP/EPA until it has run.
+EXPECTED_POINTS_TABLES = BASE_DIR / "data" / "expected_points.npz"
+
 # REST Framework
+# JSON stays the default (orjson-encoded when installed, else the stdlib
+# encoder); MessagePack is offered only when msgpack is installed
+API_RENDERER_CLASSES = ["apps.core.renderers.ORJSONRenderer"]
+API_PARSER_CLASSES = [
+    "apps.core.parsers.ORJSONParser",
+    "rest_framework.parsers.FormParser",
+    "rest_framework.parsers.MultiPartParser",
+]
+if find_spec("msgpack"):
+    API_RENDERER_CLASSES.append("apps.core.renderers.MessagePackRenderer")
+    API_PARSER_CLASSES.append("apps.core.parsers.MessagePackParser")
+
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "apps.core.pagination.StandardPagination",
     "PAGE_SIZE": 25,
@@ -138,9 +206,8 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
-    "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-    ],
+    "DEFAULT_RENDERER_CLASSES": API_RENDERER_CLASSES,
+    "DEFAULT_PARSER_CLASSES": API_PARSER_CLASSES,
 }
 
 # JWT Settings
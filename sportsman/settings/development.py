@@ -4,6 +4,7 @@ Development settings for Sports-Man project.
 DEBUG=True, SQLite database, relaxed security for local development.
 """
 from .base import *  # noqa: F401, F403
+from .base import API_RENDERER_CLASSES
 
 DEBUG = True
 SECRET_KEY = "django-insecure-dev-only-not-for-production-change-in-prod"
@@ -19,7 +20,7 @@ DATABASES = {
 
 # Allow browsable API in development
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [  # noqa: F405
-    "rest_framework.renderers.JSONRenderer",
+    *API_RENDERER_CLASSES,
     "rest_framework.renderers.BrowsableAPIRenderer",
 ]
 
@@ -13,6 +13,7 @@ Key differences from cloud production:
 import os
 from datetime import timedelta
 from .base import *  # noqa: F401, F403
+from .base import API_RENDERER_CLASSES
 
 DEBUG = os.environ.get("DEBUG", "False").lower() == "true"
 
@@ -45,7 +46,7 @@ CORS_ALLOW_CREDENTIALS = True
 
 # Enable browsable API for easier debugging on LAN
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [  # noqa: F405
-    "rest_framework.renderers.JSONRenderer",
+    *API_RENDERER_CLASSES,
     "rest_framework.renderers.BrowsableAPIRenderer",
 ]
 
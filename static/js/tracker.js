@@ -19,6 +19,7 @@
         ...JSON.parse(document.getElementById('game-state-data').textContent),
         currentForm: null,
         submitting: false,
+        flushing: false,
     };
 
     // Penalties reference
@@ -70,6 +71,7 @@
         if (formArea) formArea.classList.add('form-loading');
 
         const payload = {
+            key: newClientKey(),
             quarter: state.quarter,
             down: state.down,
             distance: state.distance,
@@ -78,6 +80,11 @@
         };
 
         try {
+            // Plays queue behind any not yet synced, to keep their order
+            if (!navigator.onLine || loadQueue().length) {
+                queuePlay(endpoint, payload);
+                return null;
+            }
             const resp = await fetch(`/games/${GAME_ID}/tracker/${endpoint}/`, {
                 method: 'POST',
                 headers: {
@@ -96,7 +103,7 @@
                 }
                 state.team_score = result.team_score;
                 state.opponent_score = result.opponent_score;
-                state.next_sequence++;
+                state.next_sequence = result.play_detail.sequence + 1;
 
                 updateScoreboard();
                 addPlayToFeed(result.play_summary, result.play_detail);
@@ -116,7 +123,8 @@
                 return null;
             }
         } catch (err) {
-            showToast('Network error — play not saved', 'error');
+            // No connection: keep the play for the sync endpoint
+            queuePlay(endpoint, payload);
             return null;
         } finally {
             state.submitting = false;
@@ -124,6 +132,115 @@
         }
     }
 
+    // =========================================================================
+    // OFFLINE QUEUE
+    // =========================================================================
+    // Plays recorded without a connection are kept in localStorage under a
+    // client key and sent, in order, to the sync endpoint once the browser is
+    // back online. The server skips keys it already has (including plays whose
+    // response was lost), so nothing is recorded twice.
+    const QUEUE_KEY = `tracker-queue-${GAME_ID}`;
+    const SYNC_TYPES = { 'field-goal': 'field_goal', 'extra-point': 'extra_point' };
+
+    function newClientKey() {
+        if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+        return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+    }
+
+    function loadQueue() {
+        try {
+            return JSON.parse(localStorage.getItem(QUEUE_KEY)) || [];
+        } catch (err) {
+            return [];
+        }
+    }
+
+    function saveQueue(queue) {
+        if (queue.length) {
+            localStorage.setItem(QUEUE_KEY, JSON.stringify(queue));
+        } else {
+            localStorage.removeItem(QUEUE_KEY);
+        }
+        const indicator = document.getElementById('offline-queue');
+        if (indicator) {
+            indicator.hidden = queue.length === 0;
+            indicator.textContent = `${queue.length} queued`;
+        }
+    }
+
+    function queuePlay(endpoint, payload) {
+        const entry = { ...payload, type: SYNC_TYPES[endpoint] || endpoint };
+        saveQueue([...loadQueue(), entry]);
+        addQueuedPlayToFeed(entry);
+        resetToPlayTypeSelection();
+        showToast('Offline — play queued', 'success');
+        flushQueue();
+    }
+
+    async function flushQueue() {
+        const queue = loadQueue();
+        if (!queue.length || state.flushing || !navigator.onLine) return;
+        state.flushing = true;
+        const after = state.next_sequence - 1;
+        let synced = false;
+
+        try {
+            const resp = await fetch(`/games/${GAME_ID}/tracker/sync/`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': getCSRFToken(),
+                },
+                body: JSON.stringify({ plays: queue }),
+            });
+            const result = await resp.json();
+            const sent = new Set(queue.map(entry => entry.key));
+            // Plays queued while the batch was in flight stay for the next one
+            saveQueue(loadQueue().filter(entry => !sent.has(entry.key)));
+            document.querySelectorAll('#plays-feed .feed-queued').forEach(function (item) {
+                if (sent.has(item.dataset.key)) item.remove();
+            });
+
+            if (result.success) {
+                synced = true;
+                result.created.forEach(function (row) {
+                    state.next_sequence = Math.max(state.next_sequence, row.sequence + 1);
+                });
+                applyLiveState(result);
+                await fetchPlaysAfter(after);
+                if (result.created.length) {
+                    showToast(`${result.created.length} offline play(s) synced`, 'success');
+                }
+            } else {
+                // The batch is rejected as a whole and would be again
+                showToast(`${queue.length} offline play(s) rejected: ${result.error}`, 'error');
+            }
+        } catch (err) {
+            // Still unreachable; the next 'online' event tries again
+        } finally {
+            state.flushing = false;
+        }
+        if (synced && loadQueue().length) flushQueue();
+    }
+
+    function addQueuedPlayToFeed(entry) {
+        const feed = document.getElementById('plays-feed');
+        if (!feed) return;
+
+        const empty = feed.querySelector('.feed-empty');
+        if (empty) empty.remove();
+
+        const item = document.createElement('div');
+        item.className = 'feed-item feed-queued';
+        item.dataset.key = entry.key;
+        item.innerHTML = `
+            <span class="feed-seq"><i class="bi bi-cloud-slash"></i></span>
+            <span class="feed-qtr">Q${entry.quarter}</span>
+            <span class="feed-desc">${entry.type.replace('_', ' ')} (queued)</span>
+        `;
+        feed.insertBefore(item, feed.firstChild);
+    }
+
     // =========================================================================
     // SCOREBOARD
     // =========================================================================
@@ -569,7 +686,7 @@
     }
 
     // =========================================================================
-    // UNDO
+    // UNDO / REDO
     // =========================================================================
     async function undoLastPlay() {
         if (state.submitting) return;
@@ -587,13 +704,17 @@
             });
             const result = await resp.json();
             if (result.success) {
+                if (result.next_state) {
+                    state.quarter = result.next_state.quarter;
+                    state.down = result.next_state.down;
+                    state.distance = result.next_state.distance;
+                    state.ball_position = result.next_state.ball_position;
+                }
                 state.team_score = result.team_score;
                 state.opponent_score = result.opponent_score;
+                state.next_sequence = result.deleted.sequence_number;
                 updateScoreboard();
-                const feed = document.getElementById('plays-feed');
-                if (feed && feed.firstElementChild) {
-                    feed.removeChild(feed.firstElementChild);
-                }
+                removePlayFromFeed(result.deleted.sequence_number);
                 showToast('Play undone', 'success');
             } else {
                 showToast(result.error || 'Nothing to undo', 'error');
@@ -605,6 +726,41 @@
         }
     }
 
+    async function redoLastPlay() {
+        if (state.submitting) return;
+        state.submitting = true;
+
+        try {
+            const resp = await fetch(`/games/${GAME_ID}/tracker/redo/`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': getCSRFToken(),
+                },
+                body: JSON.stringify({}),
+            });
+            const result = await resp.json();
+            if (result.success) {
+                state.quarter = result.next_state.quarter;
+                state.down = result.next_state.down;
+                state.distance = result.next_state.distance;
+                state.ball_position = result.next_state.ball_position;
+                state.team_score = result.team_score;
+                state.opponent_score = result.opponent_score;
+                state.next_sequence = result.play_detail.sequence + 1;
+                updateScoreboard();
+                addPlayToFeed(result.play_summary, result.play_detail);
+                showToast('Play restored', 'success');
+            } else {
+                showToast(result.error || 'Nothing to redo', 'error');
+            }
+        } catch (err) {
+            showToast('Network error', 'error');
+        } finally {
+            state.submitting = false;
+        }
+    }
+
     // =========================================================================
     // PLAY FEED
     // =========================================================================
@@ -612,13 +768,16 @@
         const feed = document.getElementById('plays-feed');
         if (!feed) return;
 
+        const seq = detail && detail.sequence !== undefined ? detail.sequence : state.next_sequence - 1;
+        // A play recorded here can also arrive through the live feed
+        if (feed.querySelector(`[data-seq="${seq}"]`)) return;
+
         const empty = feed.querySelector('.feed-empty');
         if (empty) empty.remove();
 
         const item = document.createElement('div');
         item.className = 'feed-item';
-
-        const seq = state.next_sequence - 1;
+        item.dataset.seq = seq;
         let yardsHtml = '';
         if (detail && detail.yards !== undefined) {
             const cls = detail.yards > 0 ? 'positive' : (detail.yards < 0 ? 'negative' : 'neutral');
@@ -631,7 +790,7 @@
 
         item.innerHTML = `
             <span class="feed-seq">#${seq}</span>
-            <span class="feed-qtr">Q${state.quarter}</span>
+            <span class="feed-qtr">Q${(detail && detail.quarter) || state.quarter}</span>
             <span class="feed-desc">${summary}${badges}</span>
             ${yardsHtml}
         `;
@@ -643,6 +802,75 @@
         }
     }
 
+    function removePlayFromFeed(seq) {
+        const item = document.querySelector(`#plays-feed [data-seq="${seq}"]`);
+        if (item) item.remove();
+    }
+
+    // =========================================================================
+    // LIVE FEED
+    // =========================================================================
+    // Plays recorded on other devices arrive as server-sent events that name
+    // them by sequence number; the rows themselves come from the plays
+    // endpoint. Events for this device's own writes are already applied.
+    function applyLiveState(data) {
+        if (data.next_state) {
+            state.quarter = data.next_state.quarter;
+            state.down = data.next_state.down;
+            state.distance = data.next_state.distance;
+            state.ball_position = data.next_state.ball_position;
+        }
+        state.team_score = data.team_score;
+        state.opponent_score = data.opponent_score;
+        updateScoreboard();
+    }
+
+    async function fetchPlaysAfter(sequence) {
+        const resp = await fetch(`/games/${GAME_ID}/tracker/plays/?after=${sequence}&limit=100`);
+        const result = await resp.json();
+        if (!result.success) return;
+        // Newest first from the server; the feed is built oldest first
+        result.plays.reverse().forEach(function (play) {
+            addPlayToFeed(play.summary, { ...play, sequence: play.sequence_number });
+            state.next_sequence = Math.max(state.next_sequence, play.sequence_number + 1);
+        });
+    }
+
+    function onLivePlays(lastSequence, data) {
+        if (lastSequence < state.next_sequence) return;
+        const after = state.next_sequence - 1;
+        state.next_sequence = lastSequence + 1;
+        applyLiveState(data);
+        fetchPlaysAfter(after).catch(function () {
+            showToast('Could not load new plays', 'error');
+        });
+    }
+
+    function connectLiveFeed() {
+        if (!window.EventSource) return;
+        // EventSource reconnects on its own, after the server's retry delay
+        const source = new EventSource(`/games/${GAME_ID}/tracker/live/`);
+
+        source.addEventListener('play', function (e) {
+            const data = JSON.parse(e.data);
+            onLivePlays(data.sequence, data);
+        });
+        source.addEventListener('sync', function (e) {
+            const data = JSON.parse(e.data);
+            onLivePlays(data.last_sequence, data);
+        });
+        source.addEventListener('undo', function (e) {
+            const data = JSON.parse(e.data);
+            if (data.deleted.sequence_number >= state.next_sequence) return;
+            state.next_sequence = data.deleted.sequence_number;
+            removePlayFromFeed(data.deleted.sequence_number);
+            applyLiveState(data);
+        });
+        source.addEventListener('score', function (e) {
+            applyLiveState(JSON.parse(e.data));
+        });
+    }
+
     // =========================================================================
     // SCORE / QUARTER EDIT
     // =========================================================================
@@ -719,8 +947,12 @@
         });
     });
 
-    // Undo button
+    // Send queued plays as soon as the connection returns
+    window.addEventListener('online', flushQueue);
+
+    // Undo / redo buttons
     document.getElementById('undo-btn').addEventListener('click', undoLastPlay);
+    document.getElementById('redo-btn').addEventListener('click', redoLastPlay);
 
     // Score taps
     document.getElementById('team-score').addEventListener('click', () => promptScoreEdit('team'));
@@ -813,5 +1045,9 @@
     // INITIAL RENDER
     // =========================================================================
     updateScoreboard();
+    loadQueue().forEach(addQueuedPlayToFeed);
+    saveQueue(loadQueue());
+    connectLiveFeed();
+    flushQueue();
 
 })();
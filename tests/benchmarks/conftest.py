@@ -0,0 +1,94 @@
+"""
+Fixtures and reporting for the endpoint benchmarks.
+"""
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from .harness import load_baseline, save_baseline
+from .seed import Scale, seed
+
+results_key = pytest.StashKey[dict]()
+
+
+def pytest_configure(config):
+    config.stash[results_key] = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def plain_static_storage():
+    """Render templates without a collectstatic manifest."""
+    storage = "django.contrib.staticfiles.storage.StaticFilesStorage"
+    with override_settings(STORAGES={"staticfiles": {"BACKEND": storage}}):
+        yield
+
+
+@pytest.fixture(scope="module")
+def benchmark_scale(request):
+    return Scale.parse(request.config.getoption("--benchmark-scale"))
+
+
+@pytest.fixture(scope="module")
+def benchmark_data(benchmark_scale, django_db_setup, django_db_blocker):
+    """
+    Seed the benchmark volume once per module.
+
+    The rows are committed outside the per-test transactions, so every
+    test sees them and rolls back only its own writes; they are flushed
+    when the module finishes.
+    """
+    with django_db_blocker.unblock():
+        data = seed(benchmark_scale)
+        yield data
+        call_command("flush", interactive=False, verbosity=0)
+
+
+@pytest.fixture(scope="module")
+def benchmark_client(benchmark_data, django_db_blocker):
+    """Client logged in for the frontend and authenticated for the API."""
+    client = APIClient()
+    with django_db_blocker.unblock():
+        client.force_login(benchmark_data.user)
+    client.force_authenticate(user=benchmark_data.user)
+    return client
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request):
+    path = request.config.getoption("--benchmark-compare")
+    if not path:
+        return None
+    scale = Scale.parse(request.config.getoption("--benchmark-scale"))
+    return load_baseline(path, scale)
+
+
+@pytest.fixture
+def benchmark_results(request):
+    return request.config.stash[results_key]
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash.get(results_key, None)
+    path = session.config.getoption("--benchmark-save", None)
+    if results and path:
+        save_baseline(path, Scale.parse(session.config.getoption("--benchmark-scale")), results)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(results_key, None)
+    if not results:
+        return
+    terminalreporter.section("endpoint benchmarks")
+    width = max(len(name) for name in results)
+    terminalreporter.write_line(
+        f"{'endpoint':<{width}}  status  queries   wall ms   peak KB     bytes"
+    )
+    for name, result in sorted(results.items()):
+        terminalreporter.write_line(
+            f"{name:<{width}}  {result.status:>6}  {result.queries:>7}"
+            f"  {result.wall_ms:>8.1f}  {result.peak_kb:>8.1f}  {result.bytes:>8}"
+        )
+    path = config.getoption("--benchmark-save", None)
+    if path:
+        terminalreporter.write_line(f"baseline written to {path}")
@@ -0,0 +1,174 @@
+"""
+Benchmark cases enumerated from the URL configuration.
+
+Covers every router endpoint in ``api/v1/urls.py`` (list, detail and GET
+list actions), the other API v1 views, every report view, the tracker
+endpoints and the frontend pages. Cases are built from the URL confs so
+new routes are benchmarked without editing this file; URLs are resolved
+against the seeded ``BenchmarkData`` when a case runs.
+"""
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from django.urls import reverse
+
+from api.v1.urls import router
+from apps.frontend import dashboard_urls, tracker_urls
+from apps.frontend import urls as frontend_urls
+from apps.games.models import Game
+from apps.reports import urls as report_urls
+from apps.snaps.models import BaseSnap
+from apps.teams.models import Player, Team
+
+# Views left out, with the reason
+SKIPPED = {
+    "frontend:logout": "ends the benchmark session",
+    "tracker:live_feed": "server-sent event stream never completes",
+}
+
+# Query parameters for router list actions that require them
+ACTION_PARAMS = {
+    "by_carrier": lambda data: {"player_id": data.players["RB"][0]},
+    "by_quarterback": lambda data: {"qb_id": data.players["QB"][0]},
+    "by_receiver": lambda data: {"player_id": data.players["WR"][0]},
+    "by_position": lambda data: {"position": "QB"},
+}
+
+# Model behind the ``<int:pk>`` of a frontend route, by its first segment
+FRONTEND_PK_MODELS = {"teams": Team, "players": Player, "games": Game, "plays": BaseSnap}
+
+_sync_batches = itertools.count()
+
+
+@dataclass(frozen=True)
+class Case:
+    """One request to benchmark; ``url`` and ``body`` take the seeded data."""
+
+    name: str
+    url: Callable
+    method: str = "GET"
+    body: Callable | None = field(default=None, compare=False)
+
+
+def _query(url, params):
+    if not params:
+        return url
+    return url + "?" + "&".join(f"{key}={value}" for key, value in params.items())
+
+
+def router_cases():
+    cases = []
+    for _prefix, viewset, basename in router.registry:
+        model = viewset.queryset.model
+        cases.append(Case(f"api:{basename}-list", lambda data, b=basename: reverse(f"{b}-list")))
+        cases.append(Case(
+            f"api:{basename}-detail",
+            lambda data, b=basename, m=model: reverse(f"{b}-detail", kwargs={"pk": data.pk_for(m)}),
+        ))
+        for action in viewset.get_extra_actions():
+            if action.detail or "get" not in action.mapping:
+                continue
+            params = ACTION_PARAMS.get(action.__name__, lambda data: {})
+            cases.append(Case(
+                f"api:{basename}-{action.url_name}",
+                lambda data, b=basename, a=action.url_name, p=params: _query(
+                    reverse(f"{b}-{a}"), p(data)
+                ),
+            ))
+    return cases
+
+
+def api_view_cases():
+    return [
+        Case(
+            f"api:snap-export-{export_format}",
+            lambda data, f=export_format: _query(
+                reverse("snap-export", kwargs={"export_format": f}),
+                {"season_id": data.season.pk},
+            ),
+        )
+        for export_format in ("csv", "ndjson")
+    ]
+
+
+def report_cases():
+    return [
+        Case(
+            f"reports:{pattern.name}",
+            lambda data, n=pattern.name: _query(reverse(n), {"season_id": data.season.pk}),
+        )
+        for pattern in report_urls.urlpatterns
+    ]
+
+
+def tracker_cases():
+    def players(data, position):
+        return data.players[position][0]
+
+    bodies = {
+        "add_run": lambda data: {"quarter": 2, "down": 1, "distance": 10, "ball_carrier": players(data, "RB"), "yards_gained": 4},
+        "add_pass": lambda data: {
+            "quarter": 2, "down": 2, "distance": 6, "quarterback": players(data, "QB"),
+            "receiver": players(data, "WR"), "is_complete": True, "yards_gained": 12,
+        },
+        "add_penalty": lambda data: {"quarter": 2, "penalty_yards": 5, "penalty_description": "False start"},
+        "add_kickoff": lambda data: {"quarter": 3, "kicker": players(data, "K"), "kick_yards": 65},
+        "add_punt": lambda data: {"quarter": 3, "down": 4, "punter": players(data, "P"), "punt_yards": 42},
+        "add_field_goal": lambda data: {"quarter": 4, "kicker": players(data, "K"), "kick_distance": 38, "result": "GOOD"},
+        "add_extra_point": lambda data: {"quarter": 4, "kicker": players(data, "K"), "result": "GOOD"},
+        # Fresh client keys per request so every round inserts the batch
+        "sync": lambda data: {"plays": [
+            {"key": f"bench-{batch}-{index}", "type": "run", "ball_carrier": players(data, "RB"), "yards_gained": 3}
+            for batch in [next(_sync_batches)]
+            for index in range(20)
+        ]},
+        "update_score": lambda data: {"team_score": 21, "opponent_score": 14},
+        "undo_play": lambda data: {},
+        "redo_play": lambda data: {},
+    }
+
+    cases = []
+    for pattern in tracker_urls.urlpatterns:
+        name = f"tracker:{pattern.name}"
+        if name in SKIPPED:
+            continue
+        url = lambda data, n=name: reverse(n, kwargs={"pk": data.game.pk})
+        if pattern.name in bodies:
+            cases.append(Case(name, url, method="POST", body=bodies[pattern.name]))
+        else:
+            cases.append(Case(name, url))
+    return cases
+
+
+def frontend_cases():
+    cases = []
+    for namespace, patterns in (
+        ("dashboard", dashboard_urls.urlpatterns),
+        ("frontend", frontend_urls.urlpatterns),
+    ):
+        for pattern in patterns:
+            name = f"{namespace}:{pattern.name}"
+            if name in SKIPPED:
+                continue
+            route = str(pattern.pattern)
+            params = {"season": "season"} if route.startswith("reports/") else {}
+            if "<int:pk>" in route:
+                model = FRONTEND_PK_MODELS[route.split("/")[0]]
+                url = lambda data, n=name, m=model: reverse(n, kwargs={"pk": data.pk_for(m)})
+            else:
+                url = lambda data, n=name, p=params: _query(
+                    reverse(n), {key: data.season.pk for key in p}
+                )
+            cases.append(Case(name, url))
+    return cases
+
+
+def all_cases():
+    return [
+        *router_cases(),
+        *api_view_cases(),
+        *report_cases(),
+        *tracker_cases(),
+        *frontend_cases(),
+    ]
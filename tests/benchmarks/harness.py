@@ -0,0 +1,118 @@
+"""
+Measure endpoint cost and compare runs against a saved baseline.
+
+Each case is requested ``rounds`` times; the reported wall time is the
+fastest round (the least noisy estimate of the code path's cost) and the
+query count is taken from the same round. Peak memory is measured in one
+extra round under ``tracemalloc`` so its overhead does not skew timings.
+"""
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.reports.cache import report_cache
+
+# Differences below these floors are noise, not regressions
+MIN_WALL_MS = 2.0
+MIN_PEAK_KB = 64.0
+
+
+@dataclass
+class Measurement:
+    status: int
+    queries: int
+    wall_ms: float
+    peak_kb: float
+    bytes: int
+
+
+def request(client, case, data):
+    url = case.url(data)
+    if case.method == "POST":
+        return client.post(url, case.body(data), format="json")
+    return client.get(url)
+
+
+def _body_size(response):
+    if response.streaming:
+        return sum(len(chunk) for chunk in response.streaming_content)
+    return len(response.content)
+
+
+def measure(client, case, data, rounds=3):
+    """Request ``case`` and return its fastest Measurement."""
+    best = None
+    for _ in range(rounds):
+        # Report results are cached per game version; measure the real work
+        report_cache.backend.clear()
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = request(client, case, data)
+            size = _body_size(response)
+            wall_ms = (time.perf_counter() - start) * 1000
+        if best is None or wall_ms < best.wall_ms:
+            best = Measurement(response.status_code, len(queries), wall_ms, 0.0, size)
+
+    report_cache.backend.clear()
+    tracemalloc.start()
+    try:
+        _body_size(request(client, case, data))
+        best.peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+    best.wall_ms = round(best.wall_ms, 3)
+    best.peak_kb = round(best.peak_kb, 1)
+    return best
+
+
+def save_baseline(path, scale, results):
+    """Write ``{"meta": ..., "results": {case: measurement}}`` as JSON."""
+    document = {
+        "meta": {
+            "scale": str(scale),
+            "database": connection.vendor,
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "results": {name: asdict(result) for name, result in sorted(results.items())},
+    }
+    with open(path, "w") as output:
+        json.dump(document, output, indent=2)
+        output.write("\n")
+
+
+def load_baseline(path, scale):
+    with open(path) as baseline_file:
+        document = json.load(baseline_file)
+    meta = document["meta"]
+    if meta["scale"] != str(scale) or meta["database"] != connection.vendor:
+        raise ValueError(
+            f"Baseline {path} was recorded at scale {meta['scale']} on "
+            f"{meta['database']}; this run is {scale} on {connection.vendor}"
+        )
+    return {
+        name: Measurement(**result) for name, result in document["results"].items()
+    }
+
+
+def regressions(current, baseline, tolerance):
+    """
+    Ways ``current`` is worse than ``baseline``, as readable strings.
+
+    Any extra query is a regression. Time and memory regress when they
+    grow by more than ``tolerance`` (a fraction) and by more than the
+    absolute noise floors.
+    """
+    found = []
+    if current.queries > baseline.queries:
+        found.append(f"queries {baseline.queries} -> {current.queries}")
+    for metric, floor, unit in (("wall_ms", MIN_WALL_MS, "ms"), ("peak_kb", MIN_PEAK_KB, "KB")):
+        before, after = getattr(baseline, metric), getattr(current, metric)
+        if after > before * (1 + tolerance) and after - before > floor:
+            found.append(f"{metric} {before:.1f}{unit} -> {after:.1f}{unit}")
+    return found
@@ -0,0 +1,229 @@
+"""
+Deterministic bulk seeding of realistic data volumes for the benchmarks.
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from apps.accounts.models import User
+from apps.games.models import Game, QuarterScore
+from apps.snaps.bulk import assign_sequence_numbers, bulk_create_snaps
+from apps.snaps.models import (
+    BaseSnap,
+    DefenseSnap,
+    ExtraPointSnap,
+    FieldGoalSnap,
+    KickoffSnap,
+    PassPlay,
+    PuntSnap,
+    RunPlay,
+)
+from apps.teams.models import Player, Season, Team
+
+ROSTER = {"QB": 3, "RB": 4, "WR": 6, "TE": 3, "OL": 8, "DL": 7, "LB": 6, "CB": 5, "S": 4, "K": 1, "P": 1}
+
+# Share of a game's snaps by type (one side of the ball's view of a game)
+SNAP_MIX = {
+    "run": 0.24,
+    "pass": 0.20,
+    "defense": 0.40,
+    "punt": 0.05,
+    "kickoff": 0.06,
+    "field_goal": 0.02,
+    "extra_point": 0.03,
+}
+
+
+@dataclass
+class Scale:
+    seasons: int
+    games: int
+    snaps: int
+
+    @classmethod
+    def parse(cls, value):
+        """``"5x12x150"`` -> seasons x games per season x snaps per game."""
+        seasons, games, snaps = (int(part) for part in value.lower().split("x"))
+        return cls(seasons, games, snaps)
+
+    def __str__(self):
+        return f"{self.seasons}x{self.games}x{self.snaps}"
+
+
+@dataclass
+class BenchmarkData:
+    """Handles on the seeded rows that endpoint cases point at."""
+
+    user: User
+    team: Team
+    season: Season
+    game: Game
+    players: dict
+
+    def pk_for(self, model):
+        """A representative primary key for a detail URL of ``model``."""
+        if model is Game:
+            return self.game.pk
+        if model is Season:
+            return self.season.pk
+        if model is Team:
+            return self.team.pk
+        queryset = model._base_manager.order_by("pk")
+        if issubclass(model, BaseSnap):
+            queryset = queryset.non_polymorphic()
+        if any(field.name == "game" for field in model._meta.fields):
+            # Prefer the featured game; small scales may leave it without
+            # a rare snap type
+            in_game = queryset.filter(game=self.game).values_list("pk", flat=True).first()
+            if in_game is not None:
+                return in_game
+        return queryset.values_list("pk", flat=True).first()
+
+
+def seed(scale, seed=0):
+    """Create one team with ``scale`` seasons, games and snaps; return handles."""
+    rng = random.Random(seed)
+    team = Team.objects.create(name="Benchmark Bears", abbreviation="BENCH")
+    user = User.objects.create_user(username="benchmark", password="benchmark", team=team)
+
+    Player.objects.bulk_create(
+        Player(
+            team=team,
+            first_name=f"{position}{index}",
+            last_name="Bench",
+            position=position,
+            number=number,
+        )
+        for number, (position, index) in enumerate(
+            ((position, index) for position, count in ROSTER.items() for index in range(count)),
+            start=1,
+        )
+    )
+    players = {}
+    for player in Player.objects.filter(team=team):
+        players.setdefault(player.position, []).append(player.pk)
+
+    seasons = []
+    games = []
+    for offset in range(scale.seasons):
+        season = Season.objects.create(team=team, year=2020 + offset)
+        seasons.append(season)
+        season_games = Game.objects.bulk_create(
+            Game(
+                season=season,
+                date=date(2020 + offset, 9, 1) + timedelta(weeks=week),
+                opponent=f"Opponent {week + 1}",
+                location=rng.choice(Game.Location.values),
+                weather=rng.choice(Game.Weather.values),
+                field_condition=rng.choice(Game.FieldCondition.values),
+            )
+            for week in range(scale.games)
+        )
+        games.extend(season_games)
+
+    QuarterScore.objects.bulk_create(
+        QuarterScore(
+            game=game,
+            quarter=quarter,
+            team_score=rng.choice([0, 3, 7, 10, 14]),
+            opponent_score=rng.choice([0, 3, 7, 10]),
+        )
+        for game in games
+        for quarter in range(1, 5)
+    )
+
+    kinds = list(SNAP_MIX)
+    weights = list(SNAP_MIX.values())
+    for game in games:
+        snaps = [
+            _build(kind, rng, game, players)
+            for kind in rng.choices(kinds, weights, k=scale.snaps)
+        ]
+        for index, snap in enumerate(snaps):
+            snap.quarter = 1 + index * 4 // len(snaps)
+        assign_sequence_numbers(snaps)
+        bulk_create_snaps(snaps)
+
+    featured = games[len(games) // 2] if games else None
+    return BenchmarkData(
+        user=user, team=team, season=seasons[-1], game=featured, players=players
+    )
+
+
+def _build(kind, rng, game, players):
+    def pick(position):
+        return rng.choice(players[position])
+
+    situation = {
+        "game_id": game.pk,
+        "down": rng.randint(1, 4),
+        "distance": rng.randint(1, 15),
+        "ball_position": rng.randint(-45, 50),
+    }
+    if kind == "run":
+        yards = int(rng.gauss(4, 5))
+        return RunPlay(
+            **situation,
+            ball_carrier_id=pick(rng.choice(["RB", "RB", "QB", "WR"])),
+            yards_gained=yards,
+            is_touchdown=rng.random() < 0.03,
+            is_first_down=yards >= situation["distance"],
+            fumbled=rng.random() < 0.02,
+        )
+    if kind == "pass":
+        complete = rng.random() < 0.62
+        air_yards = rng.randint(-2, 35)
+        yac = rng.randint(0, 15) if complete else 0
+        return PassPlay(
+            **situation,
+            quarterback_id=pick("QB"),
+            receiver_id=pick(rng.choice(["WR", "WR", "TE", "RB"])) if complete else None,
+            is_complete=complete,
+            air_yards=air_yards,
+            yards_after_catch=yac,
+            yards_gained=air_yards + yac if complete else 0,
+            is_touchdown=complete and rng.random() < 0.06,
+            is_interception=not complete and rng.random() < 0.05,
+            was_under_pressure=rng.random() < 0.25,
+            was_sacked=rng.random() < 0.06,
+        )
+    if kind == "defense":
+        result = rng.choices(
+            DefenseSnap.PlayResult.values, [70, 10, 5, 2, 2, 8, 3]
+        )[0]
+        return DefenseSnap(
+            **situation,
+            play_result=result,
+            primary_player_id=pick(rng.choice(["DL", "LB", "LB", "CB", "S"])),
+            tackle_yards=rng.randint(-3, 12),
+            tackle_for_loss=result == DefenseSnap.PlayResult.TACKLE_FOR_LOSS,
+            applied_pressure=rng.random() < 0.2,
+        )
+    if kind == "punt":
+        return PuntSnap(
+            **situation,
+            punter_id=pick("P"),
+            punt_yards=rng.randint(30, 60),
+            is_touchback=rng.random() < 0.1,
+        )
+    if kind == "kickoff":
+        return KickoffSnap(
+            game_id=game.pk,
+            ball_position=35,
+            kicker_id=pick("K"),
+            kick_yards=rng.randint(50, 70),
+            is_touchback=rng.random() < 0.5,
+        )
+    if kind == "field_goal":
+        return FieldGoalSnap(
+            **situation,
+            kicker_id=pick("K"),
+            kick_distance=rng.randint(20, 55),
+            result=rng.choices(FieldGoalSnap.Result.values, [8, 2, 1])[0],
+        )
+    return ExtraPointSnap(
+        game_id=game.pk,
+        kicker_id=pick("K"),
+        attempt_type=ExtraPointSnap.AttemptType.KICK,
+        result=rng.choices([ExtraPointSnap.Result.GOOD, ExtraPointSnap.Result.MISSED], [19, 1])[0],
+    )
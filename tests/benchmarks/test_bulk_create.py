@@ -0,0 +1,71 @@
+"""
+Throughput benchmark: bulk snap create vs one POST per snap.
+"""
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.snaps.models import PassPlay
+from tests.factories import PlayerFactory
+
+ROWS = 100
+
+
+def _rows(game, quarterback, receiver):
+    return [
+        {
+            "game_id": game.id,
+            "quarter": 1 + index % 4,
+            "down": 1 + index % 4,
+            "distance": 10,
+            "quarterback_id": quarterback.id,
+            "receiver_id": receiver.id,
+            "is_complete": index % 3 != 0,
+            "yards_gained": index % 17,
+        }
+        for index in range(ROWS)
+    ]
+
+
+def _measure(send):
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        send()
+        elapsed = time.perf_counter() - started
+    return elapsed, len(queries)
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestBulkCreateThroughput:
+    """Bulk create must beat the single-create path by a wide margin."""
+
+    def test_bulk_vs_single(self, authenticated_client, game, team):
+        quarterback = PlayerFactory(team=team, position="QB")
+        receiver = PlayerFactory(team=team, position="WR")
+        rows = _rows(game, quarterback, receiver)
+
+        def single():
+            for index, row in enumerate(rows, start=1):
+                response = authenticated_client.post(
+                    "/api/v1/snaps/pass/", {**row, "sequence_number": index}, format="json"
+                )
+                assert response.status_code == 201
+
+        def bulk():
+            response = authenticated_client.post("/api/v1/snaps/pass/bulk/", rows, format="json")
+            assert response.status_code == 201
+
+        single_time, single_queries = _measure(single)
+        bulk_time, bulk_queries = _measure(bulk)
+
+        print(
+            f"\n{ROWS} pass plays: single {ROWS / single_time:,.0f} rows/s "
+            f"({single_queries} queries), bulk {ROWS / bulk_time:,.0f} rows/s "
+            f"({bulk_queries} queries)"
+        )
+        assert PassPlay.objects.filter(game=game).count() == 2 * ROWS
+        assert bulk_queries * 20 < single_queries
+        assert bulk_time * 3 < single_time
@@ -0,0 +1,70 @@
+"""
+Benchmark: rows per second of the compiled list path vs the serializers.
+"""
+import io
+import time
+
+import pytest
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.compiled import CompiledSerializer
+from apps.games.models import Game
+from apps.games.serializers import GameReadSerializer
+from apps.snaps.models import PassPlay, RunPlay
+from apps.snaps.serializers import PassPlayReadSerializer, RunPlayReadSerializer
+
+# (serializer, queryset as the list view builds it in compact mode)
+LISTS = {
+    "run": (RunPlayReadSerializer, lambda: RunPlay.objects.order_by("pk")),
+    "pass": (PassPlayReadSerializer, lambda: PassPlay.objects.order_by("pk")),
+    "game": (GameReadSerializer, lambda: Game.objects.prefetch_related("quarter_scores").order_by("pk")),
+}
+
+
+def _timed(run, rounds=3):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestCompiledListThroughput:
+    """The compiled path must match the serializers byte for byte and beat them."""
+
+    @pytest.fixture(scope="class")
+    def season_data(self, django_db_setup, django_db_blocker):
+        with django_db_blocker.unblock():
+            call_command("generate_games", "--games", "12", stdout=io.StringIO())
+            yield
+            call_command("flush", interactive=False, verbosity=0)
+
+    @pytest.mark.parametrize("name", list(LISTS))
+    def test_rows_per_second(self, season_data, name):
+        serializer_class, queryset = LISTS[name]
+        context = {"expand": set(), "fields": None}
+
+        def serialize():
+            return serializer_class(queryset(), many=True, context=context).data
+
+        def compile_rows():
+            compiled = CompiledSerializer.for_serializer(serializer_class(context=context))
+            return compiled.render(compiled.values(queryset()))
+
+        serializer_time, expected = _timed(serialize)
+        compiled_time, rows = _timed(compile_rows)
+
+        renderer = JSONRenderer()
+        assert renderer.render(rows) == renderer.render(expected)
+        count = len(rows)
+        print(
+            f"\n{name} list, {count} rows: serializer {count / serializer_time:,.0f} rows/s, "
+            f"compiled {count / compiled_time:,.0f} rows/s "
+            f"({serializer_time / compiled_time:.1f}x)"
+        )
+        assert compiled_time < serializer_time
@@ -0,0 +1,34 @@
+"""
+Query count, wall time and peak memory for every endpoint.
+
+Run with ``pytest -m benchmark tests/benchmarks/test_endpoints.py``;
+see the README for saving and comparing baselines.
+"""
+import pytest
+
+from .endpoints import all_cases
+from .harness import measure, regressions
+
+CASES = all_cases()
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_endpoint(case, request, benchmark_data, benchmark_client, benchmark_baseline, benchmark_results):
+    result = measure(
+        benchmark_client,
+        case,
+        benchmark_data,
+        rounds=request.config.getoption("--benchmark-rounds"),
+    )
+    benchmark_results[case.name] = result
+
+    assert result.status < 500
+    if benchmark_baseline is not None and case.name in benchmark_baseline:
+        found = regressions(
+            result,
+            benchmark_baseline[case.name],
+            request.config.getoption("--benchmark-tolerance"),
+        )
+        assert not found, f"{case.name} regressed: " + ", ".join(found)
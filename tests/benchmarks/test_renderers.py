@@ -0,0 +1,70 @@
+"""
+Benchmark: render time and size of a 1,000-snap timeline per renderer.
+"""
+import io
+import json
+import time
+
+import msgpack
+import pytest
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer
+from apps.core.sparse import Included
+from apps.snaps.models import BaseSnap
+from apps.snaps.querysets import downcast_snaps
+from apps.snaps.serializers.timeline import SnapTimelineSerializer
+
+TIMELINE_SNAPS = 1000
+
+
+def _timed(run, rounds=5):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestRendererThroughput:
+    """orjson must write the stdlib renderer's bytes (the timeline has no NaN), faster."""
+
+    @pytest.fixture(scope="class")
+    def timeline(self, django_db_setup, django_db_blocker):
+        with django_db_blocker.unblock():
+            call_command("generate_games", "--games", "12", stdout=io.StringIO())
+            snaps = downcast_snaps(
+                BaseSnap.objects.order_by("game_id", "sequence_number")[:TIMELINE_SNAPS]
+            )
+            context = {"expand": set(), "fields": None, "included": Included()}
+            yield {
+                "results": SnapTimelineSerializer(snaps, many=True, context=context).data,
+                "included": context["included"].as_dict(),
+            }
+            call_command("flush", interactive=False, verbosity=0)
+
+    def test_timeline_render(self, timeline):
+        count = len(timeline["results"])
+        assert count == TIMELINE_SNAPS
+
+        stdlib_time, expected = _timed(lambda: JSONRenderer().render(timeline))
+        orjson_time, rendered = _timed(lambda: ORJSONRenderer().render(timeline))
+
+        assert rendered == expected
+        lines = [
+            f"stdlib json {stdlib_time * 1000:.1f} ms, {len(expected):,} bytes",
+            f"orjson {orjson_time * 1000:.1f} ms ({stdlib_time / orjson_time:.1f}x)",
+        ]
+        msgpack_time, packed = _timed(lambda: MessagePackRenderer().render(timeline))
+        assert msgpack.unpackb(packed) == json.loads(expected)
+        lines.append(
+            f"msgpack {msgpack_time * 1000:.1f} ms ({stdlib_time / msgpack_time:.1f}x), "
+            f"{len(packed):,} bytes"
+        )
+        print(f"\n{count}-snap timeline: " + "; ".join(lines))
+        assert orjson_time < stdlib_time
@@ -0,0 +1,134 @@
+"""
+Benchmark: vectorized situational splits vs one ORM query per split cell.
+"""
+import io
+import time
+
+import pytest
+from django.core.management import call_command
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+
+from apps.reports import analytics
+from apps.reports.services import SituationalReportService
+from apps.snaps.models import SnapFact
+from apps.teams.models import Season
+
+RUN = SnapFact.PlayType.RUN
+PASS = SnapFact.PlayType.PASS
+
+NET_YARDS = F("yards_gained") + Case(
+    When(was_sacked=True, then=F("sack_yards")), default=Value(0)
+)
+BUCKET_RANGES = [(1, 3), (4, 6), (7, None)]
+EXPLOSIVE = Q(play_type=RUN, net__gte=10) | Q(play_type=PASS, net__gte=20)
+BIN_RANGES = [(None, -1), (0, 3), (4, 6), (7, 9), (10, 19), (20, None)]
+
+
+def _between(queryset, field, low, high):
+    if low is not None:
+        queryset = queryset.filter(**{f"{field}__gte": low})
+    if high is not None:
+        queryset = queryset.filter(**{f"{field}__lte": high})
+    return queryset
+
+
+def orm_splits(season_id):
+    """The same splits as the analytics module, one aggregate per cell."""
+    plays = SnapFact.objects.filter(
+        season_id=season_id, play_type__in=[RUN, PASS]
+    ).annotate(net=NET_YARDS)
+
+    by_down = []
+    for down, share in analytics.SUCCESS_SHARE.items():
+        needed = ExpressionWrapper(F("distance") * share, output_field=FloatField())
+        success = (
+            ~Q(is_interception=True) & ~Q(fumble_lost=True)
+            & (Q(is_touchdown=True) | Q(net__gte=needed))
+        )
+        for bucket, (low, high) in zip(analytics.DISTANCE_BUCKETS, BUCKET_RANGES):
+            cell = _between(plays.filter(down=down), "distance", low, high).aggregate(
+                plays=Count("pk"), successes=Count("pk", filter=success)
+            )
+            if cell["plays"]:
+                by_down.append((down, bucket, cell["plays"], cell["successes"]))
+
+    red_zone = plays.filter(ball_position__gte=analytics.RED_ZONE_START).aggregate(
+        plays=Count("pk"), touchdowns=Count("pk", filter=Q(is_touchdown=True))
+    )
+
+    by_formation = {}
+    for formation in plays.values_list("formation", flat=True).distinct().order_by():
+        cell = plays.filter(formation=formation).aggregate(
+            plays=Count("pk"), explosive=Count("pk", filter=EXPLOSIVE), yards=Sum("net")
+        )
+        by_formation[formation] = (cell["plays"], cell["explosive"])
+
+    histograms = {}
+    for key, play_types in (("runs", [RUN]), ("passes", [PASS]), ("all", [RUN, PASS])):
+        histograms[key] = [
+            _between(plays.filter(play_type__in=play_types), "net", low, high).count()
+            for low, high in BIN_RANGES
+        ]
+
+    return by_down, red_zone, by_formation, histograms
+
+
+def vectorized_splits(season_id):
+    # Unwrapped so the report cache does not hide the work
+    service = SituationalReportService(season_id=season_id)
+    return SituationalReportService.get_splits.__wrapped__(service)
+
+
+def _timed(run, rounds=3):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+class TestSituationalSplits:
+    """Vectorized splits must match and beat per-split ORM queries."""
+
+    def test_full_season(self):
+        call_command("generate_games", "--games", "12", stdout=io.StringIO())
+        season_id = Season.objects.get(team__abbreviation="GEN1").pk
+
+        orm_time, orm = _timed(lambda: orm_splits(season_id))
+        vector_time, splits = _timed(lambda: vectorized_splits(season_id))
+
+        by_down, red_zone, by_formation, histograms = orm
+        assert [
+            (row["down"], row["distance_bucket"], row["plays"], row["successes"])
+            for row in splits["success_by_down_distance"]
+        ] == by_down
+        assert splits["red_zone"]["plays"] == red_zone["plays"]
+        assert splits["red_zone"]["touchdowns"] == red_zone["touchdowns"]
+        assert {
+            row["formation"]: (row["plays"], row["explosive"])
+            for row in splits["explosive_by_formation"]
+        } == by_formation
+        for key, counts in histograms.items():
+            bins = splits["yards_distribution"][key]["histogram"]
+            assert [row["plays"] for row in bins] == counts
+
+        plays = sum(row["plays"] for row in splits["explosive_by_formation"])
+        print(
+            f"\nsituational splits over {plays} plays: ORM {orm_time * 1000:.1f} ms, "
+            f"vectorized {vector_time * 1000:.1f} ms"
+        )
+        assert vector_time < orm_time
@@ -3,6 +3,8 @@ Pytest configuration and fixtures.
 """
 import pytest
 from rest_framework.test import APIClient
+from apps.reports.cache import report_cache
+from apps.snaps.game_state import game_state_cache
 from tests.factories import (
     UserFactory,
     TeamFactory,
@@ -14,6 +16,24 @@ from tests.factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_report_cache():
+    """
+    Start every test with an empty report cache.
+
+    Test databases reuse primary keys after each rollback, so results
+    cached by one test must not be served to the next.
+    """
+    report_cache.backend.clear()
+    report_cache.reset_stats()
+
+
+@pytest.fixture(autouse=True)
+def clear_game_state_cache():
+    """Start every test with no cached tracker game states."""
+    game_state_cache.backend.clear()
+
+
 @pytest.fixture
 def api_client():
     """Unauthenticated API client."""
@@ -21,9 +41,15 @@ def api_client():
 
 
 @pytest.fixture
-def user(db):
-    """Create a test user."""
-    return UserFactory()
+def user(team):
+    """Create a test user on the test team."""
+    return UserFactory(team=team)
+
+
+@pytest.fixture
+def staff_user(db):
+    """Create a staff user without a team, who sees every team's data."""
+    return UserFactory(is_staff=True)
 
 
 @pytest.fixture
@@ -94,3 +120,27 @@ def pass_play(game):
     qb = PlayerFactory(team=game.season.team, position="QB")
     wr = PlayerFactory(team=game.season.team, position="WR")
     return PassPlayFactory(game=game, quarterback=qb, receiver=wr)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "endpoint benchmarks (run with -m benchmark)")
+    group.addoption(
+        "--benchmark-scale",
+        default="5x12x150",
+        help="Seeded volume as seasons x games per season x snaps per game",
+    )
+    group.addoption(
+        "--benchmark-rounds", type=int, default=3, help="Requests per endpoint"
+    )
+    group.addoption("--benchmark-save", metavar="PATH", help="Write results as a JSON baseline")
+    group.addoption(
+        "--benchmark-compare",
+        metavar="PATH",
+        help="Fail endpoints that regressed against a saved baseline",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative growth in time and memory when comparing",
+    )
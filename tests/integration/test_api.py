@@ -1,10 +1,31 @@
 """
 Integration tests for API endpoints.
 """
+import csv
+import io
+import json
+from datetime import timedelta
+
 import pytest
 from rest_framework import status
-from apps.teams.models import Team
-from tests.factories import TeamFactory, PlayerFactory, GameFactory, RunPlayFactory
+from rest_framework.renderers import JSONRenderer
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from apps.reports.cache import report_cache
+from apps.snaps.models import (
+    DefenseSnap,
+    DefenseSnapAssist,
+    KickoffSnap,
+    OffenseSnap,
+    PassPlay,
+    PuntReturnSnap,
+    RunPlay,
+    ScoreEntry,
+    SnapFact,
+)
+from apps.games.models import QuarterScore
+from apps.core.metrics import RequestMetrics, RequestSample, request_metrics
+from tests.factories import TeamFactory, PlayerFactory, GameFactory, RunPlayFactory, UserFactory
 
 
 @pytest.mark.django_db
@@ -20,6 +41,168 @@ class TestHealthEndpoint:
         assert response.json()["database"] == "ok"
 
 
+@pytest.mark.django_db
+class TestRequestMetricsEndpoint:
+    """Tests for the per-view request metrics endpoint."""
+
+    @pytest.fixture
+    def staff_client(self, api_client):
+        request_metrics.reset()
+        api_client.force_authenticate(user=UserFactory(is_staff=True))
+        return api_client
+
+    def test_requires_authentication(self, api_client):
+        """Anonymous users get 401."""
+        response = api_client.get("/api/health/metrics/")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_staff_only(self, api_client, team):
+        """Non-staff users get 403."""
+        api_client.force_authenticate(user=UserFactory(team=team))
+        response = api_client.get("/api/health/metrics/")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_summarizes_requests_per_view(self, staff_client, team):
+        """Each view gets query, timing and size percentiles."""
+        for _ in range(3):
+            staff_client.get("/api/v1/teams/")
+
+        response = staff_client.get("/api/health/metrics/")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["enabled"] is True
+        entry = next(view for view in data["views"] if view["view"] == "team-list")
+        assert entry["count"] == 3
+        assert entry["errors"] == 0
+        assert entry["queries"]["p50"] >= 1
+        assert entry["serializer_ms"]["max"] > 0
+        assert entry["response_bytes"]["p50"] > 0
+        assert entry["slowest_query"]["sql"].startswith("SELECT")
+
+    def test_prometheus_format(self, staff_client):
+        """?format=prometheus returns text exposition summaries."""
+        staff_client.get("/api/v1/teams/")
+
+        response = staff_client.get("/api/health/metrics/?format=prometheus")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        body = response.content.decode()
+        assert "# TYPE sportsman_request_queries summary" in body
+        assert 'sportsman_request_queries_count{view="team-list"} 1' in body
+        assert 'sportsman_request_duration_milliseconds{view="team-list",quantile="0.9"}' in body
+
+    def test_buffer_is_bounded(self):
+        """Old samples fall out of the window; totals keep counting."""
+        metrics = RequestMetrics(size=10)
+        for queries in range(25):
+            metrics.add(RequestSample(view="team-list", method="GET", queries=queries))
+
+        summary = metrics.summary()
+
+        assert summary["window"]["samples"] == 10
+        assert summary["views"][0]["queries"] == {"p50": 19, "p90": 23, "p99": 24, "max": 24}
+        assert metrics.totals()["team-list"]["count"] == 25
+
+
+@pytest.mark.django_db
+class TestTeamScoping:
+    """Users with a team only see that team's data."""
+
+    @pytest.fixture
+    def own_play(self):
+        return RunPlayFactory()
+
+    @pytest.fixture
+    def other_play(self):
+        return RunPlayFactory()
+
+    @pytest.fixture
+    def team_client(self, api_client, own_play):
+        user = UserFactory(team=own_play.game.season.team)
+        api_client.force_authenticate(user=user)
+        return api_client
+
+    @pytest.mark.parametrize("url", [
+        "/api/v1/teams/",
+        "/api/v1/seasons/",
+        "/api/v1/games/",
+        "/api/v1/snaps/run/",
+    ])
+    def test_lists_only_own_team(self, team_client, own_play, other_play, url):
+        """List views leave out other teams' rows."""
+        response = team_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["results"]) == 1
+
+    def test_other_teams_objects_are_not_found(self, team_client, own_play, other_play):
+        """Detail, update and delete of another team's rows 404."""
+        assert team_client.get(f"/api/v1/snaps/run/{own_play.id}/").status_code == 200
+        url = f"/api/v1/snaps/run/{other_play.id}/"
+        assert team_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+        assert team_client.delete(url).status_code == status.HTTP_404_NOT_FOUND
+        response = team_client.get(f"/api/v1/games/{other_play.game_id}/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_staff_without_team_are_not_scoped(self, api_client, staff_user, own_play, other_play):
+        """Staff accounts not tied to a team see every team."""
+        api_client.force_authenticate(user=staff_user)
+        response = api_client.get("/api/v1/snaps/run/")
+        assert len(response.json()["results"]) == 2
+
+    @pytest.mark.parametrize("url", ["/api/v1/teams/", "/api/v1/games/", "/api/v1/snaps/run/"])
+    def test_users_without_team_are_denied(self, api_client, own_play, url):
+        """Other accounts without a team get 403 rather than every team's rows."""
+        api_client.force_authenticate(user=UserFactory())
+
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_writes_cannot_reference_other_teams(self, team_client, own_play, other_play):
+        """Related ids in a write payload only resolve to the user's own rows."""
+        carrier = PlayerFactory(team=own_play.game.season.team)
+        payload = {
+            "game_id": own_play.game_id,
+            "ball_carrier_id": carrier.id,
+            "sequence_number": 50,
+            "quarter": 1,
+            "yards_gained": 4,
+        }
+        assert team_client.post("/api/v1/snaps/run/", payload, format="json").status_code == 201
+
+        for field, other in (("game_id", other_play.game_id), ("ball_carrier_id", other_play.ball_carrier_id)):
+            response = team_client.post(
+                "/api/v1/snaps/run/", {**payload, "sequence_number": 51, field: other}, format="json"
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert field in response.json()
+
+    def test_bulk_writes_cannot_reference_other_teams(self, team_client, own_play, other_play):
+        """Bulk creates resolve related ids through the same scoped querysets."""
+        carrier = PlayerFactory(team=own_play.game.season.team)
+        rows = [
+            {"game_id": own_play.game_id, "ball_carrier_id": carrier.id, "quarter": 1},
+            {"game_id": other_play.game_id, "ball_carrier_id": carrier.id, "quarter": 1},
+        ]
+
+        response = team_client.post("/api/v1/snaps/run/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "game_id" in str(response.json())
+        assert RunPlay.objects.count() == 2
+
+    def test_users_cannot_join_another_team(self, team_client, other_play):
+        """A profile update cannot move the account onto another team."""
+        response = team_client.patch(
+            "/api/v1/auth/profile/", {"team_id": other_play.game.season.team_id}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 class TestTeamEndpoints:
     """Tests for team API endpoints."""
@@ -29,15 +212,14 @@ class TestTeamEndpoints:
         response = api_client.get("/api/v1/teams/")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_list_teams_success(self, authenticated_client):
-        """Authenticated request returns teams."""
-        existing = Team.objects.count()
+    def test_list_teams_success(self, authenticated_client, team):
+        """Authenticated request returns the user's team."""
         TeamFactory.create_batch(3)
 
         response = authenticated_client.get("/api/v1/teams/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["count"] == existing + 3
+        assert [row["id"] for row in response.data["results"]] == [team.id]
 
     def test_create_team_success(self, authenticated_client):
         """Create team with valid data."""
@@ -54,9 +236,8 @@ class TestTeamEndpoints:
 class TestPlayerEndpoints:
     """Tests for player API endpoints."""
 
-    def test_list_players_success(self, authenticated_client):
+    def test_list_players_success(self, authenticated_client, team):
         """List players returns paginated results."""
-        team = TeamFactory()
         PlayerFactory.create_batch(5, team=team)
 
         response = authenticated_client.get("/api/v1/players/")
@@ -64,9 +245,8 @@ class TestPlayerEndpoints:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 5
 
-    def test_filter_players_by_position(self, authenticated_client):
+    def test_filter_players_by_position(self, authenticated_client, team):
         """Filter players by position."""
-        team = TeamFactory()
         PlayerFactory.create_batch(2, team=team, position="QB")
         PlayerFactory.create_batch(3, team=team, position="RB")
 
@@ -85,9 +265,9 @@ class TestReportEndpoints:
         response = api_client.get("/api/v1/reports/offense/rushing/totals/")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_rushing_totals_success(self, authenticated_client):
+    def test_rushing_totals_success(self, authenticated_client, season):
         """Rushing totals returns aggregated stats."""
-        game = GameFactory()
+        game = GameFactory(season=season)
         RunPlayFactory(game=game, yards_gained=15)
         RunPlayFactory(game=game, yards_gained=10)
 
@@ -97,10 +277,10 @@ class TestReportEndpoints:
         assert response.data["attempts"] == 2
         assert response.data["yards"] == 25
 
-    def test_rushing_totals_filtered_by_game(self, authenticated_client):
+    def test_rushing_totals_filtered_by_game(self, authenticated_client, season):
         """Report can be filtered by game_ids."""
-        game1 = GameFactory()
-        game2 = GameFactory()
+        game1 = GameFactory(season=season)
+        game2 = GameFactory(season=season)
         RunPlayFactory(game=game1, yards_gained=10)
         RunPlayFactory(game=game2, yards_gained=20)
 
@@ -110,3 +290,605 @@ class TestReportEndpoints:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["yards"] == 10
+
+    def test_report_bundle(self, authenticated_client, season):
+        """Bundle returns every report section in one response."""
+        game1 = GameFactory(season=season)
+        game2 = GameFactory(season=season)
+        RunPlayFactory(game=game1, yards_gained=10)
+        RunPlayFactory(game=game2, yards_gained=20)
+
+        response = authenticated_client.get(f"/api/v1/reports/bundle/?game_ids={game1.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {"offense", "defense", "special_teams"}
+        assert response.data["offense"]["rushing_totals"]["yards"] == 10
+        assert len(response.data["offense"]["rushing_by_player"]) == 1
+        assert response.data["defense"]["team_totals"]["total_tackles"] == 0
+        assert response.data["special_teams"]["field_goal_by_kicker"] == []
+
+
+@pytest.mark.django_db
+class TestSnapExportEndpoint:
+    """Tests for the streaming play-by-play export endpoint."""
+
+    def test_streams_csv(self, authenticated_client, game):
+        """CSV export streams every snap of the season as an attachment."""
+        RunPlayFactory(game=game, yards_gained=4)
+        RunPlayFactory(game=game, yards_gained=9)
+
+        response = authenticated_client.get(
+            f"/api/v1/snaps/export/csv/?season_id={game.season_id}"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Disposition"] == (
+            f'attachment; filename="snaps-season{game.season_id}.csv"'
+        )
+        body = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert [row["yards_gained"] for row in rows] == ["4", "9"]
+
+    def test_requires_scope(self, api_client, staff_user):
+        """Unscoped exports are rejected for staff, who are not tied to a team."""
+        api_client.force_authenticate(user=staff_user)
+        response = api_client.get("/api/v1/snaps/export/ndjson/")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_defaults_to_own_team(self, authenticated_client, run_play):
+        """Team members without a scope export their own team."""
+        RunPlayFactory()
+
+        response = authenticated_client.get("/api/v1/snaps/export/ndjson/")
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = b"".join(response.streaming_content).splitlines()
+        assert [json.loads(row)["id"] for row in rows] == [run_play.id]
+
+    def test_users_without_team_are_denied(self, api_client, run_play):
+        """Non-staff accounts without a team cannot export any team."""
+        api_client.force_authenticate(user=UserFactory())
+
+        response = api_client.get(f"/api/v1/snaps/export/csv/?team_id={run_play.game.season.team_id}")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.parametrize("key", ["game_id", "season_id", "team_id"])
+    def test_other_teams_are_not_found(self, authenticated_client, key):
+        """Another team's game, season or team 404s instead of streaming its snaps."""
+        other = RunPlayFactory().game
+        ids = {"game_id": other.id, "season_id": other.season_id, "team_id": other.season.team_id}
+
+        response = authenticated_client.get(f"/api/v1/snaps/export/csv/?{key}={ids[key]}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_unknown_format(self, authenticated_client):
+        """Unsupported formats are rejected."""
+        response = authenticated_client.get("/api/v1/snaps/export/xlsx/?game_id=1")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestSnapBulkCreate:
+    """Tests for the bulk create action on the snap viewsets."""
+
+    def test_creates_rows_in_order(self, authenticated_client, game, player):
+        """Rows are created with numbers allocated in list order."""
+        rows = [
+            {"game_id": game.id, "quarter": 1, "ball_carrier_id": player.id, "yards_gained": yards}
+            for yards in (3, 8, -1)
+        ]
+
+        response = authenticated_client.post("/api/v1/snaps/run/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [row["sequence_number"] for row in response.data["created"]] == [1, 2, 3]
+        plays = RunPlay.objects.filter(game=game).order_by("sequence_number")
+        assert [play.yards_gained for play in plays] == [3, 8, -1]
+        assert {play.play_result for play in plays} == {"RUN"}
+        assert SnapFact.objects.filter(game=game).count() == 3
+        game.refresh_from_db()
+        assert game.last_sequence_number == 3
+
+    def test_scoring_rows_move_the_score(self, authenticated_client, game, player):
+        """Touchdowns in the batch write ledger rows and add to the game's score."""
+        start = game.team_score
+        rows = [
+            {"game_id": game.id, "quarter": 1, "ball_carrier_id": player.id, "yards_gained": 40, "is_touchdown": td}
+            for td in (True, False, True)
+        ]
+
+        response = authenticated_client.post("/api/v1/snaps/run/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        game.refresh_from_db()
+        assert game.team_score == start + 12
+        assert ScoreEntry.objects.filter(game=game, snap__isnull=False).count() == 2
+        assert ScoreEntry.objects.totals(game.pk) == (game.team_score, game.opponent_score)
+
+    def test_reports_errors_per_row(self, authenticated_client, game, player):
+        """Invalid rows are reported by index and nothing is saved."""
+        rows = [
+            {"game_id": game.id, "quarter": 1, "quarterback_id": player.id},
+            {"game_id": game.id, "quarter": 1, "quarterback_id": 999999},
+            {"game_id": game.id, "quarterback_id": player.id},
+        ]
+
+        response = authenticated_client.post("/api/v1/snaps/pass/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = response.data["errors"]
+        assert [error["index"] for error in errors] == [1, 2]
+        assert "quarterback_id" in errors[0]["errors"]
+        assert "quarter" in errors[1]["errors"]
+        assert not PassPlay.objects.exists()
+
+    def test_rejects_taken_sequence_numbers(self, authenticated_client, game, player):
+        """Explicit sequence numbers may not repeat existing or earlier rows."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+        rows = [
+            {"game_id": game.id, "quarter": 1, "sequence_number": 1, "play_result": "TACKLE"},
+            {"game_id": game.id, "quarter": 1, "sequence_number": 5, "play_result": "TACKLE"},
+            {"game_id": game.id, "quarter": 1, "sequence_number": 5, "play_result": "SACK"},
+        ]
+
+        response = authenticated_client.post("/api/v1/snaps/defense/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [error["index"] for error in response.data["errors"]] == [0, 2]
+
+    def test_rejects_non_list(self, authenticated_client):
+        """The body must be a list."""
+        response = authenticated_client.post("/api/v1/snaps/punt/bulk/", {"quarter": 1}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_query_count_independent_of_rows(self, authenticated_client, game, player):
+        """Related ids are checked once per model, not once per row."""
+        other = PlayerFactory(team=player.team)
+
+        def post(count):
+            rows = [
+                {
+                    "game_id": game.id,
+                    "quarter": 2,
+                    "quarterback_id": player.id,
+                    "receiver_id": other.id,
+                    "is_complete": True,
+                    "yards_gained": 6,
+                }
+                for _ in range(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = authenticated_client.post("/api/v1/snaps/pass/bulk/", rows, format="json")
+            assert response.status_code == status.HTTP_201_CREATED
+            return len(queries)
+
+        post(1)  # warm the content type cache
+        # Kept under one insert batch: SQLite caps parameters per statement
+        assert post(5) == post(20)
+        assert PassPlay.objects.filter(game=game).count() == 26
+
+
+@pytest.mark.django_db
+class TestScoreLedger:
+    """Every API write keeps the game's score equal to its ledger."""
+
+    def _score(self, game):
+        game.refresh_from_db()
+        assert ScoreEntry.objects.totals(game.pk) == (game.team_score, game.opponent_score)
+        return game.team_score, game.opponent_score
+
+    def test_created_game_opens_ledger(self, authenticated_client, season):
+        response = authenticated_client.post("/api/v1/games/", {
+            "season_id": season.id, "date": "2026-09-12", "opponent": "Rivals", "location": "home",
+            "weather": "clear", "field_condition": "grass", "team_score": 14, "opponent_score": 3,
+        })
+
+        assert response.status_code == status.HTTP_201_CREATED
+        game = season.games.get()
+        assert self._score(game) == (14, 3)
+
+    def test_score_edit_is_an_adjustment(self, authenticated_client, game):
+        start = self._score(game)
+
+        response = authenticated_client.patch(f"/api/v1/games/{game.id}/", {"team_score": start[0] + 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert self._score(game) == (start[0] + 2, start[1])
+        assert ScoreEntry.objects.filter(game=game, snap=None).count() == 2
+
+    def test_snap_create_update_delete(self, authenticated_client, game, player):
+        start = self._score(game)[0]
+        response = authenticated_client.post("/api/v1/snaps/run/", {
+            "game_id": game.id, "sequence_number": 1, "quarter": 1,
+            "ball_carrier_id": player.id, "yards_gained": 12, "is_touchdown": True,
+        })
+        assert response.status_code == status.HTTP_201_CREATED
+        url = f"/api/v1/snaps/run/{RunPlay.objects.get(game=game).pk}/"
+        assert self._score(game)[0] == start + 6
+
+        authenticated_client.patch(url, {"is_touchdown": False, "yards_gained": 9})
+        assert self._score(game)[0] == start
+        authenticated_client.patch(url, {"is_touchdown": True})
+        assert self._score(game)[0] == start + 6
+
+        assert authenticated_client.delete(url).status_code == status.HTTP_204_NO_CONTENT
+        assert self._score(game)[0] == start
+        assert not ScoreEntry.objects.filter(game=game, snap__isnull=False).exists()
+
+
+@pytest.mark.django_db
+class TestGameTimeline:
+    """Tests for the game timeline endpoint."""
+
+    @pytest.fixture
+    def plays(self, game, player):
+        return [
+            KickoffSnap.objects.create(game=game, quarter=1, kicker=player, kick_yards=60),
+            RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=4),
+            PassPlay.objects.create(game=game, quarter=1, quarterback=player, receiver=player),
+            OffenseSnap.objects.create(game=game, quarter=1, play_result="PENALTY", penalty_yards=5),
+            DefenseSnap.objects.create(game=game, quarter=2, primary_player=player, play_result="TACKLE"),
+            PuntReturnSnap.objects.create(game=game, quarter=2, returner=player, return_yards=12),
+        ]
+
+    def test_every_snap_type_in_sequence_order(self, authenticated_client, game, plays):
+        """Rows come back in play order, each serialized as its own type."""
+        response = authenticated_client.get(f"/api/v1/games/{game.id}/timeline/")
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = response.json()["results"]
+        assert [row["sequence_number"] for row in rows] == [1, 2, 3, 4, 5, 6]
+        assert [row["type"] for row in rows] == ["KO", "RUN", "PASS", "OFF", "DEF", "PR"]
+        assert rows[1]["yards_gained"] == 4
+        assert rows[4]["assists"] == []
+        assert rows[5]["return_yards"] == 12
+
+    def test_cursor_pages(self, authenticated_client, game, plays):
+        """Pages follow the cursor from the first play on."""
+        response = authenticated_client.get(f"/api/v1/games/{game.id}/timeline/?page_size=4")
+        first = response.json()
+        second = authenticated_client.get(first["next"]).json()
+
+        assert [row["sequence_number"] for row in first["results"]] == [1, 2, 3, 4]
+        assert [row["sequence_number"] for row in second["results"]] == [5, 6]
+        assert second["next"] is None
+
+    def test_query_count_independent_of_plays(self, authenticated_client, game, player):
+        """A page costs the same queries however many plays of each type it holds."""
+
+        def get():
+            report_cache.backend.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = authenticated_client.get(f"/api/v1/games/{game.id}/timeline/")
+            assert response.status_code == status.HTTP_200_OK
+            return len(queries)
+
+        for _ in range(2):
+            RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+            DefenseSnap.objects.create(game=game, quarter=1, primary_player=player, play_result="TACKLE")
+        few = get()
+        for _ in range(6):
+            RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+            DefenseSnap.objects.create(game=game, quarter=1, primary_player=player, play_result="TACKLE")
+        assert get() == few
+
+    def test_cached_until_snaps_change(self, authenticated_client, game, plays, player):
+        """A repeat request is served from the cache; a new snap invalidates it."""
+        url = f"/api/v1/games/{game.id}/timeline/"
+        authenticated_client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = authenticated_client.get(url)
+        RunPlay.objects.create(game=game, quarter=2, ball_carrier=player, yards_gained=9)
+        fresh = authenticated_client.get(url)
+
+        assert not any("snaps_" in query["sql"] for query in queries.captured_queries)
+        assert len(cached.json()["results"]) == 6
+        assert fresh.json()["results"][-1]["yards_gained"] == 9
+
+    def test_other_teams_game_is_not_found(self, api_client, plays):
+        """The timeline is team scoped like the game itself."""
+        api_client.force_authenticate(user=UserFactory(team=TeamFactory()))
+
+        response = api_client.get(f"/api/v1/games/{plays[0].game_id}/timeline/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """ETag / Last-Modified validation on games, snaps and reports."""
+
+    def test_game_detail_not_modified(self, authenticated_client, game):
+        """A matching If-None-Match gets an empty 304 after one version query."""
+        url = f"/api/v1/games/{game.id}/"
+        first = authenticated_client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert first.status_code == status.HTTP_200_OK
+        assert "Last-Modified" in first
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == first["ETag"]
+        assert not response.content
+        assert len(queries) == 1
+
+    def test_game_if_modified_since(self, authenticated_client, game):
+        """Last-Modified validates on its own."""
+        url = f"/api/v1/games/{game.id}/"
+        first = authenticated_client.get(url)
+
+        response = authenticated_client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_score_change_invalidates_game(self, authenticated_client, game):
+        """Ledger score updates and quarter scores touch the game."""
+        url = f"/api/v1/games/{game.id}/"
+        etag = authenticated_client.get(url)["ETag"]
+
+        ScoreEntry.objects.adjust(game, team_score=game.team_score + 3)
+        scored = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        QuarterScore.objects.create(game=game, quarter=1, team_score=3)
+        quarter = authenticated_client.get(url, HTTP_IF_NONE_MATCH=scored["ETag"])
+
+        assert scored.status_code == status.HTTP_200_OK
+        assert scored.json()["team_score"] == game.team_score
+        assert quarter.status_code == status.HTTP_200_OK
+        assert quarter.json()["quarter_scores"][0]["team_score"] == 3
+
+    def test_snap_list_changes_with_rows(self, authenticated_client, game, player):
+        """Adding or deleting a snap changes the list's tag."""
+        plays = [RunPlay.objects.create(game=game, quarter=1, ball_carrier=player) for _ in range(3)]
+        url = "/api/v1/snaps/run/"
+        etag = authenticated_client.get(url)["ETag"]
+
+        unchanged = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        plays[0].delete()
+        deleted = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert unchanged.status_code == status.HTTP_304_NOT_MODIFIED
+        assert deleted.status_code == status.HTTP_200_OK
+        assert deleted.json()["count"] == 2
+
+    def test_tags_differ_by_filter(self, authenticated_client, game, player):
+        """Each query string is tagged separately."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+
+        etag = authenticated_client.get("/api/v1/snaps/run/")["ETag"]
+        response = authenticated_client.get(f"/api/v1/snaps/run/?game={game.id}", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_report_not_modified_after_version_lookup(self, authenticated_client, game, player):
+        """Reports validate against the stored data version alone; a new snap changes it."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=5)
+        url = f"/api/v1/reports/offense/rushing/totals/?game_ids={game.id}"
+        etag = authenticated_client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        # Read before the next request resets the connection's query log
+        (query,) = queries.captured_queries
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=7)
+        fresh = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert '"report_data_versions"' in query["sql"]
+        assert fresh.status_code == status.HTTP_200_OK
+        assert fresh.json()["yards"] == 12
+
+    def test_timeline_not_modified(self, authenticated_client, game, player):
+        """The timeline follows the game's data version, read with the game in one query."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+        url = f"/api/v1/games/{game.id}/timeline/"
+        etag = authenticated_client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        queries = len(queries)
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+        fresh = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert queries == 1
+        assert fresh.status_code == status.HTTP_200_OK
+        assert len(fresh.json()["results"]) == 2
+
+    @pytest.mark.parametrize("url", [
+        "/api/v1/snaps/run/",
+        "/api/v1/snaps/run/{play}/",
+        "/api/v1/games/{game}/timeline/",
+    ])
+    def test_player_edit_changes_tag(self, authenticated_client, game, player, url):
+        """Snap reads embed their players, so renaming one is not answered with 304."""
+        play = RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+        url = url.format(play=play.id, game=game.id)
+        etag = authenticated_client.get(url)["ETag"]
+
+        player.last_name = "Renamed"
+        player.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "Renamed" in response.content.decode()
+
+    def test_assist_player_edit_changes_tag(self, authenticated_client, game, player):
+        """Players embedded through defensive assists count too."""
+        snap = DefenseSnap.objects.create(game=game, quarter=1, primary_player=player)
+        helper = PlayerFactory(team=game.season.team)
+        DefenseSnapAssist.objects.create(snap=snap, player=helper, assist_type="TACKLE")
+        url = f"/api/v1/snaps/defense/{snap.id}/?expand=assists"
+        etag = authenticated_client.get(url)["ETag"]
+
+        helper.number = 99
+        helper.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_writes_are_not_conditional(self, authenticated_client, game):
+        """Only safe methods are answered with 304."""
+        url = f"/api/v1/games/{game.id}/"
+        etag = authenticated_client.get(url)["ETag"]
+
+        response = authenticated_client.patch(url, {"notes": "wet"}, format="json", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "ETag" not in response
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Compact rows, ?expand= and ?fields= on the snap and game viewsets."""
+
+    def test_compact_rows_side_load_related(self, authenticated_client, game, player):
+        """Relations are ids by default, with each object included once."""
+        for _ in range(3):
+            RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+
+        data = authenticated_client.get("/api/v1/snaps/run/").json()
+
+        assert {row["game"] for row in data["results"]} == {game.id}
+        assert {row["ball_carrier"] for row in data["results"]} == {player.id}
+        assert data["results"][0]["fumble_recovered_by"] is None
+        assert list(data["included"]["games"]) == [str(game.id)]
+        assert data["included"]["players"][str(player.id)]["full_name"] == player.full_name
+
+    def test_compact_rows_skip_joins(self, authenticated_client, game, player):
+        """Related rows are loaded once per kind, never joined to the snaps."""
+        receiver = PlayerFactory(team=player.team)
+
+        def get():
+            with CaptureQueriesContext(connection) as queries:
+                response = authenticated_client.get("/api/v1/snaps/pass/")
+            assert response.status_code == status.HTTP_200_OK
+            return queries.captured_queries
+
+        PassPlay.objects.create(game=game, quarter=1, quarterback=player, receiver=receiver)
+        few = get()
+        for _ in range(5):
+            PassPlay.objects.create(game=game, quarter=1, quarterback=player, receiver=receiver)
+        many = get()
+
+        rows_query = next(q["sql"] for q in many if "LIMIT" in q["sql"])
+        assert '"players"' not in rows_query
+        assert len(many) == len(few)
+
+    def test_expand_nests_relations(self, authenticated_client, game, player):
+        """Expanded relations are nested and not side-loaded."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+
+        data = authenticated_client.get("/api/v1/snaps/run/?expand=ball_carrier,game").json()
+
+        row = data["results"][0]
+        assert row["ball_carrier"]["id"] == player.id
+        assert row["game"]["id"] == game.id
+        assert data["included"] == {}
+
+    def test_fields_selects_columns(self, authenticated_client, game, player):
+        """Only the named fields are rendered, and only their relations included."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=7)
+
+        data = authenticated_client.get("/api/v1/snaps/run/?fields=id,yards_gained,ball_carrier").json()
+
+        assert data["results"][0] == {
+            "id": data["results"][0]["id"],
+            "yards_gained": 7,
+            "ball_carrier": player.id,
+        }
+        assert list(data["included"]) == ["players"]
+
+    def test_game_detail(self, authenticated_client, game):
+        """Game retrieves side-load their season; fields drop the quarter score prefetch."""
+        data = authenticated_client.get(f"/api/v1/games/{game.id}/").json()
+
+        with CaptureQueriesContext(connection) as queries:
+            sparse = authenticated_client.get(f"/api/v1/games/{game.id}/?fields=id,opponent").json()
+
+        assert data["season"] == game.season_id
+        assert data["included"]["seasons"][str(game.season_id)]["team"]["id"] == game.season.team_id
+        assert sparse == {"id": game.id, "opponent": game.opponent, "included": {}}
+        assert not any("quarter_scores" in query["sql"] for query in queries.captured_queries)
+
+    def test_timeline_rows_are_compact(self, authenticated_client, game, player):
+        """The game timeline follows the same options."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player)
+
+        data = authenticated_client.get(f"/api/v1/games/{game.id}/timeline/?fields=id,ball_carrier").json()
+
+        assert data["results"] == [{"type": "RUN", "id": data["results"][0]["id"], "ball_carrier": player.id}]
+        assert list(data["included"]["players"]) == [str(player.id)]
+
+
+@pytest.mark.django_db
+class TestContentNegotiation:
+    """JSON stays the default; MessagePack is served when asked for and installed."""
+
+    @pytest.fixture
+    def plays(self, game, player):
+        RunPlay.objects.create(
+            game=game, quarter=1, game_clock=timedelta(minutes=5, seconds=7), ball_carrier=player
+        )
+        PassPlay.objects.create(game=game, quarter=2, quarterback=player, notes="ümlaut")
+
+    @pytest.mark.parametrize("path", ["snaps/run/", "games/", "reports/offense/rushing/totals/"])
+    def test_json_matches_stdlib_renderer(self, authenticated_client, plays, path):
+        response = authenticated_client.get(f"/api/v1/{path}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        assert response.content == JSONRenderer().render(response.data)
+
+    def test_timeline_game_clock(self, authenticated_client, game, plays):
+        response = authenticated_client.get(f"/api/v1/games/{game.id}/timeline/", HTTP_ACCEPT="application/json")
+
+        assert response.json()["results"][0]["game_clock"] == "00:05:07"
+        assert response.content == JSONRenderer().render(response.data)
+
+    def test_json_request_body(self, authenticated_client, game, player):
+        response = authenticated_client.post(
+            "/api/v1/snaps/run/",
+            data=json.dumps({
+                "game_id": game.id,
+                "sequence_number": 1,
+                "quarter": 1,
+                "ball_carrier_id": player.id,
+                "game_clock": "00:04:30",
+            }),
+            content_type="application/json",
+        )
+        malformed = authenticated_client.post("/api/v1/snaps/run/", data="{", content_type="application/json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert RunPlay.objects.get().game_clock == timedelta(minutes=4, seconds=30)
+        assert malformed.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_msgpack_by_accept_and_format(self, authenticated_client, game, plays):
+        import msgpack  # a base requirement: missing it fails, not skips
+        url = f"/api/v1/games/{game.id}/timeline/"
+        as_json = authenticated_client.get(url)
+        by_accept = authenticated_client.get(url, HTTP_ACCEPT="application/msgpack")
+        by_format = authenticated_client.get(url, {"format": "msgpack"})
+
+        assert by_accept["Content-Type"] == "application/msgpack"
+        assert msgpack.unpackb(by_accept.content) == as_json.json()
+        assert by_format.content == by_accept.content
+        assert by_accept["ETag"] != as_json["ETag"]
+
+    def test_msgpack_request_body(self, authenticated_client, game, player):
+        import msgpack  # a base requirement: missing it fails, not skips
+        body = msgpack.packb(
+            {"game_id": game.id, "sequence_number": 1, "quarter": 1, "ball_carrier_id": player.id, "yards_gained": 6}
+        )
+
+        response = authenticated_client.post(
+            "/api/v1/snaps/run/", data=body, content_type="application/msgpack", HTTP_ACCEPT="application/msgpack"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert msgpack.unpackb(response.content)["yards_gained"] == 6
@@ -0,0 +1,156 @@
+"""
+Equivalence tests for the compiled list read path.
+
+Every case fetches a list through the compiled path and again with the
+plan disabled (the regular serializer path) and compares the bytes.
+"""
+from datetime import timedelta
+
+import pytest
+from rest_framework import status
+
+from apps.core import compiled
+from apps.core.compiled import CompiledSerializer, NotCompilable
+from apps.games.models import Game, QuarterScore
+from apps.snaps.models import PassPlay, RunPlay
+from apps.snaps.serializers import RunPlayReadSerializer
+from tests.factories import GameFactory, PlayerFactory, UserFactory
+
+
+@pytest.fixture
+def fallback(monkeypatch):
+    """Make every serializer uncompilable, forcing the serializer path."""
+
+    def disable():
+        def refuse(serializer):
+            raise NotCompilable(type(serializer).__name__)
+
+        monkeypatch.setattr(CompiledSerializer, "for_serializer", staticmethod(refuse))
+
+    return disable
+
+
+@pytest.fixture
+def plays(game, season, team):
+    carrier = PlayerFactory(team=team, position="RB")
+    quarterback = PlayerFactory(team=team, position="QB", first_name="Zoë")
+    receiver = PlayerFactory(team=team, position="WR")
+    other_game = GameFactory(season=season, weather="hot", location="neutral", field_condition="wet")
+    for index, current in enumerate([game, other_game] * 3):
+        RunPlay.objects.create(
+            game=current,
+            quarter=1 + index % 4,
+            game_clock=timedelta(minutes=index, seconds=7, microseconds=250 * index),
+            down=None if index == 2 else 1 + index % 4,
+            distance=10,
+            ball_position=-20 + index,
+            formation="I-Form" if index % 2 else "",
+            ball_carrier=carrier,
+            yards_gained=index * 3 - 2,
+            is_touchdown=index == 5,
+            fumbled=index == 1,
+            fumble_lost=index == 1,
+            fumble_recovered_by=receiver if index == 1 else None,
+            notes="ümlaut \"quoted\"" if index == 3 else "",
+        )
+        PassPlay.objects.create(
+            game=current,
+            quarter=1 + index % 4,
+            game_clock=None if index % 2 else timedelta(seconds=59),
+            quarterback=quarterback,
+            target=receiver,
+            receiver=receiver if index % 3 else None,
+            is_complete=bool(index % 3),
+            yards_gained=index * 4,
+            air_yards=index,
+            was_sacked=index == 4,
+            sack_yards=-6 if index == 4 else 0,
+            had_penalty=index == 2,
+            penalty_player=quarterback if index == 2 else None,
+            penalty_yards=5 if index == 2 else None,
+        )
+    QuarterScore.objects.create(game=game, quarter=2, team_score=7)
+    QuarterScore.objects.create(game=game, quarter=1, team_score=3, opponent_score=7)
+    return other_game
+
+
+URLS = [
+    "/api/v1/snaps/run/",
+    "/api/v1/snaps/run/?ordering=-yards_gained&page_size=4",
+    "/api/v1/snaps/run/?page=2&page_size=4",
+    "/api/v1/snaps/run/?fields=id,game_clock,ball_carrier,fumble_recovered_by,created_at",
+    "/api/v1/snaps/run/?quarter=2",
+    "/api/v1/snaps/run/?expand=ball_carrier",
+    "/api/v1/snaps/pass/",
+    "/api/v1/snaps/pass/?fields=receiver,penalty_player,is_complete",
+    "/api/v1/snaps/pass/?ordering=sequence_number",
+    "/api/v1/games/",
+    "/api/v1/games/?fields=id,weather_display,result,is_win,quarter_scores",
+    "/api/v1/games/?ordering=team_score",
+    "/api/v1/games/?search=nowhere",
+    "/api/v1/games/?expand=season",
+]
+
+
+@pytest.mark.django_db
+class TestCompiledListEquivalence:
+    """The compiled path renders the same bytes as the serializers."""
+
+    @pytest.mark.parametrize("url", URLS)
+    def test_same_bytes(self, authenticated_client, plays, fallback, url):
+        compiled_response = authenticated_client.get(url)
+        fallback()
+        serializer_response = authenticated_client.get(url)
+
+        assert compiled_response.status_code == status.HTTP_200_OK
+        assert compiled_response.content == serializer_response.content
+
+    @pytest.mark.parametrize("url", ["/api/v1/snaps/run/", "/api/v1/snaps/pass/", "/api/v1/games/"])
+    def test_lists_take_compiled_path(self, authenticated_client, plays, url):
+        """The default list requests compile (the equivalence is not vacuous)."""
+        compiled._plans.clear()
+
+        authenticated_client.get(url)
+
+        assert [plan.model for plan in compiled._plans.values() if plan is not None]
+
+    def test_team_scoped_user(self, api_client, plays, fallback):
+        """Scoping applies to the compiled rows too."""
+        api_client.force_authenticate(user=UserFactory(team=plays.season.team))
+        GameFactory()  # another team's game
+        compiled_response = api_client.get("/api/v1/games/")
+        fallback()
+        serializer_response = api_client.get("/api/v1/games/")
+
+        assert compiled_response.json()["count"] == 2
+        assert compiled_response.content == serializer_response.content
+
+    def test_display_of_unknown_choice(self, authenticated_client, plays, fallback):
+        """A stored value outside the choices displays as itself."""
+        Game.objects.filter(pk=plays.pk).update(weather="foggy")
+        compiled_response = authenticated_client.get("/api/v1/games/")
+        fallback()
+
+        assert compiled_response.content == authenticated_client.get("/api/v1/games/").content
+
+
+class TestCompiledPlan:
+    """Which serializers compile."""
+
+    def test_expanded_relations_do_not_compile(self):
+        serializer = RunPlayReadSerializer(context={"expand": {"game"}})
+
+        with pytest.raises(NotCompilable):
+            CompiledSerializer.for_serializer(serializer)
+
+    def test_plans_are_cached_per_options(self):
+        compiled._plans.clear()
+        first = CompiledSerializer.for_serializer(RunPlayReadSerializer(context={"expand": set()}))
+        again = CompiledSerializer.for_serializer(RunPlayReadSerializer(context={"expand": set()}))
+        sparse = CompiledSerializer.for_serializer(
+            RunPlayReadSerializer(context={"expand": set(), "fields": {"id"}})
+        )
+
+        assert first is again
+        assert sparse is not first
+        assert sparse.columns == ["pk", "id"]
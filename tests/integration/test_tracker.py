@@ -0,0 +1,631 @@
+"""
+Integration tests for the live game tracker endpoints.
+"""
+import importlib
+import json
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+
+from apps.frontend.live_feed import (
+    AsyncSubscription,
+    InProcessPlayFeed,
+    PostgresPlayFeed,
+    Subscription,
+    get_play_feed,
+)
+from apps.games.models import Game
+from apps.snaps.game_state import game_state_cache
+from apps.snaps.models import BaseSnap, DefenseSnap, DefenseSnapAssist, RunPlay, ScoreEntry, UndonePlay
+from sportsman.settings import base as base_settings
+from tests.factories import DefenseSnapFactory, GameFactory, PlayerFactory, UserFactory
+
+
+def _post_json(client, url, payload):
+    return client.post(url, data=json.dumps(payload), content_type="application/json")
+
+
+def _create_with_lock_retry(**fields):
+    """
+    Create a run play, retrying SQLite shared-cache lock errors.
+
+    The in-memory test database rejects concurrent writers instead of
+    queueing them; PostgreSQL blocks on the game row lock, so no retry
+    ever happens there.
+    """
+    while True:
+        try:
+            return RunPlay.objects.create(**fields)
+        except OperationalError as exc:
+            if connection.vendor != "sqlite" or "locked" not in str(exc):
+                raise
+
+
+@pytest.fixture
+def tracker_client(db):
+    """Session-authenticated client for the tracker views."""
+    client = Client()
+    client.force_login(UserFactory())
+    return client
+
+
+@pytest.mark.django_db
+class TestTrackerSequenceAllocation:
+    """Tests for per-game sequence number allocation."""
+
+    def test_plays_get_consecutive_sequence_numbers(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/run/"
+        for _ in range(3):
+            assert _post_json(tracker_client, url, {"yards_gained": 4}).json()["success"]
+
+        numbers = list(game.snaps.values_list("sequence_number", flat=True))
+        assert numbers == [1, 2, 3]
+        game.refresh_from_db()
+        assert game.last_sequence_number == 3
+
+    def test_allocation_continues_after_explicit_sequence(self, tracker_client, game, player):
+        RunPlay.objects.create(game=game, sequence_number=7, quarter=1, ball_carrier=player)
+
+        response = _post_json(tracker_client, f"/games/{game.pk}/tracker/run/", {})
+
+        assert response.json()["play_detail"]["sequence"] == 8
+
+    def test_undo_releases_last_sequence_number(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/run/"
+        _post_json(tracker_client, url, {})
+        _post_json(tracker_client, url, {})
+
+        _post_json(tracker_client, f"/games/{game.pk}/tracker/undo/", {})
+        response = _post_json(tracker_client, url, {})
+
+        assert response.json()["play_detail"]["sequence"] == 2
+
+    def test_allocation_is_single_statement(self, game, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            number = Game.objects.allocate_sequence_number(game.pk)
+        assert number == 1
+
+    def test_allocate_for_missing_game_raises(self, db):
+        with pytest.raises(Game.DoesNotExist):
+            Game.objects.allocate_sequence_number(999999)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestTrackerConcurrency:
+    """Stress test: many devices recording plays for one game at once."""
+
+    THREADS = 8
+    PLAYS_PER_THREAD = 10
+
+    def test_concurrent_inserts_never_duplicate_sequence(self):
+        game = GameFactory()
+        carrier = PlayerFactory(team=game.season.team, position="RB")
+        errors = []
+        start = threading.Barrier(self.THREADS)
+
+        def record_plays():
+            try:
+                start.wait()
+                for _ in range(self.PLAYS_PER_THREAD):
+                    _create_with_lock_retry(
+                        game_id=game.pk, quarter=1, ball_carrier=carrier, yards_gained=3
+                    )
+            except Exception as exc:  # noqa: BLE001 - surfaced via the assertion below
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=record_plays) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        total = self.THREADS * self.PLAYS_PER_THREAD
+        assert errors == []
+        numbers = sorted(BaseSnap.objects.filter(game=game).values_list("sequence_number", flat=True))
+        assert numbers == list(range(1, total + 1))
+        game.refresh_from_db()
+        assert game.last_sequence_number == total
+
+
+@pytest.mark.django_db
+class TestTrackerSync:
+    """Tests for the offline batch-sync endpoint."""
+
+    def _batch(self, player):
+        return {
+            "plays": [
+                {"key": "k1", "type": "kickoff", "kick_yards": 60, "is_touchback": True},
+                {"key": "k2", "type": "run", "ball_carrier": player.pk, "yards_gained": 12,
+                 "down": 1, "distance": 10, "ball_position": -25, "is_first_down": True},
+                {"key": "k3", "type": "pass", "yards_gained": 63, "is_complete": True,
+                 "is_touchdown": True, "down": 1, "distance": 10, "ball_position": -13},
+                {"key": "k4", "type": "extra_point", "attempt_type": "KICK", "result": "GOOD"},
+                {"key": "k5", "type": "penalty", "on_offense": False, "penalty_yards": 5,
+                 "down": 1, "distance": 10, "ball_position": 0},
+            ]
+        }
+
+    def test_sync_inserts_mixed_batch_in_order(self, tracker_client, game, player):
+        game.team_score = 0
+        game.save()
+
+        response = _post_json(tracker_client, f"/games/{game.pk}/tracker/sync/", self._batch(player))
+        data = response.json()
+
+        assert response.status_code == 200
+        assert [row["sequence"] for row in data["created"]] == [1, 2, 3, 4, 5]
+        assert data["team_score"] == 7
+        assert data["next_state"]["distance"] == 5
+        types = [type(snap).__name__ for snap in game.snaps.order_by("sequence_number")]
+        assert types == ["KickoffSnap", "RunPlay", "PassPlay", "ExtraPointSnap", "DefenseSnap"]
+        run = RunPlay.objects.get(game=game)
+        assert run.ball_carrier == player
+        assert run.play_result == "RUN"
+
+    def test_replayed_batch_creates_no_duplicates(self, tracker_client, game, player):
+        game.team_score = 0
+        game.save()
+        url = f"/games/{game.pk}/tracker/sync/"
+        _post_json(tracker_client, url, self._batch(player))
+
+        response = _post_json(tracker_client, url, self._batch(player))
+        data = response.json()
+
+        assert data["created"] == []
+        assert data["skipped"] == ["k1", "k2", "k3", "k4", "k5"]
+        assert data["team_score"] == 7
+        assert game.snaps.count() == 5
+
+    def test_partial_replay_only_inserts_new_keys(self, tracker_client, game, player):
+        url = f"/games/{game.pk}/tracker/sync/"
+        batch = self._batch(player)
+        _post_json(tracker_client, url, {"plays": batch["plays"][:2]})
+
+        data = _post_json(tracker_client, url, batch).json()
+
+        assert [row["key"] for row in data["created"]] == ["k3", "k4", "k5"]
+        assert [row["sequence"] for row in data["created"]] == [3, 4, 5]
+
+    def test_play_saved_online_is_skipped_by_sync(self, tracker_client, game, player):
+        """A play whose response was lost is queued and synced again under its key."""
+        play = {"key": "k1", "ball_carrier": player.pk, "yards_gained": 4}
+        _post_json(tracker_client, f"/games/{game.pk}/tracker/run/", play)
+
+        data = _post_json(
+            tracker_client, f"/games/{game.pk}/tracker/sync/", {"plays": [{**play, "type": "run"}]}
+        ).json()
+
+        assert data["skipped"] == ["k1"]
+        assert game.snaps.count() == 1
+
+    def test_retried_play_is_returned_not_recorded_again(
+        self, tracker_client, game, django_capture_on_commit_callbacks
+    ):
+        """A single-play request retried under its key gets back the first recording."""
+        url = f"/games/{game.pk}/tracker/field-goal/"
+        play = {"key": "k1", "kick_distance": 30, "result": "GOOD"}
+        first = _post_json(tracker_client, url, play).json()
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = _post_json(tracker_client, url, play)
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["replayed"]
+        for field in ["play_id", "play_summary", "next_state", "team_score"]:
+            assert data[field] == first[field]
+        assert game.snaps.count() == 1
+        assert callbacks == []
+
+    def test_sync_rejects_unknown_play_type(self, tracker_client, game):
+        payload = {"plays": [{"key": "x", "type": "hail_mary"}]}
+
+        response = _post_json(tracker_client, f"/games/{game.pk}/tracker/sync/", payload)
+
+        assert response.status_code == 400
+        assert game.snaps.count() == 0
+
+    def test_sync_rejects_missing_key(self, tracker_client, game):
+        payload = {"plays": [{"type": "run"}]}
+
+        response = _post_json(tracker_client, f"/games/{game.pk}/tracker/sync/", payload)
+
+        assert response.status_code == 400
+
+    def test_sync_rolls_back_whole_batch_on_bad_row(self, tracker_client, game):
+        payload = {"plays": [
+            {"key": "a", "type": "run", "yards_gained": 3},
+            {"key": "b", "type": "run", "yards_gained": "lots"},
+        ]}
+
+        response = _post_json(tracker_client, f"/games/{game.pk}/tracker/sync/", payload)
+
+        assert response.status_code == 400
+        assert game.snaps.count() == 0
+        game.refresh_from_db()
+        assert game.last_sequence_number == 0
+
+
+@pytest.mark.django_db
+class TestTrackerGameState:
+    """The tracker's down/distance/field position comes from the snaps."""
+
+    @pytest.fixture(autouse=True)
+    def plain_static_storage(self, settings):
+        settings.STORAGES = {
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        }
+
+    def _page_state(self, client, game):
+        return client.get(f"/games/{game.pk}/tracker/").context["game_state_data"]
+
+    def test_new_game_waits_for_kickoff(self, tracker_client, game):
+        state = self._page_state(tracker_client, game)
+
+        assert state["situation"] == "kickoff"
+        assert state["down"] is None
+        assert state["ball_position"] == 35
+
+    def test_page_load_shows_state_after_last_play(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/"
+        _post_json(tracker_client, f"{url}kickoff/", {"is_touchback": True})
+        data = _post_json(tracker_client, f"{url}run/", {
+            "down": 1, "distance": 10, "ball_position": -25, "yards_gained": 4,
+        }).json()
+        assert data["next_state"] == {
+            "quarter": 1, "down": 2, "distance": 6, "ball_position": -21, "situation": "normal",
+        }
+
+        state = self._page_state(tracker_client, game)
+
+        assert {key: state[key] for key in data["next_state"]} == data["next_state"]
+
+    def test_page_load_replays_when_not_cached(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/"
+        _post_json(tracker_client, f"{url}kickoff/", {"is_touchback": True})
+        _post_json(tracker_client, f"{url}pass/", {
+            "down": 3, "distance": 2, "ball_position": 10, "yards_gained": 0,
+        })
+        game_state_cache.clear(game.pk)
+
+        state = self._page_state(tracker_client, game)
+
+        assert (state["down"], state["distance"], state["ball_position"]) == (4, 2, 10)
+
+    def test_edited_last_play_is_replayed(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/"
+        _post_json(tracker_client, f"{url}run/", {
+            "down": 1, "distance": 10, "ball_position": 0, "yards_gained": 3,
+        })
+        run = RunPlay.objects.get(game=game)
+        run.yards_gained = 12
+        run.is_first_down = True
+        run.save()
+
+        state = self._page_state(tracker_client, game)
+
+        assert (state["down"], state["distance"], state["ball_position"]) == (1, 10, 12)
+
+    def test_play_saved_elsewhere_is_replayed(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/"
+        _post_json(tracker_client, f"{url}kickoff/", {"is_touchback": True})
+        # Recorded through the API, so the tracker's cached history misses it
+        RunPlay.objects.create(
+            game=game, quarter=1, down=1, distance=10, ball_position=-25,
+            yards_gained=40, is_first_down=True,
+        )
+
+        data = _post_json(tracker_client, f"{url}run/", {"yards_gained": 5}).json()
+
+        assert data["next_state"]["ball_position"] == 20
+        assert (data["next_state"]["down"], data["next_state"]["distance"]) == (2, 5)
+
+    def test_undo_returns_previous_state(self, tracker_client, game):
+        url = f"/games/{game.pk}/tracker/"
+        first = _post_json(tracker_client, f"{url}run/", {
+            "down": 1, "distance": 10, "ball_position": -30, "yards_gained": 5,
+        }).json()
+        _post_json(tracker_client, f"{url}pass/", {
+            "down": 2, "distance": 5, "ball_position": -25, "yards_gained": 20, "is_first_down": True,
+        })
+
+        data = tracker_client.post(f"{url}undo/").json()
+
+        assert data["next_state"] == first["next_state"]
+        assert self._page_state(tracker_client, game)["down"] == 2
+        data = tracker_client.post(f"{url}undo/").json()
+        assert data["next_state"]["situation"] == "kickoff"
+
+
+@pytest.mark.django_db
+class TestTrackerScoreLedger:
+    """Scores move through the ledger, and undo/redo reverse them."""
+
+    @pytest.fixture
+    def scoreless(self, game):
+        ScoreEntry.objects.adjust(game, team_score=0, opponent_score=0)
+        return game
+
+    def _score(self, game):
+        game.refresh_from_db()
+        assert ScoreEntry.objects.totals(game.pk) == (game.team_score, game.opponent_score)
+        return game.team_score, game.opponent_score
+
+    def test_scoring_plays_write_ledger_rows(self, tracker_client, scoreless):
+        url = f"/games/{scoreless.pk}/tracker/"
+        _post_json(tracker_client, f"{url}run/", {"yards_gained": 30, "is_touchdown": True})
+        _post_json(tracker_client, f"{url}extra-point/", {"attempt_type": "2PT_PASS", "result": "GOOD"})
+        _post_json(tracker_client, f"{url}run/", {"yards_gained": 3})
+
+        assert self._score(scoreless) == (8, 0)
+        assert ScoreEntry.objects.filter(game=scoreless, snap__isnull=False).count() == 2
+
+    def test_undo_reverses_any_scoring_snap(self, tracker_client, scoreless):
+        DefenseSnap.objects.create(
+            game=scoreless, quarter=2, play_result="INT", is_defensive_touchdown=True
+        )
+        assert self._score(scoreless) == (6, 0)
+
+        data = tracker_client.post(f"/games/{scoreless.pk}/tracker/undo/").json()
+
+        assert data["team_score"] == 0
+        assert self._score(scoreless) == (0, 0)
+        assert not ScoreEntry.objects.filter(game=scoreless, snap__isnull=False).exists()
+
+    def test_failed_undo_leaves_play_and_score(self, tracker_client, scoreless, monkeypatch):
+        url = f"/games/{scoreless.pk}/tracker/"
+        _post_json(tracker_client, f"{url}field-goal/", {"kick_distance": 30, "result": "GOOD"})
+
+        def crash(*args):
+            raise RuntimeError("crashed mid-undo")
+
+        monkeypatch.setattr(Game.objects, "release_sequence_number", crash)
+        with pytest.raises(RuntimeError):
+            tracker_client.post(f"{url}undo/")
+
+        assert scoreless.snaps.count() == 1
+        assert self._score(scoreless) == (3, 0)
+
+    def test_undo_stack_and_redo(self, tracker_client, scoreless):
+        url = f"/games/{scoreless.pk}/tracker/"
+        qb = PlayerFactory(team=scoreless.season.team, number=7, last_name="Lane")
+        added = [
+            _post_json(tracker_client, f"{url}pass/", {
+                "quarterback": qb.pk, "is_complete": True, "yards_gained": 20, "is_touchdown": True,
+            }).json(),
+            _post_json(tracker_client, f"{url}extra-point/", {"attempt_type": "KICK", "result": "GOOD"}).json(),
+        ]
+        tracker_client.post(f"{url}undo/")
+        tracker_client.post(f"{url}undo/")
+        assert self._score(scoreless) == (0, 0)
+
+        first = tracker_client.post(f"{url}redo/").json()
+        second = tracker_client.post(f"{url}redo/").json()
+
+        assert [first["play_detail"]["sequence"], second["play_detail"]["sequence"]] == [1, 2]
+        assert [first["play_summary"], second["play_summary"]] == ["#7 Lane for 20 yds", "PAT GOOD"]
+        assert [first["play_detail"], second["play_detail"]] == [play["play_detail"] for play in added]
+        assert second["next_state"]["situation"] == "kickoff"
+        assert self._score(scoreless) == (7, 0)
+        types = [type(snap).__name__ for snap in scoreless.snaps.order_by("sequence_number")]
+        assert types == ["PassPlay", "ExtraPointSnap"]
+        assert not tracker_client.post(f"{url}redo/").json()["success"]
+
+    def test_redo_stack_is_shared_between_workers(self, tracker_client, scoreless):
+        """The stack lives in the database, not a per-process cache."""
+        url = f"/games/{scoreless.pk}/tracker/"
+        _post_json(tracker_client, f"{url}field-goal/", {"kick_distance": 35, "result": "GOOD"})
+        tracker_client.post(f"{url}undo/")
+        cache.clear()
+
+        data = tracker_client.post(f"{url}redo/").json()
+
+        assert data["success"]
+        assert self._score(scoreless) == (3, 0)
+        assert not UndonePlay.objects.filter(game=scoreless).exists()
+
+    def test_redo_restores_assists(self, tracker_client, scoreless):
+        url = f"/games/{scoreless.pk}/tracker/"
+        team = scoreless.season.team
+        snap = DefenseSnapFactory(game=scoreless, sequence_number=None, primary_player__team=team)
+        helpers = PlayerFactory.create_batch(2, team=team)
+        DefenseSnapAssist.objects.create(snap=snap, player=helpers[0], assist_type="TACKLE")
+        DefenseSnapAssist.objects.create(snap=snap, player=helpers[1], assist_type="SACK")
+        tracker_client.post(f"{url}undo/")
+        assert not DefenseSnapAssist.objects.exists()
+
+        play_id = tracker_client.post(f"{url}redo/").json()["play_id"]
+
+        restored = DefenseSnapAssist.objects.filter(snap_id=play_id).order_by("assist_type")
+        assert [(assist.player, assist.assist_type) for assist in restored] == [
+            (helpers[1], "SACK"), (helpers[0], "TACKLE"),
+        ]
+
+    def test_new_play_ends_redo(self, tracker_client, scoreless):
+        url = f"/games/{scoreless.pk}/tracker/"
+        _post_json(tracker_client, f"{url}run/", {"yards_gained": 40, "is_touchdown": True})
+        tracker_client.post(f"{url}undo/")
+        _post_json(tracker_client, f"{url}run/", {"yards_gained": 2})
+
+        assert not tracker_client.post(f"{url}redo/").json()["success"]
+        assert self._score(scoreless) == (0, 0)
+
+    def test_manual_score_is_an_adjustment(self, tracker_client, scoreless):
+        url = f"/games/{scoreless.pk}/tracker/"
+        _post_json(tracker_client, f"{url}field-goal/", {"kick_distance": 41, "result": "GOOD"})
+
+        _post_json(tracker_client, f"{url}update-score/", {"team_score": 5, "opponent_score": 7})
+
+        assert self._score(scoreless) == (5, 7)
+        adjustment = ScoreEntry.objects.filter(game=scoreless, snap=None).last()
+        assert (adjustment.team_points, adjustment.opponent_points) == (2, 7)
+
+
+@pytest.mark.django_db
+class TestPlayListQueryCounts:
+    """Play lists cost the same number of queries however long they are."""
+
+    def _record(self, tracker_client, game, plays):
+        for n in range(plays):
+            kind = "pass" if n % 2 else "run"
+            _post_json(tracker_client, f"/games/{game.pk}/tracker/{kind}/", {"yards_gained": n})
+
+    def _count(self, client, url):
+        with CaptureQueriesContext(connection) as ctx:
+            assert client.get(url).status_code == 200
+        return len(ctx.captured_queries)
+
+    @pytest.mark.parametrize("path", ["tracker/plays/?limit=100", "plays/", "tracker/"])
+    def test_constant_queries(self, tracker_client, settings, path):
+        settings.STORAGES = {
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        }
+        short, long = GameFactory(), GameFactory()
+        self._record(tracker_client, short, 2)
+        self._record(tracker_client, long, 20)
+
+        assert self._count(tracker_client, f"/games/{short.pk}/{path}") == self._count(
+            tracker_client, f"/games/{long.pk}/{path}"
+        )
+
+
+class TestPlayFeed:
+    """Tests for the in-process live play fan-out."""
+
+    def test_publish_reaches_only_that_games_subscribers(self):
+        feed = InProcessPlayFeed()
+        watching = feed.subscribe(1)
+        other = feed.subscribe(2)
+
+        feed.publish(1, "play", {"play_id": 10})
+
+        assert watching.get(timeout=0) == {"type": "play", "data": {"play_id": 10}}
+        assert other.get(timeout=0) is None
+
+    def test_close_unsubscribes(self):
+        feed = InProcessPlayFeed()
+        subscription = feed.subscribe(1)
+        assert feed.subscriber_count(1) == 1
+
+        subscription.close()
+
+        assert feed.subscriber_count(1) == 0
+
+    def test_slow_reader_drops_oldest_events(self):
+        feed = InProcessPlayFeed()
+        subscription = Subscription(feed, 1, maxsize=2)
+        for n in range(3):
+            subscription.deliver({"type": "play", "data": n})
+
+        assert subscription.get(timeout=0)["data"] == 1
+        assert subscription.get(timeout=0)["data"] == 2
+
+    def test_async_subscription_wakes_on_delivery_from_another_thread(self):
+        feed = InProcessPlayFeed()
+
+        async def follow():
+            subscription = feed.subscribe(1, AsyncSubscription)
+            assert await subscription.aget(timeout=0) is None
+            threading.Timer(0.05, feed.publish, [1, "play", {"play_id": 10}]).start()
+            event = await subscription.aget(timeout=5)
+            subscription.close()
+            return event
+
+        assert async_to_sync(follow)() == {"type": "play", "data": {"play_id": 10}}
+        assert feed.subscriber_count(1) == 0
+
+    def test_oversized_notify_payload_is_refused(self):
+        with pytest.raises(ValueError, match="NOTIFY limit"):
+            PostgresPlayFeed().publish(1, "sync", {"rows": "x" * 8000})
+
+    def test_backend_from_environment(self, monkeypatch):
+        """Multi-process deployments pick the shared feed through the environment."""
+        monkeypatch.setenv("TRACKER_FEED_BACKEND", "apps.frontend.live_feed.PostgresPlayFeed")
+        try:
+            importlib.reload(base_settings)
+            backend = base_settings.TRACKER_FEED_BACKEND
+        finally:
+            monkeypatch.undo()
+            importlib.reload(base_settings)
+
+        assert backend == "apps.frontend.live_feed.PostgresPlayFeed"
+        assert base_settings.TRACKER_FEED_BACKEND == "apps.frontend.live_feed.InProcessPlayFeed"
+
+
+@pytest.mark.django_db
+class TestTrackerLiveFeed:
+    """Tests for the server-sent events stream."""
+
+    def test_stream_delivers_recorded_play(
+        self, tracker_client, game, django_capture_on_commit_callbacks
+    ):
+        response = tracker_client.get(f"/games/{game.pk}/tracker/live/")
+        assert response["Content-Type"] == "text/event-stream"
+        stream = iter(response.streaming_content)
+        assert next(stream) == b"retry: 3000\n\n"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _post_json(tracker_client, f"/games/{game.pk}/tracker/run/", {"yards_gained": 7})
+
+        event = next(stream).decode()
+        assert event.startswith("event: play\n")
+        data = json.loads(event.split("data: ", 1)[1])
+        assert data["sequence"] == 1
+        assert "play_detail" not in data
+        response.close()
+        assert get_play_feed().subscriber_count(game.pk) == 0
+
+    def test_asgi_stream_holds_no_thread(self, game, django_capture_on_commit_callbacks):
+        client = AsyncClient()
+        client.force_login(UserFactory())
+
+        async def first_event():
+            response = await client.get(f"/games/{game.pk}/tracker/live/")
+            stream = aiter(response.streaming_content)
+            assert await anext(stream) == b"retry: 3000\n\n"
+            get_play_feed().publish(game.pk, "score", {"team_score": 3})
+            event = await anext(stream)
+            await stream.aclose()
+            return event
+
+        assert async_to_sync(first_event)() == b'event: score\ndata: {"team_score": 3}\n\n'
+        assert get_play_feed().subscriber_count(game.pk) == 0
+
+    def test_stream_requires_login(self, game):
+        response = Client().get(f"/games/{game.pk}/tracker/live/")
+
+        assert response.status_code == 302
+
+    def test_viewers_fetch_announced_plays(self, tracker_client, game):
+        for yards in (3, 4, 5):
+            _post_json(tracker_client, f"/games/{game.pk}/tracker/run/", {"yards_gained": yards})
+
+        plays = tracker_client.get(f"/games/{game.pk}/tracker/plays/?after=1").json()["plays"]
+
+        assert [play["sequence_number"] for play in plays] == [3, 2]
+
+    def test_publish_waits_for_commit(self, tracker_client, game):
+        subscription = get_play_feed().subscribe(game.pk)
+        try:
+            _post_json(tracker_client, f"/games/{game.pk}/tracker/run/", {"yards_gained": 3})
+            # The test transaction never commits, so nothing is published
+            assert subscription.get(timeout=0) is None
+        finally:
+            subscription.close()
+
+    def test_undo_publishes_event(self, tracker_client, game, django_capture_on_commit_callbacks):
+        _post_json(tracker_client, f"/games/{game.pk}/tracker/run/", {"yards_gained": 2})
+        subscription = get_play_feed().subscribe(game.pk)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                tracker_client.post(f"/games/{game.pk}/tracker/undo/")
+            assert subscription.get(timeout=0)["type"] == "undo"
+        finally:
+            subscription.close()
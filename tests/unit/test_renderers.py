@@ -0,0 +1,121 @@
+"""
+Unit tests for the API renderers and parsers.
+"""
+import importlib.util
+import io
+from collections import OrderedDict
+from datetime import UTC, date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import msgpack
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from apps.core.parsers import MessagePackParser, ORJSONParser
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer
+from apps.snaps.models import SnapFact
+from sportsman.settings import base as base_settings
+
+PAYLOADS = [
+    {"game_clock": timedelta(minutes=5, seconds=7, microseconds=250)},
+    {"created_at": datetime(2026, 9, 12, 19, 30, 1, 123456, tzinfo=UTC)},
+    {"kickoff": datetime(2026, 9, 12, 19, 30, tzinfo=timezone(timedelta(hours=-5)))},
+    {"date": date(2026, 9, 12), "time": time(19, 30, 5)},
+    {"average": Decimal("4.25"), "ratio": 0.1, "big": 10**12, "negative": -7},
+    {"notes": 'ümlaut "quoted"\n  ', "label": gettext_lazy("Rushing")},
+    {"type": SnapFact.PlayType.RUN, "rows": ({"id": 1}, {"id": 2}), "empty": [], "none": None},
+    {1: "by down", 2: True, 3: False},
+    ReturnDict(OrderedDict(id=3, yards=[1, 2]), serializer=None),
+    ReturnList([{"id": 1}, {"id": 2}], serializer=None),
+    {"notes": "line\u2028separator\u2029"},
+    {"huge": 2**70},
+]
+
+
+class TestORJSONRenderer:
+    """orjson output is byte-identical to DRF's JSONRenderer, non-finite floats aside."""
+
+    @pytest.mark.parametrize("data", PAYLOADS)
+    def test_same_bytes(self, data):
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indent_requested(self):
+        data = {"id": 1, "rows": [1, 2]}
+        media_type = "application/json; indent=2"
+
+        rendered = ORJSONRenderer().render(data, media_type, {})
+
+        assert rendered == JSONRenderer().render(data, media_type, {})
+        assert b"\n" in rendered
+
+    def test_none_is_empty(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_floats_are_null(self, value):
+        """The documented difference: null where the strict renderer raises."""
+        assert ORJSONRenderer().render({"mean": value}) == b'{"mean":null}'
+        with pytest.raises(ValueError):
+            JSONRenderer().render({"mean": value})
+
+
+class TestORJSONParser:
+    """orjson parsing keeps JSONParser's behaviour."""
+
+    def parse(self, body):
+        return ORJSONParser().parse(io.BytesIO(body), "application/json", {})
+
+    def test_parses_utf8(self):
+        assert self.parse('{"notes": "ümlaut", "yards": 4.5}'.encode()) == {"notes": "ümlaut", "yards": 4.5}
+
+    @pytest.mark.parametrize("body", [b"{", b'{"yards": NaN}', b""])
+    def test_rejects_invalid(self, body):
+        with pytest.raises(ParseError):
+            self.parse(body)
+
+
+class TestMessagePack:
+    """MessagePack encodes the values as the JSON renderer writes them."""
+
+    def test_round_trip(self):
+        data = {
+            "game_clock": timedelta(minutes=5, seconds=7),
+            "created_at": datetime(2026, 9, 12, 19, 30, tzinfo=UTC),
+            "average": Decimal("4.25"),
+            "rows": ReturnList([{"id": 1, "type": SnapFact.PlayType.PASS}], serializer=None),
+        }
+
+        rendered = MessagePackRenderer().render(data)
+
+        assert msgpack.unpackb(rendered) == {
+            "game_clock": "307.0",
+            "created_at": "2026-09-12T19:30:00Z",
+            "average": 4.25,
+            "rows": [{"id": 1, "type": "PASS"}],
+        }
+        assert MessagePackParser().parse(io.BytesIO(rendered)) == msgpack.unpackb(rendered)
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b"\xc1"))
+
+    def test_optional_in_settings(self, monkeypatch):
+        """Without msgpack installed, the API offers neither its renderer nor its parser."""
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(
+            importlib.util,
+            "find_spec",
+            lambda name, *args: None if name == "msgpack" else find_spec(name, *args),
+        )
+        try:
+            importlib.reload(base_settings)
+            renderers = base_settings.REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]
+            parsers = base_settings.REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"]
+        finally:
+            monkeypatch.undo()
+            importlib.reload(base_settings)
+
+        assert renderers == ["apps.core.renderers.ORJSONRenderer"]
+        assert "apps.core.parsers.MessagePackParser" not in parsers
+        assert "apps.core.renderers.MessagePackRenderer" in base_settings.API_RENDERER_CLASSES
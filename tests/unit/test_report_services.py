@@ -1,11 +1,24 @@
 """
 Comprehensive tests for report services.
 """
+import importlib
+import io
+
 import pytest
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from apps.reports.cache import ReportCache, report_cache
+from apps.reports.models import DataVersion
 from apps.reports.services import (
     OffenseReportService,
     DefenseReportService,
     SpecialTeamsReportService,
+    ReportBundleService,
+    SituationalReportService,
+    DriveReportService,
+    ExpectedPointsReportService,
 )
 from apps.snaps.models import (
     RunPlay,
@@ -16,7 +29,9 @@ from apps.snaps.models import (
     KickoffSnap,
     FieldGoalSnap,
     ExtraPointSnap,
+    SnapFact,
 )
+from sportsman.settings import base as base_settings
 from tests.factories import (
     TeamFactory,
     SeasonFactory,
@@ -519,3 +534,444 @@ class TestSpecialTeamsReportService:
         assert totals["pat_made"] == 3
         assert totals["two_pt_attempts"] == 2
         assert totals["two_pt_made"] == 1
+
+
+@pytest.mark.django_db
+class TestReportServicesUseSnapFacts:
+    """Reports aggregate from the flat fact table."""
+
+    def test_team_scoped_totals_run_without_joins(self, game, player):
+        """Team totals read one table, with no joins to snaps or seasons."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=12)
+        service = OffenseReportService(team_id=game.season.team_id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            totals = service.get_rushing_totals()
+
+        assert totals["yards"] == 12
+        # The first query reads the scope's data version
+        _, query = ctx.captured_queries
+        assert "JOIN" not in query["sql"]
+        assert '"snap_facts"' in query["sql"]
+
+    def test_per_player_stats_keep_player_keys(self, game):
+        """Per-player rows keep their ``<role>__<field>`` keys."""
+        qb = PlayerFactory(position="QB", first_name="Tom", last_name="Arm")
+        PassPlay.objects.create(
+            game=game, quarter=1, quarterback=qb, is_complete=True, yards_gained=20
+        )
+
+        (row,) = OffenseReportService().get_passing_by_quarterback()
+
+        assert row["quarterback__id"] == qb.pk
+        assert row["quarterback__last_name"] == "Arm"
+        assert row["quarterback__number"] == qb.number
+        assert row["yards"] == 20
+
+
+@pytest.mark.django_db
+class TestSeasonReportsFromRollups:
+    """Per-player season reports sum per-game rollups."""
+
+    def test_rushing_by_player_across_games(self, season):
+        """Season totals, longest and average span every game."""
+        rb = PlayerFactory(team=season.team, position="RB")
+        for yards in ([4, 10], [30, -2, 6]):
+            game = GameFactory(season=season)
+            for gained in yards:
+                RunPlay.objects.create(game=game, quarter=1, ball_carrier=rb, yards_gained=gained)
+
+        (row,) = OffenseReportService(season_id=season.pk).get_rushing_by_player()
+
+        assert row["attempts"] == 5
+        assert row["yards"] == 48
+        assert row["longest"] == 30
+        assert row["avg_yards"] == pytest.approx(9.6)
+        assert row["explosive_runs"] == 2
+
+    def test_player_summary_includes_penalty_only_defenders(self, game, player):
+        """Defenders appear even when none of their plays is a tackle."""
+        DefenseSnap.objects.create(game=game, quarter=1, play_result="PENALTY",
+                                   primary_player=player)
+
+        (row,) = DefenseReportService().get_player_summary()
+
+        assert row["primary_player__id"] == player.pk
+        assert row["tackles"] == 0
+
+
+@pytest.mark.django_db
+class TestReportCache:
+    """Tests for the versioned report result cache."""
+
+    def test_repeat_call_is_served_from_cache(self, game, player, django_assert_num_queries):
+        """A second identical request runs no report queries, only the version lookup."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=9)
+        OffenseReportService(game_ids=[game.pk]).get_rushing_totals()
+
+        with django_assert_num_queries(1):
+            totals = OffenseReportService(game_ids=[game.pk]).get_rushing_totals()
+
+        assert totals["yards"] == 9
+        assert report_cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+    def test_snap_write_invalidates_its_game(self, game, player):
+        """Recording a play makes that game's cached reports stale."""
+        service = OffenseReportService(game_ids=[game.pk])
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=9)
+        assert service.get_rushing_totals()["yards"] == 9
+
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=3)
+
+        assert service.get_rushing_totals()["yards"] == 12
+
+    def test_undo_invalidates_season_scope(self, game, player):
+        """Deleting a play makes season-wide reports stale."""
+        play = RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=9)
+        service = OffenseReportService(season_id=game.season_id)
+        assert service.get_rushing_totals()["attempts"] == 1
+
+        play.delete()
+
+        assert service.get_rushing_totals()["attempts"] == 0
+
+    def test_other_games_keep_their_entries(self, game, player):
+        """A write to one game leaves another game's entries fresh."""
+        other = GameFactory(season=game.season)
+        OffenseReportService(game_ids=[other.pk]).get_rushing_totals()
+
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=9)
+        OffenseReportService(game_ids=[other.pk]).get_rushing_totals()
+
+        assert report_cache.stats()["hits"] == 1
+
+    def test_versions_are_shared_between_processes(self, game, player):
+        """A write is seen through the database, not the cache holding the results."""
+        service = OffenseReportService(game_ids=[game.pk])
+        assert service.get_rushing_totals()["attempts"] == 0
+        before = report_cache.version(game_ids=[game.pk])
+
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=4)
+
+        assert DataVersion.objects.filter(scope="game", scope_id=game.pk).exists()
+        assert report_cache.version(game_ids=[game.pk]) != before
+        assert service.get_rushing_totals()["attempts"] == 1
+
+    def test_unscoped_reports_follow_team_versions(self, game, player):
+        """Writes bump no version shared by every game; unscoped results still go stale."""
+        service = OffenseReportService()
+        assert service.get_rushing_totals()["attempts"] == 0
+
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=4)
+
+        assert set(DataVersion.objects.values_list("scope", flat=True)) == {"game", "season", "team"}
+        assert service.get_rushing_totals()["attempts"] == 1
+
+    def test_key_normalizes_filters(self, game):
+        """Equivalent filters share an entry; different ones do not."""
+        OffenseReportService(game_ids=[game.pk], season_id=str(game.season_id)).get_rushing_totals()
+        OffenseReportService(game_ids=[game.pk], season_id=game.season_id).get_rushing_totals()
+        OffenseReportService(game_ids=[game.pk]).get_rushing_totals()
+        DefenseReportService(game_ids=[game.pk]).get_team_totals()
+
+        assert report_cache.stats()["hits"] == 1
+        assert report_cache.stats()["misses"] == 3
+
+    def test_pluggable_backend(self, settings, tmp_path, game, player):
+        """Any configured cache alias can hold report results."""
+        settings.CACHES = {
+            **settings.CACHES,
+            "report_files": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": str(tmp_path),
+            },
+        }
+        cache = ReportCache(alias="report_files")
+        service = OffenseReportService(game_ids=[game.pk])
+
+        first = cache.get_or_compute(service, "rushing", lambda: {"yards": 1})
+        second = cache.get_or_compute(service, "rushing", lambda: {"yards": 2})
+
+        assert first == second == {"yards": 1}
+        assert cache.stats()["hits"] == 1
+        assert any(tmp_path.iterdir())
+        caches["report_files"].clear()
+
+    def test_shared_backend_from_environment(self, monkeypatch, tmp_path):
+        """Every settings module takes a shared report cache from the environment."""
+        monkeypatch.setenv("REPORT_CACHE_DIR", str(tmp_path))
+        try:
+            importlib.reload(base_settings)
+            reports = base_settings.CACHES["reports"]
+        finally:
+            monkeypatch.undo()
+            importlib.reload(base_settings)
+
+        assert reports["BACKEND"] == "django.core.cache.backends.filebased.FileBasedCache"
+        assert reports["LOCATION"] == str(tmp_path)
+        assert base_settings.CACHES["reports"]["BACKEND"].endswith("LocMemCache")
+
+
+@pytest.mark.django_db
+class TestReportBundleService:
+    """Tests for the combined report bundle."""
+
+    @pytest.fixture
+    def plays(self, game):
+        rb = PlayerFactory(position="RB")
+        qb = PlayerFactory(position="QB")
+        wr = PlayerFactory(position="WR")
+        lb = PlayerFactory(position="LB")
+        k = PlayerFactory(position="K")
+        p = PlayerFactory(position="P")
+        other = GameFactory(season=game.season)
+
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=rb, yards_gained=12, is_touchdown=True)
+        RunPlay.objects.create(game=other, quarter=1, ball_carrier=qb, yards_gained=-2, fumbled=True)
+        PassPlay.objects.create(
+            game=game, quarter=2, quarterback=qb, receiver=wr, yards_gained=25,
+            is_complete=True, yards_after_catch=10, play_result="COMPLETE",
+        )
+        PassPlay.objects.create(game=other, quarter=2, quarterback=qb, receiver=wr, play_result="INCOMPLETE")
+        DefenseSnap.objects.create(game=game, quarter=3, primary_player=lb, play_result="TACKLE")
+        DefenseSnap.objects.create(game=other, quarter=3, primary_player=lb, play_result="SACK", applied_pressure=True)
+        PuntSnap.objects.create(game=game, quarter=4, punter=p, punt_yards=44, is_touchback=True)
+        KickoffSnap.objects.create(game=game, quarter=1, kicker=k, kick_yards=60)
+        FieldGoalSnap.objects.create(game=game, quarter=4, kicker=k, kick_distance=41, result="GOOD")
+        FieldGoalSnap.objects.create(game=other, quarter=4, kicker=k, kick_distance=50, result="MISS")
+        ExtraPointSnap.objects.create(game=game, quarter=1, kicker=k, attempt_type="KICK", result="GOOD")
+        return other
+
+    @pytest.mark.parametrize("scope", ["all", "game", "season"])
+    def test_matches_section_services(self, game, plays, scope):
+        """Every bundle entry equals the single-section report it replaces."""
+        filters = {
+            "all": {},
+            "game": {"game_ids": [game.pk]},
+            "season": {"season_id": game.season_id},
+        }[scope]
+        bundle = ReportBundleService(**filters).get_bundle()
+        offense = OffenseReportService(**filters)
+        defense = DefenseReportService(**filters)
+        special_teams = SpecialTeamsReportService(**filters)
+
+        assert bundle["offense"] == {
+            "rushing_totals": offense.get_rushing_totals(),
+            "passing_totals": offense.get_passing_totals(),
+            "rushing_by_player": offense.get_rushing_by_player(),
+            "passing_by_quarterback": offense.get_passing_by_quarterback(),
+            "receiving_by_player": offense.get_receiving_by_player(),
+        }
+        assert bundle["defense"] == {
+            "team_totals": defense.get_team_totals(),
+            "player_summary": defense.get_player_summary(),
+        }
+        assert bundle["special_teams"] == {
+            "punt_totals": special_teams.get_punt_totals(),
+            "kickoff_totals": special_teams.get_kickoff_totals(),
+            "field_goal_totals": special_teams.get_field_goal_totals(),
+            "extra_point_totals": special_teams.get_extra_point_totals(),
+            "punt_by_punter": special_teams.get_punt_by_punter(),
+            "field_goal_by_kicker": special_teams.get_field_goal_by_kicker(),
+        }
+
+    def test_costs_three_queries(self, game, plays, django_assert_num_queries):
+        """Totals, splits and player details are one query each, after the version lookup."""
+        with django_assert_num_queries(4):
+            bundle = ReportBundleService(season_id=game.season_id).get_bundle()
+
+        assert bundle["offense"]["rushing_totals"]["attempts"] == 2
+        assert len(bundle["defense"]["player_summary"]) == 1
+
+    def test_empty_bundle(self):
+        """With no plays, totals are zeroed and splits are empty."""
+        bundle = ReportBundleService().get_bundle()
+
+        assert bundle["offense"]["rushing_totals"]["yards"] == 0
+        assert bundle["special_teams"]["field_goal_totals"]["percentage"] == 0.0
+        assert bundle["offense"]["rushing_by_player"] == []
+        assert bundle["special_teams"]["field_goal_by_kicker"] == []
+
+
+@pytest.mark.django_db
+class TestSituationalReportService:
+    """Tests for the vectorized situational splits."""
+
+    @pytest.fixture
+    def plays(self, game, player):
+        def run(down, distance, yards, **extra):
+            RunPlay.objects.create(
+                game=game, quarter=1, down=down, distance=distance,
+                formation="I-Formation", ball_carrier=player, yards_gained=yards, **extra
+            )
+
+        def pass_(down, distance, yards, **extra):
+            PassPlay.objects.create(
+                game=game, quarter=1, down=down, distance=distance,
+                formation="Shotgun", quarterback=player, yards_gained=yards, **extra
+            )
+
+        run(1, 10, 4)                     # success: 40% of 10
+        run(1, 10, 3)                     # failure
+        run(2, 5, 12)                     # success, explosive
+        pass_(3, 8, 0, was_sacked=True, sack_yards=-7)
+        pass_(3, 2, 25, is_complete=True, is_first_down=True)
+        run(1, 10, 30, fumble_lost=True)  # turnovers are never successes
+        run(2, 3, 5, ball_position=45, is_touchdown=True)
+
+    def test_success_by_down_distance(self, plays):
+        """Cells count plays and successes per down and distance bucket."""
+        rows = SituationalReportService().get_success_by_down_distance()
+
+        assert [
+            (row["down"], row["distance_bucket"], row["plays"], row["successes"])
+            for row in rows
+        ] == [
+            (1, "long", 3, 1),
+            (2, "short", 1, 1),
+            (2, "medium", 1, 1),
+            (3, "short", 1, 1),
+            (3, "long", 1, 0),
+        ]
+        assert rows[0]["success_rate"] == pytest.approx(0.333)
+
+    def test_red_zone_and_formations(self, plays):
+        """Red-zone plays and explosive rates use net yards."""
+        service = SituationalReportService()
+
+        assert service.get_red_zone()["plays"] == 1
+        assert service.get_red_zone()["touchdown_rate"] == 1.0
+        assert [
+            (row["formation"], row["plays"], row["explosive"])
+            for row in service.get_explosive_by_formation()
+        ] == [("I-Formation", 5, 2), ("Shotgun", 2, 1)]
+
+    def test_yards_distribution(self, plays):
+        """Sacks land in the loss bin of the pass distribution."""
+        distribution = SituationalReportService().get_yards_distribution()
+
+        passes = distribution["passes"]
+        assert passes["plays"] == 2
+        assert passes["histogram"][0] == {"bin": "loss", "plays": 1}
+        assert distribution["all"]["percentiles"]["p50"] == 5.0
+
+    def test_splits_load_plays_once(self, plays, django_assert_num_queries):
+        """Every split comes from a single query, after the version lookup."""
+        with django_assert_num_queries(2):
+            splits = SituationalReportService().get_splits()
+
+        assert splits["red_zone"]["pass_plays"] == 0
+
+    def test_empty(self):
+        """With no plays every split is empty or zero."""
+        splits = SituationalReportService().get_splits()
+
+        assert splits["success_by_down_distance"] == []
+        assert splits["explosive_by_formation"] == []
+        assert splits["yards_distribution"]["all"]["mean"] == 0.0
+
+
+@pytest.mark.django_db
+class TestDriveReportService:
+    """Tests for drive efficiency from the Drive table."""
+
+    def test_drive_summary(self, game, player):
+        """Scores, three-and-outs and field position per drive."""
+        def run(yards, **extra):
+            RunPlay.objects.create(game=game, quarter=1, ball_carrier=player,
+                                   yards_gained=yards, **extra)
+
+        run(5, ball_position=-20)
+        run(70, is_touchdown=True)
+        ExtraPointSnap.objects.create(game=game, quarter=1, kicker=player,
+                                      attempt_type="KICK", result="GOOD")
+        run(1, ball_position=-30)
+        run(2)
+        run(0)
+        PuntSnap.objects.create(game=game, quarter=1, punter=player, punt_yards=40)
+
+        with CaptureQueriesContext(connection) as queries:
+            summary = DriveReportService(game_ids=[game.pk]).get_drive_summary()
+
+        assert len(queries) == 2  # data version, then drives
+        assert (summary["drives"], summary["points"], summary["touchdowns"]) == (2, 7, 1)
+        assert summary["points_per_drive"] == 3.5
+        assert (summary["three_and_outs"], summary["three_and_out_rate"]) == (1, 0.5)
+        assert summary["avg_start_position"] == -25.0
+        assert summary["avg_plays"] == 2.5
+
+    def test_empty(self):
+        """With no drives every rate is zero."""
+        summary = DriveReportService().get_drive_summary()
+
+        assert summary["drives"] == 0
+        assert summary["points_per_drive"] == 0.0
+        assert summary["avg_start_position"] is None
+
+
+@pytest.mark.django_db
+class TestExpectedPointsReportService:
+    """Tests for EPA totals and leaderboards."""
+
+    @pytest.fixture
+    def season_id(self, settings, tmp_path):
+        settings.EXPECTED_POINTS_TABLES = tmp_path / "expected_points.npz"
+        call_command("generate_games", "--games", "8", stdout=io.StringIO())
+        call_command("fit_expected_points", stdout=io.StringIO())
+        return SnapFact.objects.values_list("season_id", flat=True).first()
+
+    def test_totals_match_stored_epa(self, season_id):
+        """Team EPA sums the per-play values stored on the facts."""
+        totals = ExpectedPointsReportService(season_id=season_id).get_epa_totals()
+
+        runs = SnapFact.objects.filter(play_type="RUN", epa__isnull=False)
+        assert totals["run_plays"] == runs.count()
+        assert totals["plays"] == totals["run_plays"] + totals["pass_plays"]
+        assert totals["total_epa"] == pytest.approx(
+            sum(SnapFact.objects.filter(
+                play_type__in=["RUN", "PASS"], epa__isnull=False
+            ).values_list("epa", flat=True))
+        )
+
+    def test_leaderboards(self, season_id, django_assert_num_queries):
+        """Leaders are ranked by total EPA; each board is two queries, after the version lookup."""
+        with django_assert_num_queries(8):
+            boards = ExpectedPointsReportService(season_id=season_id).get_leaderboards()
+
+        rushing = boards["rushing"]
+        assert rushing
+        assert [row["total_epa"] for row in rushing] == sorted(
+            (row["total_epa"] for row in rushing), reverse=True
+        )
+        leader = rushing[0]
+        assert leader["plays"] == SnapFact.objects.filter(
+            play_type="RUN", player_id=leader["ball_carrier__id"], epa__isnull=False
+        ).count()
+        assert boards["receiving"][0]["receiver__last_name"]
+
+    def test_empty_without_model(self):
+        """No fitted model, no scored plays."""
+        boards = ExpectedPointsReportService().get_leaderboards()
+
+        assert boards["totals"]["plays"] == 0
+        assert boards["rushing"] == []
+
+
+@pytest.mark.django_db
+class TestExplainReports:
+    """Tests for the explain_reports management command."""
+
+    def test_requires_data(self):
+        """Without snaps there is nothing to explain."""
+        with pytest.raises(CommandError, match="generate_games"):
+            call_command("explain_reports")
+
+    def test_generated_games_use_indexes(self):
+        """Every report query over generated data avoids sequential scans."""
+        call_command("generate_games", "--games", "2", "--seed", "1", stdout=io.StringIO())
+        out = io.StringIO()
+
+        call_command("explain_reports", "--verbose-plans", stdout=out)
+
+        assert "No sequential scans in" in out.getvalue()
+        assert "ReportBundleService.get_bundle [team]" in out.getvalue()
@@ -1,10 +1,22 @@
 """
 Unit tests for snap models.
 """
+import csv
+import io
+import json
 import pytest
 from datetime import timedelta
+from django.core.management import CommandError, call_command
+from apps.snaps.bulk import bulk_create_snaps
+from apps.snaps.expected_points import load_model, rescore
+from apps.snaps.export import export_columns, export_rows, stream_arrow, stream_parquet
+from apps.snaps.game_state import SCRIMMAGE, GameState, Outcome, advance, replay
+from apps.snaps.generator import ROSTER, simulate_season
+from apps.games.models import Game
+from apps.snaps.querysets import downcast_snaps
 from apps.snaps.models import (
     Play,
+    BaseSnap,
     RunPlay,
     PassPlay,
     DefenseSnap,
@@ -13,6 +25,10 @@ from apps.snaps.models import (
     KickoffSnap,
     FieldGoalSnap,
     ExtraPointSnap,
+    SnapFact,
+    PlayerGameStats,
+    Drive,
+    ScoreEntry,
 )
 from tests.factories import GameFactory, PlayerFactory
 
@@ -612,3 +628,632 @@ class TestSpecialTeamsModels:
         )
 
         assert xp.result == "BLOCK"
+
+
+@pytest.mark.django_db
+class TestBulkCreateSnaps:
+    """Tests for multi-table bulk snap inserts."""
+
+    def test_mixed_types_round_trip(self):
+        """Every snap type comes back from the polymorphic base queryset."""
+        game = GameFactory()
+        rb = PlayerFactory(position="RB")
+        k = PlayerFactory(position="K")
+
+        bulk_create_snaps([
+            RunPlay(game=game, sequence_number=1, quarter=1, play_result="RUN",
+                    ball_carrier=rb, yards_gained=7),
+            FieldGoalSnap(game=game, sequence_number=2, quarter=1, kicker=k,
+                          kick_distance=30, result="GOOD"),
+            RunPlay(game=game, sequence_number=3, quarter=2, play_result="RUN",
+                    ball_carrier=rb, yards_gained=-2),
+        ])
+
+        snaps = list(BaseSnap.objects.filter(game=game).order_by("sequence_number"))
+        assert [type(s).__name__ for s in snaps] == ["RunPlay", "FieldGoalSnap", "RunPlay"]
+        assert snaps[0].ball_carrier == rb
+        assert snaps[2].yards_gained == -2
+        assert snaps[1].kick_distance == 30
+        assert snaps[0].created_at is not None
+
+    def test_one_insert_per_table(self, django_assert_num_queries):
+        """Batch size does not change the number of INSERT statements."""
+        game = GameFactory()
+
+        # snaps, snaps_offense, snaps_offense_run, then the game's season/team
+        # lookup, snap_facts and the two rollup aggregates (content type is
+        # cached; no player, so no rollup rows), then the later-facts check,
+        # the game's last drive, the update extending it and the report data
+        # version bump. 20 rows keeps
+        # the wide snap_facts insert under SQLite's bound-parameter limit.
+        bulk_create_snaps([RunPlay(game=game, sequence_number=1, quarter=1, play_result="RUN")])
+        with django_assert_num_queries(11):
+            bulk_create_snaps([
+                RunPlay(game=game, sequence_number=n, quarter=1, play_result="RUN")
+                for n in range(2, 22)
+            ])
+
+        assert RunPlay.objects.filter(game=game).count() == 21
+
+
+@pytest.mark.django_db
+class TestDowncastSnaps:
+    """Tests for batch polymorphic downcasting."""
+
+    def _mixed_game(self, plays=10):
+        game = GameFactory()
+        rb = PlayerFactory(team=game.season.team, position="RB")
+        k = PlayerFactory(team=game.season.team, position="K")
+        for n in range(1, plays + 1):
+            if n % 3 == 0:
+                FieldGoalSnap.objects.create(game=game, quarter=1, kicker=k,
+                                             kick_distance=30, result="GOOD")
+            else:
+                RunPlay.objects.create(game=game, quarter=1, ball_carrier=rb,
+                                       yards_gained=n)
+        return game
+
+    def test_returns_concrete_types_in_queryset_order(self):
+        """Snaps come back as subclasses, keeping the caller's ordering."""
+        game = self._mixed_game(plays=4)
+
+        snaps = downcast_snaps(game.snaps.order_by("-sequence_number"))
+
+        assert [s.sequence_number for s in snaps] == [4, 3, 2, 1]
+        assert [type(s).__name__ for s in snaps] == [
+            "RunPlay", "FieldGoalSnap", "RunPlay", "RunPlay"
+        ]
+
+    def test_sliced_queryset(self):
+        """A sliced page is downcast without evaluating the rest."""
+        game = self._mixed_game(plays=6)
+
+        snaps = downcast_snaps(game.snaps.order_by("sequence_number")[2:4])
+
+        assert [s.sequence_number for s in snaps] == [3, 4]
+
+    @pytest.mark.parametrize("plays", [6, 60])
+    def test_query_count_is_independent_of_page_size(self, plays, django_assert_num_queries):
+        """One id query plus one per snap type, players and game included."""
+        game = self._mixed_game(plays=plays)
+
+        with django_assert_num_queries(3):
+            snaps = downcast_snaps(game.snaps.all())
+            labels = [
+                str(s.ball_carrier) if isinstance(s, RunPlay) else str(s.kicker)
+                for s in snaps
+            ]
+            games = {s.game for s in snaps}
+
+        assert len(labels) == plays
+        assert games == {game}
+
+
+@pytest.mark.django_db
+class TestSnapFactSync:
+    """Tests for keeping SnapFact rows in step with snaps."""
+
+    def test_create_writes_fact(self, game, player):
+        """Saving a new snap writes its flat fact row."""
+        play = PassPlay.objects.create(
+            game=game, quarter=2, down=3, distance=7, quarterback=player,
+            receiver=player, is_complete=True, yards_gained=18, air_yards=12,
+        )
+
+        fact = SnapFact.objects.get(snap_id=play.pk)
+        assert fact.play_type == SnapFact.PlayType.PASS
+        assert (fact.season_id, fact.team_id) == (game.season_id, game.season.team_id)
+        assert fact.player_id == player.pk
+        assert fact.receiver_id == player.pk
+        assert fact.yards_gained == 18
+        assert fact.air_yards == 12
+        assert fact.is_complete
+        assert fact.result == "PASS"
+
+    def test_update_refreshes_fact(self, game, player):
+        """Editing a snap rewrites its fact row."""
+        play = RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=3)
+
+        play.yards_gained = 40
+        play.is_touchdown = True
+        play.save()
+
+        fact = SnapFact.objects.get(snap_id=play.pk)
+        assert fact.yards_gained == 40
+        assert fact.is_touchdown
+
+    def test_delete_removes_fact(self, game):
+        """Deleting a snap cascades to its fact row."""
+        play = FieldGoalSnap.objects.create(game=game, quarter=4, kick_distance=45, result="GOOD")
+
+        play.delete()
+
+        assert not SnapFact.objects.exists()
+
+    def test_type_specific_columns_fold_onto_shared_ones(self, game, player):
+        """Defense and kicking columns map onto the shared fact columns."""
+        tackle = DefenseSnap.objects.create(
+            game=game, quarter=1, play_result="INT", primary_player=player,
+            is_defensive_touchdown=True, interception_return_yards=55,
+        )
+        fg = FieldGoalSnap.objects.create(
+            game=game, quarter=1, kicker=player, kick_distance=38, result="MISS"
+        )
+
+        facts = SnapFact.objects.in_bulk([tackle.pk, fg.pk])
+        assert facts[tackle.pk].is_touchdown
+        assert facts[tackle.pk].interception_return_yards == 55
+        assert facts[fg.pk].yards_gained == 38
+        assert facts[fg.pk].result == "MISS"
+
+    def test_bulk_create_writes_facts(self, game):
+        """Bulk-inserted snaps get their fact rows too."""
+        bulk_create_snaps([
+            RunPlay(game=game, sequence_number=n, quarter=1, play_result="RUN", yards_gained=n)
+            for n in range(1, 4)
+        ])
+
+        assert list(
+            SnapFact.objects.order_by("sequence_number").values_list("yards_gained", flat=True)
+        ) == [1, 2, 3]
+
+    def test_rebuild_command_repairs_stale_facts(self, game, player):
+        """rebuild_snap_facts recreates rows after writes that skip save()."""
+        play = RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=3)
+        PuntSnap.objects.create(game=game, quarter=1, punter=player, punt_yards=41)
+        RunPlay.objects.filter(pk=play.pk).update(yards_gained=9)
+        SnapFact.objects.filter(play_type=SnapFact.PlayType.PUNT).delete()
+
+        call_command("rebuild_snap_facts", game_ids=[game.pk])
+
+        assert SnapFact.objects.get(snap_id=play.pk).yards_gained == 9
+        assert SnapFact.objects.get(play_type=SnapFact.PlayType.PUNT).yards_gained == 41
+
+
+@pytest.mark.django_db
+class TestPlayerGameStats:
+    """Tests for incrementally maintained per-game player rollups."""
+
+    def test_new_snaps_increment_rollups(self, game):
+        """Each created snap folds into its players' rows."""
+        qb = PlayerFactory(team=game.season.team, position="QB")
+        wr = PlayerFactory(team=game.season.team, position="WR")
+        PassPlay.objects.create(game=game, quarter=1, quarterback=qb, receiver=wr,
+                                is_complete=True, yards_gained=25, yards_after_catch=10)
+        PassPlay.objects.create(game=game, quarter=1, quarterback=qb, receiver=wr,
+                                is_complete=True, yards_gained=8)
+        PassPlay.objects.create(game=game, quarter=1, quarterback=qb, is_complete=False)
+
+        qb_row = PlayerGameStats.objects.get(game=game, player=qb)
+        assert (qb_row.pass_attempts, qb_row.pass_completions) == (3, 2)
+        assert qb_row.pass_yards == 33
+        assert qb_row.pass_longest == 25
+        wr_row = PlayerGameStats.objects.get(game=game, player=wr)
+        assert wr_row.rec_receptions == 2
+        assert wr_row.rec_yac == 10
+        assert wr_row.pass_attempts == 0
+
+    def test_edit_moves_stats_between_players(self, game):
+        """Changing a snap's player refreshes both players' rows."""
+        rb1 = PlayerFactory(team=game.season.team, position="RB")
+        rb2 = PlayerFactory(team=game.season.team, position="RB")
+        play = RunPlay.objects.create(game=game, quarter=1, ball_carrier=rb1, yards_gained=12)
+
+        play.ball_carrier = rb2
+        play.save()
+
+        assert not PlayerGameStats.objects.filter(player=rb1).exists()
+        assert PlayerGameStats.objects.get(player=rb2).rush_yards == 12
+
+    def test_undo_recomputes_longest(self, game, player):
+        """Deleting the longest play restores the previous longest."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=4)
+        long_run = RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=60)
+
+        long_run.delete()
+
+        row = PlayerGameStats.objects.get(player=player)
+        assert (row.rush_attempts, row.rush_yards, row.rush_longest) == (1, 4, 4)
+
+    def test_bulk_created_snaps_increment_rollups(self, game, player):
+        """Batch-synced snaps are rolled up too."""
+        bulk_create_snaps([
+            RunPlay(game=game, sequence_number=n, quarter=1, play_result="RUN",
+                    ball_carrier=player, yards_gained=n)
+            for n in range(1, 5)
+        ])
+
+        row = PlayerGameStats.objects.get(player=player)
+        assert (row.rush_attempts, row.rush_yards, row.rush_longest) == (4, 10, 4)
+
+    def test_rollups_match_full_recompute(self, game, player):
+        """A mixed game leaves nothing for the consistency checker to report."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=7)
+        DefenseSnap.objects.create(game=game, quarter=2, play_result="SACK", primary_player=player)
+        FieldGoalSnap.objects.create(game=game, quarter=3, kicker=player,
+                                     kick_distance=41, result="GOOD")
+        play = PuntSnap.objects.create(game=game, quarter=4, punter=player, punt_yards=38)
+        play.punt_yards = 44
+        play.save()
+
+        assert PlayerGameStats.objects.diff() == []
+
+    def test_check_command_reports_and_fixes_drift(self, game, player):
+        """check_stat_rollups flags drifted rows and --fix rebuilds them."""
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=7)
+        PlayerGameStats.objects.update(rush_yards=99)
+
+        with pytest.raises(CommandError):
+            call_command("check_stat_rollups")
+        assert PlayerGameStats.objects.diff() == [
+            (game.pk, player.pk, "rush_yards", 99, 7)
+        ]
+
+        call_command("check_stat_rollups", fix=True)
+        assert PlayerGameStats.objects.diff() == []
+
+
+@pytest.mark.django_db
+class TestDrives:
+    """Tests for drives segmented from the snap sequence."""
+
+    def _run(self, game, player, quarter=1, clock=None, **fields):
+        return RunPlay.objects.create(
+            game=game, quarter=quarter, ball_carrier=player,
+            game_clock=timedelta(seconds=clock) if clock is not None else None, **fields
+        )
+
+    def test_touchdown_drive_counts_the_try(self, game, player):
+        """A scoring drive ends on the touchdown and adds a good PAT."""
+        self._run(game, player, clock=600, down=1, distance=10, ball_position=-25,
+                  yards_gained=12, is_first_down=True)
+        self._run(game, player, clock=560, down=1, distance=10, ball_position=-13,
+                  yards_gained=63, is_touchdown=True)
+        ExtraPointSnap.objects.create(game=game, quarter=1, kicker=player,
+                                      attempt_type="KICK", result="GOOD")
+
+        drive = Drive.objects.get(game=game)
+        assert (drive.result, drive.points) == (Drive.Result.TOUCHDOWN, 7)
+        assert (drive.plays, drive.yards, drive.first_downs) == (2, 75, 1)
+        assert drive.start_position == -25
+        assert drive.duration == timedelta(seconds=40)
+
+    def test_punt_after_three_plays(self, game, player):
+        """Three plays and a punt close the drive; the next snap opens another."""
+        for down in (1, 2, 3):
+            self._run(game, player, down=down, distance=10, yards_gained=2)
+        PuntSnap.objects.create(game=game, quarter=1, punter=player, punt_yards=40)
+        self._run(game, player, down=1, distance=10, yards_gained=4)
+
+        first, second = Drive.objects.filter(game=game)
+        assert (first.number, first.result, first.plays) == (1, Drive.Result.PUNT, 3)
+        assert (second.number, second.result) == (2, "")
+
+    def test_turnovers_and_downs(self, game, player):
+        """Interceptions, lost fumbles and failed fourth downs end drives."""
+        PassPlay.objects.create(game=game, quarter=1, quarterback=player,
+                                is_interception=True)
+        self._run(game, player, yards_gained=3, fumbled=True, fumble_lost=True)
+        self._run(game, player, down=4, distance=2, yards_gained=1)
+
+        assert list(Drive.objects.filter(game=game).values_list("result", flat=True)) == [
+            Drive.Result.TURNOVER, Drive.Result.TURNOVER, Drive.Result.DOWNS,
+        ]
+
+    def test_half_ends_drive(self, game, player):
+        """A drive open at halftime ends there; the third quarter starts anew."""
+        self._run(game, player, quarter=2, yards_gained=5)
+        self._run(game, player, quarter=3, yards_gained=5)
+
+        first, second = Drive.objects.filter(game=game)
+        assert first.result == Drive.Result.END_OF_HALF
+        assert (second.start_quarter, second.result) == (3, "")
+
+    def test_other_snaps_end_unfinished_drive(self, game, player):
+        """Defense after our offense means possession changed unrecorded."""
+        self._run(game, player, yards_gained=5)
+        DefenseSnap.objects.create(game=game, quarter=1, play_result="PENALTY")
+        self._run(game, player, yards_gained=5)
+        DefenseSnap.objects.create(game=game, quarter=1, play_result="TACKLE")
+
+        assert Drive.objects.get(game=game).result == Drive.Result.POSSESSION_LOST
+
+    def test_incremental_drives_match_rebuild(self, game, player):
+        """Appending snap by snap, in bulk and out of order agrees with a rebuild."""
+        self._run(game, player, sequence_number=1, down=1, distance=10, yards_gained=8)
+        bulk_create_snaps([
+            RunPlay(game=game, sequence_number=n, quarter=1, play_result="RUN",
+                    ball_carrier=player, down=2, distance=2, yards_gained=1)
+            for n in range(2, 5)
+        ])
+        FieldGoalSnap.objects.create(game=game, sequence_number=6, quarter=1,
+                                     kicker=player, kick_distance=30, result="GOOD")
+        self._run(game, player, sequence_number=5, down=4, distance=1, yards_gained=0)
+
+        fields = ["number", "start_sequence", "end_sequence", "plays", "yards", "result", "points"]
+        incremental = list(Drive.objects.filter(game=game).values_list(*fields))
+        Drive.objects.rebuild([game.pk])
+        assert list(Drive.objects.filter(game=game).values_list(*fields)) == incremental
+        assert [row[-2] for row in incremental] == [Drive.Result.DOWNS, Drive.Result.FIELD_GOAL]
+
+    def test_edit_and_delete_resegment(self, game, player):
+        """Changing or undoing a drive-ending snap re-segments the game."""
+        self._run(game, player, yards_gained=5)
+        touchdown = self._run(game, player, yards_gained=20, is_touchdown=True)
+        assert Drive.objects.get(game=game).result == Drive.Result.TOUCHDOWN
+
+        touchdown.is_touchdown = False
+        touchdown.fumble_lost = True
+        touchdown.save()
+        assert Drive.objects.get(game=game).result == Drive.Result.TURNOVER
+
+        touchdown.delete()
+        drive = Drive.objects.get(game=game)
+        assert (drive.result, drive.plays) == ("", 1)
+
+    def test_rebuild_drives_command(self, game, player):
+        """rebuild_drives restores drives for historical games."""
+        self._run(game, player, yards_gained=5)
+        PuntSnap.objects.create(game=game, quarter=1, punter=player, punt_yards=40)
+        Drive.objects.all().delete()
+
+        out = io.StringIO()
+        call_command("rebuild_drives", game_ids=[game.pk], stdout=out)
+
+        assert Drive.objects.get(game=game).result == Drive.Result.PUNT
+        assert "Rebuilt 1 drives for 1 games" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestExpectedPoints:
+    """Tests for the offline-fitted EP/WP tables and per-play EPA."""
+
+    @pytest.fixture
+    def tables(self, settings, tmp_path):
+        settings.EXPECTED_POINTS_TABLES = tmp_path / "expected_points.npz"
+        call_command("generate_games", "--games", "8", stdout=io.StringIO())
+        call_command("fit_expected_points", stdout=io.StringIO())
+        return load_model()
+
+    def test_fit_writes_compact_tables(self, tables, settings):
+        """Tables are small, on disk, and rank situations sensibly."""
+        assert settings.EXPECTED_POINTS_TABLES.exists()
+        assert tables.ep.shape == (4, 8, 20)
+        assert tables.wp.shape == (16, 57)
+        first_and_goal = tables.expected_points([1], [1], [1])[0]
+        backed_up = tables.expected_points([1], [10], [99])[0]
+        assert first_and_goal > backed_up
+        assert (tables.wp[:, -1] > tables.wp[:, 0]).all()
+
+    def test_fit_rescores_stored_facts(self, tables):
+        """Every run and pass with a known situation gets EP and EPA."""
+        plays = SnapFact.objects.filter(
+            play_type__in=[SnapFact.PlayType.RUN, SnapFact.PlayType.PASS],
+            down__isnull=False, distance__isnull=False, ball_position__isnull=False,
+        )
+        assert plays.exists()
+        assert not plays.filter(epa__isnull=True).exists()
+        assert not SnapFact.objects.filter(wp__isnull=True).exists()
+
+    def test_new_play_scored_on_write(self, tables, player):
+        """A tracker play gets its EPA immediately, without the next snap."""
+        game = Game.objects.first()
+        play = RunPlay.objects.create(
+            game=game, quarter=1, down=1, distance=10, ball_position=40,
+            ball_carrier=player, yards_gained=10, is_touchdown=True,
+        )
+
+        fact = SnapFact.objects.get(snap_id=play.pk)
+        before = tables.expected_points([1], [10], [10])[0]
+        assert fact.ep == pytest.approx(before, abs=1e-3)
+        assert fact.epa == pytest.approx(tables.touchdown_value - before, abs=1e-3)
+        assert 0 < fact.wp < 1
+
+    def test_incremental_scores_match_bulk_rescore(self, tables):
+        """Games inserted after the fit score the same as a bulk rescore."""
+        call_command(
+            "generate_games", "--games", "2", "--start-year", "2030", "--seed", "7",
+            stdout=io.StringIO(),
+        )
+        columns = ["snap_id", "ep", "epa", "wp"]
+        incremental = list(SnapFact.objects.order_by("snap_id").values_list(*columns))
+
+        rescore(model=tables)
+
+        assert list(SnapFact.objects.order_by("snap_id").values_list(*columns)) == incremental
+
+    def test_without_tables_columns_stay_empty(self, game, player):
+        """No fitted model: facts are written without EP."""
+        play = RunPlay.objects.create(game=game, quarter=1, down=1, distance=10,
+                                      ball_position=0, ball_carrier=player, yards_gained=4)
+
+        fact = SnapFact.objects.get(snap_id=play.pk)
+        assert (fact.ep, fact.epa, fact.wp) == (None, None, None)
+
+    def test_fit_needs_enough_plays(self, settings, tmp_path):
+        """Fitting an empty database is refused."""
+        settings.EXPECTED_POINTS_TABLES = tmp_path / "expected_points.npz"
+
+        with pytest.raises(CommandError):
+            call_command("fit_expected_points", stdout=io.StringIO())
+        assert load_model() is None
+
+
+class TestGameState:
+    """Tests for the tracker's game state machine."""
+
+    def test_states_are_interned(self):
+        state = GameState.of(2, 3, 4, -10)
+        assert state is GameState.of(2, 3, 4, -10)
+        assert state.replace(down=4) is GameState.of(2, 4, 4, -10)
+        with pytest.raises(AttributeError):
+            state.down = 1
+
+    def test_transitions_are_memoized(self):
+        run = Outcome(SCRIMMAGE, yards=3)
+        after = advance(GameState.of(1, 1, 10, 0), run)
+        assert after is advance(GameState.of(1, 1, 10, 0), Outcome(SCRIMMAGE, yards=3))
+        assert after.as_dict() == {
+            "quarter": 1, "down": 2, "distance": 7, "ball_position": 3, "situation": "normal",
+        }
+
+    def test_fourth_down_stop_hands_the_ball_over(self):
+        after = advance(GameState.of(1, 4, 3, 20), Outcome(SCRIMMAGE, yards=1))
+        assert (after.down, after.ball_position, after.situation) == (1, -21, "turnover_on_downs")
+
+    def test_replay_uses_recorded_spots(self):
+        snaps = [
+            KickoffSnap(sequence_number=1, quarter=1, ball_position=35, is_touchback=True),
+            RunPlay(sequence_number=2, quarter=1, down=1, distance=10, ball_position=-30,
+                    yards_gained=4),
+            DefenseSnap(sequence_number=3, quarter=2, down=2, distance=6, ball_position=-26,
+                        play_result="PENALTY", penalty_yards=5),
+        ]
+        assert replay(snaps[:1]) == GameState.of(1, 1, 10, -25)
+        # The run is spotted at -30 despite the touchback
+        assert replay(snaps[:2]) == GameState.of(1, 2, 6, -26)
+        assert replay(snaps) == GameState.of(2, 2, 1, -21)
+
+
+@pytest.mark.django_db
+class TestSnapExport:
+    """Tests for the streaming play-by-play export."""
+
+    @pytest.fixture
+    def snaps(self, game, player):
+        other = GameFactory(season=game.season)
+        RunPlay.objects.create(game=game, quarter=1, ball_carrier=player, yards_gained=7)
+        PuntSnap.objects.create(
+            game=game, quarter=1, punter=player, punt_yards=41, hang_time=timedelta(seconds=4.5)
+        )
+        PassPlay.objects.create(game=game, quarter=2, quarterback=player, is_complete=True, yards_gained=15)
+        DefenseSnap.objects.create(game=other, quarter=1, primary_player=player, play_result="TACKLE")
+        return other
+
+    def test_rows_merge_all_types_in_play_order(self, game, snaps):
+        """Every snap type is exported, ordered by game then sequence."""
+        rows = list(export_rows(season_id=game.season_id, chunk_size=2))
+
+        assert [row["snap_type"] for row in rows] == [
+            "RunPlay", "PuntSnap", "PassPlay", "DefenseSnap"
+        ]
+        assert [row["sequence_number"] for row in rows[:3]] == [1, 2, 3]
+        assert all(set(row) == set(export_columns()) for row in rows)
+        assert rows[0]["yards_gained"] == 7
+        assert rows[0]["punt_yards"] is None
+        assert rows[1]["hang_time"] == 4.5
+
+    def test_rows_scoped_to_game(self, game, snaps):
+        """A game export leaves out other games' snaps."""
+        rows = list(export_rows(game_id=snaps.pk))
+
+        assert [row["snap_type"] for row in rows] == ["DefenseSnap"]
+
+    def test_command_writes_csv_to_stdout(self, game, snaps):
+        """export_snaps prints a CSV with one line per snap."""
+        out = io.StringIO()
+        call_command("export_snaps", "--game", str(game.pk), stdout=out)
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        assert [row["snap_type"] for row in rows] == ["RunPlay", "PuntSnap", "PassPlay"]
+        assert rows[2]["is_complete"] == "True"
+
+    def test_command_writes_ndjson_file(self, game, snaps, tmp_path):
+        """NDJSON output has one JSON object per line."""
+        path = tmp_path / "snaps.ndjson"
+        call_command(
+            "export_snaps", "--season", str(game.season_id), "--format", "ndjson",
+            "--output", str(path), stderr=io.StringIO(),
+        )
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 4
+        assert json.loads(lines[3])["play_result"] == "TACKLE"
+
+    def test_command_requires_scope(self):
+        """Exports are always scoped to a game, season or team."""
+        with pytest.raises(CommandError):
+            call_command("export_snaps")
+
+    def test_parquet_row_group_per_chunk(self, game, snaps):
+        """Parquet output writes one row group per chunk of rows."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        data = b"".join(stream_parquet(export_rows(season_id=game.season_id), chunk_size=3))
+
+        parquet = pq.ParquetFile(io.BytesIO(data))
+        table = parquet.read()
+        assert parquet.num_row_groups == 2
+        assert table.column_names == export_columns()
+        assert table.column("yards_gained").to_pylist() == [7, None, 15, None]
+
+    def test_arrow_stream(self, game, snaps):
+        """Arrow IPC output reads back as a stream of record batches."""
+        pa = pytest.importorskip("pyarrow")
+        data = b"".join(stream_arrow(export_rows(season_id=game.season_id), chunk_size=2))
+
+        table = pa.ipc.open_stream(data).read_all()
+        assert table.num_rows == 4
+        assert table.column("snap_type").to_pylist()[-1] == "DefenseSnap"
+
+
+@pytest.mark.django_db
+class TestGenerateGames:
+    """Tests for the synthetic game generator."""
+
+    @pytest.fixture
+    def generated(self):
+        call_command("generate_games", "--games", "2", "--seed", "3", stdout=io.StringIO())
+        return Game.objects.filter(season__team__abbreviation="GEN1").order_by("date")
+
+    def test_games_are_consistent(self, generated):
+        """Sequence numbers, quarter scores and final scores add up."""
+        assert generated.count() == 2
+        for game in generated:
+            snaps = list(BaseSnap.objects.filter(game=game).order_by("sequence_number"))
+            assert [snap.sequence_number for snap in snaps] == list(range(1, len(snaps) + 1))
+            assert game.last_sequence_number == len(snaps)
+            assert {snap.quarter for snap in snaps} == {1, 2, 3, 4}
+            assert all(snap.down in (None, 1, 2, 3, 4) for snap in snaps)
+
+            points = (
+                6 * RunPlay.objects.filter(game=game, is_touchdown=True).count()
+                + 6 * PassPlay.objects.filter(game=game, is_touchdown=True).count()
+                + 3 * FieldGoalSnap.objects.filter(game=game, result="GOOD").count()
+                + ExtraPointSnap.objects.filter(game=game, result="GOOD", attempt_type="KICK").count()
+                + 2 * ExtraPointSnap.objects.filter(game=game, result="GOOD").exclude(attempt_type="KICK").count()
+            )
+            quarters = game.quarter_scores.all()
+            assert game.team_score == points == sum(q.team_score for q in quarters)
+            assert game.opponent_score == sum(q.opponent_score for q in quarters)
+            assert ScoreEntry.objects.totals(game.pk) == (game.team_score, game.opponent_score)
+
+    def test_realistic_mix(self, generated):
+        """Both sides of the ball and the kicking game are represented."""
+        types = {
+            type(snap).__name__
+            for snap in BaseSnap.objects.filter(game__in=generated)
+        }
+        assert {"RunPlay", "PassPlay", "DefenseSnap", "PuntSnap"} <= types
+        assert types & {"KickoffSnap", "KickoffReturnSnap"}
+        assert 200 < BaseSnap.objects.filter(game__in=generated).count() < 400
+
+    def test_facts_and_rollups(self, generated):
+        """Bulk inserted snaps get facts and consistent rollups."""
+        assert SnapFact.objects.filter(game__in=generated).count() == (
+            BaseSnap.objects.filter(game__in=generated).count()
+        )
+        assert PlayerGameStats.objects.filter(game__in=generated).exists()
+        assert PlayerGameStats.objects.diff() == []
+
+    def test_deterministic_from_seed(self):
+        """The same seed replays the same games; another seed does not."""
+        players = {position: [10 * index + n for n in range(3)] for index, position in enumerate(ROSTER)}
+
+        first = simulate_season(7, "GEN1", 0, 2, players)
+        assert first == simulate_season(7, "GEN1", 0, 2, players)
+        assert first != simulate_season(8, "GEN1", 0, 2, players)
+
+    def test_workers_need_database_server(self):
+        """Parallel writers are refused on SQLite."""
+        with pytest.raises(CommandError):
+            call_command("generate_games", "--workers", "2", stdout=io.StringIO())